@@ -1 +1,3 @@
 from .linkedin_scraper import LinkedinScraper
+from .async_linkedin_scraper import AsyncLinkedinScraper
+from .sharded_scraper import ShardedScraper, Credential
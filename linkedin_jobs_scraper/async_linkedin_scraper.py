@@ -0,0 +1,179 @@
+import asyncio
+import concurrent.futures
+import threading
+from copy import copy
+from typing import Union, List, AsyncIterator
+from .linkedin_scraper import LinkedinScraper, DEFAULT_MAX_BUFFER, BUFFER_CHECK_INTERVAL
+from .query import Query, QueryOptions
+from .events import Events, EventData, EventMetrics, EventBegin
+
+
+class AsyncLinkedinScraper(LinkedinScraper):
+    """
+    A LinkedinScraper for asyncio applications, taking the same arguments.
+
+    The scraping itself is unchanged, workers and browsers included: its calls run on threads,
+    and what the event loop gets is their results. `stream` yields the events of a run as they
+    are emitted, and `run_async`, `scrape_job_async` and `scrape_jobs_async` are the blocking
+    calls turned into coroutines. Cancelling any of them cancels the scrape behind it.
+    """
+
+    async def __run_cancellable(self, call, *args) -> None:
+        """
+        Run a blocking call of the scraper off the event loop, cancelling it with the task awaiting it
+        :param call: Callable
+        :param args: args
+        :return: None
+        """
+
+        future = asyncio.get_running_loop().run_in_executor(None, call, *args)
+
+        try:
+            await asyncio.shield(future)
+        except asyncio.CancelledError:
+            self.cancel()
+
+            # The workers are left to unwind before the task lets go: it owns the browsers
+            # they are closing
+            await asyncio.wait({future})
+            raise
+
+    async def run_async(self, queries: Union[Query, List[Query]], options: QueryOptions = None,
+                        resume: bool = False) -> None:
+        """
+        Run a query or a list of queries, as run does, without blocking the event loop
+        :param queries: Union[Query, List[Query]]
+        :param options: QueryOptions
+        :param resume: bool
+        :return: None
+        """
+
+        await self.__run_cancellable(self.run, queries, options, resume)
+
+    async def scrape_job_async(self, url_or_id: str, apply_link: bool = False) -> None:
+        """
+        Scrape a single job, as scrape_job does, without blocking the event loop
+        :param url_or_id: a numeric id, a '/jobs/view/<id>' url or a '?currentJobId=<id>' url
+        :param apply_link: bool
+        :return: None
+        """
+
+        await self.__run_cancellable(self.scrape_job, url_or_id, apply_link)
+
+    async def scrape_jobs_async(self, urls_or_ids, apply_link: bool = False) -> None:
+        """
+        Scrape many jobs, as scrape_jobs does, without blocking the event loop
+        :param urls_or_ids: Iterable[str] numeric ids, '/jobs/view/<id>' urls or '?currentJobId=<id>' urls
+        :param apply_link: bool
+        :return: None
+        """
+
+        await self.__run_cancellable(self.scrape_jobs, urls_or_ids, apply_link)
+
+    async def stream(
+            self,
+            queries: Union[Query, List[Query]],
+            options: QueryOptions = None,
+            max_buffer: int = DEFAULT_MAX_BUFFER,
+    ) -> AsyncIterator[Union[EventData, EventMetrics, EventBegin]]:
+        """
+        Run a query or a list of queries, yielding its BEGIN, DATA and METRICS events as they come
+
+        Events wait in a buffer of max_buffer events until they are consumed. A worker with a
+        full buffer in front of it waits for room rather than scraping ahead, so a slow consumer
+        slows the scrape down instead of filling memory, and nothing is ever dropped.
+
+        Leaving the loop early, closing the generator or cancelling the task consuming it
+        cancels the run: the browsers in use are closed and the generator returns once every
+        worker is over. An exception raised by the run, from a listener registered with on() for
+        instance, is raised by the generator once the events emitted before it are consumed.
+
+        The other events go to the listeners registered with on(), as they do for run. Only one
+        stream may run on a scraper at a time.
+
+        :param queries: Union[Query, List[Query]]
+        :param options: QueryOptions
+        :param max_buffer: int the most events waiting to be consumed
+        :return: AsyncIterator[Union[EventData, EventMetrics, EventBegin]]
+        """
+
+        if not isinstance(max_buffer, int) or max_buffer < 1:
+            raise ValueError('Parameter max_buffer must be a positive integer')
+
+        loop = asyncio.get_running_loop()
+        buffer = asyncio.Queue(maxsize=max_buffer)
+        closed = threading.Event()
+
+        def push(event) -> None:
+            # A consumer that went away before the run began had nothing to cancel then
+            if closed.is_set():
+                self.cancel()
+                self.raise_if_cancelled()
+
+            # Called on a worker thread, which is the one to wait for room
+            put = asyncio.run_coroutine_threadsafe(buffer.put(event), loop)
+
+            while True:
+                try:
+                    put.result(timeout=BUFFER_CHECK_INTERVAL)
+                    return
+                except concurrent.futures.TimeoutError:
+                    if self._cancelled.is_set():
+                        put.cancel()
+                        self.raise_if_cancelled()
+
+        # The strategy goes on counting on the metrics it emitted, which may well be before
+        # they are consumed: what is buffered is the count at the time
+        listeners = {
+            Events.BEGIN: lambda begin: push(begin),
+            Events.DATA: lambda data: push(data),
+            Events.METRICS: lambda metrics: push(copy(metrics)),
+        }
+
+        for event, cb in listeners.items():
+            self.on(event, cb)
+
+        def produce() -> None:
+            if not closed.is_set():
+                self.run(queries, options)
+
+        run = loop.run_in_executor(None, produce)
+
+        try:
+            while True:
+                if not buffer.empty():
+                    yield buffer.get_nowait()
+                    continue
+
+                if run.done():
+                    break
+
+                get = asyncio.ensure_future(buffer.get())
+
+                try:
+                    await asyncio.wait({get, run}, return_when=asyncio.FIRST_COMPLETED)
+                finally:
+                    if not get.done():
+                        get.cancel()
+
+                if get.done() and not get.cancelled():
+                    yield get.result()
+
+            # Raises whatever ended the run, once everything it emitted has been consumed
+            run.result()
+        finally:
+            closed.set()
+
+            if not run.done():
+                self.cancel()
+                await asyncio.wait({run})
+
+            for event, cb in listeners.items():
+                self.remove_listener(event, cb)
+
+    async def __aenter__(self) -> 'AsyncLinkedinScraper':
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, exc_traceback) -> None:
+        # Closing waits for the workers to stop, which is no wait for the event loop to share
+        await asyncio.get_running_loop().run_in_executor(None, self.close)
@@ -8,7 +8,11 @@ from __future__ import annotations
 import argparse
 import importlib.metadata
 from dataclasses import dataclass, field
+from datetime import date
 
+from ..utils.blocking import resolve_blocklist
+from ..utils.pace_trace import pace_trace_format
+from ..utils.pacing import CLEAN_RUN_BEFORE_EASING, PACING_EASE_FACTOR, PACING_INCREASE_FACTOR
 from .mapping import (
     RELEVANCE_CHOICES,
     TIME_CHOICES,
@@ -49,6 +53,16 @@ class CliConfig:
     chrome_binary_location: str | None = None
     chrome_user_data_dir: str | None = None
     interactive_login: bool = False
+    api_mode: bool = False
+    pipeline_details: bool = False
+    tabs_per_driver: int = 1
+    prefetch_pages: bool = False
+    seen_index: str | None = None
+    timings: str | None = None
+    blocked_resources: list[str] | None = None
+    observe_network: bool = False
+    rate_limiter: str | None = None
+    pace_trace: str | None = None
 
     # Output
     out_format: str | None = None
@@ -65,7 +79,12 @@ class CliConfig:
     limit: int = DEFAULT_LIMIT
     apply_link: bool = False
     skip_promoted_jobs: bool = False
+    no_details: bool = False
     page_offset: int = DEFAULT_PAGE_OFFSET
+    only_new: bool = False
+    stop_at_job_id: str | None = None
+    stop_before: date | None = None
+    stop_after_seen: int | None = None
     relevance: str | None = None
     time: str | None = None
     salary: str | None = None
@@ -78,6 +97,12 @@ class CliConfig:
     # job
     url_or_id: str = ''
 
+    # simulate-pace
+    trace: str = ''
+    increase_factor: float = PACING_INCREASE_FACTOR
+    ease_factor: float = PACING_EASE_FACTOR
+    clean_run: int = CLEAN_RUN_BEFORE_EASING
+
 
 def _package_version() -> str:
     """Read the version from the installed distribution metadata, the single source."""
@@ -130,6 +155,28 @@ def _add_driver_arguments(parser: argparse.ArgumentParser) -> None:
                        help='Chrome profile directory kept across runs')
     group.add_argument('--interactive-login', action='store_true',
                        help='Sign in by hand into the profile before scraping')
+    group.add_argument('--api-mode', action='store_true',
+                       help="Read jobs from LinkedIn's JSON API instead of rendering its pages")
+    group.add_argument('--pipeline-details', action='store_true',
+                       help="Render the next job's card and open it while the current one is read")
+    group.add_argument('--tabs-per-driver', type=int, default=1, metavar='N',
+                       help='Tabs one Chrome hosts, one per worker, sharing its session and profile '
+                            '(default: %(default)s)')
+    group.add_argument('--prefetch-pages', action='store_true',
+                       help='Load the next page of results in a background tab while the current one is scraped')
+    group.add_argument('--seen-index', default=None, metavar='PATH',
+                       help='Database recording every job scraped, kept across runs')
+    group.add_argument('--timings', default=None, metavar='PATH',
+                       help='File the waits learn their timings into, kept across runs')
+    group.add_argument('--block-resources', nargs='*', default=None, metavar='CATEGORY',
+                       help='Requests the browser refuses: categories (images, media, fonts, analytics, '
+                            'messaging, ads) or URL patterns. Alone, every category but images')
+    group.add_argument('--observe-network', action='store_true',
+                       help="Pace the run from LinkedIn's Retry-After and rate limit headers, read over BiDi")
+    group.add_argument('--rate-limiter', default=None, metavar='PATH',
+                       help="Database the account's request budget is shared through, by every process given it")
+    group.add_argument('--pace-trace', default=None, metavar='PATH',
+                       help='File every report of the pacer is written to as it is made, .csv or .jsonl')
 
 
 def _add_output_arguments(parser: argparse.ArgumentParser) -> None:
@@ -160,8 +207,19 @@ def _add_search_arguments(parser: argparse.ArgumentParser) -> None:
     options.add_argument('--apply-link', action='store_true',
                          help='Resolve the external apply link for each job')
     options.add_argument('--skip-promoted-jobs', action='store_true', help='Skip promoted jobs')
+    options.add_argument('--no-details', action='store_true',
+                         help='Read each job off its card in the results list, without opening it: '
+                              'no description, company link, employee count or insights')
     options.add_argument('--page-offset', type=int, default=DEFAULT_PAGE_OFFSET, metavar='N',
                          help='Number of result pages to skip (default: %(default)s)')
+    options.add_argument('--only-new', action='store_true',
+                         help='Skip the jobs already recorded in --seen-index, without opening them')
+    options.add_argument('--stop-at-job-id', default=None, metavar='ID',
+                         help='Stop at this job, where the last crawl of a --relevance recent search started')
+    options.add_argument('--stop-before', type=date.fromisoformat, default=None, metavar='YYYY-MM-DD',
+                         help='Stop at the first job posted before this day')
+    options.add_argument('--stop-after-seen', type=int, default=None, metavar='N',
+                         help='Stop after N jobs in a row already recorded in --seen-index')
 
     filters = parser.add_argument_group('filters')
     filters.add_argument('--relevance', choices=list(RELEVANCE_CHOICES), default=None,
@@ -200,6 +258,21 @@ def _add_login_arguments(parser: argparse.ArgumentParser) -> None:
     parser.add_argument('--chrome-binary-location', default=None, help='Path to the Chrome binary')
 
 
+def _add_simulate_pace_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument('trace', metavar='TRACE',
+                        help='A trace recorded with --pace-trace, .csv or .jsonl')
+    parser.add_argument('--slow-mo', type=float, default=DEFAULT_SLOW_MO, metavar='SECONDS',
+                        help='Floor on seconds slept between jobs (default: %(default)s)')
+    parser.add_argument('--no-adaptive-slow-mo', action='store_true',
+                        help='Keep slow-mo a fixed delay instead of adapting to 429s')
+    parser.add_argument('--increase-factor', type=float, default=PACING_INCREASE_FACTOR, metavar='FACTOR',
+                        help='What a 429 multiplies the pace by (default: %(default)s)')
+    parser.add_argument('--ease-factor', type=float, default=PACING_EASE_FACTOR, metavar='FACTOR',
+                        help='What a clean run divides the pace by (default: %(default)s)')
+    parser.add_argument('--clean-run', type=int, default=CLEAN_RUN_BEFORE_EASING, metavar='N',
+                        help='Steps without a 429 before the pace eases (default: %(default)s)')
+
+
 def build_parser() -> argparse.ArgumentParser:
     """Build the full argparse parser with all subcommands and flags."""
     # --no-color lives on a shared parent so it is accepted before or after the
@@ -236,6 +309,11 @@ def build_parser() -> argparse.ArgumentParser:
                                   parents=[color_parent])
     _add_login_arguments(login)
 
+    simulate_pace = subparsers.add_parser('simulate-pace',
+                                          help='Replay a recorded pace trace with other pacing constants',
+                                          parents=[color_parent])
+    _add_simulate_pace_arguments(simulate_pace)
+
     return parser
 
 
@@ -259,6 +337,16 @@ def _namespace_to_config(namespace: argparse.Namespace) -> CliConfig:
         chrome_binary_location=getattr(namespace, 'chrome_binary_location', None),
         chrome_user_data_dir=getattr(namespace, 'chrome_user_data_dir', None),
         interactive_login=getattr(namespace, 'interactive_login', False),
+        api_mode=getattr(namespace, 'api_mode', False),
+        pipeline_details=getattr(namespace, 'pipeline_details', False),
+        tabs_per_driver=getattr(namespace, 'tabs_per_driver', 1),
+        prefetch_pages=getattr(namespace, 'prefetch_pages', False),
+        seen_index=getattr(namespace, 'seen_index', None),
+        timings=getattr(namespace, 'timings', None),
+        blocked_resources=getattr(namespace, 'block_resources', None),
+        observe_network=getattr(namespace, 'observe_network', False),
+        rate_limiter=getattr(namespace, 'rate_limiter', None),
+        pace_trace=getattr(namespace, 'pace_trace', None),
         out_format=getattr(namespace, 'out_format', None),
         out_path=getattr(namespace, 'out_path', None),
         fields=fields,
@@ -271,7 +359,12 @@ def _namespace_to_config(namespace: argparse.Namespace) -> CliConfig:
         limit=getattr(namespace, 'limit', DEFAULT_LIMIT),
         apply_link=getattr(namespace, 'apply_link', False),
         skip_promoted_jobs=getattr(namespace, 'skip_promoted_jobs', False),
+        no_details=getattr(namespace, 'no_details', False),
         page_offset=getattr(namespace, 'page_offset', DEFAULT_PAGE_OFFSET),
+        only_new=getattr(namespace, 'only_new', False),
+        stop_at_job_id=getattr(namespace, 'stop_at_job_id', None),
+        stop_before=getattr(namespace, 'stop_before', None),
+        stop_after_seen=getattr(namespace, 'stop_after_seen', None),
         relevance=getattr(namespace, 'relevance', None),
         time=getattr(namespace, 'time', None),
         salary=getattr(namespace, 'salary', None),
@@ -281,6 +374,10 @@ def _namespace_to_config(namespace: argparse.Namespace) -> CliConfig:
         workplace=list(getattr(namespace, 'workplace', None) or []),
         industry=list(getattr(namespace, 'industry', None) or []),
         url_or_id=getattr(namespace, 'url_or_id', ''),
+        trace=getattr(namespace, 'trace', ''),
+        increase_factor=getattr(namespace, 'increase_factor', PACING_INCREASE_FACTOR),
+        ease_factor=getattr(namespace, 'ease_factor', PACING_EASE_FACTOR),
+        clean_run=getattr(namespace, 'clean_run', CLEAN_RUN_BEFORE_EASING),
     )
 
 
@@ -288,4 +385,32 @@ def parse_args(argv: list[str] | None = None) -> CliConfig:
     """Parse argv into a typed CliConfig."""
     parser = build_parser()
     namespace = parser.parse_args(argv)
+
+    if getattr(namespace, 'only_new', False) and not getattr(namespace, 'seen_index', None):
+        parser.error('argument --only-new: requires --seen-index')
+
+    if getattr(namespace, 'stop_after_seen', None) is not None and not getattr(namespace, 'seen_index', None):
+        parser.error('argument --stop-after-seen: requires --seen-index')
+
+    if getattr(namespace, 'no_details', False) and getattr(namespace, 'apply_link', False):
+        parser.error('argument --no-details: not allowed with argument --apply-link')
+
+    try:
+        resolve_blocklist(getattr(namespace, 'block_resources', None))
+    except ValueError as e:
+        parser.error(f'argument --block-resources: {e}')
+
+    for dest, argument in (('pace_trace', '--pace-trace'), ('trace', 'TRACE')):
+        try:
+            if getattr(namespace, dest, None):
+                pace_trace_format(getattr(namespace, dest))
+        except ValueError as e:
+            parser.error(f'argument {argument}: {e}')
+
+    if getattr(namespace, 'increase_factor', 1) < 1 or getattr(namespace, 'ease_factor', 1) < 1:
+        parser.error('arguments --increase-factor, --ease-factor: must be at least 1')
+
+    if getattr(namespace, 'clean_run', 1) < 1:
+        parser.error('argument --clean-run: must be at least 1')
+
     return _namespace_to_config(namespace)
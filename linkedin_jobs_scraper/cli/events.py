@@ -50,10 +50,17 @@ class Feedback:
 
     @staticmethod
     def _format_metrics(metrics: EventMetrics) -> str:
-        return (
+        text = (
             f'processed={metrics.processed} failed={metrics.failed} '
             f'missed={metrics.missed} skipped={metrics.skipped} '
-            f'throttled={metrics.throttled} pace={metrics.pace}s')
+            f'throttled={metrics.throttled} pace={metrics.pace}s '
+            f'transferred={round(metrics.transferred / 1024)}KB')
+
+        # Only a run started with --observe-network listens, and only then is there a cost to show
+        if metrics.listen_overhead:
+            text += f' listening={metrics.listen_overhead}s'
+
+        return text
 
     def _println(self, text: str) -> None:
         """Print a standalone line with the animated spinner cleared under its lock."""
@@ -97,7 +104,9 @@ class Feedback:
         return (
             f'apply-link={self._on_off(config.apply_link)} '
             f'skip-promoted={self._on_off(config.skip_promoted_jobs)} '
-            f'page-offset={config.page_offset}')
+            f'page-offset={config.page_offset} '
+            f'only-new={self._on_off(config.only_new)} '
+            f'details={self._on_off(not config.no_details)}')
 
     def _format_driver(self, config: 'CliConfig') -> str:
         parts = [
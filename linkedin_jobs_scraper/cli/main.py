@@ -6,9 +6,11 @@ import os
 import sys
 
 from ..config import Config
+from ..events import Events
 from ..exceptions import InvalidCookieException
 from ..linkedin_scraper import LinkedinScraper
 from ..login import LOGIN_TIMEOUT, print_credentials, sign_in
+from ..utils.pace_trace import PaceTraceWriter, read_pace_trace, simulate_pacing, summarize_pace_trace
 from .args import CliConfig, parse_args
 from .color import Colorizer, color_enabled
 from .events import Feedback, create_feedback, register_events
@@ -58,27 +60,71 @@ def _run_login(config: CliConfig) -> int:
     return 0
 
 
+def _run_simulate_pace(config: CliConfig) -> int:
+    try:
+        recorded = read_pace_trace(config.trace)
+    except (OSError, ValueError, KeyError) as error:
+        print(f'error: cannot read the pace trace {config.trace}: {error}', file=sys.stderr, flush=True)
+        return 1
+
+    replayed = simulate_pacing(
+        recorded,
+        slow_mo=config.slow_mo,
+        adaptive_slow_mo=not config.no_adaptive_slow_mo,
+        increase_factor=config.increase_factor,
+        ease_factor=config.ease_factor,
+        clean_run=config.clean_run)
+
+    before, after = summarize_pace_trace(recorded), summarize_pace_trace(replayed)
+
+    if not before:
+        print(f'The pace trace {config.trace} records no step')
+        return 0
+
+    # The refusals are the recorded ones in both: only what the pace made of them differs
+    print(f'{"class":<12}{"steps":>7}{"429s":>6}{"eased":>14}{"slept (s)":>20}{"max pace (s)":>18}')
+
+    for request_class, row in before.items():
+        replay = after[request_class]
+        eased = f'{row["eased"]} -> {replay["eased"]}'
+        slept = f'{row["slept"]:.1f} -> {replay["slept"]:.1f}'
+        peak = f'{row["max"]:.2f} -> {replay["max"]:.2f}'
+        print(f'{request_class:<12}{row["steps"]:>7}{row["throttled"]:>6}{eased:>14}{slept:>20}{peak:>18}')
+
+    return 0
+
+
 def _dispatch(config: CliConfig, writer: Writer, feedback: Feedback, spinner: Spinner) -> None:
     """Build the scraper, register handlers, and run the requested subcommand.
 
-    Exceptions propagate to main(), which maps them onto exit codes; the writer is
-    always closed and the spinner always stopped here whatever the outcome.
+    Exceptions propagate to main(), which maps them onto exit codes; the writer and
+    the scraper are always closed and the spinner always stopped here whatever the
+    outcome. Closing the scraper is what saves --timings.
     """
     scraper = LinkedinScraper(**build_scraper_kwargs(config))
     register_events(scraper, writer, feedback)
+    pace_trace = PaceTraceWriter(config.pace_trace) if config.pace_trace else None
+    if pace_trace is not None:
+        scraper.on(Events.PACE, pace_trace.write)
     feedback.announce(config)
     writer.begin()
     try:
         if config.subcommand == 'jobs':
             feedback.set_location_labels(describe_locations(config))
             spinner.start('starting…')
-            scraper.run(build_query(config))
+            scraper.run(build_query(config, writer.fields))
         else:
             spinner.start('loading job…')
             scraper.scrape_job(config.url_or_id, apply_link=config.apply_link)
     finally:
         writer.end()
         spinner.stop()
+        # Before the trace: closing the dispatcher delivers the PACE events still queued
+        try:
+            scraper.close()
+        finally:
+            if pace_trace is not None:
+                pace_trace.close()
 
 
 def compute_exit_code(
@@ -107,6 +153,9 @@ def main(argv: list[str] | None = None) -> int:
     if config.subcommand == 'login':
         return _run_login(config)
 
+    if config.subcommand == 'simulate-pace':
+        return _run_simulate_pace(config)
+
     spinner = create_spinner(config)
 
     try:
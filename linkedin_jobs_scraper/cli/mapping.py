@@ -56,6 +56,15 @@ def build_scraper_kwargs(config: CliConfig) -> dict[str, Any]:
         'chrome_binary_location': config.chrome_binary_location,
         'chrome_user_data_dir': config.chrome_user_data_dir,
         'interactive_login': config.interactive_login,
+        'api_mode': config.api_mode,
+        'pipeline_details': config.pipeline_details,
+        'tabs_per_driver': config.tabs_per_driver,
+        'prefetch_pages': config.prefetch_pages,
+        'seen_index': config.seen_index,
+        'timings': config.timings,
+        'blocked_resources': config.blocked_resources,
+        'observe_network': config.observe_network,
+        'rate_limiter': config.rate_limiter,
     }
 
 
@@ -107,8 +116,11 @@ def build_query_filters(config: CliConfig) -> QueryFilters | None:
     return QueryFilters(**kwargs)
 
 
-def build_query_options(config: CliConfig) -> QueryOptions:
-    """Assemble QueryOptions from the search options and filters."""
+def build_query_options(config: CliConfig, fields: list[str] | None = None) -> QueryOptions:
+    """Assemble QueryOptions from the search options and filters.
+
+    fields is what the writer emits: the scraper extracts nothing else.
+    """
     return QueryOptions(
         limit=config.limit,
         locations=build_locations(config),
@@ -116,9 +128,15 @@ def build_query_options(config: CliConfig) -> QueryOptions:
         apply_link=config.apply_link,
         skip_promoted_jobs=config.skip_promoted_jobs,
         page_offset=config.page_offset,
+        only_new=config.only_new,
+        stop_at_job_id=config.stop_at_job_id,
+        stop_before=config.stop_before,
+        stop_after_seen=config.stop_after_seen,
+        details=not config.no_details,
+        fields=fields,
     )
 
 
-def build_query(config: CliConfig) -> Query:
-    """Build a Query for the jobs subcommand."""
-    return Query(query=config.query, options=build_query_options(config))
+def build_query(config: CliConfig, fields: list[str] | None = None) -> Query:
+    """Build a Query for the jobs subcommand, extracting only the given fields."""
+    return Query(query=config.query, options=build_query_options(config, fields))
@@ -198,6 +198,13 @@ def _compact_url(url: str) -> str:
 class Writer:
     """Common interface every output writer implements."""
 
+    _fields: list[str]
+
+    @property
+    def fields(self) -> list[str]:
+        """The fields this writer emits, which are all the scraper has to extract."""
+        return self._fields
+
     def begin(self) -> None:
         """Open the destination and emit any preamble."""
         raise NotImplementedError
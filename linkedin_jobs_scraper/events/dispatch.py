@@ -0,0 +1,324 @@
+"""Delivering events off the scraping threads: the dispatcher, batched listeners and what they cost."""
+import pickle
+import tempfile
+import threading
+from collections import deque
+from enum import Enum
+from time import monotonic
+from typing import Callable, Optional
+from ..utils.logger import debug
+
+# Events the dispatcher queue holds before its overflow policy applies
+DEFAULT_DISPATCH_QUEUE_SIZE = 1000
+
+
+class OverflowPolicy(Enum):
+    BLOCK = 'block'  # The emitting worker waits for room, which is what slows the scrape down
+    DROP = 'drop'  # A DATA event that finds no room is counted and discarded, any other waits
+    SPILL = 'spill'  # Events that find no room go to a temporary file, and are delivered from it in order
+
+
+class DispatchMetrics:
+    """What delivering events has cost so far, across every call of a scraper."""
+
+    def __init__(self):
+        self.depth = 0  # Events waiting to be delivered, spilled ones included
+        self.max_depth = 0  # The most events that were ever waiting at once
+        self.dispatched = 0  # Events delivered to their listeners
+        self.dropped = 0  # DATA events discarded by the DROP policy
+        self.spilled = 0  # Events that went through the spill file
+        self.callback_errors = 0  # Listeners that raised, when they were run by the dispatcher
+        self.callback_time = 0.0  # Seconds spent in listeners
+        self.callback_max = 0.0  # Seconds the slowest listener call took
+        self._lock = threading.Lock()
+
+    def record_callback(self, seconds: float, failed: bool = False) -> None:
+        """
+        Account for one listener call
+        :param seconds: float
+        :param failed: bool
+        :return: None
+        """
+
+        # Inline delivery runs listeners on every worker thread at once
+        with self._lock:
+            self.callback_time += seconds
+            self.callback_max = max(self.callback_max, seconds)
+
+            if failed:
+                self.callback_errors += 1
+
+    def __str__(self):
+        return f'{{ depth: {self.depth}, max_depth: {self.max_depth}, dispatched: {self.dispatched}, ' \
+               f'dropped: {self.dropped}, spilled: {self.spilled}, callback_errors: {self.callback_errors}, ' \
+               f'callback_time: {round(self.callback_time, 3)}, callback_max: {round(self.callback_max, 3)} }}'
+
+
+class EventBatch:
+    """The payloads a batched listener has been handed and not yet received.
+
+    A batch is due once it holds max_size payloads, or once its oldest payload has waited
+    max_latency seconds.
+    """
+
+    def __init__(self, max_size: int, max_latency: float):
+        self.max_size = max_size
+        self.max_latency = max_latency
+        self._items = []
+        self._started_at = None
+        self._lock = threading.Lock()
+
+    @property
+    def deadline(self) -> Optional[float]:
+        """
+        Return the monotonic time the batch is due at, None while it is empty
+        :return: Optional[float]
+        """
+
+        started_at = self._started_at
+        return None if started_at is None else started_at + self.max_latency
+
+    def add(self, item) -> Optional[list]:
+        """
+        Add a payload, answering the whole batch when that makes it due
+        :param item: the payload
+        :return: Optional[list] the payloads to deliver, None while the batch is not due
+        """
+
+        with self._lock:
+            if not self._items:
+                self._started_at = monotonic()
+
+            self._items.append(item)
+
+            if len(self._items) >= self.max_size or monotonic() >= self._started_at + self.max_latency:
+                return self.__take()
+
+            return None
+
+    def take(self, due_only: bool = False) -> Optional[list]:
+        """
+        Take the payloads waiting, if any
+        :param due_only: bool only when the batch has waited max_latency already
+        :return: Optional[list] the payloads to deliver, None when there is nothing to
+        """
+
+        with self._lock:
+            if not self._items:
+                return None
+
+            if due_only and monotonic() < self._started_at + self.max_latency:
+                return None
+
+            return self.__take()
+
+    def __take(self) -> list:
+        items, self._items = self._items, []
+        self._started_at = None
+        return items
+
+
+class _SpillFile:
+    """Events queued on disk, in the order they were written, for as long as the queue is full."""
+
+    def __init__(self):
+        self._file = tempfile.TemporaryFile()
+        self._read_at = 0
+
+    def write(self, item) -> None:
+        self._file.seek(0, 2)
+        pickle.dump(item, self._file, protocol=pickle.HIGHEST_PROTOCOL)
+
+    def read(self):
+        self._file.seek(self._read_at)
+        item = pickle.load(self._file)
+        self._read_at = self._file.tell()
+        return item
+
+    def reset(self) -> None:
+        # Everything written has been read, so the file starts over rather than growing for ever
+        self._file.seek(0)
+        self._file.truncate()
+        self._read_at = 0
+
+    def close(self) -> None:
+        self._file.close()
+
+
+class Dispatcher:
+    """Delivers events on a thread of its own, in the order they were put.
+
+    The scraping threads only queue what they emit, so a listener writing to a database costs
+    a job nothing but the queueing. The queue holds max_size events; what happens to one that
+    finds it full is up to the overflow policy.
+
+    A listener that raises is logged and counted on the metrics. It never reaches the worker
+    that emitted the event, which has long moved on.
+    """
+
+    def __init__(
+            self,
+            deliver: Callable[[object, tuple], None],
+            flush_batches: Callable[[bool], None],
+            next_deadline: Callable[[], Optional[float]],
+            metrics: DispatchMetrics,
+            max_size: int = DEFAULT_DISPATCH_QUEUE_SIZE,
+            overflow: OverflowPolicy = OverflowPolicy.BLOCK):
+        self._deliver = deliver
+        self._flush_batches = flush_batches
+        self._next_deadline = next_deadline
+        self._max_size = max_size
+        self._overflow = overflow
+        self.metrics = metrics
+
+        self._queue = deque()
+        self._spill = None
+        self._spilled = 0  # Events waiting in the spill file, all of them queued after the ones in memory
+
+        # Flushes asked for and flushes done, numbered so that a caller knows once its own is over
+        self._flushes_requested = 0
+        self._flushes_done = 0
+
+        self._closed = False
+        self._condition = threading.Condition()
+
+        self._thread = threading.Thread(target=self.__loop, name='linkedin-jobs-scraper-dispatcher', daemon=True)
+        self._thread.start()
+
+    def put(self, event, args: tuple, droppable: bool = False) -> bool:
+        """
+        Queue an event for delivery, applying the overflow policy when the queue is full
+        :param event: Events
+        :param args: tuple the payload the listeners are called with
+        :param droppable: bool whether the DROP policy may discard it
+        :return: bool False when the event was dropped
+        """
+
+        with self._condition:
+            if self._closed:
+                raise RuntimeError('The dispatcher is closed')
+
+            while len(self._queue) >= self._max_size and not self._spilled:
+                if self._overflow == OverflowPolicy.SPILL:
+                    break
+
+                if self._overflow == OverflowPolicy.DROP and droppable:
+                    self.metrics.dropped += 1
+                    return False
+
+                self._condition.wait()
+
+            # Once an event is on disk every later one follows it there, or it would overtake it
+            if self._spilled or len(self._queue) >= self._max_size:
+                if self._spill is None:
+                    self._spill = _SpillFile()
+
+                self._spill.write((event, args))
+                self._spilled += 1
+                self.metrics.spilled += 1
+            else:
+                self._queue.append((event, args))
+
+            self.metrics.depth = len(self._queue) + self._spilled
+            self.metrics.max_depth = max(self.metrics.max_depth, self.metrics.depth)
+            self._condition.notify_all()
+
+            return True
+
+    def flush(self) -> None:
+        """
+        Wait for every event queued so far to be delivered, partial batches included
+        :return: None
+        """
+
+        if threading.current_thread() is self._thread:
+            return
+
+        with self._condition:
+            self._flushes_requested += 1
+            flush = self._flushes_requested
+            self._condition.notify_all()
+
+            while self._flushes_done < flush and not self._closed:
+                self._condition.wait()
+
+    def close(self) -> None:
+        """
+        Deliver what is left, then stop the thread
+        :return: None
+        """
+
+        self.flush()
+
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+
+        if threading.current_thread() is not self._thread:
+            self._thread.join()
+
+        if self._spill is not None:
+            self._spill.close()
+
+    def __next(self):
+        """
+        Wait for the next thing to do: an event, every batch to flush, the due ones, or stopping
+        :return: tuple (what, item)
+        """
+
+        with self._condition:
+            while True:
+                if self._queue:
+                    item = self._queue.popleft()
+                    self._condition.notify_all()
+                    return 'event', item
+
+                if self._spilled:
+                    item = self._spill.read()
+                    self._spilled -= 1
+
+                    if not self._spilled:
+                        self._spill.reset()
+
+                    return 'event', item
+
+                # Only once the queue is empty, so that a flush covers every event put before it
+                if self._flushes_done < self._flushes_requested:
+                    return 'flush', self._flushes_requested
+
+                if self._closed:
+                    return 'close', None
+
+                deadline = self._next_deadline()
+                timeout = None if deadline is None else deadline - monotonic()
+
+                if timeout is not None and timeout <= 0:
+                    return 'due', None
+
+                self._condition.wait(timeout)
+
+    def __loop(self) -> None:
+        while True:
+            what, item = self.__next()
+
+            if what == 'close':
+                return
+
+            try:
+                if what == 'event':
+                    self._deliver(*item)
+                else:
+                    self._flush_batches(what == 'due')
+            except BaseException as e:
+                # Whatever a listener raised has been accounted for where it was called, and
+                # the thread has every other listener still to serve
+                debug('Event delivery failed', e)
+
+            with self._condition:
+                if what == 'event':
+                    self.metrics.dispatched += 1
+                    self.metrics.depth = len(self._queue) + self._spilled
+                elif what == 'flush':
+                    self._flushes_done = max(self._flushes_done, item)
+
+                self._condition.notify_all()
@@ -12,6 +12,7 @@ class Events(Enum):
     INVALID_SESSION = 'scraper:invalid-session'
     SESSION_REFRESHED = 'scraper:session-refreshed'
     NOT_FOUND = 'scraper:not-found'
+    PACE = 'scraper:pace'
 
 
 class EventSession(NamedTuple):
@@ -37,6 +38,21 @@ class EventNotFound(NamedTuple):
     job_id: str = ''
 
 
+class EventPace(NamedTuple):
+    """Emitted for every report the pacer is given, carrying the pace it left the class of
+    the step at. Together they are the time series of a run's pacing.
+
+    Listeners are called on the thread that made the report: a worker, or with observe_network
+    the thread reading the responses, unless dispatch_events hands every event to the dispatcher.
+    What they raise is logged rather than raised, and a cancelled call still delivers them."""
+    at: float = 0.0  # Seconds since the epoch
+    request_class: str = ''  # A value of utils.pacing.RequestClass
+    event: str = ''  # throttled, clean, eased, or a server hint: retry_after, budget
+    delay: float = 0.0  # Seconds slept before the next step of the class; for retry_after, the hold
+    throttled: int = 0  # Refusals the class has met so far
+    clean_streak: int = 0  # Steps of the class nobody refused since the last refusal or easing
+
+
 class EventData(NamedTuple):
     query: str = ''
     location: str = ''
@@ -64,8 +80,11 @@ class EventMetrics:
         self.missed = 0  # Number of missed jobs to load during scraping
         self.skipped = 0  # Number of skipped jobs
         self.throttled = 0  # Number of times LinkedIn answered with a 429
-        self.pace = 0.0  # Seconds currently slept between jobs
+        self.pace = 0.0  # Seconds currently slept before a job's details, the step that paces jobs
+        self.transferred = 0  # Bytes downloaded by the pages finished so far
+        self.listen_overhead = 0.0  # Seconds spent reading the network's responses, with observe_network
 
     def __str__(self):
         return f'{{ processed: {self.processed}, failed: {self.failed}, missed: {self.missed}, ' \
-               f'skipped: {self.skipped}, throttled: {self.throttled}, pace: {self.pace} }}'
+               f'skipped: {self.skipped}, throttled: {self.throttled}, pace: {self.pace}, ' \
+               f'transferred: {self.transferred}, listen_overhead: {self.listen_overhead} }}'
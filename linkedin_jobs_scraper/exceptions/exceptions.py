@@ -9,4 +9,10 @@ class InvalidCookieException(Exception):
     """Raised when the session cookie is invalid"""
 
     def __init__(self, *args):
-        super().__init__(*args)
\ No newline at end of file
+        super().__init__(*args)
+
+class CancelledException(Exception):
+    """Raised in the workers of a scraper whose call was cancelled, to unwind them"""
+
+    def __init__(self, *args):
+        super().__init__(*args)
@@ -1,21 +1,42 @@
+import queue
+import threading
 import traceback
+from copy import copy
 from inspect import signature
-from concurrent.futures import ThreadPoolExecutor
+from time import monotonic
+from concurrent.futures import ThreadPoolExecutor, wait
 from urllib.parse import urlparse, urlencode
-from typing import Union, Callable, List
+from typing import Union, Callable, List, Iterable, Iterator
+from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
 from .utils.logger import debug, info, warn, error
 from .utils.url import get_query_params, get_domain, get_url_no_query_params, get_job_id
 from .utils.chrome_driver import build_driver
-from .utils.pacing import Pacer, MIN_SLOW_MO, PACING_CEILING_FACTOR, PACING_CEILING_LIMIT
+from .utils.driver_pool import DriverPool, PooledDriver
+from .utils.tabs import TabFactory
+from .utils.seen_index import SeenIndex
+from .utils.timings import TimingModel
+from .utils.blocking import resolve_blocklist
+from .utils.network import ResponseObserver
+from .utils.rate_limit import RateLimiter, SqliteRateLimiter
+from .utils.checkpoint import Checkpoint, CheckpointStore, SqliteCheckpointStore
+from .utils.pacing import Pacer, RequestClass, MIN_SLOW_MO, PACING_CEILING_FACTOR, PACING_CEILING_LIMIT
 from .utils.session import get_session_cookie, is_on_linkedin, wait_for_linkedin
 from .login import ensure_session
 from .query import Query, QueryOptions, Location
+from .filters import RelevanceFilters
 from .utils.constants import HOME_URL, JOBS_SEARCH_URL
-from .strategies import Strategy, AuthenticatedStrategy
+from .strategies import Strategy, AuthenticatedStrategy, VoyagerStrategy
 from .config import Config
-from .events import Events, EventSession
-from .exceptions import CallbackException, InvalidCookieException
+from .events import Events, EventSession, EventMetrics, EventData
+from .events.dispatch import Dispatcher, DispatchMetrics, EventBatch, OverflowPolicy, DEFAULT_DISPATCH_QUEUE_SIZE
+from .exceptions import CallbackException, InvalidCookieException, CancelledException
+
+# Results a pull-based consumer may fall behind by, unless it says otherwise
+DEFAULT_MAX_BUFFER = 100
+
+# How often a worker blocked on a full buffer looks up to see whether it was cancelled
+BUFFER_CHECK_INTERVAL = 0.1
 
 
 class LinkedinScraper:
@@ -26,12 +47,14 @@ class LinkedinScraper:
         headless (bool): Overrides headless mode only if chrome_options is None. If chrome_options is passed in
             the constructor, this flag is ignored.
         max_workers (int): Number of threads spawned to execute concurrent queries. Each thread will use a
-            different Chrome driver instance. Forced to 1 when chrome_user_data_dir is set.
+            different Chrome driver instance, or a different tab of one when tabs_per_driver is above 1. Forced
+            to tabs_per_driver when chrome_user_data_dir is set.
         slow_mo (float): Seconds slept between jobs, to avoid 429 (Too many requests) errors. It is the
             floor on that sleep, so the fastest the run will ever go rather than the pace it keeps:
             unless adaptive_slow_mo is off, a run that gets throttled paces itself above this number
             and eases back down towards it. Must be at least 0.2, the fastest any run is allowed to
-            ask for.
+            ask for. Steps that ask LinkedIn for less are charged a share of it, see
+            utils.pacing.REQUEST_CLASS_FACTORS.
         adaptive_slow_mo (bool): Let the run find its own pace between slow_mo and
             min(10, slow_mo * 10), doubling it on every 429 LinkedIn answers and easing it back after
             a run of jobs nobody refused. Off makes slow_mo a fixed delay again.
@@ -43,6 +66,64 @@ class LinkedinScraper:
             before the scrape starts. Requires chrome_user_data_dir, a display and somebody to type a password:
             it opens a visible browser and waits for it, so it is off by default and must stay off wherever
             nobody is watching, a CI job or a server.
+        parallel_locations (bool): Schedule every (query, location) pair as a unit of work of its own, instead
+            of walking the locations of a query one after the other. A worker that runs out of queries then
+            picks up the remaining locations of a large one. Each worker still keeps one browser for every
+            pair it runs, so this adds no browsers beyond max_workers.
+        reuse_drivers (bool): Keep browsers open between calls to run and scrape_job, so that a warm call skips
+            the browser launch and the session establishment altogether. The browsers stay open until close
+            is called, or the scraper is used as a context manager and its block exits.
+        driver_max_age (float): Seconds a browser may serve before it is replaced by a fresh one. None keeps it
+            for as long as it stays healthy.
+        driver_max_jobs (int): Jobs a browser may scrape before it is replaced by a fresh one. None keeps it for
+            as long as it stays healthy.
+        api_mode (bool): Read jobs from the JSON API LinkedIn's own frontend uses instead of from its pages.
+            The browser only establishes the session and issues the requests, so nothing is rendered or
+            clicked. A few fields are not populated in this mode: date_text, description_html and insights.
+        dispatch_events (bool): Call listeners on a dispatcher thread of their own instead of on the worker that
+            emitted the event, so that a slow listener does not slow the scrape down. A listener that raises is
+            then logged and counted on dispatch_metrics rather than raised as a CallbackException. Every call
+            returns once the events it emitted have all been delivered.
+        dispatch_queue_size (int): Events waiting for the dispatcher before dispatch_overflow applies.
+        dispatch_overflow (OverflowPolicy): What happens to an event that finds the dispatcher queue full: BLOCK
+            makes the worker wait for room, DROP discards a DATA event (and waits with any other), SPILL
+            queues it in a temporary file.
+        seen_index (Union[str, SeenIndex]): Path to a database of every job id delivered so far, kept from one run
+            to the next, or a SeenIndex already open. Every job emitted is recorded in it, and a query with
+            only_new set skips the jobs it holds without opening them.
+        checkpoint_store (Union[str, CheckpointStore]): Path to a database the progress of every (query, location)
+            is saved to as it is crawled, or a CheckpointStore of your own. A run called with resume then starts
+            each location where the last crawl of it stopped, rather than from page_offset.
+        pipeline_details (bool): Overlap each job's waits with the work around it. The next card is brought into
+            view while the current job's details load, and renders inside the sleeps before the next job is
+            opened rather than after them. LinkedIn is asked for details no more often than without it. Has no
+            effect in api_mode or with details off.
+        tabs_per_driver (int): Tabs one Chrome hosts, each worked by a worker of its own, so that max_workers
+            workers need max_workers / tabs_per_driver browsers rather than max_workers. The tabs share the
+            browser's session, and a chrome_user_data_dir, which only one browser can hold, can then serve
+            that many workers. Workers overlap their sleeps and page loads, while commands to the browser
+            still run one at a time, so a tab is worth less than a browser of its own, at a fraction of the
+            memory.
+        prefetch_pages (bool): Load the next page of results in a background tab while the current one is
+            scraped, so that moving on to it costs next to nothing. The page is asked for no sooner than the
+            pacer allows. Has no effect in api_mode.
+        timings (Union[str, TimingModel]): Path to a file the latencies of the waits are kept in from one run to
+            the next, or a TimingModel of your own. Waits are shortened to what they are observed to take
+            either way; by default what was learned is forgotten when the scraper is.
+        blocked_resources (List[str]): Requests the browser refuses to make, as categories of
+            utils.blocking.BLOCKLISTS (images, media, fonts, analytics, messaging, ads) or URL patterns with *
+            wildcards. An empty list blocks DEFAULT_BLOCKED_RESOURCES, every category but images. A blocked
+            image keeps its URL, so company_img_link is still read. None, the default, blocks nothing.
+        observe_network (bool): Listen to the responses the browsers receive, over WebDriver BiDi, and pace the
+            run from what LinkedIn says of its rate limit: a Retry-After is waited out exactly, instead of a step
+            of the backoff ladder, and an X-RateLimit budget spaces the jobs over what is left of it. The time
+            spent listening is reported as listen_overhead. Relies on an API Selenium documents as internal. In
+            api_mode the headers are read off the requests themselves, with or without it.
+        rate_limiter (Union[str, RateLimiter]): The request budget of the account, shared with whatever else
+            scrapes with it. A path is a SQLite database every process of the host given the same path takes its
+            turns from; a LocalRateLimiter shares it between scrapers of one process. The account as a whole then
+            keeps to the pace, with a short burst allowed after a quiet spell, rather than each scraper keeping to
+            it on its own. None, the default, leaves the scraper the account to itself.
     """
 
     def __init__(
@@ -56,7 +137,24 @@ class LinkedinScraper:
             adaptive_slow_mo: bool = True,
             page_load_timeout=20,
             chrome_user_data_dir: str = None,
-            interactive_login: bool = False):
+            interactive_login: bool = False,
+            parallel_locations: bool = False,
+            reuse_drivers: bool = False,
+            driver_max_age: float = None,
+            driver_max_jobs: int = None,
+            api_mode: bool = False,
+            dispatch_events: bool = False,
+            dispatch_queue_size: int = DEFAULT_DISPATCH_QUEUE_SIZE,
+            dispatch_overflow: OverflowPolicy = OverflowPolicy.BLOCK,
+            seen_index: Union[str, SeenIndex] = None,
+            checkpoint_store: Union[str, CheckpointStore] = None,
+            pipeline_details: bool = False,
+            tabs_per_driver: int = 1,
+            prefetch_pages: bool = False,
+            timings: Union[str, TimingModel] = None,
+            blocked_resources: List[str] = None,
+            observe_network: bool = False,
+            rate_limiter: Union[str, RateLimiter] = None):
 
         # Input validation
         if chrome_executable_path is not None and not isinstance(chrome_executable_path, str):
@@ -90,6 +188,62 @@ class LinkedinScraper:
             raise ValueError('Input parameter interactive_login requires chrome_user_data_dir: signing in is only '
                              'worth doing into a profile that outlives the run')
 
+        if not isinstance(parallel_locations, bool):
+            raise ValueError('Input parameter parallel_locations must be of type bool')
+
+        if not isinstance(reuse_drivers, bool):
+            raise ValueError('Input parameter reuse_drivers must be of type bool')
+
+        if driver_max_age is not None and (not isinstance(driver_max_age, (int, float)) or driver_max_age <= 0):
+            raise ValueError('Input parameter driver_max_age must be a positive number of seconds')
+
+        if driver_max_jobs is not None and (not isinstance(driver_max_jobs, int) or driver_max_jobs < 1):
+            raise ValueError('Input parameter driver_max_jobs must be a positive integer')
+
+        if not isinstance(api_mode, bool):
+            raise ValueError('Input parameter api_mode must be of type bool')
+
+        if not isinstance(dispatch_events, bool):
+            raise ValueError('Input parameter dispatch_events must be of type bool')
+
+        if not isinstance(dispatch_queue_size, int) or dispatch_queue_size < 1:
+            raise ValueError('Input parameter dispatch_queue_size must be a positive integer')
+
+        if not isinstance(dispatch_overflow, OverflowPolicy):
+            raise ValueError('Input parameter dispatch_overflow must be an instance of enum class OverflowPolicy')
+
+        if seen_index is not None and not isinstance(seen_index, (str, SeenIndex)):
+            raise ValueError('Input parameter seen_index must be of type str or an instance of class SeenIndex')
+
+        if checkpoint_store is not None and not isinstance(checkpoint_store, (str, CheckpointStore)):
+            raise ValueError('Input parameter checkpoint_store must be of type str or an instance of class '
+                             'CheckpointStore')
+
+        if not isinstance(pipeline_details, bool):
+            raise ValueError('Input parameter pipeline_details must be of type bool')
+
+        if not isinstance(tabs_per_driver, int) or tabs_per_driver < 1:
+            raise ValueError('Input parameter tabs_per_driver must be a positive integer')
+
+        if not isinstance(prefetch_pages, bool):
+            raise ValueError('Input parameter prefetch_pages must be of type bool')
+
+        if timings is not None and not isinstance(timings, (str, TimingModel)):
+            raise ValueError('Input parameter timings must be of type str or an instance of class TimingModel')
+
+        if blocked_resources is not None and (not isinstance(blocked_resources, (list, tuple)) or
+                                              not all(isinstance(e, str) for e in blocked_resources)):
+            raise ValueError('Input parameter blocked_resources must be a list of str')
+
+        if not isinstance(observe_network, bool):
+            raise ValueError('Input parameter observe_network must be of type bool')
+
+        if rate_limiter is not None and not isinstance(rate_limiter, (str, RateLimiter)):
+            raise ValueError('Input parameter rate_limiter must be of type str or an instance of class RateLimiter')
+
+        # Raises on a name that is neither a category nor a pattern
+        self.blocked_urls = resolve_blocklist(blocked_resources)
+
         self.chrome_executable_path = chrome_executable_path
         self.chrome_binary_location = chrome_binary_location
         self.chrome_options = chrome_options
@@ -99,21 +253,64 @@ class LinkedinScraper:
         self.page_load_timeout = page_load_timeout
         self.chrome_user_data_dir = chrome_user_data_dir
         self.interactive_login = interactive_login
+        self.parallel_locations = parallel_locations
+        self.reuse_drivers = reuse_drivers
+        self.pipeline_details = pipeline_details
+        self.tabs_per_driver = tabs_per_driver
+        self.prefetch_pages = prefetch_pages
+
+        # Opened here only when given a path, and then closed here too
+        self._owns_rate_limiter = isinstance(rate_limiter, str)
+        self.rate_limiter = SqliteRateLimiter(rate_limiter) if isinstance(rate_limiter, str) else rate_limiter
 
         # One pacer for the whole scraper, not one per query thread: LinkedIn enforces its
         # limit per account, so a refusal one worker meets is a reason for all of them to
-        # slow down. It stays at slow_mo when the caller opted out of adapting.
+        # slow down. It stays at slow_mo when the caller opted out of adapting. Every report it
+        # is given is emitted as a PACE event.
         self.pacer = Pacer(
             floor=slow_mo,
             ceiling=min(PACING_CEILING_LIMIT, slow_mo * PACING_CEILING_FACTOR) if adaptive_slow_mo
-            else slow_mo)
+            else slow_mo,
+            limiter=self.rate_limiter,
+            on_sample=lambda sample: self.emit(Events.PACE, sample))
+
+        # One listener for every browser, feeding the one pacer
+        self.network = ResponseObserver(self.pacer) if observe_network else None
+
+        # The tabs of one browser share its profile, which is as many workers as a profile serves
+        if chrome_user_data_dir and max_workers > tabs_per_driver:
+            if tabs_per_driver == 1:
+                warn('A Chrome profile cannot be shared by concurrent browsers, running one worker')
+            else:
+                warn(f'A Chrome profile cannot be shared by concurrent browsers, running {tabs_per_driver} '
+                     f'workers, one per tab')
 
-        if chrome_user_data_dir and max_workers > 1:
-            warn('A Chrome profile cannot be shared by concurrent browsers, running one worker')
-            max_workers = 1
+            max_workers = tabs_per_driver
 
+        self.max_workers = max_workers
         self._pool = ThreadPoolExecutor(max_workers=max_workers)
         self._strategy: Strategy
+
+        # Every unit of work borrows its browser from here, so one browser serves every
+        # location a worker runs. Without reuse_drivers the idle ones are closed when the
+        # call that opened them returns, which is what every run did before the pool existed.
+        self._drivers = DriverPool(
+            factory=TabFactory(self.__build_driver, tabs_per_driver) if tabs_per_driver > 1 else self.__build_driver,
+            is_healthy=lambda driver: self._strategy.is_reusable(driver),
+            max_age=driver_max_age,
+            max_jobs=driver_max_jobs)
+
+        # The browser each worker thread has on loan, which is what a job emitted from that
+        # thread is counted against
+        self._leases = threading.local()
+
+        # Set by cancel() and cleared once no call it cancelled is left running. The calls are
+        # counted so that a cancel arriving once they are over has nothing to leave behind for
+        # the next one.
+        self._cancelled = threading.Event()
+        self._calls = 0
+        self._calls_lock = threading.Lock()
+
         self._emitter = {
             Events.DATA: [],
             Events.ERROR: [],
@@ -122,21 +319,58 @@ class LinkedinScraper:
             Events.INVALID_SESSION: [],
             Events.SESSION_REFRESHED: [],
             Events.NOT_FOUND: [],
+            Events.PACE: [],
             Events.END: [],
         }
 
+        # What calling the listeners costs, and with dispatch_events what waits to be delivered
+        self.dispatch_metrics = DispatchMetrics()
+
+        self._dispatcher = Dispatcher(
+            deliver=self.__deliver,
+            flush_batches=self.__flush_batches,
+            next_deadline=self.__next_batch_deadline,
+            metrics=self.dispatch_metrics,
+            max_size=dispatch_queue_size,
+            overflow=dispatch_overflow) if dispatch_events else None
+
+        # Opened here only when given a path, and then closed here too
+        self._owns_seen_index = isinstance(seen_index, str)
+        self.seen_index = SeenIndex(seen_index) if isinstance(seen_index, str) else seen_index
+
+        # Likewise
+        self._owns_checkpoint_store = isinstance(checkpoint_store, str)
+        self.checkpoint_store = SqliteCheckpointStore(checkpoint_store) if isinstance(checkpoint_store, str) \
+            else checkpoint_store
+
+        # Learned in memory unless a file is given, which is then written back on close
+        self._owns_timings = not isinstance(timings, TimingModel)
+        self.timings = timings if isinstance(timings, TimingModel) else TimingModel(timings)
+
+        # Whether the run in progress picks up where the checkpoints left off
+        self._resume = False
+
         # Every run authenticates, so there is one strategy and it is built unconditionally.
         # The constructor cannot tell whether a session will be available: a persistent profile
         # carries its own, and a caller can put --user-data-dir in their own chrome_options,
         # where no Config value describes the credential. So it warns about what it can see and
         # leaves the verdict to AuthenticatedStrategy.__authenticate, which says precisely what
         # is missing once a browser is open.
-        if not (Config.LI_AT_COOKIE or Config.LI_RM_COOKIE or Config.LI_BCOOKIE or chrome_user_data_dir):
+        if not self._credential_configured(chrome_user_data_dir):
             warn('No credential configured: unless the browser brings a session of its own, there '
                  'will be nothing to scrape with. Set LI_RM_COOKIE with LI_BCOOKIE, or sign in '
                  'once with linkedin-jobs-scraper login --chrome-user-data-dir <path>')
 
-        self._strategy = AuthenticatedStrategy(self)
+        self._strategy = VoyagerStrategy(self) if api_mode else AuthenticatedStrategy(self)
+
+    def _credential_configured(self, chrome_user_data_dir: str) -> bool:
+        """
+        Return True if the scraper can see a credential to scrape with
+        :param chrome_user_data_dir: str
+        :return: bool
+        """
+
+        return bool(Config.LI_AT_COOKIE or Config.LI_RM_COOKIE or Config.LI_BCOOKIE or chrome_user_data_dir)
 
     @staticmethod
     def __build_search_url(query: Query, location: Union[str, Location] = '') -> str:
@@ -212,14 +446,16 @@ class LinkedinScraper:
         parsed = parsed._replace(query=urlencode(params))
         return parsed.geturl()
 
-    def __emit_refreshed_session(self, driver) -> None:
+    def __emit_refreshed_session(self, pooled: PooledDriver) -> None:
         """
         Report the session cookie when it no longer matches the one supplied
 
-        :param driver: webdriver
+        :param pooled: PooledDriver
         :return: None
         """
 
+        driver = pooled.driver
+
         # The jar the driver exposes belongs to the page on screen, so a run that ended on an
         # error page reports no session at all - which is exactly the run whose caller most
         # needs the session that was issued along the way
@@ -234,12 +470,92 @@ class LinkedinScraper:
 
         li_at = get_session_cookie(driver)
 
-        if li_at and li_at != Config.LI_AT_COOKIE:
+        if li_at and li_at != Config.LI_AT_COOKIE and li_at != pooled.reported_li_at:
+            pooled.reported_li_at = li_at
             self.emit(Events.SESSION_REFRESHED, EventSession(li_at=li_at))
 
+    def __build_driver(self) -> webdriver:
+        """
+        Build a Chrome driver from the options the scraper was given
+        :return: webdriver
+        """
+
+        driver = build_driver(
+            executable_path=self.chrome_executable_path,
+            binary_location=self.chrome_binary_location,
+            options=self.chrome_options,
+            headless=self.headless,
+            chrome_user_data_dir=self.chrome_user_data_dir,
+            timeout=self.page_load_timeout,
+            background_tabs=self.tabs_per_driver > 1 or self.prefetch_pages,
+            bidi=self.network is not None
+        )
+
+        if self.network is not None:
+            self.network.attach(driver)
+
+        return driver
+
+    def __checkout(self) -> PooledDriver:
+        """
+        Borrow a browser for the calling worker thread
+        :return: PooledDriver
+        """
+
+        pooled = self._drivers.checkout()
+        self._leases.current = pooled
+        return pooled
+
+    def __checkin(self, pooled: PooledDriver) -> None:
+        """
+        Give the calling worker thread's browser back, reporting its session first
+        :param pooled: PooledDriver
+        :return: None
+        """
+
+        self._leases.current = None
+
+        try:
+            # A cancelled call has no listener left to tell, and quite possibly no browser
+            if not self._cancelled.is_set():
+                self.__emit_refreshed_session(pooled)
+        finally:
+            self._drivers.checkin(pooled)
+
+    def __release_drivers(self) -> None:
+        """
+        Close the idle browsers once a call is over, unless they are meant to outlive it
+        :return: None
+        """
+
+        if not self.reuse_drivers:
+            self._drivers.drain()
+
+    def __run_location(self, query: Query, location: Union[str, Location], driver: webdriver) -> None:
+        """
+        Run the strategy for one location of a query, on a browser that may already have served others
+        :param query: Query
+        :param location: Union[str, Location]
+        :param driver: webdriver
+        :return: None
+        """
+
+        # A location entry is a plain string or a Location; the strategy and
+        # EventData.location always receive the string label.
+        location_label = location.label if isinstance(location, Location) else location
+        search_url = LinkedinScraper.__build_search_url(query, location)
+
+        self._strategy.run(
+            driver,
+            search_url,
+            query,
+            location_label,
+            query.options.page_offset,
+        )
+
     def __run(self, query: Query) -> None:
         """
-        Run query in a new thread for each location
+        Run every location of a query, one after the other, on one browser
         :param query: Query
         :return: None
         """
@@ -249,44 +565,19 @@ class LinkedinScraper:
         info('Starting new query', str(query))
 
         try:
-            page_offset = query.options.page_offset
+            self.raise_if_cancelled()
 
-            driver = build_driver(
-                executable_path=self.chrome_executable_path,
-                binary_location=self.chrome_binary_location,
-                options=self.chrome_options,
-                headless=self.headless,
-                chrome_user_data_dir=self.chrome_user_data_dir,
-                timeout=self.page_load_timeout
-            )
+            pooled = self.__checkout()
 
             # One browser serves every location of the query: each new browser means
             # another session establishment for LinkedIn to look at
             try:
                 # Locations loop
                 for location in query.options.locations:
-                    # A location entry is a plain string or a Location; the strategy and
-                    # EventData.location always receive the string label.
-                    location_label = location.label if isinstance(location, Location) else location
-                    tag = f'[{query.query}][{location_label}]'
-                    search_url = LinkedinScraper.__build_search_url(query, location)
-
-                    # Run strategy
-                    self._strategy.run(
-                        driver,
-                        search_url,
-                        query,
-                        location_label,
-                        page_offset,
-                    )
-
-                self.__emit_refreshed_session(driver)
+                    tag = f'[{query.query}][{location.label if isinstance(location, Location) else location}]'
+                    self.__run_location(query, location, pooled.driver)
             finally:
-                try:
-                    debug(tag, 'Closing driver')
-                    driver.quit()
-                except BaseException:
-                    pass
+                self.__checkin(pooled)
         except CallbackException as e:
             error(tag, e)
             raise e
@@ -294,12 +585,96 @@ class LinkedinScraper:
             error(tag, e)
             raise e
         except BaseException as e:
+            # Whatever a cancelled call fails with, a browser closed under it included, is
+            # the cancellation rather than an error of its own
+            if self._cancelled.is_set():
+                info(tag, 'Cancelled')
+                return
+
             error(tag, e)
             self.emit(Events.ERROR, str(e) + '\n' + traceback.format_exc())
 
         # Emit END event
         self.emit(Events.END)
 
+    def __run_pair(self, query: Query, location: Union[str, Location], pending: dict,
+                   pending_lock: threading.Lock) -> None:
+        """
+        Run one (query, location) pair on whichever browser the pool lends the worker that picked it up
+
+        END still fires once per query, after its last location: the pairs of a query finish in
+        any order, so the one that brings its count of pending locations to zero emits it.
+
+        :param query: Query
+        :param location: Union[str, Location]
+        :param pending: dict how many locations of each query are still to finish
+        :param pending_lock: threading.Lock
+        :return: None
+        """
+
+        location_label = location.label if isinstance(location, Location) else location
+        tag = f'[{query.query}][{location_label}]'
+
+        info('Starting new location', tag)
+
+        try:
+            self.raise_if_cancelled()
+
+            pooled = self.__checkout()
+
+            try:
+                self.__run_location(query, location, pooled.driver)
+            finally:
+                self.__checkin(pooled)
+        except CallbackException as e:
+            error(tag, e)
+            raise e
+        except InvalidCookieException as e:
+            error(tag, e)
+            raise e
+        except BaseException as e:
+            # Whatever a cancelled call fails with, a browser closed under it included, is
+            # the cancellation rather than an error of its own
+            if self._cancelled.is_set():
+                info(tag, 'Cancelled')
+                return
+
+            error(tag, e)
+            self.emit(Events.ERROR, str(e) + '\n' + traceback.format_exc())
+
+        with pending_lock:
+            pending[id(query)] -= 1
+            is_last = pending[id(query)] == 0
+
+        if is_last:
+            self.emit(Events.END)
+
+    def __run_pairs(self, queries: List[Query]) -> list:
+        """
+        Submit every (query, location) pair as a unit of work of its own
+        :param queries: List[Query]
+        :return: list the futures of every unit of work
+        """
+
+        pending = {id(query): len(query.options.locations or []) for query in queries}
+        pending_lock = threading.Lock()
+
+        for query in queries:
+            info('Starting new query', str(query))
+
+        # Queries are submitted in order and locations within them, so the pool drains a
+        # query's locations before the next query's, and a worker that frees up early goes
+        # on with whatever remains of the one still running
+        futures = [self._pool.submit(self.__run_pair, query, location, pending, pending_lock)
+                   for query in queries
+                   for location in query.options.locations or []]
+
+        # A query holding no location has no pair to end it, and is left to the path that
+        # already reports it
+        futures += [self._pool.submit(self.__run, query) for query in queries if not query.options.locations]
+
+        return futures
+
     def scrape_job(self, url_or_id: str, apply_link: bool = False) -> None:
         """
         Scrape a single job by its url or id, bypassing search and pagination
@@ -319,25 +694,16 @@ class LinkedinScraper:
                 self.chrome_user_data_dir, self.chrome_executable_path, self.chrome_binary_location):
             raise RuntimeError('Interactive login did not establish a session, nothing to scrape with')
 
+        self.__begin_call()
+
         try:
-            driver = build_driver(
-                executable_path=self.chrome_executable_path,
-                binary_location=self.chrome_binary_location,
-                options=self.chrome_options,
-                headless=self.headless,
-                chrome_user_data_dir=self.chrome_user_data_dir,
-                timeout=self.page_load_timeout
-            )
+            pooled = self.__checkout()
 
             try:
-                self._strategy.scrape_job(driver, job_id, apply_link)
-                self.__emit_refreshed_session(driver)
+                self._strategy.scrape_job(pooled.driver, job_id, apply_link)
             finally:
-                try:
-                    debug(tag, 'Closing driver')
-                    driver.quit()
-                except BaseException:
-                    pass
+                self.__checkin(pooled)
+                self.__release_drivers()
         except CallbackException as e:
             error(tag, e)
             raise e
@@ -345,14 +711,157 @@ class LinkedinScraper:
             error(tag, e)
             raise e
         except BaseException as e:
+            # Whatever a cancelled call fails with, a browser closed under it included, is
+            # the cancellation rather than an error of its own
+            if self._cancelled.is_set():
+                info(tag, 'Cancelled')
+                return
+
             error(tag, e)
             self.emit(Events.ERROR, str(e) + '\n' + traceback.format_exc())
+        finally:
+            self.__end_call()
+
+    def __scrape_job_ids(self, urls_or_ids, urls_or_ids_lock: threading.Lock, stop: threading.Event,
+                         apply_link: bool, metrics: EventMetrics) -> None:
+        """
+        Scrape ids off a shared iterator until it runs dry, on one browser for as long as it stays fit
+
+        Between two ids the browser goes back to the pool and out again, which is where it is
+        checked and retired like any other unit of work: a batch of thousands of ids would
+        otherwise outlive every driver_max_age and driver_max_jobs it was given.
+
+        :param urls_or_ids: iterator over the job urls or ids still to scrape, shared by every worker
+        :param urls_or_ids_lock: threading.Lock
+        :param stop: threading.Event set when a worker met an error that ends the whole batch
+        :param apply_link: bool
+        :param metrics: EventMetrics this worker's own, merged by the caller once every worker is over
+        :return: None
+        """
+
+        pooled = None
+
+        try:
+            while not stop.is_set():
+                with urls_or_ids_lock:
+                    try:
+                        url_or_id = next(urls_or_ids)
+                    except StopIteration:
+                        break
+
+                tag = f'[job:{url_or_id}]'
+
+                try:
+                    job_id = get_job_id(url_or_id)
+                    tag = f'[job:{job_id}]'
+
+                    if pooled is not None:
+                        self.__checkin(pooled)
+                        pooled = None
+
+                    pooled = self.__checkout()
+
+                    self._strategy.scrape_job(pooled.driver, job_id, apply_link, metrics)
+                except (CallbackException, InvalidCookieException) as e:
+                    error(tag, e)
+                    stop.set()
+                    raise e
+                except BaseException as e:
+                    if self._cancelled.is_set():
+                        info(tag, 'Cancelled')
+                        break
+
+                    error(tag, e)
+                    metrics.failed += 1
+                    self.emit(Events.ERROR, str(e) + '\n' + traceback.format_exc())
+        finally:
+            if pooled is not None:
+                self.__checkin(pooled)
+
+    def scrape_jobs(self, urls_or_ids: Iterable[str], apply_link: bool = False) -> None:
+        """
+        Scrape many jobs by their url or id, each on a browser that has already scraped the previous ones
 
-    def run(self, queries: Union[Query, List[Query]], options: QueryOptions = None) -> None:
+        The ids are shared by max_workers workers, each holding one browser and one session for
+        the whole batch and going straight from one job panel to the next, so a batch costs a
+        browser launch per worker rather than per id. Every id emits DATA or NOT_FOUND exactly
+        as scrape_job would, and the batch ends with one METRICS event counting them all.
+
+        The ids are read lazily, so a generator over a large export is never held in memory.
+
+        :param urls_or_ids: Iterable[str] numeric ids, '/jobs/view/<id>' urls or '?currentJobId=<id>' urls
+        :param apply_link: bool
+        :return: None
+        """
+
+        # A string is an iterable too, and would otherwise be scraped one digit at a time
+        if isinstance(urls_or_ids, str) or not isinstance(urls_or_ids, Iterable):
+            raise ValueError('Parameter urls_or_ids must be an iterable of job urls or ids')
+
+        info('Starting batch job scrape')
+
+        # Chrome locks a profile directory, so the sign in has to be over before a browser
+        # opens on it
+        if self.interactive_login and not ensure_session(
+                self.chrome_user_data_dir, self.chrome_executable_path, self.chrome_binary_location):
+            raise RuntimeError('Interactive login did not establish a session, nothing to scrape with')
+
+        # Read lazily, one id at a time: an id that cannot be parsed fails when it is reached
+        # rather than up front, which would mean reading the whole iterable before the first job
+        urls_or_ids = iter(urls_or_ids)
+        urls_or_ids_lock = threading.Lock()
+        stop = threading.Event()
+
+        worker_metrics = [EventMetrics() for _ in range(self.max_workers)]
+
+        self.__begin_call()
+
+        try:
+            futures = [self._pool.submit(self.__scrape_job_ids, urls_or_ids, urls_or_ids_lock, stop, apply_link,
+                                         metrics)
+                       for metrics in worker_metrics]
+
+            wait(futures)
+
+            try:
+                [f.result() for f in futures]  # Necessary also to get exceptions from futures
+            except CancelledException:
+                # A worker that was cancelled between two of its own checks
+                info('Cancelled')
+            finally:
+                self.__release_drivers()
+
+            # A cancelled batch has nobody left to report to
+            if self._cancelled.is_set():
+                return
+        finally:
+            self.__end_call()
+
+        metrics = EventMetrics()
+
+        for m in worker_metrics:
+            metrics.processed += m.processed
+            metrics.failed += m.failed
+            metrics.missed += m.missed
+            metrics.skipped += m.skipped
+            metrics.transferred += m.transferred
+
+        metrics.throttled = self.pacer.throttled_count
+        metrics.pace = round(self.pacer.delay_of(RequestClass.DETAILS), 2)
+
+        if self.network is not None:
+            metrics.listen_overhead = round(self.network.overhead, 3)
+
+        info('[batch]', str(metrics))
+
+        self.emit(Events.METRICS, metrics)
+
+    def run(self, queries: Union[Query, List[Query]], options: QueryOptions = None, resume: bool = False) -> None:
         """
         Run a query or a list of queries
         :param queries: Union[Query, List[Query]]
         :param options: QueryOptions
+        :param resume: bool start every location where the checkpoint of its last crawl stopped
         :return: None
         """
 
@@ -360,6 +869,12 @@ class LinkedinScraper:
         if queries is None:
             raise ValueError('Parameter queries is missing')
 
+        if not isinstance(resume, bool):
+            raise ValueError('Parameter resume must be a boolean')
+
+        if resume and self.checkpoint_store is None:
+            raise ValueError('Parameter resume requires a scraper built with a checkpoint_store')
+
         if not isinstance(queries, list):
             queries = [queries]
 
@@ -380,14 +895,262 @@ class LinkedinScraper:
         for query in queries:
             query.merge_options(global_options)
 
+            if (query.options.only_new or query.options.stop_after_seen) and self.seen_index is None:
+                raise ValueError('Options only_new and stop_after_seen require a scraper built with a seen_index')
+
+            if query.options.apply_link and not query.options.details:
+                raise ValueError('Option apply_link requires details: the apply button is in the details panel')
+
+            # A watermark is where the newest results end and the known ones begin, which
+            # only holds for results sorted newest first
+            if (query.options.stop_at_job_id or query.options.stop_before or query.options.stop_after_seen) and \
+                    (query.options.filters is None or query.options.filters.relevance != RelevanceFilters.RECENT):
+                warn(f'[{query.query}]', 'A watermark stops the crawl early only when results are sorted by '
+                                         'RelevanceFilters.RECENT, jobs past it may be missed')
+
         # Chrome locks a profile directory, so the sign in has to be over before any worker
         # opens a browser on it
         if self.interactive_login and not ensure_session(
                 self.chrome_user_data_dir, self.chrome_executable_path, self.chrome_binary_location):
             raise RuntimeError('Interactive login did not establish a session, nothing to scrape with')
 
-        futures = [self._pool.submit(self.__run, query) for query in queries]
-        [f.result() for f in futures]  # Necessary also to get exceptions from futures
+        self.__begin_call()
+        self._resume = resume
+
+        try:
+            self._run_queries(queries)
+        finally:
+            self._resume = False
+            self.__end_call()
+
+    def _run_queries(self, queries: List[Query]) -> None:
+        """
+        Run queries already validated and merged with the global options, on this scraper's workers
+        :param queries: List[Query]
+        :return: None
+        """
+
+        if self.parallel_locations:
+            futures = self.__run_pairs(queries)
+        else:
+            futures = [self._pool.submit(self.__run, query) for query in queries]
+
+        # Every unit of work has to be over before the idle browsers are closed: a failure
+        # surfacing from one future says nothing about the others still running
+        wait(futures)
+
+        try:
+            [f.result() for f in futures]  # Necessary also to get exceptions from futures
+        except CancelledException:
+            # A worker that was cancelled between two of its own checks
+            info('Cancelled')
+        finally:
+            self.__release_drivers()
+
+    def iter_results(self, queries: Union[Query, List[Query]], options: QueryOptions = None,
+                     max_buffer: int = DEFAULT_MAX_BUFFER) -> Iterator[EventData]:
+        """
+        Run a query or a list of queries, yielding every job it scrapes instead of emitting it
+
+        The run starts with the iteration, on a thread of its own. Jobs wait in a buffer of
+        max_buffer jobs until they are taken, and a worker with a full buffer in front of it
+        waits for room rather than scraping ahead: memory stays bounded by max_buffer whatever
+        the consumer does with what it takes, and nothing is ever dropped.
+
+        Closing the generator before it is exhausted, breaking out of a for loop over it
+        included, cancels the rest of the run and returns once every worker is over. An
+        exception raised by the run is raised by the generator once the jobs scraped before it
+        have been taken.
+
+        Every event still goes to the listeners registered with on(), DATA included. Only one
+        iteration may run on a scraper at a time.
+
+        :param queries: Union[Query, List[Query]]
+        :param options: QueryOptions
+        :param max_buffer: int the most jobs waiting to be taken
+        :return: Iterator[EventData]
+        """
+
+        if not isinstance(max_buffer, int) or max_buffer < 1:
+            raise ValueError('Parameter max_buffer must be a positive integer')
+
+        buffer = queue.Queue(maxsize=max_buffer)
+        closed = threading.Event()
+        finished = object()
+        failures = []
+
+        def push(data: EventData) -> None:
+            # A consumer that went away before the run began had nothing to cancel then
+            if closed.is_set():
+                self.cancel()
+                self.raise_if_cancelled()
+
+            while True:
+                try:
+                    buffer.put(data, timeout=BUFFER_CHECK_INTERVAL)
+                    return
+                except queue.Full:
+                    self.raise_if_cancelled()
+
+        def produce() -> None:
+            try:
+                if not closed.is_set():
+                    self.run(queries, options)
+            except BaseException as e:
+                failures.append(e)
+            finally:
+                while not closed.is_set():
+                    try:
+                        buffer.put(finished, timeout=BUFFER_CHECK_INTERVAL)
+                        break
+                    except queue.Full:
+                        continue
+
+        self.on(Events.DATA, push)
+
+        producer = threading.Thread(target=produce, name='linkedin-jobs-scraper-results', daemon=True)
+        producer.start()
+
+        try:
+            while True:
+                data = buffer.get()
+
+                if data is finished:
+                    break
+
+                yield data
+
+            if failures:
+                raise failures[0]
+        finally:
+            closed.set()
+
+            if producer.is_alive():
+                self.cancel()
+                producer.join()
+
+            self.remove_listener(Events.DATA, push)
+
+    def __begin_call(self) -> None:
+        """
+        Count a call to run, scrape_job or scrape_jobs in, so that cancel() knows there is one
+        :return: None
+        """
+
+        with self._calls_lock:
+            self._calls += 1
+
+    def __end_call(self) -> None:
+        """
+        Count a call out once every worker it started is over, clearing the cancel after the last one
+
+        The events the call emitted are all delivered first, partial batches included, so that
+        a caller finds its listeners done with the call once it returns.
+
+        :return: None
+        """
+
+        try:
+            if self._dispatcher is not None:
+                self._dispatcher.flush()
+                debug('Dispatch metrics', str(self.dispatch_metrics))
+            else:
+                self.__flush_batches(False)
+        finally:
+            self.__count_call_out()
+
+    def __count_call_out(self) -> None:
+        """
+        Count a call out, clearing the cancel once no call is left
+        :return: None
+        """
+
+        with self._calls_lock:
+            self._calls -= 1
+
+            # Only once every worker is over: one still unwinding must go on seeing the cancel
+            if self._calls == 0:
+                self._cancelled.clear()
+
+    def cancel(self) -> None:
+        """
+        Stop the call to run, scrape_job or scrape_jobs in progress, from any thread
+
+        Every browser in use is closed on the spot, so a worker in the middle of a page load
+        or a wait fails straight away rather than once it is over, and every worker leaves at
+        the next job it would have started or reported. The call then returns normally, with
+        no END for the queries it did not finish. Idle browsers kept by reuse_drivers stay.
+
+        With no call in progress there is nothing to cancel, and the next call runs as usual.
+
+        :return: None
+        """
+
+        with self._calls_lock:
+            if not self._calls:
+                return
+
+            self._cancelled.set()
+
+        info('Cancelling')
+
+        self._drivers.interrupt()
+
+    def checkpoint(self, key: str) -> Checkpoint:
+        """
+        Return the checkpoint a strategy keeps the progress of one (query, location) in
+        :param key: str what identifies the crawl, its search url
+        :return: Checkpoint
+        """
+
+        return Checkpoint(self.checkpoint_store, key, self._resume)
+
+    def raise_if_cancelled(self) -> None:
+        """
+        Raise CancelledException if the call in progress was cancelled, for a worker to unwind
+        :return: None
+        """
+
+        if self._cancelled.is_set():
+            raise CancelledException('The call was cancelled')
+
+    def close(self) -> None:
+        """
+        Close every browser the scraper keeps and stop its workers
+        :return: None
+        """
+
+        self._drivers.close()
+        self._pool.shutdown(wait=True)
+
+        if self._dispatcher is not None:
+            self._dispatcher.close()
+
+        if self.seen_index is not None and self._owns_seen_index:
+            self.seen_index.close()
+
+        if self.checkpoint_store is not None and self._owns_checkpoint_store:
+            self.checkpoint_store.close()
+
+        debug('Learned timings', self.timings.snapshot())
+        debug('Pacing by request class', self.pacer.snapshot())
+
+        if self.network is not None:
+            debug(f'Read {self.network.events} responses, {self.network.hints} of them about the rate limit, '
+                  f'in {round(self.network.overhead, 3)}s')
+            self.network.close()
+
+        if self.rate_limiter is not None and self._owns_rate_limiter:
+            self.rate_limiter.close()
+
+        if self._owns_timings:
+            self.timings.save()
+
+    def __enter__(self) -> 'LinkedinScraper':
+        return self
+
+    def __exit__(self, exc_type, exc_value, exc_traceback) -> None:
+        self.close()
 
     def on(self, event: Events, cb: Callable, once=False) -> None:
         """
@@ -404,7 +1167,8 @@ class LinkedinScraper:
         if not callable(cb):
             raise ValueError('Callback must be callable')
 
-        if event in (Events.DATA, Events.ERROR, Events.METRICS, Events.SESSION_REFRESHED, Events.BEGIN, Events.NOT_FOUND):
+        if event in (Events.DATA, Events.ERROR, Events.METRICS, Events.SESSION_REFRESHED, Events.BEGIN, Events.NOT_FOUND,
+                     Events.PACE):
             allowed_params = 1
         else:
             allowed_params = 0
@@ -412,7 +1176,43 @@ class LinkedinScraper:
         if len(signature(cb).parameters) != allowed_params:
             raise ValueError(f'Callback for event {event} must have {allowed_params} arguments')
 
-        self._emitter[event].append({'cb': cb, 'once': once})
+        self._emitter[event].append({'cb': cb, 'once': once, 'batch': None})
+
+    def on_batch(self, event: Events, cb: Callable, max_size: int = 100, max_latency: float = 1.0) -> None:
+        """
+        Add callback receiving the payloads of the given event in lists, rather than one at a time
+
+        A batch is delivered once it holds max_size payloads, once its oldest payload has waited
+        max_latency seconds, and at the end of every call, so that no payload outlives the call
+        that emitted it. With dispatch_events the dispatcher delivers a batch on time even when
+        no further event comes; without, the latency is checked whenever the event is emitted.
+
+        :param event: Events one carrying a payload, DATA typically
+        :param cb: Callable taking the list of payloads
+        :param max_size: int
+        :param max_latency: float seconds
+        :return: None
+        """
+
+        if not isinstance(event, Events):
+            raise ValueError(f'Event must be an instance of enum class Events')
+
+        if event in (Events.END, Events.INVALID_SESSION):
+            raise ValueError(f'Event {event} carries no payload to batch')
+
+        if not callable(cb):
+            raise ValueError('Callback must be callable')
+
+        if len(signature(cb).parameters) != 1:
+            raise ValueError(f'Callback for batches of event {event} must have 1 arguments')
+
+        if not isinstance(max_size, int) or max_size < 1:
+            raise ValueError('Parameter max_size must be a positive integer')
+
+        if not isinstance(max_latency, (int, float)) or max_latency <= 0:
+            raise ValueError('Parameter max_latency must be a positive number of seconds')
+
+        self._emitter[event].append({'cb': cb, 'once': False, 'batch': EventBatch(max_size, max_latency)})
 
     def once(self, event: Events, cb: Callable) -> None:
         """
@@ -435,14 +1235,118 @@ class LinkedinScraper:
         if not isinstance(event, Events):
             raise ValueError(f'Event must be an instance of enum class Events')
 
+        # Every worker reports what it does, so this is where a cancelled one finds out. A PACE
+        # is not a report of the worker's but of the pacer's, made from inside its accounting
+        # and from the thread reading the responses, neither of which is the place to unwind.
+        if event != Events.PACE:
+            self.raise_if_cancelled()
+
+        # A browser is retired after driver_max_jobs jobs, and the jobs it scraped are the ones
+        # emitted from the thread it is on loan to
+        if event == Events.DATA:
+            lease = getattr(self._leases, 'current', None)
+
+            if lease is not None:
+                lease.jobs += 1
+
+        handed_over = True
+
+        if self._dispatcher is not None:
+            # The strategy goes on counting on the metrics it emitted, which may well be before
+            # they are delivered: what is queued is the count at the time
+            args = tuple(copy(arg) if isinstance(arg, EventMetrics) else arg for arg in args)
+            handed_over = self._dispatcher.put(event, args, droppable=event == Events.DATA)
+        else:
+            self.__deliver(event, args)
+
+        # Only once it has been handed over: a job a listener failed on inline, or the DROP
+        # policy discarded, is not one the next run can leave out
+        if event == Events.DATA and handed_over and self.seen_index is not None:
+            self.seen_index.add([args[0].job_id])
+
+    def __deliver(self, event: Events, args: tuple) -> None:
+        """
+        Call the listeners of an event, on whichever thread delivers it
+        :param event: Events
+        :param args: tuple
+        :return: None
+        """
+
+        fired_once = False
+
         for listener in self._emitter[event]:
-            try:
-                listener['cb'](*args)
-            except BaseException as e:
+            if listener['batch'] is not None:
+                items = listener['batch'].add(args[0])
+
+                if items is not None:
+                    self.__call_listener(event, listener['cb'], items)
+
+                continue
+
+            self.__call_listener(event, listener['cb'], *args)
+            fired_once = fired_once or listener['once']
+
+        # Remove 'once' callbacks, rebuilding the list only when one of them has just fired
+        if fired_once:
+            self._emitter[event] = [e for e in self._emitter[event] if not e['once']]
+
+    def __call_listener(self, event: Events, cb: Callable, *args) -> None:
+        """
+        Call one listener, timing it, and deal with what it raises
+        :param event: Events
+        :param cb: Callable
+        :param args: args
+        :return: None
+        """
+
+        started = monotonic()
+        failed = False
+
+        try:
+            cb(*args)
+        except CancelledException:
+            raise
+        except BaseException as e:
+            failed = True
+
+            # Inline, the worker that emitted the event is the caller to tell. The dispatcher
+            # has no caller, and every other listener still to serve.
+            if self._dispatcher is None:
                 raise CallbackException(str(e) + '\n' + traceback.format_exc())
 
-        # Remove 'once' callbacks
-        self._emitter[event] = [e for e in self._emitter[event] if not e['once']]
+            error(f'A listener of {event} failed', e, traceback.format_exc(), exc_info=False)
+        finally:
+            self.dispatch_metrics.record_callback(monotonic() - started, failed)
+
+    def __flush_batches(self, due_only: bool) -> None:
+        """
+        Deliver the batches waiting, or only those that have waited max_latency
+        :param due_only: bool
+        :return: None
+        """
+
+        for event, listeners in self._emitter.items():
+            for listener in listeners:
+                if listener['batch'] is not None:
+                    items = listener['batch'].take(due_only)
+
+                    if items is not None:
+                        self.__call_listener(event, listener['cb'], items)
+
+    def __next_batch_deadline(self) -> Union[float, None]:
+        """
+        Return when the next batch falls due, None when no batch holds anything
+        :return: Union[float, None] a monotonic time
+        """
+
+        deadlines = [listener['batch'].deadline
+                     for listeners in self._emitter.values()
+                     for listener in listeners
+                     if listener['batch'] is not None]
+
+        deadlines = [deadline for deadline in deadlines if deadline is not None]
+
+        return min(deadlines) if deadlines else None
 
     def remove_listener(self, event: Events, cb: Callable) -> bool:
         """
@@ -1,4 +1,6 @@
+from datetime import date
 from typing import List, Union
+from ..events import EventData
 from ..filters import TimeFilters, ExperienceLevelFilters, TypeFilters, RelevanceFilters, OnSiteOrRemoteFilters, IndustryFilters, SalaryBaseFilters
 from ..utils.url import get_query_params
 
@@ -105,7 +107,13 @@ class QueryOptions(__Base):
                  filters: QueryFilters = None,
                  apply_link: bool = None,
                  skip_promoted_jobs: bool = None,
-                 page_offset: int = None):
+                 page_offset: int = None,
+                 only_new: bool = None,
+                 stop_at_job_id: str = None,
+                 stop_before: date = None,
+                 stop_after_seen: int = None,
+                 details: bool = None,
+                 fields: List[str] = None):
 
         super().__init__()
 
@@ -118,6 +126,12 @@ class QueryOptions(__Base):
         self.apply_link = apply_link
         self.skip_promoted_jobs = skip_promoted_jobs
         self.page_offset = page_offset
+        self.only_new = only_new
+        self.stop_at_job_id = stop_at_job_id
+        self.stop_before = stop_before
+        self.stop_after_seen = stop_after_seen
+        self.details = details
+        self.fields = fields
 
     def validate(self):
         if self.limit is not None:
@@ -142,6 +156,28 @@ class QueryOptions(__Base):
             if not isinstance(self.page_offset, int) or self.page_offset < 0:
                 raise ValueError('Parameter page_offset must be a positive integer')
 
+        if self.only_new is not None and not isinstance(self.only_new, bool):
+            raise ValueError('Parameter only_new must be a boolean')
+
+        if self.stop_at_job_id is not None and (not isinstance(self.stop_at_job_id, str) or len(self.stop_at_job_id) == 0):
+            raise ValueError('Parameter stop_at_job_id must be a non-empty string')
+
+        if self.stop_before is not None and not isinstance(self.stop_before, date):
+            raise ValueError('Parameter stop_before must be a date or a datetime')
+
+        if self.stop_after_seen is not None:
+            if not isinstance(self.stop_after_seen, int) or self.stop_after_seen < 1:
+                raise ValueError('Parameter stop_after_seen must be a positive integer')
+
+        if self.details is not None and not isinstance(self.details, bool):
+            raise ValueError('Parameter details must be a boolean')
+
+        if self.fields is not None:
+            if not isinstance(self.fields, List) or len(self.fields) == 0 or any(
+                    [e not in EventData._fields for e in self.fields]):
+                raise ValueError(f'Parameter fields must be a non-empty list of EventData fields: '
+                                 f'{", ".join(EventData._fields)}')
+
         if self.filters is not None:
             self.filters.validate()
 
@@ -166,6 +202,24 @@ class Query(__Base):
         if self.options.page_offset is None:
             self.options.page_offset = options.page_offset if options.page_offset is not None else 0
 
+        if self.options.only_new is None:
+            self.options.only_new = options.only_new if options.only_new is not None else False
+
+        if self.options.details is None:
+            self.options.details = options.details if options.details is not None else True
+
+        if self.options.fields is None:
+            self.options.fields = options.fields
+
+        if self.options.stop_at_job_id is None:
+            self.options.stop_at_job_id = options.stop_at_job_id
+
+        if self.options.stop_before is None:
+            self.options.stop_before = options.stop_before
+
+        if self.options.stop_after_seen is None:
+            self.options.stop_after_seen = options.stop_after_seen
+
         if self.options.locations is None and options.locations is not None:
             self.options.locations = options.locations
 
@@ -0,0 +1,574 @@
+import copy
+import multiprocessing
+import queue
+import threading
+import traceback
+from time import sleep
+from typing import Callable, Iterator, List, Union
+from .linkedin_scraper import LinkedinScraper, DEFAULT_MAX_BUFFER
+from .config import Config
+from .query import Query, QueryOptions
+from .events import Events, EventData, EventMetrics
+from .exceptions import CancelledException
+from .utils.logger import debug, info, warn, error
+from .utils.seen_index import SeenIndex
+from .utils.checkpoint import CheckpointStore, SqliteCheckpointStore
+from .events.dispatch import DispatchMetrics
+
+# Seconds the parent waits for news from its shards before it checks that they are still alive
+SHARD_POLL_INTERVAL = 0.5
+
+# Seconds a shard is given to close its browsers and exit once the run is over, before it is killed
+SHARD_EXIT_TIMEOUT = 30
+
+# Constructor arguments that belong to the parent, where the events are delivered
+_PARENT_ONLY_ARGUMENTS = ('dispatch_events', 'dispatch_queue_size', 'dispatch_overflow')
+
+# Constructor arguments that belong to the shards, which open the browsers and learn the
+# timings. The parent is built without them: it would otherwise keep a pool, a network observer
+# and a timing model of its own, and closing it would save its empty model over the shards'.
+_SHARD_ONLY_ARGUMENTS = ('chrome_executable_path', 'chrome_binary_location', 'chrome_options', 'headless',
+                         'page_load_timeout', 'reuse_drivers', 'driver_max_age', 'driver_max_jobs',
+                         'pipeline_details', 'tabs_per_driver', 'prefetch_pages', 'timings', 'blocked_resources',
+                         'observe_network')
+
+# Events a shard forwards, and how many arguments their listeners take. END is not among them:
+# a shard runs one location of a query at a time, and only the parent knows when a query is over.
+_FORWARDED_EVENTS = {
+    Events.DATA: 1,
+    Events.ERROR: 1,
+    Events.METRICS: 1,
+    Events.BEGIN: 1,
+    Events.NOT_FOUND: 1,
+    Events.SESSION_REFRESHED: 1,
+    Events.PACE: 1,
+    Events.INVALID_SESSION: 0,
+}
+
+
+class Credential:
+    """The LinkedIn account a shard scrapes with.
+
+    Any of the ways the scraper authenticates will do: a session cookie (li_at), a remember me
+    cookie with the browser id it was issued to (li_rm and bcookie), or a Chrome profile that
+    holds a session of its own (chrome_user_data_dir).
+    """
+
+    def __init__(self, li_at: str = None, li_rm: str = None, bcookie: str = None, chrome_user_data_dir: str = None):
+        self.li_at = li_at
+        self.li_rm = li_rm
+        self.bcookie = bcookie
+        self.chrome_user_data_dir = chrome_user_data_dir
+
+    def validate(self):
+        for name in ('li_at', 'li_rm', 'bcookie', 'chrome_user_data_dir'):
+            value = getattr(self, name)
+
+            if value is not None and (not isinstance(value, str) or len(value) == 0):
+                raise ValueError(f'Parameter {name} must be a non-empty string')
+
+        if (self.li_rm is None) != (self.bcookie is None):
+            raise ValueError('Parameters li_rm and bcookie must be given together')
+
+        if not (self.li_at or self.li_rm or self.chrome_user_data_dir):
+            raise ValueError('A credential needs li_at, li_rm with bcookie, or chrome_user_data_dir')
+
+    def __str__(self):
+        # Never the cookies themselves, which end up in logs
+        kind = 'profile' if self.chrome_user_data_dir else 'li_rm' if self.li_rm else 'li_at'
+        return f'Credential({kind})'
+
+
+def _forwarder(results, shard: int, event: Events, arity: int) -> Callable:
+    """
+    Build the listener a shard forwards one event to its parent with
+    :param results: multiprocessing.Queue
+    :param shard: int
+    :param event: Events
+    :param arity: int
+    :return: Callable
+    """
+
+    if arity == 0:
+        return lambda: results.put(('event', shard, event, ()))
+
+    def forward(payload) -> None:
+        # The queue pickles on a thread of its own, by which time the strategy may well have
+        # gone on counting on the metrics it emitted
+        if isinstance(payload, EventMetrics):
+            payload = copy.copy(payload)
+
+        results.put(('event', shard, event, (payload,)))
+
+    return forward
+
+
+def _run_shard(shard: int, credential: Credential, queries: List[Query], scraper_kwargs: dict,
+               scraper_factory: Callable, resume: bool, tasks, results, stop) -> None:
+    """
+    Run in a process of its own: take (query, location) pairs off the shared queue until told to stop
+    :param shard: int
+    :param credential: Credential
+    :param queries: List[Query]
+    :param scraper_kwargs: dict
+    :param scraper_factory: Callable building the shard's scraper from scraper_kwargs
+    :param resume: bool
+    :param tasks: multiprocessing.Queue the pairs, shared by every shard
+    :param results: multiprocessing.Queue what the shard reports to its parent
+    :param stop: multiprocessing.Event set by the parent when the run is over or cancelled
+    :return: None
+    """
+
+    scraper = None
+    workers = []
+
+    try:
+        # The process has the account to itself, which is the reason it exists: the scraper
+        # reads its credential from Config, and Config is per process
+        Config.LI_AT_COOKIE = credential.li_at
+        Config.LI_RM_COOKIE = credential.li_rm
+        Config.LI_BCOOKIE = credential.bcookie
+
+        # Every pair is a call of its own, and the browsers are what they should share
+        scraper = scraper_factory(**scraper_kwargs, chrome_user_data_dir=credential.chrome_user_data_dir,
+                                  reuse_drivers=True)
+
+        for event, arity in _FORWARDED_EVENTS.items():
+            scraper.on(event, _forwarder(results, shard, event, arity))
+
+        stop_shard = threading.Event()
+
+        def work() -> None:
+            while not stop.is_set() and not stop_shard.is_set():
+                try:
+                    task = tasks.get(timeout=SHARD_POLL_INTERVAL)
+                except queue.Empty:
+                    continue
+
+                if task is None:
+                    return
+
+                # Taken by a worker that was waiting when another pair of the shard failed
+                if stop_shard.is_set():
+                    tasks.put(task)
+                    return
+
+                query_index, location = task
+                pair = copy.deepcopy(queries[query_index])
+                pair.options.locations = [location]
+
+                results.put(('start', shard, task))
+
+                try:
+                    scraper.run(pair, resume=resume)
+                except BaseException as e:
+                    # The credential is what fails a whole pair, and it would fail every other
+                    # one this shard took: the pair goes back for another shard to steal
+                    tasks.put(task)
+                    results.put(('failed', shard, task, str(e) + '\n' + traceback.format_exc()))
+                    stop_shard.set()
+                    return
+
+                # A pair the shard cut short when one of its other pairs failed is not done
+                if stop_shard.is_set() and not stop.is_set():
+                    tasks.put(task)
+                    results.put(('returned', shard, task))
+                    return
+
+                results.put(('done', shard, task))
+
+        workers = [threading.Thread(target=work, daemon=True) for _ in range(scraper.max_workers)]
+
+        for worker in workers:
+            worker.start()
+
+        # Polled rather than waited on: setting a multiprocessing Event waits for every process
+        # sleeping on it to wake up, and a shard that has exited never does
+        while any(worker.is_alive() for worker in workers) and not stop.is_set() and not stop_shard.is_set():
+            sleep(SHARD_POLL_INTERVAL)
+    except BaseException as e:
+        results.put(('failed', shard, None, str(e) + '\n' + traceback.format_exc()))
+    finally:
+        if scraper is not None:
+            scraper.cancel()
+
+            # What the workers still have to report has to be sent before the process exits
+            for worker in workers:
+                worker.join(timeout=SHARD_EXIT_TIMEOUT)
+
+            scraper.close()
+
+        results.put(('exit', shard))
+
+
+class _ShardEvents(LinkedinScraper):
+    """The scraper a ShardedScraper runs through, in the parent process.
+
+    It checks a run's queries and delivers every event of it, as any LinkedinScraper does, and
+    hands the queries to the shards instead of to workers of its own. It never opens a browser.
+    """
+
+    def __init__(self, sharded: 'ShardedScraper', **kwargs):
+        self._sharded = sharded
+        super().__init__(**kwargs)
+
+    def _credential_configured(self, chrome_user_data_dir: str) -> bool:
+        # The credentials are the shards', and were checked by the ShardedScraper
+        return True
+
+    def _run_queries(self, queries: List[Query]) -> None:
+        self._sharded._run_shards(queries, self._resume)
+
+    def cancel(self) -> None:
+        super().cancel()
+        self._sharded._stop_shards()
+
+
+class ShardedScraper:
+    """
+    Args:
+        credentials (List[Credential]): One LinkedIn account per shard. Each shard is a process of its own,
+            with its own browsers and its own pacer, so each account is paced on its own refusals only.
+        scraper_factory (Callable): Builds the scraper of a shard, in the shard's process, from the keyword
+            arguments the ShardedScraper was given. It has to be picklable, a module-level function or class.
+            LinkedinScraper when None.
+        **kwargs: Any argument of LinkedinScraper, passed on to every shard. max_workers is per shard, so a run
+            keeps up to max_workers browsers open per credential. chrome_user_data_dir and interactive_login
+            belong to a credential and are refused here. dispatch_events, dispatch_queue_size and
+            dispatch_overflow apply to the parent, where every listener runs. The arguments about browsers,
+            the network and timings apply to the shards only, and are checked as each shard builds its scraper.
+
+    A sharded run is a search run: jobs by id are scraped with a LinkedinScraper.
+    """
+
+    def __init__(self, credentials: List[Credential], scraper_factory: Callable = None, **kwargs):
+        if not isinstance(credentials, list) or len(credentials) == 0:
+            raise ValueError('Input parameter credentials must be a non-empty list of Credential')
+
+        for credential in credentials:
+            if not isinstance(credential, Credential):
+                raise ValueError(f'A credential must be an instance of class Credential, found {type(credential)}')
+            credential.validate()
+
+        if scraper_factory is not None and not callable(scraper_factory):
+            raise ValueError('Input parameter scraper_factory must be callable')
+
+        if kwargs.get('chrome_user_data_dir') is not None:
+            raise ValueError('Input parameter chrome_user_data_dir is per shard: set it on a Credential')
+
+        if kwargs.get('interactive_login'):
+            raise ValueError('Input parameter interactive_login is not supported by a sharded run, which has '
+                             'nobody to sign in for each shard')
+
+        if kwargs.get('rate_limiter') is not None:
+            raise ValueError('Input parameter rate_limiter is per account, and every shard scrapes with an account '
+                             'of its own')
+
+        self.credentials = credentials
+        self.scraper_factory = scraper_factory or LinkedinScraper
+
+        # Each shard builds its own scraper from these, and keeps its browsers between pairs
+        self._shard_kwargs = {k: v for k, v in kwargs.items() if k not in _PARENT_ONLY_ARGUMENTS and k != 'reuse_drivers'}
+
+        # A connection does not cross processes, the file it is open on does
+        if isinstance(kwargs.get('seen_index'), SeenIndex):
+            self._shard_kwargs['seen_index'] = kwargs['seen_index'].path
+
+        if isinstance(kwargs.get('checkpoint_store'), CheckpointStore):
+            # Any other store reaches the shards pickled, so it has to survive that
+            store = kwargs['checkpoint_store']
+            self._shard_kwargs['checkpoint_store'] = store.path if isinstance(store, SqliteCheckpointStore) else store
+
+        # Processes started with fork would inherit the parent's threads in whatever state they
+        # were, locks held included
+        self._context = multiprocessing.get_context('spawn')
+
+        # The run in progress, so that cancel() can reach its shards
+        self._stop = None
+
+        # Validates the arguments every shard is given but those of its browsers, and delivers
+        # what the shards report
+        self._events = _ShardEvents(self, **{k: v for k, v in kwargs.items() if k not in _SHARD_ONLY_ARGUMENTS})
+
+    @property
+    def max_workers(self) -> int:
+        return self._events.max_workers
+
+    @property
+    def seen_index(self) -> SeenIndex:
+        return self._events.seen_index
+
+    @property
+    def checkpoint_store(self) -> CheckpointStore:
+        return self._events.checkpoint_store
+
+    @property
+    def dispatch_metrics(self) -> DispatchMetrics:
+        return self._events.dispatch_metrics
+
+    def __emit_data(self, data: EventData, seen: set) -> bool:
+        """
+        Emit a job unless another shard already has
+        :param data: EventData
+        :param seen: set the ids emitted so far
+        :return: bool
+        """
+
+        # Shards run different locations of the same query, and a job open to several of them
+        # is found by each
+        if data.job_id in seen:
+            debug(f'Job {data.job_id} was already scraped by another shard, skip')
+            return False
+
+        seen.add(data.job_id)
+        self._events.emit(Events.DATA, data)
+        return True
+
+    def run(self, queries: Union[Query, List[Query]], options: QueryOptions = None, resume: bool = False) -> None:
+        """
+        Run a query or a list of queries, every (query, location) pair on whichever shard is free
+        :param queries: Union[Query, List[Query]]
+        :param options: QueryOptions
+        :param resume: bool start every location where the checkpoint of its last crawl stopped
+        :return: None
+        """
+
+        self._events.run(queries, options, resume)
+
+    def iter_results(self, queries: Union[Query, List[Query]], options: QueryOptions = None,
+                     max_buffer: int = DEFAULT_MAX_BUFFER) -> Iterator[EventData]:
+        """
+        Run a query or a list of queries, yielding every job the shards scrape, see LinkedinScraper.iter_results
+        :param queries: Union[Query, List[Query]]
+        :param options: QueryOptions
+        :param max_buffer: int the most jobs waiting to be taken
+        :return: Iterator[EventData]
+        """
+
+        return self._events.iter_results(queries, options, max_buffer)
+
+    def _run_shards(self, queries: List[Query], resume: bool) -> None:
+        """
+        Share every (query, location) pair between one process per credential
+        :param queries: List[Query] validated and merged with the global options
+        :param resume: bool
+        :return: None
+        """
+
+        tasks = self._context.Queue()
+        results = self._context.Queue()
+        stop = self._context.Event()
+        self._stop = stop
+
+        # Every pair is on one shared queue, and a shard takes the next one whenever one of its
+        # workers is free: a shard on a slow account, or on large locations, ends up with fewer
+        # pairs rather than holding everyone else up
+        pending = {index: len(query.options.locations or []) for index, query in enumerate(queries)}
+        remaining = sum(pending.values())
+
+        for index, query in enumerate(queries):
+            for location in query.options.locations or []:
+                tasks.put((index, location))
+
+            # A query holding no location has nothing to share, and is over already
+            if not query.options.locations:
+                self._events.emit(Events.END)
+
+        shards = [self._context.Process(
+            target=_run_shard,
+            args=(index, credential, queries, self._shard_kwargs, self.scraper_factory, resume,
+                  tasks, results, stop),
+            name=f'linkedin-jobs-scraper-shard-{index}',
+            daemon=True) for index, credential in enumerate(self.credentials)]
+
+        for index, shard in enumerate(shards):
+            info(f'[shard:{index}]', 'Starting with', str(self.credentials[index]))
+            shard.start()
+
+        alive = set(range(len(shards)))
+        in_flight = {index: set() for index in alive}
+        seen = set()
+        duplicates = 0
+
+        try:
+            while remaining and alive:
+                try:
+                    message = results.get(timeout=SHARD_POLL_INTERVAL)
+                except queue.Empty:
+                    # A shard that crashed never says so: the pairs it held go back on the queue
+                    for index in list(alive):
+                        if not shards[index].is_alive():
+                            warn(f'[shard:{index}]', 'Exited unexpectedly, its pairs go to the others')
+                            alive.discard(index)
+
+                            for task in in_flight.pop(index, set()):
+                                tasks.put(task)
+
+                    continue
+
+                kind, index = message[0], message[1]
+
+                if kind == 'event':
+                    event, args = message[2], message[3]
+
+                    if event == Events.DATA:
+                        if not self.__emit_data(args[0], seen):
+                            duplicates += 1
+                    else:
+                        self._events.emit(event, *args)
+                elif kind == 'start':
+                    in_flight[index].add(message[2])
+                elif kind == 'done':
+                    task = message[2]
+                    in_flight[index].discard(task)
+                    remaining -= 1
+                    pending[task[0]] -= 1
+
+                    if pending[task[0]] == 0:
+                        self._events.emit(Events.END)
+                elif kind == 'returned':
+                    # The shard has put the pair back itself
+                    in_flight[index].discard(message[2])
+                elif kind == 'failed':
+                    # Likewise
+                    in_flight[index].discard(message[2])
+                    error(f'[shard:{index}]', 'Stopped', message[3], exc_info=False)
+                    self._events.emit(Events.ERROR, message[3])
+                elif kind == 'exit':
+                    alive.discard(index)
+
+            if remaining:
+                error(f'Every shard stopped with {remaining} locations left to scrape', exc_info=False)
+                self._events.emit(Events.ERROR, f'Every shard stopped with {remaining} locations left to scrape')
+
+            info('[shards]', f'{len(seen)} jobs scraped, {duplicates} found by more than one shard')
+        except CancelledException:
+            info('Cancelled')
+        finally:
+            self.__close_shards(shards, tasks, results, stop)
+            self._stop = None
+
+    def __close_shards(self, shards: list, tasks, results, stop) -> None:
+        """
+        Tell every shard the run is over and wait for it to close its browsers
+        :param shards: list
+        :param tasks: multiprocessing.Queue
+        :param results: multiprocessing.Queue
+        :param stop: multiprocessing.Event
+        :return: None
+        """
+
+        stop.set()
+
+        # One per worker of every shard, each of which may be waiting for a pair
+        for _ in range(len(shards) * self.max_workers):
+            tasks.put(None)
+
+        # A process does not exit before what it put on a queue has been read, so the shards
+        # are listened to until they are gone, whatever they still have to say
+        exited = set()
+
+        for _ in range(int(SHARD_EXIT_TIMEOUT / SHARD_POLL_INTERVAL)):
+            if all(index in exited or not shard.is_alive() for index, shard in enumerate(shards)):
+                break
+
+            try:
+                message = results.get(timeout=SHARD_POLL_INTERVAL)
+            except queue.Empty:
+                continue
+
+            if message[0] == 'exit':
+                exited.add(message[1])
+
+        for index, shard in enumerate(shards):
+            shard.join(timeout=SHARD_POLL_INTERVAL)
+
+            if shard.is_alive():
+                warn(f'[shard:{index}]', 'Did not exit in time, killing it')
+                shard.kill()
+
+    def _stop_shards(self) -> None:
+        """
+        Tell the shards of the run in progress, if any, that it is over
+        :return: None
+        """
+
+        stop = self._stop
+
+        if stop is not None:
+            stop.set()
+
+    def cancel(self) -> None:
+        """
+        Stop the run in progress, from any thread, every shard included
+        :return: None
+        """
+
+        self._events.cancel()
+
+    def close(self) -> None:
+        """
+        Close what the scraper keeps open in the parent: the dispatcher, and the seen index and
+        checkpoint store it opened itself
+        :return: None
+        """
+
+        self._events.close()
+
+    def __enter__(self) -> 'ShardedScraper':
+        return self
+
+    def __exit__(self, exc_type, exc_value, exc_traceback) -> None:
+        self.close()
+
+    def on(self, event: Events, cb: Callable, once=False) -> None:
+        """
+        Add callback for the given event, called in the parent process whichever shard it comes from
+        :param event: Events
+        :param cb: Callable
+        :param once: bool
+        :return: None
+        """
+
+        self._events.on(event, cb, once)
+
+    def on_batch(self, event: Events, cb: Callable, max_size: int = 100, max_latency: float = 1.0) -> None:
+        """
+        Add callback receiving the payloads of the given event in lists, see LinkedinScraper.on_batch
+        :param event: Events
+        :param cb: Callable
+        :param max_size: int
+        :param max_latency: float seconds
+        :return: None
+        """
+
+        self._events.on_batch(event, cb, max_size, max_latency)
+
+    def once(self, event: Events, cb: Callable) -> None:
+        """
+        Add once callback for the given event
+        :param event: Events
+        :param cb: Callable
+        :return: None
+        """
+
+        self._events.once(event, cb)
+
+    def remove_listener(self, event: Events, cb: Callable) -> bool:
+        """
+        Remove listener for the given event
+        :param event: Events
+        :param cb: Callable
+        :return: bool
+        """
+
+        return self._events.remove_listener(event, cb)
+
+    def remove_all_listeners(self, event: Events) -> None:
+        """
+        Remove all listeners for the given event
+        :param event: Events
+        :return: None
+        """
+
+        self._events.remove_all_listeners(event)
@@ -1,7 +1,9 @@
 from .strategy import Strategy
 from .authenticated_strategy import AuthenticatedStrategy
+from .voyager_strategy import VoyagerStrategy
 
 __all__ = [
     'Strategy',
     'AuthenticatedStrategy',
+    'VoyagerStrategy',
 ]
@@ -5,20 +5,28 @@ from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as ec
-from time import sleep
+from time import monotonic, sleep
 from .strategy import Strategy
+from .watermark import Watermark
+from .extraction import (WAIT_CONDITION, extract_job, install_extraction, is_uninstalled, register_extraction,
+                         to_event_fields)
+from .projection import needs_details, wants
 from ..config import Config
 from ..query import Query
 from ..utils.logger import debug, info, warn, error
 from ..utils.chrome_driver import mask_headless_user_agent
 from ..utils.constants import FEED_URL, HOME_URL, JOBS_SEARCH_URL, JOBS_URL
+from ..utils.blocking import block_urls
+from ..utils.pacing import Pacer, RequestClass
+from ..utils.tabs import PagePrefetch
+from ..utils.timings import TimingModel
 from ..utils.session import (REMEMBER_COOKIE_NAME, SESSION_COOKIE_NAME, get_cookie, get_session_cookie,
                              is_on_linkedin, set_remember_me_cookies, set_session_cookie,
                              wait_for_linkedin)
 from ..utils.url import override_query_params
-from ..utils.text import normalize_spaces
+from ..utils.waits import wait_for
 from ..events import Events, EventData, EventMetrics, EventBegin, EventNotFound
-from ..exceptions import InvalidCookieException
+from ..exceptions import InvalidCookieException, CancelledException
 
 
 # Attribute carrying the job id on each item of the results list. It is set on every
@@ -63,6 +71,11 @@ RESOURCE_TIMING_BUFFER_SIZE = 1000
 LIST_SETTLE_QUIET_PERIOD = 1
 LIST_SETTLE_TIMEOUT = 8
 
+# A document older than this has long replaced its preliminary render, so a full batch of ids
+# read from it is believed without waiting out the quiet period. A page prefetched in a
+# background tab is one by the time it is switched to.
+LIST_SETTLED_AGE = 10
+
 # How long an item may be absent from the list before it is taken to have left it, rather
 # than to be momentarily detached by a re-render.
 MISSING_ITEM_GRACE = 1
@@ -87,6 +100,19 @@ CONTAINER_WAIT_TIMEOUT = 15
 SINGLE_JOB_PANEL_TIMEOUT = 15
 SINGLE_JOB_PANEL_QUIET_PERIOD = 1
 
+# How long a card may take to render, and a job's details to load, once it is clicked
+JOB_CARD_TIMEOUT = 5
+JOB_DETAILS_TIMEOUT = 5
+
+# The timeouts above, and the quiet period of the results list, are ceilings: the scraper's
+# TimingModel brings them down to what the waits are observed to take, never below these.
+# The grace of a missing item and the quiet period of a single job's panel are not learned.
+# A wait that ends too early there does so silently - a job skipped as gone, a description
+# read half rendered - so nothing would ever show that the learned value was too short.
+MIN_LEARNED_TIMEOUT = 1.5
+MIN_LEARNED_QUIET_PERIOD = 0.3
+MIN_LEARNED_PANEL_TIMEOUT = 5
+
 
 class Selectors(NamedTuple):
     container = '.scaffold-layout__list'
@@ -135,6 +161,67 @@ def jittered_backoff(base: float) -> float:
     return base * uniform(1 - THROTTLE_BACKOFF_JITTER, 1 + THROTTLE_BACKOFF_JITTER)
 
 
+def backoff_wait(pacer: Pacer, step: float) -> float:
+    """
+    Return how long to wait before asking again for something LinkedIn refused
+
+    The server's own Retry-After when one was heard, and a step of the ladder otherwise. The
+    ladder is a guess at what the server would have said, so it is only the fallback.
+
+    :param pacer: Pacer
+    :param step: float the step of the backoff ladder reached
+    :return: float
+    """
+
+    hold = pacer.hold
+
+    return hold if hold > 0 else jittered_backoff(step)
+
+
+def expected_page_size(job_total: int, page: int) -> int | None:
+    """
+    Return how many jobs a page of results holds, going by LinkedIn's count of them
+
+    Only the last page holds fewer than a full batch, and it is the one the list wait cannot
+    otherwise tell from a page still rendering: it waits it out to the timeout.
+
+    :param job_total: int LinkedIn's count, -1 when it could not be read
+    :param page: int
+    :return: int | None None when the count says nothing about this page
+    """
+
+    left = job_total - page * PAGINATION_SIZE
+
+    # Past the count, LinkedIn serves the last page again, whatever it held
+    if job_total < 0 or left <= 0:
+        return None
+
+    return min(PAGINATION_SIZE, left)
+
+
+def time_to_next_job(last_read: float | None, spacing: float, now: float) -> float:
+    """
+    Return how long a pipelined run still has to wait before opening the next job
+
+    Opening a job is what asks LinkedIn for its details, so that is the request the spacing is
+    kept on. The serial loop sleeps the spacing from when the last details were read, and then
+    renders the next card; pipelined, the card renders inside the spacing, and only what is
+    left of it is slept. Counted from the read rather than from the open, the time the details
+    took stays between two requests, as it does in the serial loop.
+
+    :param last_read: float when the details of the last job were read, on the monotonic clock,
+        None for none yet
+    :param spacing: float the serial loop's sleeps between two jobs, the card's and the details'
+    :param now: float
+    :return: float seconds, 0 when it may be opened right away
+    """
+
+    if last_read is None:
+        return 0
+
+    return max(0.0, last_read + spacing - now)
+
+
 class AuthenticatedStrategy(Strategy):
     def __init__(self, scraper: 'LinkedinScraper'):
         super().__init__(scraper)
@@ -281,7 +368,7 @@ class AuthenticatedStrategy(Strategy):
         except BaseException:
             pass
 
-    def __slow_down(self, tag: str) -> None:
+    def __slow_down(self, tag: str, request_class: RequestClass) -> None:
         """
         Report a refusal to the pacer, saying so when it makes the run slower
 
@@ -290,29 +377,58 @@ class AuthenticatedStrategy(Strategy):
         rescue a page.
 
         :param tag: str
+        :param request_class: RequestClass the kind of step that was refused
         :return: None
         """
 
         pacer = self.scraper.pacer
-        before = pacer.delay
-        after = pacer.throttled()
+        before = pacer.pace_of(request_class)
+        after = pacer.throttled(request_class)
 
         if after > before:
-            warn(tag, f'LinkedIn is throttling this run, slowing to {round(after, 2)}s between jobs')
+            warn(tag, f'LinkedIn is throttling this run, slowing to {round(after, 2)}s before each '
+                      f'{request_class.value} step')
 
-    def __speed_up(self, tag: str) -> None:
+    def __speed_up(self, tag: str, request_class: RequestClass) -> None:
         """
         Report a unit of work nobody refused, saying so when it makes the run faster
         :param tag: str
+        :param request_class: RequestClass the kind of step that went through
         :return: None
         """
 
         pacer = self.scraper.pacer
-        before = pacer.delay
-        after = pacer.clean()
+        before = pacer.pace_of(request_class)
+        after = pacer.clean(request_class)
 
         if after < before:
-            info(tag, f'No refusals for a while, easing to {round(after, 2)}s between jobs')
+            info(tag, f'No refusals for a while, easing to {round(after, 2)}s before each '
+                      f'{request_class.value} step')
+
+    @staticmethod
+    def __read_transferred(driver: webdriver) -> int:
+        """
+        Return how many bytes the document on screen downloaded, itself and everything it loaded
+
+        A request that was blocked downloads nothing and leaves no entry, so what a blocklist
+        saves shows as the difference between runs with and without it. Cross origin resources
+        not opted into timing report 0, which makes this a lower bound.
+
+        :param driver: webdriver
+        :return: int
+        """
+
+        try:
+            transferred = driver.execute_script(
+                '''
+                    return performance.getEntriesByType('navigation')
+                        .concat(performance.getEntriesByType('resource'))
+                        .reduce((total, e) => total + (e.transferSize || 0), 0);
+                ''')
+        except BaseException:
+            return 0
+
+        return int(transferred or 0)
 
     def __record_pace(self, metrics: EventMetrics) -> None:
         """
@@ -326,7 +442,10 @@ class AuthenticatedStrategy(Strategy):
         """
 
         metrics.throttled = self.scraper.pacer.throttled_count
-        metrics.pace = round(self.scraper.pacer.delay, 2)
+        metrics.pace = round(self.scraper.pacer.delay_of(RequestClass.DETAILS), 2)
+
+        if self.scraper.network is not None:
+            metrics.listen_overhead = round(self.scraper.network.overhead, 3)
 
     def __observe_resources(self, driver: webdriver, tag: str,
                             baseline: tuple[float, int] | None) -> tuple[float, int] | None:
@@ -358,10 +477,12 @@ class AuthenticatedStrategy(Strategy):
             # which says as little about how the run is going as a document swap does
             return reading
 
+        # The requests that pile up in the buffer while a page is worked are the ones its job
+        # details make: the page itself was accounted for when it was opened
         if reading[1] > baseline[1]:
-            self.__slow_down(tag)
+            self.__slow_down(tag, RequestClass.DETAILS)
         else:
-            self.__speed_up(tag)
+            self.__speed_up(tag, RequestClass.DETAILS)
 
         return reading
 
@@ -500,7 +621,8 @@ class AuthenticatedStrategy(Strategy):
         except BaseException:
             return False
 
-    def __open_and_wait(self, driver: webdriver, tag: str, url: str, wait) -> bool:
+    def __open_and_wait(self, driver: webdriver, tag: str, url: str, wait,
+                        request_class: RequestClass = RequestClass.NAVIGATION) -> bool:
         """
         Open a url and wait for its page, asking again while LinkedIn answers with a throttle
 
@@ -513,12 +635,13 @@ class AuthenticatedStrategy(Strategy):
         :param tag: str
         :param url: str
         :param wait: callable taking the driver and returning whether the page arrived
+        :param request_class: RequestClass what opening the url is paced and accounted as
         :return: bool
         """
 
         for delay in (0, *THROTTLE_BACKOFF_DELAYS):
             if delay:
-                waited = jittered_backoff(delay)
+                waited = backoff_wait(self.scraper.pacer, delay)
                 warn(tag, f'LinkedIn is throttling this run (HTTP {THROTTLED_STATUS}), '
                           f'waiting {round(waited, 1)}s before asking again')
                 sleep(waited)
@@ -531,15 +654,14 @@ class AuthenticatedStrategy(Strategy):
                 warn(tag, 'Failed to open the page', e)
                 return False
 
-            sleep(self.scraper.pacer.delay)
+            sleep(self.scraper.pacer.wait(request_class))
 
             if wait(driver):
                 AuthenticatedStrategy.__widen_resource_timings(driver)
 
-                # A page that arrived is deliberately not reported as clean work. The unit the
-                # pacer eases on is a job, and there are far more jobs than navigations, so
-                # counting these too would quietly shorten the run of clean work that easing
-                # has to be earned by.
+                # Clean work of the class the page was paced as, and of that class only: its
+                # refusals raised it, and nothing else it does would ever bring it back down
+                self.__speed_up(tag, request_class)
                 return True
 
             if not AuthenticatedStrategy.__is_throttled(driver):
@@ -547,7 +669,7 @@ class AuthenticatedStrategy(Strategy):
 
             # One report per refused attempt, so the pacer and the backoff count the same
             # events: the backoff waits this one out, the pacer makes the next one less likely
-            self.__slow_down(tag)
+            self.__slow_down(tag, request_class)
 
         warn(tag, f'LinkedIn kept throttling this run after {len(THROTTLE_BACKOFF_DELAYS)} waits. '
                   f'Raise slow_mo, or lower max_workers, to ask for less')
@@ -612,7 +734,7 @@ class AuthenticatedStrategy(Strategy):
         # Cookies can only be injected for the domain the browser is on, and the refusal may
         # have redirected it anywhere
         driver.get(HOME_URL)
-        sleep(self.scraper.pacer.delay)
+        sleep(self.scraper.pacer.wait())
 
         if not wait_for_linkedin(driver):
             warn(tag, 'The browser never landed back on LinkedIn, so no credential can be '
@@ -745,19 +867,18 @@ class AuthenticatedStrategy(Strategy):
         except (ValueError, AttributeError):
             return -1
 
-    def __emit_begin(self, driver: webdriver, tag: str) -> None:
+    def __emit_begin(self, tag: str, total: int) -> None:
         """
         Emit the BEGIN event carrying LinkedIn's approximate total result count
 
         Fired once per query/location, before the pagination loop delivers any job. A count
         that cannot be read is reported as -1 rather than aborting the run.
 
-        :param driver: webdriver
         :param tag: str
+        :param total: int
         :return: None
         """
 
-        total = AuthenticatedStrategy.__read_job_total(driver)
         debug(tag, f'Total results reported by LinkedIn: {total}')
         self.scraper.emit(Events.BEGIN, EventBegin(job_total=total))
 
@@ -788,8 +909,9 @@ class AuthenticatedStrategy(Strategy):
     @staticmethod
     def __wait_for_stable_job_ids(
             driver: webdriver,
-            timeout=LIST_SETTLE_TIMEOUT,
-            quiet_period=LIST_SETTLE_QUIET_PERIOD) -> list:
+            timings: TimingModel,
+            expected: int | None = None,
+            settled_age=LIST_SETTLED_AGE) -> list:
         """
         Return the ids of the results list once it has stopped changing
 
@@ -806,37 +928,76 @@ class AuthenticatedStrategy(Strategy):
         measured held 7 items where the settled one held `PAGINATION_SIZE` - so a full batch
         is what the list has to reach before holding still is believed. Short of that only
         the timeout can tell a render still on its way from the last page of results, which
-        genuinely holds fewer.
+        genuinely holds fewer - unless LinkedIn's count of the results says how many it holds.
+
+        How long the list takes to settle, and the longest it holds still before changing
+        again, are learned as pages go by. Both set the next wait, never above the hand-tuned
+        values; the quiet period only for a page expected full, the batch size guarding it.
 
         :param driver: webdriver
-        :param timeout: int
-        :param quiet_period: int how long the list has to hold still to count as settled
+        :param timings: TimingModel
+        :param expected: int | None how many items the page holds, None for a full batch or fewer
+        :param settled_age: int how old the document has to be for a full batch to count as settled
         :return: list
         """
 
-        elapsed = 0
-        sleep_time = 0.1
-        quiet = 0
-        job_ids = []
+        timeout = timings.learned('list_settle', LIST_SETTLE_TIMEOUT, MIN_LEARNED_TIMEOUT)
+        quiet_period = LIST_SETTLE_QUIET_PERIOD
 
-        while elapsed < timeout:
-            current = AuthenticatedStrategy.__get_job_ids(driver)
+        if expected is None or expected == PAGINATION_SIZE:
+            quiet_period = timings.learned('list_quiet', LIST_SETTLE_QUIET_PERIOD, MIN_LEARNED_QUIET_PERIOD)
 
-            if current and current == job_ids:
-                quiet += sleep_time
+        # The ids are read and compared inside the page, which answers once they have held
+        # still for the quiet period: the clock restarts on every render that changes them
+        result = wait_for(
+            driver,
+            '''
+                const ids = Array.from(document.querySelectorAll(args[0]))
+                    .map(e => e.getAttribute(args[1]))
+                    .filter(e => e);
 
-                if quiet >= quiet_period and len(job_ids) >= PAGINATION_SIZE:
-                    return job_ids
-            else:
-                quiet = 0
-                job_ids = current
+                const key = ids.join(',');
+                const now = performance.now();
 
-            sleep(sleep_time)
-            elapsed += sleep_time
+                if (key !== state.key) {
+                    // The longest a list holding anything has stayed as it was before changing
+                    if (state.key) {
+                        state.gap = Math.max(state.gap || 0, now - state.since);
+                    }
+
+                    state.key = key;
+                    state.since = now;
+                }
+
+                state.partial = {ids: ids};
+
+                // The page's clock starts with its navigation
+                const waived = now >= args[4];
+                const quiet = waived ? 0 : args[3];
+
+                return ids.length >= args[2] && now - state.since >= quiet
+                    ? {ids: ids, gap: state.gap || 0, waived: waived}
+                    : null;
+            ''',
+            Selectors.job_items,
+            JOB_ID_ATTRIBUTE,
+            expected or PAGINATION_SIZE,
+            quiet_period * 1000,
+            settled_age * 1000,
+            timeout=timeout)
+
+        if result.met:
+            timings.observe('list_settle', result.elapsed)
+
+            if not result.value['waived']:
+                timings.observe('list_quiet', result.value['gap'] / 1000)
+        elif expected is not None:
+            # The page was known to hold that many, so it was slow rather than short
+            timings.observe('list_settle', LIST_SETTLE_TIMEOUT)
 
         # A short list here is the last page of results, and an empty one a page holding
         # none: both are the caller's to report
-        return job_ids
+        return result.value['ids'] if result.value else []
 
     @staticmethod
     def __load_more_jobs(driver: webdriver, job_count: int, timeout=3) -> bool:
@@ -852,38 +1013,33 @@ class AuthenticatedStrategy(Strategy):
         :return: bool
         """
 
-        elapsed = 0
-        sleep_time = 0.05
-
-        while elapsed < timeout:
-            try:
-                count = driver.execute_script(
-                    '''
-                        const items = document.querySelectorAll(arguments[0]);
-
-                        // Scrolling the last known item into view is what makes LinkedIn
-                        // append the next batch
-                        if (items.length && items.length <= arguments[1]) {
-                            items[items.length - 1].scrollIntoView({block: 'end'});
-                        }
+        return wait_for(
+            driver,
+            '''
+                const items = document.querySelectorAll(args[0]);
 
-                        return items.length;
-                    ''',
-                    Selectors.job_items,
-                    job_count)
-            except BaseException:
-                count = None
+                if (items.length > args[1]) {
+                    return true;
+                }
 
-            if count is not None and count > job_count:
-                return True
+                // Scrolling the last known item into view is what makes LinkedIn append the
+                // next batch. Once per item is enough: scrolling again on every mutation would
+                // only cause more of them.
+                const last = items[items.length - 1];
 
-            sleep(sleep_time)
-            elapsed += sleep_time
+                if (last && state.scrolled !== last) {
+                    last.scrollIntoView({block: 'end'});
+                    state.scrolled = last;
+                }
 
-        return False
+                return null;
+            ''',
+            Selectors.job_items,
+            job_count,
+            timeout=timeout).met
 
     @staticmethod
-    def __load_job_card(driver: webdriver, job_id: str, timeout=5) -> object:
+    def __load_job_card(driver: webdriver, job_id: str, timings: TimingModel) -> object:
         """
         Wait for the card of a job to be rendered, scrolling it into view
 
@@ -898,96 +1054,187 @@ class AuthenticatedStrategy(Strategy):
 
         :param driver: webdriver
         :param job_id: str
-        :param timeout: int
-        :return: object
+        :param timings: TimingModel
+        :return: object with the day the job was posted under date, once rendered
         """
 
-        elapsed = 0
-        sleep_time = 0.05
-        missing_for = 0
-
-        while elapsed < timeout:
-            try:
-                state = driver.execute_script(
-                    '''
-                        const item = document.querySelector(arguments[0]);
+        result = wait_for(
+            driver,
+            '''
+                const item = document.querySelector(args[0]);
+                const now = performance.now();
 
-                        if (!item) {
-                            return 'missing';
-                        }
+                if (!item) {
+                    if (state.missingSince === undefined) {
+                        state.missingSince = now;
+                    }
 
-                        if (item.querySelector(arguments[1])) {
-                            return 'rendered';
-                        }
+                    return now - state.missingSince >= args[2] ? 'missing' : null;
+                }
 
-                        item.scrollIntoView({block: 'center'});
-                        return 'pending';
-                    ''',
-                    get_job_item_selector(job_id),
-                    Selectors.jobs)
-            except BaseException:
-                # execute_script yields nothing while the document is being replaced
-                state = None
+                delete state.missingSince;
 
-            if state == 'rendered':
-                return {'success': True}
+                if (item.querySelector(args[1])) {
+                    // The day the job was posted is on the card, which is all a watermark
+                    // needs to be checked before the job is opened
+                    const date = item.querySelector(args[3]);
+                    return {date: date ? date.getAttribute('datetime') || '' : ''};
+                }
 
-            if state == 'missing':
-                missing_for += sleep_time
+                // Rendering the card is what bringing the item into view does; the same
+                // item is not scrolled to again for every mutation that follows
+                if (state.scrolled !== item) {
+                    item.scrollIntoView({block: 'center'});
+                    state.scrolled = item;
+                }
 
-                if missing_for >= MISSING_ITEM_GRACE:
-                    break
-            else:
-                missing_for = 0
+                return null;
+            ''',
+            get_job_item_selector(job_id),
+            Selectors.jobs,
+            MISSING_ITEM_GRACE * 1000,
+            Selectors.date,
+            timeout=timings.learned('card', JOB_CARD_TIMEOUT, MIN_LEARNED_TIMEOUT))
 
-            sleep(sleep_time)
-            elapsed += sleep_time
+        if isinstance(result.value, dict):
+            timings.observe('card', result.elapsed)
+            return {'success': True, 'date': result.value.get('date') or ''}
 
-        if missing_for >= MISSING_ITEM_GRACE:
+        if result.value == 'missing':
             return {'success': False, 'missing': True,
                     'error': f'Job {job_id} is no longer in the results list'}
 
+        # A card that is in the list renders, given the time: this one was slow
+        timings.observe('card', JOB_CARD_TIMEOUT)
+
         return {'success': False, 'missing': False,
                 'error': f'Timeout on rendering job card {job_id}'}
 
     @staticmethod
-    def __load_job_details(driver: webdriver, job_id: str, timeout=5) -> object:
+    def __prefetch_card(driver: webdriver, job_id: str) -> None:
         """
-        Wait for job details to load
+        Bring the item of a job into view without waiting for it, so that its card renders
+        while the job before it is being finished
         :param driver: webdriver
         :param job_id: str
-        :param timeout: int
+        :return: None
+        """
+
+        try:
+            driver.execute_script(
+                '''
+                    const item = document.querySelector(arguments[0]);
+
+                    if (item) {
+                        item.scrollIntoView({block: 'center'});
+                    }
+                ''',
+                get_job_item_selector(job_id))
+        except BaseException as e:
+            # Only ever a head start: the card is loaded the usual way when its turn comes
+            debug('Failed to prefetch the card of job', job_id, e)
+
+    @staticmethod
+    def __extraction_args(job_id: str, card_selector: str | None, require_details: bool,
+                          card_only: bool = False, fields: list | None = None) -> dict:
+        """
+        Build what the extraction function is called with
+        :param job_id: str
+        :param card_selector: str the job's item in the results list, or None to read the top card of the panel
+        :param require_details: bool answer nothing until the details panel holds the job
+        :param card_only: bool read the fields of the card and nothing else
+        :param fields: list the fields to read, None for all of them
+        :return: dict
+        """
+
+        return {
+            'jobId': job_id,
+            'cardSelector': card_selector,
+            'requireDetails': require_details,
+            'cardOnly': card_only,
+            'fields': fields,
+            'selectors': {
+                'title': Selectors.title,
+                'company': Selectors.company,
+                'place': Selectors.place,
+                'date': Selectors.date,
+                'panelTitle': Selectors.panel_title,
+                'panelCompany': Selectors.panel_company,
+                'dateText': Selectors.date_text,
+                'companyLink': Selectors.company_link,
+                'companyEmployeeCount': Selectors.company_employee_count,
+                'description': Selectors.description,
+                'detailsPanel': Selectors.detailsPanel,
+                'insights': Selectors.insights,
+            },
+        }
+
+    @staticmethod
+    def __read_job_card(driver: webdriver, job_id: str, fields: list | None) -> object:
+        """
+        Read the fields a job's card shows: title, company, place, date, logo and promoted flag
+
+        The card has already been rendered by the time this is called, so one call reads it.
+
+        :param driver: webdriver
+        :param job_id: str
+        :param fields: list the fields to read, None for all of them
         :return: object
         """
 
-        elapsed = 0
-        sleep_time = 0.05
+        extracted = extract_job(driver, AuthenticatedStrategy.__extraction_args(
+            job_id, get_job_item_selector(job_id), False, True, fields))
 
-        try:
-            while elapsed < timeout:
-                loaded = driver.execute_script(
-                    '''
-                        const detailsPanel = document.querySelector(arguments[1]);
-                        const description = document.querySelector(arguments[2]);
-                        return detailsPanel && detailsPanel.innerHTML.includes(arguments[0]) &&
-                            description && description.innerText.length > 0;
-                    ''',
-                    job_id,
-                    Selectors.detailsPanel,
-                    Selectors.description)
+        if extracted is None:
+            return {'success': False, 'error': f'Card of job {job_id} was no longer rendered'}
 
-                if loaded:
-                    return {'success': True}
+        return {'success': True, 'fields': extracted['fields']}
 
-                sleep(sleep_time)
-                elapsed += sleep_time
-        finally:
-            pass
+    @staticmethod
+    def __extract_job_details(driver: webdriver, tag: str, job_id: str, fields: list | None,
+                              timings: TimingModel) -> object:
+        """
+        Wait for job details to load and read every field of the job in the same call
+
+        The extraction answers nothing while the panel does not hold the job yet, so waiting
+        and reading are one round trip per tick instead of a wait followed by one call per
+        field.
+
+        :param driver: webdriver
+        :param tag: str
+        :param job_id: str
+        :param fields: list the fields to read, None for all of them
+        :param timings: TimingModel
+        :return: object
+        """
 
-        return {'success': False, 'error': 'Timeout on loading job details'}
+        args = AuthenticatedStrategy.__extraction_args(job_id, get_job_item_selector(job_id), True, fields=fields)
+        timeout = timings.learned('details', JOB_DETAILS_TIMEOUT, MIN_LEARNED_TIMEOUT)
+        result = wait_for(driver, WAIT_CONDITION, args, timeout=timeout)
+
+        # Only a document opened before the function was registered, once: it is defined there
+        # and the wait goes on for what is left of it
+        if result.met and is_uninstalled(result.value):
+            install_extraction(driver)
+            waited = result.elapsed
+            result = wait_for(driver, WAIT_CONDITION, args, timeout=max(0.0, timeout - waited))
+            result = result._replace(elapsed=result.elapsed + waited)
+
+            if is_uninstalled(result.value):
+                result = result._replace(met=False)
+
+        # A job that was clicked has details, so one that never showed them was slow
+        timings.observe('details', result.elapsed if result.met else JOB_DETAILS_TIMEOUT)
+
+        if not result.met:
+            return {'success': False, 'error': 'Timeout on loading job details'}
+
+        debug(tag, 'Extraction timings (ms)', {name: round(ms, 1) for name, ms in result.value['timings'].items()})
+
+        return {'success': True, 'fields': result.value['fields']}
 
     @staticmethod
-    def __wait_for_job_panel(driver: webdriver, job_id: str, timeout=SINGLE_JOB_PANEL_TIMEOUT) -> bool:
+    def __wait_for_job_panel(driver: webdriver, job_id: str, timings: TimingModel) -> bool:
         """
         Wait for the detail panel of a single job opened by its currentJobId to settle
 
@@ -997,59 +1244,53 @@ class AuthenticatedStrategy(Strategy):
         which is what tells the two apart: the panel is ready only once the requested job's
         title is present and its description has stopped growing.
 
+        An id that does not exist waits the whole timeout out, which is learned from how long the
+        panels that did render took. It is not brought down as far as the other timeouts: a panel
+        slower than that is reported as a job that was not found.
+
         :param driver: webdriver
         :param job_id: str
-        :param timeout: int
+        :param timings: TimingModel
         :return: bool
         """
 
-        elapsed = 0
-        sleep_time = 0.05
-        stable_for = 0
-        last_length = -1
+        result = wait_for(
+            driver,
+            r'''
+                const panel = document.querySelector(args[1]);
+                const titleEl = document.querySelector(args[2]);
+                const descEl = document.querySelector(args[3]);
 
-        while elapsed < timeout:
-            try:
-                state = driver.execute_script(
-                    r'''
-                        const panel = document.querySelector(arguments[1]);
-                        const titleEl = document.querySelector(arguments[2]);
-                        const descEl = document.querySelector(arguments[3]);
-
-                        const hasId = panel ? panel.innerHTML.includes(arguments[0]) : false;
-                        const title = titleEl
-                            ? (titleEl.innerText.split('\n').map(e => e.trim()).find(e => e.length) || "")
-                            : "";
-                        const length = descEl ? descEl.innerText.length : 0;
-
-                        return {hasId: hasId, hasTitle: title.length > 0, length: length};
-                    ''',
-                    job_id,
-                    Selectors.detailsPanel,
-                    Selectors.panel_title,
-                    Selectors.description)
-            except BaseException:
-                # execute_script yields nothing while the document is being replaced
-                state = None
+                const hasId = panel ? panel.innerHTML.includes(args[0]) : false;
+                const title = titleEl
+                    ? (titleEl.innerText.split('\n').map(e => e.trim()).find(e => e.length) || "")
+                    : "";
+                const length = descEl ? descEl.innerText.length : 0;
+                const now = performance.now();
 
-            if state and state['hasId'] and state['hasTitle'] and state['length'] > 0:
-                if state['length'] == last_length:
-                    stable_for += sleep_time
+                if (!(hasId && title.length > 0 && length > 0)) {
+                    state.length = -1;
+                    return null;
+                }
 
-                    if stable_for >= SINGLE_JOB_PANEL_QUIET_PERIOD:
-                        return True
-                else:
-                    stable_for = 0
+                if (length !== state.length) {
+                    state.length = length;
+                    state.since = now;
+                }
 
-                last_length = state['length']
-            else:
-                stable_for = 0
-                last_length = -1
+                return now - state.since >= args[4];
+            ''',
+            job_id,
+            Selectors.detailsPanel,
+            Selectors.panel_title,
+            Selectors.description,
+            SINGLE_JOB_PANEL_QUIET_PERIOD * 1000,
+            timeout=timings.learned('panel', SINGLE_JOB_PANEL_TIMEOUT, MIN_LEARNED_PANEL_TIMEOUT))
 
-            sleep(sleep_time)
-            elapsed += sleep_time
+        if result.met:
+            timings.observe('panel', result.elapsed)
 
-        return False
+        return result.met
 
     @staticmethod
     def __wait_for_job_items(driver: webdriver, tag: str, timeout=CONTAINER_WAIT_TIMEOUT) -> bool:
@@ -1104,13 +1345,154 @@ class AuthenticatedStrategy(Strategy):
         def has_items(d: webdriver) -> bool:
             return AuthenticatedStrategy.__wait_for_job_items(d, tag)
 
-        if self.__open_and_wait(driver, tag, url, has_items):
+        if self.__open_and_wait(driver, tag, url, has_items, RequestClass.PAGINATION):
             return {'success': True}
 
         return {'success': False,
                 'error': f'Timeout on pagination: no item matched {Selectors.job_items} in '
                          f'{CONTAINER_WAIT_TIMEOUT}s. {AuthenticatedStrategy.__describe_page(driver)}'}
 
+    def __prefetch_page(self, prefetch: PagePrefetch, tag: str, url: str) -> None:
+        """
+        Start loading the next page of results in a background tab
+
+        Opening it is a request like any other, so it is paced like one - before it is made
+        rather than after, since nothing waits on it: the page in front is worked meanwhile.
+
+        :param prefetch: PagePrefetch
+        :param tag: str
+        :param url: str
+        :return: None
+        """
+
+        sleep(self.scraper.pacer.wait(RequestClass.PAGINATION))
+        info(tag, f'Prefetching {url}')
+        prefetch.open(url)
+
+    def __adopt_page(self, driver: webdriver, tag: str, handle: str, previous: str) -> object:
+        """
+        Switch to the next page of results, loaded ahead of time, and close the one it replaces
+
+        It is accounted for like a page opened by `__paginate`: it has to render the same list,
+        and LinkedIn refusing it is reported to the pacer. What it does not do is ask again, which
+        is left to `__paginate`, with its backoff.
+
+        :param driver: webdriver
+        :param tag: str
+        :param handle: str the window of the page loaded ahead of time
+        :param previous: str the window of the page it replaces
+        :return: object
+        """
+
+        info(tag, 'Switching to the prefetched page')
+        driver.switch_to.window(handle)
+
+        # The tab was opened outside of the session's window, so the blocklist did not follow it
+        block_urls(driver, self.scraper.blocked_urls)
+
+        try:
+            driver.execute_cdp_cmd('Target.closeTarget', {'targetId': previous})
+        except BaseException as e:
+            debug(tag, 'Failed to close the previous page', e)
+
+        if AuthenticatedStrategy.__wait_for_job_items(driver, tag):
+            AuthenticatedStrategy.__widen_resource_timings(driver)
+            self.__speed_up(tag, RequestClass.PAGINATION)
+            return {'success': True}
+
+        if AuthenticatedStrategy.__is_throttled(driver):
+            self.__slow_down(tag, RequestClass.PAGINATION)
+
+        return {'success': False,
+                'error': f'The prefetched page rendered no item matching {Selectors.job_items}. '
+                         f'{AuthenticatedStrategy.__describe_page(driver)}'}
+
+    def __establish_session(self, driver: webdriver, tag: str, has_profile: bool) -> bool:
+        """
+        Make sure the browser holds a LinkedIn session, opening the home page and authenticating if needed
+
+        A browser handed back by the scraper's pool has already been through all of this for a
+        previous unit of work: it is on LinkedIn, masked and holding a session. Opening the home
+        page again would only add a request to the account's count, so such a browser goes
+        straight on to the search. A session LinkedIn has retired meanwhile is caught by the
+        same recovery that catches it part way through a run.
+
+        :param driver: webdriver
+        :param tag: str
+        :param has_profile: bool
+        :return: bool True if the browser holds a session, False if the unit of work has to be skipped
+        """
+
+        if is_on_linkedin(driver) and AuthenticatedStrategy.__is_authenticated_session(driver):
+            debug(tag, 'Warm browser, the session is already established')
+            return True
+
+        # Before the first page, so that nothing on it is downloaded that the blocklist refuses,
+        # and so that every document it opens holds the extraction function from the start
+        block_urls(driver, self.scraper.blocked_urls)
+        register_extraction(driver)
+
+        # Open main page first to verify/set the session
+        debug(tag, f'Opening {HOME_URL}')
+        driver.get(HOME_URL)
+        sleep(self.scraper.pacer.wait())
+
+        # Both the masking and the cookies need the browser to be on a LinkedIn page: client
+        # hints are not exposed outside a secure context, and a cookie can only be injected
+        # for the domain of the document on screen
+        if not wait_for_linkedin(driver):
+            warn(tag, 'The browser never landed on LinkedIn, skip')
+            debug(tag, AuthenticatedStrategy.__describe_page(driver))
+            return False
+
+        # This first page is the only one requested before the session cookie is in place,
+        # so it is where the headless User-Agent can still be replaced without any
+        # authenticated request having carried it
+        mask_headless_user_agent(driver)
+
+        # A session already in the jar, which is what a persistent profile provides, wins
+        # over any supplied credential. Only a profile can be carrying one, so only then is
+        # it worth waiting for the navigation to deliver it.
+        if has_profile:
+            AuthenticatedStrategy.__wait_for_session(driver)
+
+        if not AuthenticatedStrategy.__is_authenticated_session(driver):
+            return AuthenticatedStrategy.__authenticate(driver, tag, has_profile)
+
+        return True
+
+    def open_session(self, driver: webdriver, tag: str) -> bool:
+        """
+        Make sure the browser holds a LinkedIn session, for a strategy that reads LinkedIn other than through its pages
+        :param driver: webdriver
+        :param tag: str
+        :return: bool
+        """
+
+        return self.__establish_session(driver, tag, bool(self.scraper.chrome_user_data_dir))
+
+    def is_reusable(self, driver: webdriver) -> bool:
+        """
+        Return True if a browser left idle can serve another unit of work
+
+        The browser has to answer at all - an idle Chrome can crash or be closed by hand - and
+        must not be sitting on LinkedIn without a session: that one would have to authenticate
+        again, which a fresh browser does just as well without the baggage of the old one.
+
+        :param driver: webdriver
+        :return: bool
+        """
+
+        try:
+            driver.window_handles
+        except BaseException:
+            return False
+
+        try:
+            return not AuthenticatedStrategy.__is_session_lost(driver)
+        except BaseException:
+            return False
+
     @staticmethod
     def __accept_cookies(driver: webdriver, tag: str) -> None:
         """
@@ -1183,7 +1565,17 @@ class AuthenticatedStrategy(Strategy):
             debug(tag, 'Failed to close chat panel')
 
     @staticmethod
-    def __extract_apply_link(tag: str, driver: webdriver, timeout=4):
+    def __sibling_handles(driver: webdriver) -> set:
+        """
+        Return the windows other workers are using, for a driver that is one tab of a shared browser
+        :param driver: webdriver
+        :return: set the target ids of those windows, which are never another worker's to close
+        """
+
+        return set(getattr(driver, 'sibling_handles', ()))
+
+    @staticmethod
+    def __extract_apply_link(tag: str, driver: webdriver, timeout=4, reserved: set = frozenset()):
         try:
             elapsed = 0
             sleep_time = 0.1
@@ -1205,16 +1597,19 @@ class AuthenticatedStrategy(Strategy):
                 Selectors.applyBtn
             )
 
-            if len(driver.window_handles) > 1:
+            # The reserved windows are open whether or not the apply button opened one
+            if len(driver.window_handles) > 1 + len(reserved):
                 debug(tag, 'Try extracting apply link')
 
+                siblings = AuthenticatedStrategy.__sibling_handles(driver) | reserved
+
                 while elapsed < timeout:
                     targets_result = driver.execute_cdp_cmd('Target.getTargets', {})
 
                     if targets_result and 'targetInfos' in targets_result and len(targets_result['targetInfos']) > 0:
                         for target in targets_result['targetInfos']:
                             if target['attached'] and target['type'] == 'page' and target['url'] and \
-                                    target['url'] != current_url:
+                                    target['url'] != current_url and target['targetId'] not in siblings:
                                 driver.execute_cdp_cmd('Target.closeTarget', {'targetId': target['targetId']})
                                 return {'success': True, 'apply_link': target['url']}
 
@@ -1228,7 +1623,8 @@ class AuthenticatedStrategy(Strategy):
             warn(tag, 'Failed to extract apply link', e)
             return {'success': False, 'error': str(e)}
 
-    def scrape_job(self, driver: webdriver, job_id: str, apply_link: bool = False) -> None:
+    def scrape_job(self, driver: webdriver, job_id: str, apply_link: bool = False,
+                   metrics: EventMetrics = None) -> None:
         """
         Scrape a single job by its id
 
@@ -1237,43 +1633,26 @@ class AuthenticatedStrategy(Strategy):
         semantic detail panel for the requested job from the url param alone, with no card to
         click. Every field is therefore read from the panel, document-scoped.
 
+        A browser that has just scraped another job is still on LinkedIn with its session, so
+        the next id goes straight from one panel to the next without passing by the home page.
+
         :param driver: webdriver
         :param job_id: str
         :param apply_link: bool
+        :param metrics: EventMetrics the outcome of the job is counted on, when the caller reports a batch
         :return: None
         """
 
         tag = f'[job:{job_id}]'
 
-        # Open main page first to verify/set the session
-        debug(tag, f'Opening {HOME_URL}')
-        driver.get(HOME_URL)
-        sleep(self.scraper.pacer.delay)
-
-        # Both the masking and the cookies need the browser to be on a LinkedIn page: client
-        # hints are not exposed outside a secure context, and a cookie can only be injected
-        # for the domain of the document on screen
-        if not wait_for_linkedin(driver):
-            warn(tag, 'The browser never landed on LinkedIn, skip')
-            debug(tag, AuthenticatedStrategy.__describe_page(driver))
-            return
-
-        # This first page is the only one requested before the session cookie is in place,
-        # so it is where the headless User-Agent can still be replaced without any
-        # authenticated request having carried it
-        mask_headless_user_agent(driver)
+        if metrics is None:
+            metrics = EventMetrics()
 
         has_profile = bool(self.scraper.chrome_user_data_dir)
 
-        # A session already in the jar, which is what a persistent profile provides, wins
-        # over any supplied credential. Only a profile can be carrying one, so only then is
-        # it worth waiting for the navigation to deliver it.
-        if has_profile:
-            AuthenticatedStrategy.__wait_for_session(driver)
-
-        if not AuthenticatedStrategy.__is_authenticated_session(driver):
-            if not AuthenticatedStrategy.__authenticate(driver, tag, has_profile):
-                return
+        if not self.__establish_session(driver, tag, has_profile):
+            metrics.failed += 1
+            return
 
         # The currentJobId render depends on a search context, so the url carries a generic
         # keywords value alongside the requested job id
@@ -1287,151 +1666,46 @@ class AuthenticatedStrategy(Strategy):
         # without emitting rather than crashing
         if not self.__open_and_wait(
                 driver, tag, url,
-                lambda d: AuthenticatedStrategy.__wait_for_job_panel(d, job_id)):
+                lambda d: AuthenticatedStrategy.__wait_for_job_panel(d, job_id, self.scraper.timings)):
             if AuthenticatedStrategy.__is_throttled(driver):
                 # A 429 is transient: the job may well exist, we just could not confirm it
                 warn(tag, f'LinkedIn kept throttling, could not confirm job {job_id}, skip')
+                metrics.failed += 1
                 return
 
             if not is_on_linkedin(driver):
                 # An error page tells us nothing about the job itself
                 warn(tag, f'The page did not load, nothing can be said about job {job_id}, skip')
                 debug(tag, AuthenticatedStrategy.__describe_page(driver))
+                metrics.failed += 1
                 return
 
             # On LinkedIn, authenticated and not throttled, yet the panel never rendered: the
             # job genuinely does not exist or is no longer available
             warn(tag, f'Job {job_id} not found or no longer available')
+            metrics.missed += 1
             self.scraper.emit(Events.NOT_FOUND, EventNotFound(job_id=job_id))
             return
 
-        # Extract title/company/place from the panel top card
-        debug(tag, 'Evaluating selectors', [Selectors.panel_title, Selectors.panel_company, Selectors.date_text])
-
-        job_title, job_company, job_place = driver.execute_script(
-            r'''
-                const titleEl = document.querySelector(arguments[0]);
-                const companyEl = document.querySelector(arguments[1]);
-                const tertiaryEl = document.querySelector(arguments[2]);
-
-                const title = titleEl
-                    ? (titleEl.innerText.split('\n').map(e => e.trim()).find(e => e.length) || "")
-                    : "";
-
-                const company = companyEl ? companyEl.innerText.trim() : "";
-
-                // The container reads "<place> · <date> · <applicants>", but any segment can be
-                // missing; the place is the first segment
-                let place = "";
-                if (tertiaryEl) {
-                    const segments = tertiaryEl.innerText
-                        .split('·')
-                        .map(e => e.replace(/[\n\r\t ]+/g, ' ').trim())
-                        .filter(e => e.length);
-                    place = segments.length ? segments[0] : "";
-                }
-
-                return [title, company, place];
-            ''',
-            Selectors.panel_title,
-            Selectors.panel_company,
-            Selectors.date_text)
-
-        job_title = normalize_spaces(job_title)
-        job_company = normalize_spaces(job_company)
-        job_place = normalize_spaces(job_place)
-
-        # Extract date text (eg '1 week ago')
-        debug(tag, 'Evaluating selectors', [Selectors.date_text])
-
-        job_date_text = driver.execute_script(
-            r'''
-                const el = document.querySelector(arguments[0]);
-
-                if (!el) {
-                    return "";
-                }
-
-                // The container reads "<place> · <date> · <applicants>", but any
-                // segment can be missing, so the date is matched by shape rather
-                // than by its position
-                const segments = el.innerText
-                    .split('·')
-                    .map(e => e.replace(/[\n\r\t ]+/g, ' ').trim())
-                    .filter(e => e.length);
-
-                return segments.find(e => /\bago\b|just now/i.test(e)) || "";
-            ''',
-            Selectors.date_text
-        )
-
-        # Extract company link
-        debug(tag, 'Evaluating selectors', [Selectors.company_link])
+        # Every field in one call: the panel has settled, so there is nothing left to wait for
+        extracted = extract_job(driver, AuthenticatedStrategy.__extraction_args(job_id, None, False))
 
-        job_company_link = driver.execute_script(
-            r'''
-                const el = document.querySelector(arguments[0]);
-
-                if (el) {
-                    const href = (el.getAttribute("href") || "").split("?")[0];
-                    return href.replace(/\/life\/?$/, "");
-                }
-                else {
-                    return "";
-                }
-            ''',
-            Selectors.company_link
-        )
-
-        # Extract employee count
-        debug(tag, 'Evaluating selectors', [Selectors.company_employee_count])
-
-        job_company_employee_count = driver.execute_script(
-            '''
-                const spans = Array.from(document.querySelectorAll(arguments[0]));
-                const el = spans.find(e => /employee/i.test(e.innerText));
-
-                if (el) {
-                    return el.innerText.split(' employees')[0].replace(/,/g, '').trim();
-                }
-
-                return '';
-            ''',
-            Selectors.company_employee_count
-        )
-
-        # Extract description
-        debug(tag, 'Evaluating selectors', [Selectors.description])
-
-        job_description, job_description_html = driver.execute_script(
-            '''
-                const el = document.querySelector(arguments[0]);
+        if extracted is None:
+            # The panel settled, then the document went: nothing was read, and nothing about
+            # the job can be said from that
+            warn(tag, f'The page was replaced while job {job_id} was read, skip')
+            metrics.failed += 1
+            return
 
-                if (!el) {
-                    return ["", ""];
-                }
+        fields = extracted['fields']
 
-                return [
-                    el.innerText,
-                    el.outerHTML
-                ];
-            ''',
-            Selectors.description)
-
-        # Extract insights
-        debug(tag, 'Evaluating selectors', [Selectors.insights])
-
-        job_insights = driver.execute_script(
-            r'''
-                const nodes = document.querySelectorAll(arguments[0]);
-                return Array.from(nodes).map(e => e.textContent.replace(/[\n\r\t ]+/g, ' ').trim());
-            ''',
-            Selectors.insights)
+        debug(tag, 'Extraction timings (ms)', {name: round(ms, 1) for name, ms in extracted['timings'].items()})
 
         # Apply link
         job_apply_link = ''
 
         if apply_link:
+            sleep(self.scraper.pacer.wait(RequestClass.APPLY))
             apply_link_result = AuthenticatedStrategy.__extract_apply_link(tag, driver)
 
             if apply_link_result['success']:
@@ -1442,24 +1716,17 @@ class AuthenticatedStrategy(Strategy):
             location='',
             job_id=job_id,
             job_index=-1,
-            title=job_title,
-            company=job_company,
-            company_link=job_company_link,
-            company_employee_count=job_company_employee_count,
-            company_img_link='',
-            place=job_place,
-            date='',
-            date_text=job_date_text,
             link=job_link,
             apply_link=job_apply_link,
-            description=job_description,
-            description_html=job_description_html,
-            insights=job_insights)
+            **to_event_fields(fields))
 
         info(tag, 'Processed')
 
         self.scraper.emit(Events.DATA, data)
 
+        metrics.processed += 1
+        metrics.transferred += AuthenticatedStrategy.__read_transferred(driver)
+
     def run(
         self,
         driver: webdriver,
@@ -1479,41 +1746,55 @@ class AuthenticatedStrategy(Strategy):
         :return: None
         """
 
-        tag = f'[{query.query}][{location}]'
+        prefetch = PagePrefetch(driver) if self.scraper.prefetch_pages else None
 
-        metrics = EventMetrics()
+        # However the crawl ends, the page it opened ahead of time is not left behind in a
+        # browser the next unit of work may be handed
+        try:
+            self.__crawl(driver, search_url, query, location, page_offset, prefetch)
+        finally:
+            if prefetch is not None:
+                prefetch.discard()
 
-        pagination_index = page_offset
+    def __crawl(
+        self,
+        driver: webdriver,
+        search_url: str,
+        query: Query,
+        location: str,
+        page_offset: int,
+        prefetch: PagePrefetch | None,
+    ) -> None:
+        """
+        Crawl the results of a location, page after page
+        :param driver: webdriver
+        :param search_url: str
+        :param query: Query
+        :param location: str
+        :param page_offset: int
+        :param prefetch: PagePrefetch | None where the next page is loaded ahead of time, None to not
+        :return: None
+        """
 
-        # Open main page first to verify/set the session
-        debug(tag, f'Opening {HOME_URL}')
-        driver.get(HOME_URL)
-        sleep(self.scraper.pacer.delay)
+        tag = f'[{query.query}][{location}]'
 
-        # Both the masking and the cookies need the browser to be on a LinkedIn page: client
-        # hints are not exposed outside a secure context, and a cookie can only be injected
-        # for the domain of the document on screen
-        if not wait_for_linkedin(driver):
-            warn(tag, 'The browser never landed on LinkedIn, skip')
-            debug(tag, AuthenticatedStrategy.__describe_page(driver))
-            return
+        metrics = EventMetrics()
 
-        # This first page is the only one requested before the session cookie is in place,
-        # so it is where the headless User-Agent can still be replaced without any
-        # authenticated request having carried it
-        mask_headless_user_agent(driver)
+        pagination_index = page_offset
 
         has_profile = bool(self.scraper.chrome_user_data_dir)
 
-        # A session already in the jar, which is what a persistent profile provides, wins
-        # over any supplied credential. Only a profile can be carrying one, so only then is
-        # it worth waiting for the navigation to deliver it.
-        if has_profile:
-            AuthenticatedStrategy.__wait_for_session(driver)
+        # Where the last crawl of this location stopped, when the run resumes it. The search
+        # url holds the query, the location and every filter, so it is the crawl's identity.
+        checkpoint = self.scraper.checkpoint(search_url)
+        restored = checkpoint.restore(metrics)
 
-        if not AuthenticatedStrategy.__is_authenticated_session(driver):
-            if not AuthenticatedStrategy.__authenticate(driver, tag, has_profile):
-                return
+        if restored is not None:
+            pagination_index = restored['page']
+            info(tag, f'Resuming at page {pagination_index}, {len(restored["processed_ids"])} jobs already processed')
+
+        if not self.__establish_session(driver, tag, has_profile):
+            return
 
         # Open search url
         current_url = override_query_params(search_url, {'start': pagination_index * PAGINATION_SIZE})
@@ -1521,10 +1802,14 @@ class AuthenticatedStrategy(Strategy):
         if not self.__open_results(driver, tag, current_url, has_profile):
             return
 
+        # The window the results are worked in, which changes whenever a prefetched page takes
+        # over from the one before it. Without prefetching it is only ever the first one.
+        page_handle = driver.current_window_handle if prefetch is not None else None
+
         # A page is re-opened whenever the session has to be rebuilt part way through it, so
         # the jobs already delivered are remembered for the whole location rather than per
         # page. It also covers LinkedIn re-rendering a card it has already shown.
-        processed_ids = set()
+        processed_ids = restored['processed_ids'] if restored is not None else set()
         recoveries = 0
 
         # Which document was on screen at the last reading, and how many refused requests it
@@ -1544,8 +1829,26 @@ class AuthenticatedStrategy(Strategy):
         # is guarded against the re-entry that a mid-run session recovery causes.
         begin_emitted = False
 
+        # LinkedIn's count of the results, which says how many items the last page holds
+        job_total = -1
+        timings = self.scraper.timings
+
+        # Why the crawl crossed into jobs an earlier one covered, once it has
+        watermark = Watermark(query, self.scraper.seen_index)
+        watermark_reached = None
+
+        # A query asking only for what the cards show has no use for the details panel
+        details = query.options.details and needs_details(query.options.fields)
+
+        # Pipelined, each job's waits overlap the work around it: the next card renders while
+        # this one is read, and the next job is opened as soon as the pacer allows
+        pipelined = details and self.scraper.pipeline_details
+        last_read = None
+
         # Pagination loop
         while is_unlimited or metrics.processed < limit:
+            self.scraper.raise_if_cancelled()
+
             # Verify session in loop
             if AuthenticatedStrategy.__is_session_lost(driver):
                 if recoveries >= MAX_SESSION_RECOVERIES:
@@ -1555,6 +1858,10 @@ class AuthenticatedStrategy(Strategy):
                 recoveries += 1
                 warn(tag, 'Session is no longer valid, rebuilding it and re-opening this page')
 
+                # Whatever was prefetched was asked for with the session that is being replaced
+                if prefetch is not None:
+                    prefetch.discard()
+
                 # Every credential is tried again here, and the page is opened once more with
                 # whatever session comes out of it
                 if not self.__open_results(driver, tag, current_url, has_profile):
@@ -1574,11 +1881,20 @@ class AuthenticatedStrategy(Strategy):
             # grows as the page is scrolled, so it is re-read on every iteration - but the
             # first read waits for the preliminary render to be replaced, since the ids it
             # shows are largely not the ones the page ends up holding.
-            job_ids = AuthenticatedStrategy.__wait_for_stable_job_ids(driver)
+            if job_total < 0:
+                job_total = AuthenticatedStrategy.__read_job_total(driver)
+
+            job_ids = AuthenticatedStrategy.__wait_for_stable_job_ids(
+                driver, timings, expected_page_size(job_total, pagination_index))
 
             if not begin_emitted:
                 begin_emitted = True
-                self.__emit_begin(driver, tag)
+
+                # The header may only have rendered its count along with the list
+                if job_total < 0:
+                    job_total = AuthenticatedStrategy.__read_job_total(driver)
+
+                self.__emit_begin(tag, job_total)
 
             # LinkedIn serves the last page repeatedly once results run out, so in an
             # unlimited run a page carrying no id that has not already been processed marks
@@ -1587,6 +1903,21 @@ class AuthenticatedStrategy(Strategy):
                 info(tag, 'No new jobs on this page, results exhausted')
                 break
 
+            # The next page loads while this one is worked. A short page is the last one, and one
+            # that may well reach the limit leaves the next unasked for.
+            if prefetch is not None and len(job_ids) >= PAGINATION_SIZE:
+                next_start = (pagination_index + 1) * PAGINATION_SIZE
+                next_url = override_query_params(search_url, {'start': next_start})
+
+                needed = next_start < MAX_RESULTS_CEILING if is_unlimited else \
+                    metrics.processed + len(job_ids) < limit
+
+                if needed and prefetch.url != next_url:
+                    self.__prefetch_page(prefetch, tag, next_url)
+
+            # Windows no job of this page may close
+            reserved = prefetch.handles if prefetch is not None else set()
+
             known_ids = set(job_ids)
             next_index = 0
             session_lost = False
@@ -1611,16 +1942,42 @@ class AuthenticatedStrategy(Strategy):
                     debug(tag, f'Job {job_id} was already processed, skip')
                     continue
 
-                sleep(self.scraper.pacer.delay)
+                watermark_reached = watermark.reached_at(job_id)
+
+                if watermark_reached:
+                    break
+
+                # Delivered by an earlier run: the id on the card is all it takes to know, so
+                # the click and the details, which are the whole cost of a job, are spared. It
+                # is still seen today, which is what its last_seen records.
+                if query.options.only_new and job_id in self.scraper.seen_index:
+                    debug(tag, f'Job {job_id} was delivered by an earlier run, skip')
+                    self.scraper.seen_index.add([job_id])
+                    processed_ids.add(job_id)
+                    metrics.skipped += 1
+                    continue
+
+                # Checked before every job, not only when one is reported: a page of cards
+                # that never render goes on without reporting anything
+                self.scraper.raise_if_cancelled()
+
+                # A job read off its card asks LinkedIn for nothing: the page it is on was paced
+                # when it was opened. A pipelined one is paced when it is opened instead.
+                if details and not pipelined:
+                    sleep(self.scraper.pacer.wait(RequestClass.CARD))
+
                 tag = f'[{query.query}][{location}][{pagination_index * PAGINATION_SIZE + job_index + 1}]'
 
                 # Try to recover focus to main page in case of unwanted tabs still open
                 # (generally caused by apply link click).
-                if len(driver.window_handles) > 1:
+                if len(driver.window_handles) > 1 + len(reserved):
                     debug('Try closing unwanted targets')
                     try:
                         targets_result = driver.execute_cdp_cmd('Target.getTargets', {})
 
+                        # The tabs other workers of a shared browser are on are theirs
+                        siblings = AuthenticatedStrategy.__sibling_handles(driver) | reserved
+
                         # try to close other unwanted tabs (targets)
                         if targets_result and 'targetInfos' in targets_result and len(targets_result['targetInfos']) > 1:
                             for target in targets_result['targetInfos']:
@@ -1629,6 +1986,9 @@ class AuthenticatedStrategy(Strategy):
                                 if target.get('type') != 'page' or 'targetId' not in target:
                                     continue
 
+                                if target['targetId'] in siblings:
+                                    continue
+
                                 if 'linkedin.com/jobs' not in target.get('url', ''):
                                     debug(f'Closing target {target["url"]}')
                                     driver.execute_cdp_cmd('Target.closeTarget',
@@ -1638,11 +1998,11 @@ class AuthenticatedStrategy(Strategy):
                         warn(tag, 'Failed to close unwanted targets', e)
                     finally:
                         debug('Switched to main handle')
-                        driver.switch_to.window(driver.window_handles[0])
+                        driver.switch_to.window(page_handle or driver.window_handles[0])
 
                 try:
                     # Wait for the card of this job to be rendered before reading it
-                    load_card_result = AuthenticatedStrategy.__load_job_card(driver, job_id)
+                    load_card_result = AuthenticatedStrategy.__load_job_card(driver, job_id, timings)
 
                     if not load_card_result['success']:
                         # An id that left the list belongs to a render LinkedIn has since
@@ -1656,17 +2016,29 @@ class AuthenticatedStrategy(Strategy):
                         metrics.failed += 1
                         continue
 
-                    # Extract job main fields
-                    debug(tag, 'Evaluating selectors', [
-                        Selectors.job_items,
-                        Selectors.link,
-                        Selectors.company,
-                        Selectors.place,
-                        Selectors.date])
-
-                    job_title, job_company, \
-                        job_company_img_link, job_place, job_date, job_is_promoted = \
-                        driver.execute_script(
+                    watermark_reached = watermark.reached_on(load_card_result['date'])
+
+                    if watermark_reached:
+                        break
+
+                    # The link emitted to consumers is the canonical job URL, matching the
+                    # single-job path and free of the list anchor's tracking params
+                    job_link = f'{JOBS_URL}/view/{job_id}'
+
+                    if details:
+                        # Open the job. Its fields are read once its details have loaded, card
+                        # and panel in the same call; only the promoted flag is needed now, to
+                        # skip the job before its details are asked for.
+                        debug(tag, 'Evaluating selectors', [Selectors.job_items, Selectors.link])
+
+                        if pipelined:
+                            # The card and the details are slept as one: the serial loop's two sleeps,
+                            # inside which the card was brought into view while the last job was read
+                            pacer = self.scraper.pacer
+                            spacing = pacer.delay_of(RequestClass.CARD) + pacer.delay_of(RequestClass.DETAILS)
+                            sleep(pacer.wait(RequestClass.DETAILS, time_to_next_job(last_read, spacing, monotonic())))
+
+                        job_is_promoted = driver.execute_script(
                             '''
                                 const job = document.querySelector(arguments[0]);
                                 const link = job.querySelector(arguments[1]);
@@ -1675,195 +2047,84 @@ class AuthenticatedStrategy(Strategy):
                                 link.scrollIntoView();
                                 link.click();
 
-                                let title = "";
-                                const titleElem = job.querySelector(arguments[2]);
-
-                                if (titleElem) {
-                                    // The title is duplicated in a visually hidden node for
-                                    // screen readers, the strong element holds the visible one
-                                    const visibleTitle = titleElem.querySelector("strong") || titleElem;
-
-                                    title = visibleTitle.innerText
-                                        .split("\\n")
-                                        .map(e => e.trim())
-                                        .filter(e => e.length)[0] || "";
-                                }
-
-                                let company = "";
-                                const companyElem = job.querySelector(arguments[3]);
-
-                                if (companyElem) {
-                                    company = companyElem.innerText;
-                                }
-
-                                const companyImgLink = job.querySelector("img") ?
-                                    job.querySelector("img").getAttribute("src") : "";
-
-                                const place = job.querySelector(arguments[4]) ?
-                                    job.querySelector(arguments[4]).innerText : "";
-
-                                const date = job.querySelector(arguments[5]) ?
-                                    job.querySelector(arguments[5]).getAttribute('datetime') : "";
-
-                                const isPromoted = Array.from(job.querySelectorAll('li'))
+                                return Array.from(job.querySelectorAll('li'))
                                     .find(e => e.innerText === 'Promoted') ? true : false;
-
-                                return [
-                                    title,
-                                    company,
-                                    companyImgLink,
-                                    place,
-                                    date,
-                                    isPromoted,
-                                ];
                             ''',
                             get_job_item_selector(job_id),
-                            Selectors.link,
-                            Selectors.title,
-                            Selectors.company,
-                            Selectors.place,
-                            Selectors.date)
-
-                    # Promoted jobs
-                    if query.options.skip_promoted_jobs and job_is_promoted:
-                        info(tag, 'Skipped because promoted')
-                        metrics.skipped += 1
-                        continue
+                            Selectors.link)
 
-                    job_title = normalize_spaces(job_title)
-                    job_company = normalize_spaces(job_company)
-                    job_place = normalize_spaces(job_place)
+                        # Promoted jobs
+                        if query.options.skip_promoted_jobs and job_is_promoted:
+                            info(tag, 'Skipped because promoted')
+                            metrics.skipped += 1
+                            continue
 
-                    # The link emitted to consumers is the canonical job URL, matching the
-                    # single-job path and free of the list anchor's tracking params
-                    job_link = f'{JOBS_URL}/view/{job_id}'
+                        if not pipelined:
+                            sleep(self.scraper.pacer.wait(RequestClass.DETAILS))
 
-                    sleep(self.scraper.pacer.delay)
+                        # The job is open, so the list is free to move on to the next card, which
+                        # renders while the details load and are read
+                        if pipelined and next_index < len(job_ids):
+                            AuthenticatedStrategy.__prefetch_card(driver, job_ids[next_index])
 
-                    # Wait for job details to load
-                    debug(tag, f'Loading details job {job_id}')
-                    load_result = AuthenticatedStrategy.__load_job_details(driver, job_id)
+                        # Wait for job details to load, and read them
+                        debug(tag, f'Loading details job {job_id}')
+                        load_result = AuthenticatedStrategy.__extract_job_details(
+                            driver, tag, job_id, query.options.fields, timings)
+                        last_read = monotonic()
 
-                    if not load_result['success']:
-                        error(tag, load_result['error'], exc_info=False)
-                        info(tag, 'Failed to process')
-                        metrics.failed += 1
-                        continue
+                        if not load_result['success']:
+                            error(tag, load_result['error'], exc_info=False)
+                            info(tag, 'Failed to process')
+                            metrics.failed += 1
+                            continue
+
+                        fields = load_result['fields']
+
+                        # Apply link
+                        job_apply_link = ''
+
+                        if query.options.apply_link and wants(query.options.fields, 'apply_link'):
+                            sleep(self.scraper.pacer.wait(RequestClass.APPLY))
+                            apply_link_result = AuthenticatedStrategy.__extract_apply_link(
+                                tag, driver, reserved=reserved)
+
+                            if apply_link_result['success']:
+                                job_apply_link = apply_link_result['apply_link']
+
+                        data = EventData(
+                            query=query.query,
+                            location=location,
+                            job_id=job_id,
+                            job_index=job_index,
+                            link=job_link,
+                            apply_link=job_apply_link,
+                            **to_event_fields(fields))
+                    else:
+                        # List mode, or only card fields asked for: the job is read where it
+                        # sits in the list, without a click and without its details
+                        card_result = AuthenticatedStrategy.__read_job_card(driver, job_id, query.options.fields)
+
+                        if not card_result['success']:
+                            error(tag, card_result['error'], exc_info=False)
+                            info(tag, 'Failed to process')
+                            metrics.failed += 1
+                            continue
 
-                    # Extract date text (eg '1 week ago')
-                    debug(tag, 'Evaluating selectors', [Selectors.date_text])
-
-                    job_date_text = driver.execute_script(
-                        r'''
-                            const el = document.querySelector(arguments[0]);
-
-                            if (!el) {
-                                return "";
-                            }
-
-                            // The container reads "<place> · <date> · <applicants>", but any
-                            // segment can be missing, so the date is matched by shape rather
-                            // than by its position
-                            const segments = el.innerText
-                                .split('·')
-                                .map(e => e.replace(/[\n\r\t ]+/g, ' ').trim())
-                                .filter(e => e.length);
-
-                            return segments.find(e => /\bago\b|just now/i.test(e)) || "";
-                        ''',
-                        Selectors.date_text
-                    )
-
-                    # Extract company link
-                    debug(tag, 'Evaluating selectors', [Selectors.company_link])
-
-                    job_company_link = driver.execute_script(
-                        r'''
-                            const el = document.querySelector(arguments[0]);
-
-                            if (el) {
-                                const href = el.getAttribute("href") || "";
-                                return href.replace(/\/life\/?(?:\?.*)?$/, "");
-                            }
-                            else {
-                                return "";
-                            }
-                        ''',
-                        Selectors.company_link
-                    )
-
-                    # Extract employee count
-                    debug(tag, 'Evaluating selectors', [Selectors.company_employee_count])
-
-                    job_company_employee_count = driver.execute_script(
-                        '''
-                            const spans = Array.from(document.querySelectorAll(arguments[0]));
-                            const el = spans.find(e => /employee/i.test(e.innerText));
-
-                            if (el) {
-                                return el.innerText.split(' employees')[0].replace(/,/g, '').trim();
-                            }
-
-                            return '';
-                        ''',
-                        Selectors.company_employee_count
-                    )
-
-                    # Extract description
-                    debug(tag, 'Evaluating selectors', [Selectors.description])
-
-                    job_description, job_description_html = driver.execute_script(
-                        '''
-                            const el = document.querySelector(arguments[0]);
-
-                            if (!el) {
-                                return ["", ""];
-                            }
-
-                            return [
-                                el.innerText,
-                                el.outerHTML
-                            ];
-                        ''',
-                        Selectors.description)
-
-                    # Extract insights
-                    debug(tag, 'Evaluating selectors', [Selectors.insights])
-
-                    job_insights = driver.execute_script(
-                        r'''
-                            const nodes = document.querySelectorAll(arguments[0]);
-                            return Array.from(nodes).map(e => e.textContent.replace(/[\n\r\t ]+/g, ' ').trim());                            
-                        ''',
-                        Selectors.insights)
-
-                    # Apply link
-                    job_apply_link = ''
-
-                    if query.options.apply_link:
-                        apply_link_result = AuthenticatedStrategy.__extract_apply_link(tag, driver)
-
-                        if apply_link_result['success']:
-                            job_apply_link = apply_link_result['apply_link']
-
-                    data = EventData(
-                        query=query.query,
-                        location=location,
-                        job_id=job_id,
-                        job_index=job_index,
-                        title=job_title,
-                        company=job_company,
-                        company_link=job_company_link,
-                        company_employee_count=job_company_employee_count,
-                        company_img_link=job_company_img_link,
-                        place=job_place,
-                        date=job_date,
-                        date_text=job_date_text,
-                        link=job_link,
-                        apply_link=job_apply_link,
-                        description=job_description,
-                        description_html=job_description_html,
-                        insights=job_insights)
+                        fields = card_result['fields']
+
+                        if query.options.skip_promoted_jobs and fields['promoted']:
+                            info(tag, 'Skipped because promoted')
+                            metrics.skipped += 1
+                            continue
+
+                        data = EventData(
+                            query=query.query,
+                            location=location,
+                            job_id=job_id,
+                            job_index=job_index,
+                            link=job_link,
+                            **to_event_fields(fields))
 
                     info(tag, 'Processed')
 
@@ -1871,7 +2132,10 @@ class AuthenticatedStrategy(Strategy):
                     processed_ids.add(job_id)
 
                     self.scraper.emit(Events.DATA, data)
+                    checkpoint.save(pagination_index, processed_ids, metrics)
 
+                except CancelledException:
+                    raise
                 except BaseException as e:
                     # Every remaining job of this page would fail the same way, so a lost
                     # session leaves the page to the pagination loop, which rebuilds it
@@ -1896,6 +2160,16 @@ class AuthenticatedStrategy(Strategy):
 
             tag = f'[{query.query}][{location}]'
 
+            # Every job past the watermark was scraped by an earlier crawl, and so was every
+            # page after this one
+            if watermark_reached:
+                info(tag, watermark_reached, 'stop')
+                metrics.transferred += AuthenticatedStrategy.__read_transferred(driver)
+                self.__record_pace(metrics)
+                info(tag, 'Metrics:', str(metrics))
+                self.scraper.emit(Events.METRICS, metrics)
+                break
+
             # The jobs left on this page are not missed, they are retried: the top of this
             # loop rebuilds the session and opens the same page again
             if session_lost:
@@ -1910,18 +2184,21 @@ class AuthenticatedStrategy(Strategy):
             # Check if we reached the limit of jobs to process
             if not is_unlimited and metrics.processed == limit:
                 info(tag, 'Query limit reached!')
+                metrics.transferred += AuthenticatedStrategy.__read_transferred(driver)
                 self.__record_pace(metrics)
                 info(tag, 'Metrics:', str(metrics))
                 self.scraper.emit(Events.METRICS, metrics)
                 break
             else:
                 metrics.missed += len(job_ids) - next_index
+                metrics.transferred += AuthenticatedStrategy.__read_transferred(driver)
                 self.__record_pace(metrics)
                 info(tag, 'Metrics:', str(metrics))
                 self.scraper.emit(Events.METRICS, metrics)
 
             # Try to paginate
             pagination_index += 1
+            checkpoint.save(pagination_index, processed_ids, metrics)
 
             # LinkedIn stops serving results past MAX_RESULTS_CEILING, so an unlimited run
             # does not advance start beyond it.
@@ -1932,7 +2209,19 @@ class AuthenticatedStrategy(Strategy):
 
             info(tag, f'Pagination requested [{pagination_index}]')
             current_url = override_query_params(search_url, {'start': pagination_index * PAGINATION_SIZE})
-            paginate_result = self.__paginate(driver, current_url, tag)
+            prefetched = prefetch.take(current_url) if prefetch is not None else None
+
+            if prefetched is not None:
+                paginate_result = self.__adopt_page(driver, tag, prefetched, page_handle)
+                page_handle = prefetched
+
+                # Only ever a head start: a page that did not come through is opened again the
+                # usual way, in the window it was switched to
+                if not paginate_result['success']:
+                    warn(tag, 'The prefetched page failed, opening it again', paginate_result['error'])
+                    paginate_result = self.__paginate(driver, current_url, tag)
+            else:
+                paginate_result = self.__paginate(driver, current_url, tag)
 
             # The next page does not always render on the first attempt, and giving up there
             # costs every result past the first page. A throttled one is the exception: the
@@ -1964,3 +2253,7 @@ class AuthenticatedStrategy(Strategy):
 
                 info(tag, "Couldn't find more jobs for the running query", paginate_result['error'])
                 return
+
+        # Every way out of the loop above is the crawl being over, and there is nothing left to
+        # resume. Every return is a crawl cut short, which leaves its checkpoint behind.
+        checkpoint.clear()
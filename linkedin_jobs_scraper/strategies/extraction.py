@@ -0,0 +1,286 @@
+"""Every field of a job read off the page in a single WebDriver call."""
+from selenium import webdriver
+from ..events import EventData
+from ..utils.logger import debug
+from ..utils.text import normalize_spaces
+
+# The global the extraction function is kept under in every document. It is defined
+# non-enumerable, so it does not show up when the page walks its own window object.
+EXTRACT_FUNCTION_NAME = '__ljsExtractJob'
+
+# The extraction routine itself. It receives the selectors and the job it is after, and
+# answers null while the details panel does not hold that job yet, which lets the caller
+# poll the extraction itself instead of waiting first and reading afterwards. Asked for the
+# card only, it reads the fields the results list shows and leaves the panel alone.
+#
+# Each field is read by a function of its own and timed separately, so a selector that has
+# started matching half the page shows up as the one field taking all the time.
+EXTRACT_FUNCTION = r'''
+function (args) {
+    const s = args.selectors;
+    const started = performance.now();
+    const timings = {};
+
+    const timed = (name, read) => {
+        const start = performance.now();
+
+        try {
+            return read();
+        } finally {
+            timings[name] = performance.now() - start;
+        }
+    };
+
+    if (args.requireDetails) {
+        const detailsPanel = document.querySelector(s.detailsPanel);
+        const description = document.querySelector(s.description);
+
+        if (!(detailsPanel && detailsPanel.innerHTML.includes(args.jobId) &&
+              description && description.innerText.length > 0)) {
+            return null;
+        }
+    }
+
+    // The containers read "<place> · <date> · <applicants>", but any segment can be missing
+    const segmentsOf = el => el
+        ? el.innerText
+            .split('·')
+            .map(e => e.replace(/[\n\r\t ]+/g, ' ').trim())
+            .filter(e => e.length)
+        : [];
+
+    const fields = {};
+
+    // A field nobody asked for is neither read nor sent back, which matters most for
+    // description_html: the panel's whole markup, often tens of KB
+    const field = (name, read) => {
+        if (!args.fields || args.fields.includes(name)) {
+            fields[name] = timed(name, read);
+        }
+    };
+
+    // The card is read after the details have loaded, by which time the virtualized list may
+    // have re-rendered it away; the panel's top card holds the same title, company and place
+    const job = args.cardSelector ? document.querySelector(args.cardSelector) : null;
+
+    if (job) {
+        field('title', () => {
+            const titleElem = job.querySelector(s.title);
+
+            if (!titleElem) {
+                return "";
+            }
+
+            // The title is duplicated in a visually hidden node for screen readers, the
+            // strong element holds the visible one
+            const visibleTitle = titleElem.querySelector("strong") || titleElem;
+
+            return visibleTitle.innerText
+                .split("\n")
+                .map(e => e.trim())
+                .filter(e => e.length)[0] || "";
+        });
+
+        field('company', () => {
+            const el = job.querySelector(s.company);
+            return el ? el.innerText : "";
+        });
+
+        field('company_img_link', () => {
+            const el = job.querySelector("img");
+            return el ? el.getAttribute("src") || "" : "";
+        });
+
+        field('place', () => {
+            const el = job.querySelector(s.place);
+            return el ? el.innerText : "";
+        });
+
+        field('date', () => {
+            const el = job.querySelector(s.date);
+            return el ? el.getAttribute('datetime') || "" : "";
+        });
+
+        // The card is all a job read without opening it has, and the panel holds some other job
+        if (args.cardOnly) {
+            fields.promoted = timed('promoted', () =>
+                Array.from(job.querySelectorAll('li')).some(e => e.innerText === 'Promoted'));
+
+            timings.total = performance.now() - started;
+
+            return {fields: fields, timings: timings};
+        }
+    } else if (args.cardOnly) {
+        // Re-rendered away between the card loading and this read
+        return null;
+    } else {
+        field('title', () => {
+            const el = document.querySelector(s.panelTitle);
+
+            return el
+                ? (el.innerText.split('\n').map(e => e.trim()).find(e => e.length) || "")
+                : "";
+        });
+
+        field('company', () => {
+            const el = document.querySelector(s.panelCompany);
+            return el ? el.innerText.trim() : "";
+        });
+
+        // The place is the first segment of the panel's tertiary line
+        field('place', () => segmentsOf(document.querySelector(s.dateText))[0] || "");
+    }
+
+    // The date is matched by shape rather than by its position among the segments
+    field('date_text', () =>
+        segmentsOf(document.querySelector(s.dateText)).find(e => /\bago\b|just now/i.test(e)) || "");
+
+    field('company_link', () => {
+        const el = document.querySelector(s.companyLink);
+
+        if (!el) {
+            return "";
+        }
+
+        const href = el.getAttribute("href") || "";
+
+        return args.cardSelector
+            ? href.replace(/\/life\/?(?:\?.*)?$/, "")
+            : href.split("?")[0].replace(/\/life\/?$/, "");
+    });
+
+    field('company_employee_count', () => {
+        const spans = Array.from(document.querySelectorAll(s.companyEmployeeCount));
+        const el = spans.find(e => /employee/i.test(e.innerText));
+        return el ? el.innerText.split(' employees')[0].replace(/,/g, '').trim() : '';
+    });
+
+    field('description', () => {
+        const el = document.querySelector(s.description);
+        return el ? el.innerText : "";
+    });
+
+    field('description_html', () => {
+        const el = document.querySelector(s.description);
+        return el ? el.outerHTML : "";
+    });
+
+    field('insights', () =>
+        Array.from(document.querySelectorAll(s.insights))
+            .map(e => e.textContent.replace(/[\n\r\t ]+/g, ' ').trim()));
+
+    timings.total = performance.now() - started;
+
+    return {fields: fields, timings: timings};
+}
+'''
+
+# Defines the function in the document it runs in. Registered with the browser, it runs in
+# every document before the page's own scripts, so the function is there by the time a job
+# is read and each read ships a one-line call rather than the whole routine.
+INSTALL_SCRIPT = f'''
+    if (typeof window['{EXTRACT_FUNCTION_NAME}'] !== 'function') {{
+        Object.defineProperty(window, '{EXTRACT_FUNCTION_NAME}', {{
+            value: ({EXTRACT_FUNCTION}),
+            enumerable: false,
+            configurable: true,
+        }});
+    }}
+'''
+
+CALL_SCRIPT = f'''
+    const extract = window['{EXTRACT_FUNCTION_NAME}'];
+    return typeof extract === 'function' ? {{installed: true, result: extract(arguments[0])}} : {{installed: false}};
+'''
+
+INSTALL_AND_CALL_SCRIPT = INSTALL_SCRIPT + f'''
+    return {{installed: true, result: window['{EXTRACT_FUNCTION_NAME}'](arguments[0])}};
+'''
+
+# The condition of a wait on the extraction, see utils.waits: the function defined in the
+# document is called on every tick, and what the wait ships is this line rather than the
+# routine. A document that predates the registration ends the wait at once, saying so.
+WAIT_CONDITION = f'''
+    const extract = window['{EXTRACT_FUNCTION_NAME}'];
+    return typeof extract === 'function' ? extract(args[0]) : {{installed: false}};
+'''
+
+
+def register_extraction(driver: webdriver) -> bool:
+    """
+    Have the browser define the extraction function in every document it opens from now on
+
+    :param driver: webdriver
+    :return: bool False when the browser does not speak CDP, in which case every new document
+        pays one call that ships the whole routine
+    """
+
+    try:
+        driver.execute_cdp_cmd('Page.addScriptToEvaluateOnNewDocument', {'source': INSTALL_SCRIPT})
+        return True
+    except BaseException as e:
+        debug('Failed to register the extraction script', e)
+        return False
+
+
+def install_extraction(driver: webdriver) -> None:
+    """
+    Define the extraction function in the document on screen, which was opened before it was
+    registered, and register it for the documents to come
+    :param driver: webdriver
+    :return: None
+    """
+
+    register_extraction(driver)
+    driver.execute_script(INSTALL_SCRIPT)
+
+
+def is_uninstalled(value) -> bool:
+    """
+    Return True if a wait on WAIT_CONDITION ended on a document without the function
+    :param value: the value the wait answered with
+    :return: bool
+    """
+
+    return isinstance(value, dict) and value.get('installed') is False
+
+
+def extract_job(driver: webdriver, args: dict) -> dict | None:
+    """
+    Read every field of a job in one call, or None while its details have not loaded
+
+    A document opened before the function was registered, or in a browser that could not
+    register it, answers that it has no such function. That document gets it defined on the
+    spot, and the browser is asked once more to define it in every document to come.
+
+    :param driver: webdriver
+    :param args: dict what the extraction function expects: selectors, jobId, cardSelector,
+        requireDetails, cardOnly and fields, the names to read or None for all of them
+    :return: dict with 'fields', holding only the names asked for, and 'timings', in
+        milliseconds per field, None as well while the document is being swapped
+    """
+
+    answer = driver.execute_script(CALL_SCRIPT, args)
+
+    # A document on its way out answers nothing at all, which says as little about the
+    # function as about the job
+    if answer is None:
+        return None
+
+    if not answer['installed']:
+        register_extraction(driver)
+        answer = driver.execute_script(INSTALL_AND_CALL_SCRIPT, args)
+
+    return answer['result'] if answer is not None else None
+
+
+def to_event_fields(fields: dict) -> dict:
+    """
+    Turn the fields an extraction read into EventData arguments, the ones it did not read left out
+    :param fields: dict
+    :return: dict
+    """
+
+    # Read off the rendered text, where the spacing is whatever the markup left
+    return {name: normalize_spaces(value) if name in ('title', 'company', 'place') else value
+            for name, value in fields.items() if name in EventData._fields}
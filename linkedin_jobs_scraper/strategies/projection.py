@@ -0,0 +1,46 @@
+"""Which fields of a job a query asked for, and what reading only those spares."""
+from typing import List, Optional
+from ..events import EventData
+
+# Every job carries these whatever was asked for: they cost nothing to know, and the scraper
+# itself needs the id, for the seen-index, checkpoints and deduplication
+IDENTITY_FIELDS = ('query', 'location', 'job_id', 'job_index', 'link')
+
+# What a result card shows. A job whose asked-for fields are all among these is never opened.
+CARD_FIELDS = ('title', 'company', 'company_img_link', 'place', 'date')
+
+
+def needs_details(fields: Optional[List[str]]) -> bool:
+    """
+    Tell whether any of the fields asked for is only found past the card, in the job's details
+    :param fields: Optional[List[str]] None for every field
+    :return: bool
+    """
+
+    return fields is None or any(name not in IDENTITY_FIELDS + CARD_FIELDS for name in fields)
+
+
+def wants(fields: Optional[List[str]], name: str) -> bool:
+    """
+    Tell whether a field was asked for
+    :param fields: Optional[List[str]] None for every field
+    :param name: str
+    :return: bool
+    """
+
+    return fields is None or name in fields or name in IDENTITY_FIELDS
+
+
+def project(data: EventData, fields: Optional[List[str]]) -> EventData:
+    """
+    Clear the fields that were not asked for, so they are not held on to downstream
+    :param data: EventData
+    :param fields: Optional[List[str]] None for every field
+    :return: EventData
+    """
+
+    if fields is None:
+        return data
+
+    return data._replace(**{name: EventData._field_defaults[name] for name in EventData._fields
+                            if not wants(fields, name)})
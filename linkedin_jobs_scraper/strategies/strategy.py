@@ -1,5 +1,6 @@
 from selenium import webdriver
 from ..query import Query
+from ..events import EventMetrics
 
 
 class Strategy:
@@ -20,6 +21,15 @@ class Strategy:
         self,
         driver: webdriver,
         job_id: str,
-        apply_link: bool = False
+        apply_link: bool = False,
+        metrics: EventMetrics = None
     ) -> None:
         raise NotImplementedError('Must implement method in subclass')
+
+    def is_reusable(self, driver: webdriver) -> bool:
+        """
+        Return True if a browser that has served a unit of work can be handed to the next one
+        :param driver: webdriver
+        :return: bool
+        """
+        return True
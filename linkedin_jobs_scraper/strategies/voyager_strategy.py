@@ -0,0 +1,650 @@
+import json
+import re
+import traceback
+from datetime import datetime, timezone
+from time import sleep
+from urllib.parse import quote, urlencode
+from selenium import webdriver
+from .watermark import Watermark
+from .projection import needs_details, project
+from .authenticated_strategy import (AuthenticatedStrategy, PAGINATION_SIZE, MAX_RESULTS_CEILING,
+                                     THROTTLE_BACKOFF_DELAYS, THROTTLED_STATUS, backoff_wait)
+from ..query import Query
+from ..utils.constants import HOME_URL, JOBS_URL
+from ..utils.logger import debug, info, warn, error
+from ..utils.network import apply_rate_limit_headers
+from ..utils.pacing import RequestClass
+from ..utils.text import normalize_spaces
+from ..utils.url import get_query_params
+from ..events import Events, EventData, EventMetrics, EventBegin, EventNotFound
+from ..exceptions import CancelledException
+
+# The JSON API LinkedIn's own frontend reads jobs from
+VOYAGER_API_URL = f'{HOME_URL}/voyager/api'
+
+# Decorations name the projection of an entity an endpoint answers with. These are the ones
+# the jobs search page and the job detail panel ask for themselves.
+JOB_CARDS_DECORATION = 'com.linkedin.voyager.dash.deco.jobs.search.JobSearchCardsCollection-220'
+JOB_POSTING_DECORATION = 'com.linkedin.voyager.deco.jobs.web.shared.WebFullJobPosting-65'
+
+# Search url params and the names the API knows the same filters by. The values are the
+# same on both sides.
+FILTER_PARAMS = {
+    'f_TPR': 'timePostedRange',
+    'f_JT': 'jobType',
+    'f_E': 'experience',
+    'f_WT': 'workplaceType',
+    'f_SB2': 'salaryBucketV2',
+    'f_C': 'company',
+    'f_I': 'industry',
+    'sortBy': 'sortBy',
+}
+
+# What the API answers a session it no longer accepts with
+SESSION_REFUSED_STATUSES = (401, 403)
+
+NOT_FOUND_STATUS = 404
+
+# Issued from inside the page, so the request carries the browser's own cookies, headers and
+# TLS fingerprint. The API refuses a call without the csrf token, which is the JSESSIONID
+# cookie value. The request is same origin, so its answer's headers are all readable, and
+# the ones about the rate limit come back with the body, no network listener needed.
+FETCH_SCRIPT = '''
+    const done = arguments[arguments.length - 1];
+    const cookie = document.cookie.split('; ').find(c => c.startsWith('JSESSIONID='));
+    const csrf = cookie ? cookie.slice('JSESSIONID='.length).replace(/"/g, '') : '';
+
+    fetch(arguments[0], {
+        credentials: 'include',
+        headers: {
+            'accept': arguments[1],
+            'csrf-token': csrf,
+            'x-restli-protocol-version': '2.0.0',
+        },
+    })
+        .then(response => response.text().then(body => done({
+            status: response.status,
+            body: body,
+            headers: Object.fromEntries(Array.from(response.headers.entries())
+                .filter(([name]) => /retry-after|ratelimit/i.test(name))),
+        })))
+        .catch(e => done({status: 0, body: String(e)}));
+'''
+
+NORMALIZED_JSON = 'application/vnd.linkedin.normalized+json+2.1'
+PLAIN_JSON = 'application/json'
+
+
+def _restli_value(value: str) -> str:
+    """
+    Escape a value for a Rest.li query, where parentheses, commas and colons are syntax
+    :param value: str
+    :return: str
+    """
+
+    return quote(value, safe='')
+
+
+def build_search_query(search_url: str) -> str:
+    """
+    Translate the params of a jobs search url into the Rest.li query the search API expects
+    :param search_url: str
+    :return: str
+    """
+
+    params = get_query_params(search_url)
+    query = ['origin:JOB_SEARCH_PAGE_SEARCH_BUTTON']
+
+    if params.get('keywords'):
+        query.append(f'keywords:{_restli_value(params["keywords"])}')
+
+    # A pinned geo wins over a place name, as it does on the search page
+    if params.get('geoId'):
+        query.append(f'locationUnion:(geoId:{_restli_value(params["geoId"])})')
+    elif params.get('location'):
+        query.append(f'locationFallback:{_restli_value(params["location"])}')
+
+    filters = [f'{name}:List({",".join(_restli_value(v) for v in params[param].split(","))})'
+               for param, name in FILTER_PARAMS.items() if params.get(param)]
+
+    if filters:
+        query.append(f'selectedFilters:({",".join(filters)})')
+
+    query.append('spellCorrectionEnabled:true')
+
+    return f'({",".join(query)})'
+
+
+def build_job_cards_url(search_url: str, start: int, count: int = PAGINATION_SIZE) -> str:
+    """
+    Build the url of a page of search results
+    :param search_url: str
+    :param start: int
+    :param count: int
+    :return: str
+    """
+
+    params = urlencode({
+        'decorationId': JOB_CARDS_DECORATION,
+        'count': count,
+        'q': 'jobSearch',
+        'query': build_search_query(search_url),
+        'start': start,
+    }, safe='(),:%')
+
+    return f'{VOYAGER_API_URL}/voyagerJobsDashJobCards?{params}'
+
+
+def build_job_posting_url(job_id: str) -> str:
+    """
+    Build the url of a job posting
+    :param job_id: str
+    :return: str
+    """
+
+    return f'{VOYAGER_API_URL}/jobs/jobPostings/{job_id}?decorationId={JOB_POSTING_DECORATION}'
+
+
+def _job_id_of(urn: str) -> str:
+    """
+    Return the job id an urn carries, whichever entity it names
+    :param urn: str e.g. 'urn:li:fsd_jobPostingCard:(4055815184,JOBS_SEARCH)'
+    :return: str
+    """
+
+    match = re.search(r'(\d{5,})', urn or '')
+    return match.group(1) if match else ''
+
+
+def _text_of(value) -> str:
+    """
+    Return the text of a TextViewModel, which is how the API sends most strings
+    :param value: dict or str
+    :return: str
+    """
+
+    if isinstance(value, dict):
+        return value.get('text') or ''
+
+    return value or ''
+
+
+def _vector_image_url(image: dict) -> str:
+    """
+    Return the url of the largest rendition of a vector image
+    :param image: dict
+    :return: str
+    """
+
+    if not isinstance(image, dict) or not image.get('artifacts'):
+        return ''
+
+    largest = max(image['artifacts'], key=lambda a: a.get('width') or 0)
+    return f'{image.get("rootUrl", "")}{largest.get("fileIdentifyingUrlPathSegment", "")}'
+
+
+def _find(value, key: str):
+    """
+    Return the first value held under a key anywhere in a nested payload
+
+    Decorated entities nest the same field at depths that differ from one projection to the
+    next, and under union members named after Java classes, so fields are looked for rather
+    than addressed.
+
+    :param value: a decoded JSON payload
+    :param key: str
+    :return: the value, or None
+    """
+
+    if isinstance(value, dict):
+        if key in value:
+            return value[key]
+
+        for child in value.values():
+            found = _find(child, key)
+
+            if found is not None:
+                return found
+
+    if isinstance(value, list):
+        for child in value:
+            found = _find(child, key)
+
+            if found is not None:
+                return found
+
+    return None
+
+
+def format_listed_at(listed_at) -> str:
+    """
+    Format a posting time in epoch milliseconds the way the search page's time[datetime] does
+    :param listed_at: int
+    :return: str
+    """
+
+    if not listed_at:
+        return ''
+
+    return datetime.fromtimestamp(listed_at / 1000, tz=timezone.utc).date().isoformat()
+
+
+def parse_job_cards(payload: dict) -> tuple[int, list]:
+    """
+    Read the total and the cards off a page of search results
+    :param payload: dict a normalized response of the search endpoint
+    :return: tuple the total LinkedIn reports (-1 when absent), and one dict per card, in order
+    """
+
+    data = payload.get('data') or {}
+    paging = data.get('paging') or {}
+    total = paging.get('total', -1)
+
+    cards = {entity.get('entityUrn'): entity for entity in payload.get('included') or []
+             if str(entity.get('$type', '')).endswith('JobPostingCard')}
+
+    # The elements hold the order LinkedIn ranked the results in; the included entities, the
+    # content, in whatever order the server serialized them
+    urns = [_find(element, '*jobPostingCard') for element in data.get('elements') or []]
+    ordered = [cards[urn] for urn in urns if urn in cards] or list(cards.values())
+
+    jobs = []
+
+    for card in ordered:
+        job_id = _job_id_of(card.get('jobPostingUrn') or card.get('*jobPosting') or card.get('entityUrn'))
+
+        if not job_id:
+            continue
+
+        footer = card.get('footerItems') or []
+
+        jobs.append({
+            'job_id': job_id,
+            'title': _text_of(card.get('jobPostingTitle') or card.get('title')),
+            'company': _text_of(card.get('primaryDescription')),
+            'place': _text_of(card.get('secondaryDescription')),
+            'company_img_link': _vector_image_url(_find(card.get('logo'), 'vectorImage')),
+            'date': format_listed_at(next((item.get('timeAt') for item in footer
+                                           if item.get('type') == 'LISTED_DATE'), None)),
+            'is_promoted': any(item.get('type') == 'PROMOTED' for item in footer),
+        })
+
+    return total, jobs
+
+
+def parse_job_posting(payload: dict) -> dict:
+    """
+    Read the fields of a job posting
+    :param payload: dict a plain JSON response of the job posting endpoint
+    :return: dict
+    """
+
+    company = _find(payload.get('companyDetails'), 'companyResolutionResult') or {}
+    apply_url = _find(payload.get('applyMethod'), 'companyApplyUrl') or ''
+    staff_count = company.get('staffCount')
+
+    return {
+        'title': _text_of(payload.get('title')),
+        'company': company.get('name') or _find(payload.get('companyDetails'), 'companyName') or '',
+        'company_link': (company.get('url') or '').split('?')[0],
+        'company_employee_count': str(staff_count) if staff_count is not None else '',
+        'company_img_link': _vector_image_url(_find(company.get('logo'), 'com.linkedin.common.VectorImage')),
+        'place': payload.get('formattedLocation') or '',
+        'date': format_listed_at(payload.get('listedAt')),
+        'description': _text_of(payload.get('description')),
+        'apply_link': apply_url,
+    }
+
+
+class VoyagerStrategy(AuthenticatedStrategy):
+    """
+    Read jobs from the JSON API LinkedIn's own frontend uses, instead of from its pages
+
+    The browser is only there to establish the session and to issue the requests from inside
+    a LinkedIn document, where they carry its cookies. Nothing is rendered and nothing is
+    clicked, so a job costs two requests and the pace between them, which is the pacer's to
+    set rather than the renderer's. With details off it costs none: a page of 25 cards is one
+    request.
+
+    The API answers with data, not with the page, so a few fields the search page shows are
+    not populated: date_text, description_html and insights.
+    """
+
+    def __init__(self, scraper: 'LinkedinScraper'):
+        super().__init__(scraper)
+
+    def __fetch(self, driver: webdriver, tag: str, url: str, accept: str,
+                request_class: RequestClass) -> tuple[int, dict | None]:
+        """
+        Issue an API request from the page, paced, asking again while LinkedIn throttles it
+
+        :param driver: webdriver
+        :param tag: str
+        :param url: str
+        :param accept: str the representation to ask for
+        :param request_class: RequestClass what the request is paced and accounted as
+        :return: tuple the status of the last answer, and its decoded body when it was a 200
+        """
+
+        status = 0
+
+        for delay in (0, *THROTTLE_BACKOFF_DELAYS):
+            if delay:
+                waited = backoff_wait(self.scraper.pacer, delay)
+                warn(tag, f'LinkedIn is throttling this run (HTTP {THROTTLED_STATUS}), '
+                          f'waiting {round(waited, 1)}s before asking again')
+                sleep(waited)
+
+            # Every request waits its turn, which is what bounds how fast an account is read
+            sleep(self.scraper.pacer.wait(request_class))
+
+            debug(tag, f'Fetching {url}')
+
+            try:
+                answer = driver.execute_async_script(FETCH_SCRIPT, url, accept)
+            except BaseException as e:
+                warn(tag, 'Failed to issue the request', e)
+                return 0, None
+
+            status = answer['status']
+            apply_rate_limit_headers(self.scraper.pacer, status,
+                                     {name.lower(): value for name, value in (answer.get('headers') or {}).items()})
+
+            if status == 200:
+                return status, json.loads(answer['body'])
+
+            if status != THROTTLED_STATUS:
+                return status, None
+
+            before = self.scraper.pacer.pace_of(request_class)
+            after = self.scraper.pacer.throttled(request_class)
+
+            if after > before:
+                warn(tag, f'LinkedIn is throttling this run, slowing to {round(after, 2)}s before each '
+                          f'{request_class.value} step')
+
+        warn(tag, f'LinkedIn kept throttling this run after {len(THROTTLE_BACKOFF_DELAYS)} waits. '
+                  f'Raise slow_mo, or lower max_workers, to ask for less')
+
+        return status, None
+
+    def __fetch_job_posting(self, driver: webdriver, tag: str, job_id: str) -> tuple[int, dict | None]:
+        """
+        Fetch and read a job posting
+        :param driver: webdriver
+        :param tag: str
+        :param job_id: str
+        :return: tuple the status, and the fields of the posting when it was found
+        """
+
+        status, payload = self.__fetch(driver, tag, build_job_posting_url(job_id), PLAIN_JSON, RequestClass.DETAILS)
+        return status, parse_job_posting(payload) if payload is not None else None
+
+    def __request_done(self, tag: str, request_class: RequestClass) -> None:
+        """
+        Report a request nobody refused to the pacer, as clean work of the class it was paced as
+        :param tag: str
+        :param request_class: RequestClass
+        :return: None
+        """
+
+        before = self.scraper.pacer.pace_of(request_class)
+        after = self.scraper.pacer.clean(request_class)
+
+        if after < before:
+            info(tag, f'No refusals for a while, easing to {round(after, 2)}s before each '
+                      f'{request_class.value} step')
+
+    def __record_metrics(self, tag: str, metrics: EventMetrics) -> None:
+        """
+        Report the metrics of a page, with the pacer's state on them
+        :param tag: str
+        :param metrics: EventMetrics
+        :return: None
+        """
+
+        metrics.throttled = self.scraper.pacer.throttled_count
+        metrics.pace = round(self.scraper.pacer.delay_of(RequestClass.DETAILS), 2)
+        info(tag, 'Metrics:', str(metrics))
+        self.scraper.emit(Events.METRICS, metrics)
+
+    def run(
+        self,
+        driver: webdriver,
+        search_url: str,
+        query: Query,
+        location: str,
+        page_offset: int,
+    ) -> None:
+        """
+        Run strategy
+        :param driver: webdriver
+        :param search_url: str
+        :param query: Query
+        :param location: str
+        :param page_offset: int
+        :return: None
+        """
+
+        tag = f'[{query.query}][{location}]'
+
+        metrics = EventMetrics()
+
+        if not self.open_session(driver, tag):
+            return
+
+        limit = query.options.limit
+        is_unlimited = limit == 0
+        start = page_offset * PAGINATION_SIZE
+        processed_ids = set()
+        begun = False
+
+        checkpoint = self.scraper.checkpoint(search_url)
+        restored = checkpoint.restore(metrics)
+
+        if restored is not None:
+            start = restored['page'] * PAGINATION_SIZE
+            processed_ids = restored['processed_ids']
+            info(tag, f'Resuming at page {restored["page"]}, {len(processed_ids)} jobs already processed')
+
+        watermark = Watermark(query, self.scraper.seen_index)
+        watermark_reached = None
+
+        # A query asking only for what the cards show has no use for the posting
+        details = query.options.details and needs_details(query.options.fields)
+
+        while is_unlimited or metrics.processed < limit:
+            self.scraper.raise_if_cancelled()
+
+            if start >= MAX_RESULTS_CEILING:
+                info(tag, f'Reached the pagination ceiling of {MAX_RESULTS_CEILING} results, '
+                          f'LinkedIn serves no more past it, stop')
+                break
+
+            status, payload = self.__fetch(driver, tag, build_job_cards_url(search_url, start), NORMALIZED_JSON,
+                                           RequestClass.PAGINATION)
+
+            # Both leave the checkpoint behind, for a run with resume to try again
+            if status in SESSION_REFUSED_STATUSES:
+                warn(tag, f'LinkedIn refused the session (HTTP {status}), skip')
+                return
+
+            if payload is None:
+                warn(tag, f'No results page (HTTP {status}), skip')
+                return
+
+            # The page of cards is a request of its own, eased by its own clean work
+            self.__request_done(tag, RequestClass.PAGINATION)
+
+            total, jobs = parse_job_cards(payload)
+
+            if not begun:
+                debug(tag, f'Total results reported by LinkedIn: {total}')
+                self.scraper.emit(Events.BEGIN, EventBegin(job_total=total))
+                begun = True
+
+            if not jobs:
+                info(tag, 'No more jobs to process')
+                break
+
+            for job_index, card in enumerate(jobs, start=start):
+                if not is_unlimited and metrics.processed >= limit:
+                    break
+
+                job_id = card['job_id']
+                tag = f'[{query.query}][{location}][{job_index + 1}]'
+
+                # LinkedIn repeats a job across pages of the same search now and then
+                if job_id in processed_ids:
+                    continue
+
+                # The list carries the posting day of every job, so the watermark costs no request
+                watermark_reached = watermark.reached_at(job_id) or watermark.reached_on(card['date'])
+
+                if watermark_reached:
+                    break
+
+                # Delivered by an earlier run, so its posting is not fetched again
+                if query.options.only_new and job_id in self.scraper.seen_index:
+                    debug(tag, f'Job {job_id} was delivered by an earlier run, skip')
+                    self.scraper.seen_index.add([job_id])
+                    processed_ids.add(job_id)
+                    metrics.skipped += 1
+                    continue
+
+                if query.options.skip_promoted_jobs and card['is_promoted']:
+                    info(tag, 'Skipped because promoted')
+                    metrics.skipped += 1
+                    continue
+
+                # A request that fails is not reported as a job, so this is checked before each
+                self.scraper.raise_if_cancelled()
+
+                try:
+                    if details:
+                        status, posting = self.__fetch_job_posting(driver, tag, job_id)
+
+                        if posting is None:
+                            warn(tag, f'Failed to fetch job {job_id} (HTTP {status})')
+                            info(tag, 'Failed to process')
+                            metrics.failed += 1
+                            continue
+
+                        data = EventData(
+                            query=query.query,
+                            location=location,
+                            job_id=job_id,
+                            job_index=job_index,
+                            title=normalize_spaces(card['title'] or posting['title']),
+                            company=normalize_spaces(card['company'] or posting['company']),
+                            company_link=posting['company_link'],
+                            company_employee_count=posting['company_employee_count'],
+                            company_img_link=card['company_img_link'] or posting['company_img_link'],
+                            place=normalize_spaces(card['place'] or posting['place']),
+                            date=card['date'] or posting['date'],
+                            link=f'{JOBS_URL}/view/{job_id}',
+                            apply_link=posting['apply_link'] if query.options.apply_link else '',
+                            description=posting['description'])
+                    else:
+                        # List mode, or only card fields asked for: the page of cards holds them
+                        data = EventData(
+                            query=query.query,
+                            location=location,
+                            job_id=job_id,
+                            job_index=job_index,
+                            title=normalize_spaces(card['title']),
+                            company=normalize_spaces(card['company']),
+                            company_img_link=card['company_img_link'],
+                            place=normalize_spaces(card['place']),
+                            date=card['date'],
+                            link=f'{JOBS_URL}/view/{job_id}')
+
+                    info(tag, 'Processed')
+
+                    metrics.processed += 1
+                    processed_ids.add(job_id)
+
+                    # The posting comes whole, so what was not asked for is dropped here
+                    self.scraper.emit(Events.DATA, project(data, query.options.fields))
+                    checkpoint.save(start // PAGINATION_SIZE, processed_ids, metrics)
+
+                    if details:
+                        self.__request_done(tag, RequestClass.DETAILS)
+                except CancelledException:
+                    raise
+                except BaseException as e:
+                    error(tag, e, traceback.format_exc())
+                    self.scraper.emit(Events.ERROR, str(e) + '\n' + traceback.format_exc())
+                    info(tag, 'Failed to process')
+                    metrics.failed += 1
+
+            tag = f'[{query.query}][{location}]'
+
+            self.__record_metrics(tag, metrics)
+
+            if watermark_reached:
+                info(tag, watermark_reached, 'stop')
+                break
+
+            start += PAGINATION_SIZE
+            checkpoint.save(start // PAGINATION_SIZE, processed_ids, metrics)
+
+            if 0 <= total <= start:
+                info(tag, 'No more jobs to process')
+                break
+
+        checkpoint.clear()
+
+    def scrape_job(self, driver: webdriver, job_id: str, apply_link: bool = False,
+                   metrics: EventMetrics = None) -> None:
+        """
+        Scrape a single job by its id, from the job posting endpoint
+        :param driver: webdriver
+        :param job_id: str
+        :param apply_link: bool
+        :param metrics: EventMetrics the outcome of the job is counted on, when the caller reports a batch
+        :return: None
+        """
+
+        tag = f'[job:{job_id}]'
+
+        if metrics is None:
+            metrics = EventMetrics()
+
+        if not self.open_session(driver, tag):
+            metrics.failed += 1
+            return
+
+        status, posting = self.__fetch_job_posting(driver, tag, job_id)
+
+        if status == NOT_FOUND_STATUS:
+            warn(tag, f'Job {job_id} not found or no longer available')
+            metrics.missed += 1
+            self.scraper.emit(Events.NOT_FOUND, EventNotFound(job_id=job_id))
+            return
+
+        if posting is None:
+            warn(tag, f'Failed to fetch job {job_id} (HTTP {status}), skip')
+            metrics.failed += 1
+            return
+
+        data = EventData(
+            job_id=job_id,
+            job_index=-1,
+            title=normalize_spaces(posting['title']),
+            company=normalize_spaces(posting['company']),
+            company_link=posting['company_link'],
+            company_employee_count=posting['company_employee_count'],
+            company_img_link=posting['company_img_link'],
+            place=normalize_spaces(posting['place']),
+            date=posting['date'],
+            link=f'{JOBS_URL}/view/{job_id}',
+            apply_link=posting['apply_link'] if apply_link else '',
+            description=posting['description'])
+
+        info(tag, 'Processed')
+
+        self.scraper.emit(Events.DATA, data)
+
+        metrics.processed += 1
+        self.__request_done(tag, RequestClass.DETAILS)
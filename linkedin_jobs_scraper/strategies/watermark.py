@@ -0,0 +1,65 @@
+"""Where a newest-first crawl of a search crosses into the jobs an earlier crawl already covered."""
+from datetime import date, datetime
+from ..query import Query
+
+
+class Watermark:
+    """The stop conditions of one (query, location), and how close the crawl is to them.
+
+    Results sorted by RelevanceFilters.RECENT come newest first, so once a crawl meets a job it
+    has seen before, everything past it was seen before too. Crawling on pays a page load for
+    every 25 jobs it already holds, up to the pagination ceiling.
+
+    Any of the conditions ends the crawl: the job stop_at_job_id, a job posted before
+    stop_before, or stop_after_seen ids in a row that the seen-index already holds.
+    """
+
+    def __init__(self, query: Query, seen_index=None):
+        self._stop_at_job_id = query.options.stop_at_job_id
+        self._stop_after_seen = query.options.stop_after_seen
+        self._seen_index = seen_index
+        self._seen_streak = 0
+
+        stop_before = query.options.stop_before
+
+        # Cards carry the day a job was posted, never the time: a job posted on the day of the
+        # watermark may be on either side of it, so only the days before are past it
+        self._stop_before = stop_before.date() if isinstance(stop_before, datetime) else stop_before
+
+    def reached_at(self, job_id: str) -> str | None:
+        """
+        Tell whether a job, known by its id only, is past the watermark
+        :param job_id: str
+        :return: str | None why the crawl should stop, None to go on
+        """
+
+        if self._stop_at_job_id is not None and job_id == self._stop_at_job_id:
+            return f'Reached job {job_id}, where the last crawl started'
+
+        if self._stop_after_seen is not None:
+            self._seen_streak = self._seen_streak + 1 if job_id in self._seen_index else 0
+
+            if self._seen_streak >= self._stop_after_seen:
+                return f'{self._seen_streak} jobs in a row were already seen'
+
+        return None
+
+    def reached_on(self, posted: str) -> str | None:
+        """
+        Tell whether a job, known by the day it was posted, is past the watermark
+        :param posted: str the card's time[datetime], an ISO date, empty when the card has none
+        :return: str | None why the crawl should stop, None to go on
+        """
+
+        if self._stop_before is None or not posted:
+            return None
+
+        try:
+            posted_on = date.fromisoformat(posted[:10])
+        except ValueError:
+            return None
+
+        if posted_on < self._stop_before:
+            return f'Reached a job posted on {posted_on}, before {self._stop_before}'
+
+        return None
@@ -0,0 +1,125 @@
+"""Requests the browser is told not to make: what a page loads that no field of a job is read from."""
+from typing import Iterable, List, Optional
+from selenium import webdriver
+from .logger import debug, warn
+
+# URL patterns by category, in the wildcard syntax of CDP's Network.setBlockedURLs. A pattern
+# has to match the whole URL, query string included, hence the trailing wildcards.
+BLOCKLISTS = {
+    # Logos and photos. An image that is not downloaded keeps its src, so company_img_link is
+    # still read off the card, as the URL it would have been downloaded from.
+    'images': (
+        '*://media.licdn.com/dms/image/*',
+        '*://static.licdn.com/aero-v1/sc/h/*.svg',
+        '*.png*',
+        '*.jpg*',
+        '*.jpeg*',
+        '*.gif*',
+        '*.webp*',
+    ),
+    'media': (
+        '*://*.licdn.com/playlist/*',
+        '*.mp4*',
+        '*.webm*',
+        '*.m3u8*',
+        '*.mp3*',
+    ),
+    'fonts': (
+        '*://fonts.gstatic.com/*',
+        '*.woff*',
+        '*.ttf*',
+        '*.otf*',
+    ),
+    'analytics': (
+        '*://*.linkedin.com/li/track*',
+        '*://*.linkedin.com/li/tscp/*',
+        '*://*.linkedin.com/sensorCollect/*',
+        '*://snap.licdn.com/*',
+        '*://*.google-analytics.com/*',
+        '*://*.googletagmanager.com/*',
+        '*://*.demdex.net/*',
+        '*://*.omtrdc.net/*',
+    ),
+    # The messaging overlay, and the realtime connection that keeps it up to date, which the
+    # scraper only ever closes
+    'messaging': (
+        '*://realtime.www.linkedin.com/*',
+        '*://*.linkedin.com/realtime/*',
+        '*/voyager/api/messaging/*',
+        '*/voyagerMessagingGraphQL/*',
+    ),
+    'ads': (
+        '*://px.ads.linkedin.com/*',
+        '*://*.doubleclick.net/*',
+        '*://*.googlesyndication.com/*',
+        '*://*.adsrvr.org/*',
+    ),
+}
+
+# What `blocked_resources=[]` and `--block-resources` with no category block. Images are left
+# out: they are the one category a caller may want to look at.
+DEFAULT_BLOCKED_RESOURCES = ('media', 'fonts', 'analytics', 'messaging', 'ads')
+
+
+def is_url_pattern(entry: str) -> bool:
+    """
+    Tell a URL pattern from a category name
+    :param entry: str
+    :return: bool
+    """
+
+    return any(c in entry for c in '*/.:')
+
+
+def resolve_blocklist(entries: Optional[Iterable[str]]) -> Optional[List[str]]:
+    """
+    Expand a list of categories and URL patterns into the patterns to block
+    :param entries: Optional[Iterable[str]] None to block nothing, empty for DEFAULT_BLOCKED_RESOURCES
+    :return: Optional[List[str]] None when nothing is to be blocked
+    """
+
+    if entries is None:
+        return None
+
+    entries = list(entries) or list(DEFAULT_BLOCKED_RESOURCES)
+    patterns = []
+
+    for entry in entries:
+        if entry in BLOCKLISTS:
+            patterns.extend(BLOCKLISTS[entry])
+        elif is_url_pattern(entry):
+            patterns.append(entry)
+        else:
+            raise ValueError(f'Unknown resource category {entry}, expected one of {", ".join(BLOCKLISTS)} '
+                             f'or a URL pattern')
+
+    # Categories overlap on the generic patterns, and Chrome matches every pattern on every request
+    return list(dict.fromkeys(patterns))
+
+
+def block_urls(driver: webdriver, patterns: Optional[List[str]]) -> bool:
+    """
+    Have the window the driver is on refuse every request matching one of the patterns
+
+    The block holds for the target, and every document it opens from then on, but not for the
+    other windows of the browser, each of which has to be told on its own.
+
+    :param driver: webdriver
+    :param patterns: Optional[List[str]] None to block nothing
+    :return: bool whether the window blocks them
+    """
+
+    if not patterns:
+        return False
+
+    try:
+        driver.execute_cdp_cmd('Network.enable', {})
+        driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': patterns})
+    except BaseException as e:
+        # The page loads everything then, as it did before there was a blocklist
+        warn('Failed to block resources', e)
+        return False
+
+    debug(f'Blocking {len(patterns)} URL patterns')
+
+    return True
@@ -0,0 +1,133 @@
+"""How far the crawl of each (query, location) got, kept so that a run that died can pick it up again."""
+import json
+import sqlite3
+import threading
+from time import time
+from typing import Optional
+from ..events import EventMetrics
+
+# Seconds a connection waits for another process to release the database: shards of a
+# ShardedScraper share one checkpoint file
+SQLITE_TIMEOUT = 30
+
+# The counters of a location that carry over to the run resuming it. The pace does not: it
+# belongs to the account, and the pacer of the new run finds its own.
+RESTORED_METRICS = ('processed', 'failed', 'missed', 'skipped', 'throttled', 'transferred')
+
+
+class CheckpointStore:
+    """Where checkpoints are kept, one per key. Subclass it to keep them anywhere else.
+
+    A state is a dict of JSON types. Every method may be called from any worker thread.
+    """
+
+    def load(self, key: str) -> Optional[dict]:
+        """
+        Return the last state saved under a key
+        :param key: str
+        :return: Optional[dict] None when there is none
+        """
+
+        raise NotImplementedError('Must implement method in subclass')
+
+    def save(self, key: str, state: dict) -> None:
+        raise NotImplementedError('Must implement method in subclass')
+
+    def clear(self, key: str) -> None:
+        raise NotImplementedError('Must implement method in subclass')
+
+    def close(self) -> None:
+        pass
+
+
+class SqliteCheckpointStore(CheckpointStore):
+    """Checkpoints in a SQLite database, which any number of workers and processes can share."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, timeout=SQLITE_TIMEOUT, check_same_thread=False)
+
+        with self._connection:
+            self._connection.execute(
+                'CREATE TABLE IF NOT EXISTS checkpoints ('
+                'key TEXT PRIMARY KEY, state TEXT NOT NULL, saved_at REAL NOT NULL)')
+
+    def load(self, key: str) -> Optional[dict]:
+        with self._lock:
+            row = self._connection.execute('SELECT state FROM checkpoints WHERE key = ?', (key,)).fetchone()
+
+        return json.loads(row[0]) if row else None
+
+    def save(self, key: str, state: dict) -> None:
+        with self._lock, self._connection:
+            self._connection.execute(
+                'INSERT INTO checkpoints (key, state, saved_at) VALUES (?, ?, ?) '
+                'ON CONFLICT (key) DO UPDATE SET state = excluded.state, saved_at = excluded.saved_at',
+                (key, json.dumps(state), time()))
+
+    def clear(self, key: str) -> None:
+        with self._lock, self._connection:
+            self._connection.execute('DELETE FROM checkpoints WHERE key = ?', (key,))
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+
+class Checkpoint:
+    """The checkpoint of one (query, location), as its strategy sees it.
+
+    It is saved as the crawl goes, after every job and every page, and cleared once the crawl
+    is over. A crawl that ends any other way, a crash, a session that could not be rebuilt, a
+    page that would not load, leaves it behind for a run with resume to start from.
+
+    Without a store every method does nothing, so a strategy calls them unconditionally.
+    """
+
+    def __init__(self, store: Optional[CheckpointStore], key: str, resume: bool):
+        self._store = store
+        self._key = key
+        self._resume = resume
+
+    def restore(self, metrics: EventMetrics) -> Optional[dict]:
+        """
+        Return where the last crawl stopped, and bring the metrics back to what it had counted
+        :param metrics: EventMetrics
+        :return: Optional[dict] the page it was on and the ids it had processed, None to start over
+        """
+
+        if self._store is None or not self._resume:
+            return None
+
+        state = self._store.load(self._key)
+
+        if state is None:
+            return None
+
+        for name in RESTORED_METRICS:
+            setattr(metrics, name, state['metrics'].get(name, 0))
+
+        return {'page': state['page'], 'processed_ids': set(state['processed_ids'])}
+
+    def save(self, page: int, processed_ids: set, metrics: EventMetrics) -> None:
+        """
+        Record how far the crawl got
+        :param page: int the page the crawl is on, or is about to open
+        :param processed_ids: set
+        :param metrics: EventMetrics
+        :return: None
+        """
+
+        if self._store is None:
+            return
+
+        self._store.save(self._key, {
+            'page': page,
+            'processed_ids': sorted(processed_ids),
+            'metrics': {name: getattr(metrics, name) for name in RESTORED_METRICS},
+        })
+
+    def clear(self) -> None:
+        if self._store is not None:
+            self._store.clear(self._key)
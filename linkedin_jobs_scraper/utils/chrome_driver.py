@@ -24,7 +24,8 @@ def get_default_driver_options(
         height: int = 828,
         headless: bool = True,
         chrome_user_data_dir: str | None = None,
-        user_agent: str | None = None) -> ChromeOptions:
+        user_agent: str | None = None,
+        background_tabs: bool = False) -> ChromeOptions:
     """
     Generate default Chrome driver options
     :param width: int
@@ -32,6 +33,7 @@ def get_default_driver_options(
     :param headless: bool
     :param chrome_user_data_dir: str
     :param user_agent: str
+    :param background_tabs: bool keep the tabs not in front running at full speed
     :return: Options
     """
 
@@ -73,6 +75,13 @@ def get_default_driver_options(
     chrome_options.add_argument("--ignore-certificate-errors")
     chrome_options.add_argument("--remote-allow-origins=*")
 
+    if background_tabs:
+        # Only one tab is in front at a time, and Chrome slows the timers and the rendering of
+        # the others down, which is every tab but one when several are worked at once
+        chrome_options.add_argument("--disable-background-timer-throttling")
+        chrome_options.add_argument("--disable-backgrounding-occluded-windows")
+        chrome_options.add_argument("--disable-renderer-backgrounding")
+
     # Disable downloads
     chrome_options.add_experimental_option(
         'prefs', {
@@ -243,7 +252,9 @@ def build_driver(
         options: ChromeOptions = None,
         headless=True,
         chrome_user_data_dir: str | None = None,
-        timeout=20) -> webdriver:
+        timeout=20,
+        background_tabs: bool = False,
+        bidi: bool = False) -> webdriver:
     """
     Build Chrome driver instance
     :param executable_path: str
@@ -252,6 +263,8 @@ def build_driver(
     :param headless: bool
     :param chrome_user_data_dir: str
     :param timeout: int
+    :param background_tabs: bool keep the tabs not in front running at full speed
+    :param bidi: bool open a WebDriver BiDi connection, which driver.network needs, caller supplied options included
     :return: webdriver
     """
 
@@ -265,11 +278,16 @@ def build_driver(
         chrome_options = get_default_driver_options(
             headless=headless,
             chrome_user_data_dir=chrome_user_data_dir,
-            user_agent=resolve_masked_user_agent(executable_path, binary_location) if headless else None)
+            user_agent=resolve_masked_user_agent(executable_path, binary_location) if headless else None,
+            background_tabs=background_tabs)
 
     if binary_location:
         chrome_options.binary_location = binary_location
 
+    if bidi:
+        # Not automatic: without the capability the first touch of driver.network raises
+        chrome_options.enable_bidi = True
+
     driver = webdriver.Chrome(options=chrome_options, service=chrome_service)
     driver.set_page_load_timeout(timeout)
 
@@ -0,0 +1,200 @@
+"""The browsers a scraper keeps between the units of work it runs, and when it stops trusting one."""
+import threading
+from time import monotonic
+from typing import Callable
+from selenium import webdriver
+from .logger import debug
+
+
+class PooledDriver:
+    """A browser on loan from a `DriverPool`, with what the pool needs to know to retire it."""
+
+    def __init__(self, driver: webdriver):
+        self.driver = driver
+        self.created_at = monotonic()
+        self.jobs = 0
+
+        # The last session cookie reported for this browser, so that a browser serving many
+        # units of work announces a refreshed session once rather than after every one of them
+        self.reported_li_at = None
+
+    @property
+    def age(self) -> float:
+        """
+        Return how many seconds ago the browser was started
+        :return: float
+        """
+
+        return monotonic() - self.created_at
+
+
+class DriverPool:
+    """Browsers checked out for a unit of work and checked back in once it is over.
+
+    A Chrome start and a session establishment cost seconds each, and LinkedIn sees every new
+    session, so a browser that is still healthy is handed to the next unit of work instead of
+    being closed. Health is asked on checkout rather than trusted from checkin: a browser
+    sitting idle can crash, and a session can be retired while nobody is using it.
+
+    A browser is retired once it is older than `max_age` seconds or has served `max_jobs`
+    jobs. Both are checked between units of work, never during one, so a long query finishes
+    on the browser it started on.
+
+    The pool itself holds no limit on how many browsers exist: a browser exists per unit of
+    work running, which the caller's thread pool already bounds.
+    """
+
+    def __init__(
+            self,
+            factory: Callable[[], webdriver],
+            is_healthy: Callable[[webdriver], bool],
+            max_age: float = None,
+            max_jobs: int = None):
+        self._factory = factory
+        self._is_healthy = is_healthy
+        self._max_age = max_age
+        self._max_jobs = max_jobs
+        self._idle = []
+        self._checked_out = set()
+        self._interrupted = set()
+        self._closed = False
+        self._lock = threading.Lock()
+
+    def __is_expired(self, pooled: PooledDriver) -> bool:
+        """
+        Return True if a browser has served as long as it is allowed to
+        :param pooled: PooledDriver
+        :return: bool
+        """
+
+        if self._max_age is not None and pooled.age >= self._max_age:
+            return True
+
+        return self._max_jobs is not None and pooled.jobs >= self._max_jobs
+
+    @staticmethod
+    def __quit(pooled: PooledDriver) -> None:
+        """
+        Close a browser, whatever state it is in
+        :param pooled: PooledDriver
+        :return: None
+        """
+
+        try:
+            debug('Closing driver')
+            pooled.driver.quit()
+        except BaseException:
+            pass
+
+    def checkout(self) -> PooledDriver:
+        """
+        Lend a browser, reusing an idle one when it is still fit to serve
+        :return: PooledDriver
+        """
+
+        while True:
+            with self._lock:
+                if self._closed:
+                    raise RuntimeError('The driver pool is closed')
+
+                pooled = self._idle.pop() if self._idle else None
+
+            if pooled is None:
+                break
+
+            # Asked outside the lock: it is a round trip to the browser, and a browser that
+            # has died answers it slowly
+            if not self.__is_expired(pooled) and self._is_healthy(pooled.driver):
+                debug('Reusing a warm driver')
+
+                with self._lock:
+                    self._checked_out.add(pooled)
+
+                return pooled
+
+            debug('Retiring a driver that is expired or no longer healthy')
+            DriverPool.__quit(pooled)
+
+        # Built outside the lock: a Chrome start takes seconds, and other workers may be
+        # building their own at the same time
+        pooled = PooledDriver(self._factory())
+
+        with self._lock:
+            self._checked_out.add(pooled)
+
+        return pooled
+
+    def checkin(self, pooled: PooledDriver, discard: bool = False) -> None:
+        """
+        Take a browser back, keeping it for the next checkout unless it has to go
+        :param pooled: PooledDriver
+        :param discard: bool close it whatever its state, for a browser the caller saw fail
+        :return: None
+        """
+
+        with self._lock:
+            self._checked_out.discard(pooled)
+            interrupted = pooled in self._interrupted
+            self._interrupted.discard(pooled)
+            keep = not discard and not interrupted and not self._closed and not self.__is_expired(pooled)
+
+            if keep:
+                self._idle.append(pooled)
+
+        if not keep:
+            DriverPool.__quit(pooled)
+
+    def drain(self) -> None:
+        """
+        Close every idle browser, leaving the pool usable
+        :return: None
+        """
+
+        with self._lock:
+            idle, self._idle = self._idle, []
+
+        for pooled in idle:
+            DriverPool.__quit(pooled)
+
+    def interrupt(self) -> None:
+        """
+        Close every browser checked out right now, leaving the idle ones and the pool usable
+
+        The unit of work holding one fails at its next call to the browser instead of going on
+        with it, which is the quickest way out of a page load or a wait that is not ours to
+        cut short. A browser closed this way is not kept when it comes back.
+
+        :return: None
+        """
+
+        with self._lock:
+            busy = list(self._checked_out)
+            self._interrupted.update(busy)
+
+        for pooled in busy:
+            DriverPool.__quit(pooled)
+
+    def close(self) -> None:
+        """
+        Close every idle browser and refuse any further checkout
+
+        A browser still checked out is closed when it comes back, since the unit of work
+        holding it cannot be interrupted from here.
+
+        :return: None
+        """
+
+        with self._lock:
+            self._closed = True
+
+        self.drain()
+
+    @property
+    def idle_count(self) -> int:
+        """
+        Return how many browsers are waiting for a checkout
+        :return: int
+        """
+
+        with self._lock:
+            return len(self._idle)
@@ -0,0 +1,303 @@
+"""What LinkedIn's responses say about the account's rate limit, read as they arrive."""
+import threading
+from datetime import timezone
+from email.utils import parsedate_to_datetime
+from queue import Empty, Queue
+from time import perf_counter, sleep, time
+from typing import Dict, Optional, Tuple
+from urllib.parse import urlparse
+from selenium import webdriver
+from .logger import debug, warn
+from .pacing import Pacer
+
+# The statuses a Retry-After is honoured on. On anything else it is either meaningless or a
+# redirect hint, neither of which is about the account asking for too much.
+RETRY_AFTER_STATUSES = (429, 503)
+
+# A reset this large is a point in time, in seconds since the epoch, rather than a number of
+# seconds to go. Both are found in the wild under the same header name.
+EPOCH_RESET_THRESHOLD = 10 ** 9
+
+# Only LinkedIn's limit is the account's. The third parties a page loads have quotas of their
+# own, and a beacon's budget running out is no reason to slow the run down.
+RATE_LIMITED_DOMAIN = 'linkedin.com'
+
+# How long the drainer waits on an empty queue before checking whether it was stopped
+DRAIN_POLL_INTERVAL = 0.2
+
+
+def parse_retry_after(value: Optional[str], now: Optional[float] = None) -> Optional[float]:
+    """
+    Return how many seconds a Retry-After header asks for
+    :param value: Optional[str] a number of seconds, or an HTTP date
+    :param now: Optional[float] the current time in seconds since the epoch, for tests
+    :return: Optional[float] None when there is no header or it cannot be read
+    """
+
+    if not value:
+        return None
+
+    value = value.strip()
+
+    if value.isdigit():
+        return float(value)
+
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError, IndexError):
+        return None
+
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+
+    now = time() if now is None else now
+
+    # A date already past, by the server's clock or a skew of ours, asks for no wait at all
+    return max(0.0, when.timestamp() - now)
+
+
+def parse_rate_limit(headers: Dict[str, str], now: Optional[float] = None) -> Optional[Tuple[int, float]]:
+    """
+    Return the requests left in the current window and the seconds until it resets
+
+    Reads the X-RateLimit-* family, the RateLimit-* headers of the IETF draft, and the draft's
+    later single RateLimit header (`limit=100, remaining=50, reset=30`).
+
+    :param headers: Dict[str, str] with lowercase names
+    :param now: Optional[float] the current time in seconds since the epoch, for tests
+    :return: Optional[Tuple[int, float]] None unless both numbers are given
+    """
+
+    remaining = headers.get('x-ratelimit-remaining', headers.get('ratelimit-remaining'))
+    reset = headers.get('x-ratelimit-reset', headers.get('ratelimit-reset'))
+
+    if remaining is None and 'ratelimit' in headers:
+        fields = dict(field.strip().partition('=')[::2] for field in headers['ratelimit'].split(','))
+        remaining, reset = fields.get('remaining'), fields.get('reset')
+
+    try:
+        remaining, reset = int(remaining), float(reset)
+    except (TypeError, ValueError):
+        return None
+
+    if reset > EPOCH_RESET_THRESHOLD:
+        reset -= time() if now is None else now
+
+    return max(0, remaining), max(0.0, reset)
+
+
+def apply_rate_limit_headers(pacer: Pacer, status: int, headers: Dict[str, str]) -> bool:
+    """
+    Hand whatever a response said about the rate limit over to the pacer
+    :param pacer: Pacer
+    :param status: int
+    :param headers: Dict[str, str] with lowercase names
+    :return: bool whether the response carried anything the pacer took
+    """
+
+    applied = False
+
+    if status in RETRY_AFTER_STATUSES:
+        seconds = parse_retry_after(headers.get('retry-after'))
+
+        if seconds is not None:
+            debug(f'LinkedIn asked for {round(seconds, 1)}s before the next request')
+            pacer.retry_after(seconds)
+            applied = True
+
+    budget = parse_rate_limit(headers)
+
+    if budget is not None:
+        pacer.budget(*budget)
+        applied = True
+
+    return applied
+
+
+def bidi_headers_to_dict(headers) -> Dict[str, str]:
+    """
+    Flatten the wire shape of BiDi headers, `[{name, value: {type, value}}]`
+    :param headers: list
+    :return: Dict[str, str] with lowercase names
+    """
+
+    flattened = {}
+
+    for header in headers or []:
+        value = header.get('value')
+
+        if isinstance(value, dict):
+            value = value.get('value')
+
+        flattened[str(header.get('name', '')).lower()] = value
+
+    return flattened
+
+
+def is_rate_limited_url(url: str) -> bool:
+    """
+    Tell LinkedIn's own requests from the third parties its pages load
+    :param url: str
+    :return: bool
+    """
+
+    host = urlparse(url or '').hostname or ''
+
+    return host == RATE_LIMITED_DOMAIN or host.endswith(f'.{RATE_LIMITED_DOMAIN}')
+
+
+class ResponseObserver:
+    """Every response the browsers of a scraper receive, read for what it says about the limit.
+
+    The pacer otherwise learns of a 429 only after the fact, from the status the Performance
+    API keeps, which never carries a header. Listening to the network lets the run wait out
+    exactly the Retry-After the server asked for, and pace itself from the budget a response
+    says is left before it is refused at all.
+
+    The route is WebDriver BiDi's `response_started` event, which installs no intercept and
+    pauses nothing, so the pages load as they would with nobody listening. Selenium keeps it
+    under `selenium.webdriver.common.bidi` and documents it as internal; a Selenium that no
+    longer has it makes `attach` fail and the run go on as it did without an observer.
+
+    Selenium calls the handler on a thread of its own for every event, so the handler only
+    queues, and a single drainer thread does the reading. The time spent in both is what
+    listening costs the run, and is reported as `overhead`.
+
+    One instance serves every browser of a scraper, as the pacer it feeds does.
+
+    :param pacer: Pacer
+    """
+
+    def __init__(self, pacer: Pacer):
+        self._pacer = pacer
+        self._queue = Queue()
+        self._lock = threading.Lock()
+        self._events = 0
+        self._hints = 0
+        self._overhead = 0.0
+        self._stop = threading.Event()
+        self._drainer: Optional[threading.Thread] = None
+
+    @property
+    def events(self) -> int:
+        """
+        Return how many responses have been read
+        :return: int
+        """
+
+        with self._lock:
+            return self._events
+
+    @property
+    def hints(self) -> int:
+        """
+        Return how many responses said something the pacer took
+        :return: int
+        """
+
+        with self._lock:
+            return self._hints
+
+    @property
+    def overhead(self) -> float:
+        """
+        Return the seconds spent handling responses, in the handler and in the drainer
+        :return: float
+        """
+
+        with self._lock:
+            return self._overhead
+
+    def attach(self, driver: webdriver) -> bool:
+        """
+        Start listening to the responses of a browser, which has to have been started with BiDi
+        :param driver: webdriver
+        :return: bool whether the browser is listened to
+        """
+
+        try:
+            driver.network.add_event_handler('response_started', self.on_response)
+        except BaseException as e:
+            # Nothing is lost but the hints: the pacer goes on reading the statuses as before
+            warn('Failed to listen to the network, pacing from refusals alone', e)
+            return False
+
+        with self._lock:
+            if self._drainer is None:
+                self._drainer = threading.Thread(target=self.__drain, name='response-observer', daemon=True)
+                self._drainer.start()
+
+        return True
+
+    def on_response(self, params: dict) -> None:
+        """
+        Queue an event for the drainer, and nothing else: it runs on the event's own thread
+        :param params: dict the event's parameters
+        :return: None
+        """
+
+        started = perf_counter()
+        self._queue.put(params)
+        elapsed = perf_counter() - started
+
+        with self._lock:
+            self._overhead += elapsed
+
+    def __drain(self) -> None:
+        while not self._stop.is_set():
+            try:
+                params = self._queue.get(timeout=DRAIN_POLL_INTERVAL)
+            except Empty:
+                continue
+
+            started = perf_counter()
+
+            try:
+                applied = self.__read(params)
+            except BaseException as e:
+                # One malformed event is no reason to stop listening to the rest
+                debug('Failed to read a response event', e)
+                applied = False
+
+            elapsed = perf_counter() - started
+
+            with self._lock:
+                self._events += 1
+                self._hints += int(applied)
+                self._overhead += elapsed
+
+            self._queue.task_done()
+
+    def __read(self, params: dict) -> bool:
+        response = params.get('response') or {}
+
+        if not is_rate_limited_url(response.get('url', '')):
+            return False
+
+        return apply_rate_limit_headers(self._pacer,
+                                        response.get('status', 0),
+                                        bidi_headers_to_dict(response.get('headers')))
+
+    def settle(self, timeout: float = 5) -> None:
+        """
+        Wait for the queued events to be read
+        :param timeout: float
+        :return: None
+        """
+
+        elapsed = 0.0
+
+        while self._queue.unfinished_tasks and elapsed < timeout:
+            sleep(0.05)
+            elapsed += 0.05
+
+    def close(self) -> None:
+        """
+        Stop the drainer. The browsers are not detached from: they are closed by their owner.
+        :return: None
+        """
+
+        self._stop.set()
+
+        if self._drainer is not None:
+            self._drainer.join(timeout=DRAIN_POLL_INTERVAL * 5)
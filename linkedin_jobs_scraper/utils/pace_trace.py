@@ -0,0 +1,194 @@
+"""The time series of a run's pacing, written out, read back, and replayed against other constants."""
+import csv
+import json
+import os
+import threading
+from typing import Dict, Iterable, List
+from ..events import EventPace
+from .pacing import (
+    CLEAN_RUN_BEFORE_EASING,
+    PACING_CEILING_FACTOR,
+    PACING_CEILING_LIMIT,
+    PACING_EASE_FACTOR,
+    PACING_INCREASE_FACTOR,
+    Pacer,
+    RequestClass,
+)
+
+PACE_TRACE_FORMATS = {'.csv': 'csv', '.jsonl': 'jsonl'}
+
+# The reports a step makes, which a replay feeds to a pacer of its own. The server's hints are
+# not replayed: they are the server's numbers, and would be the same whatever the constants.
+STEP_EVENTS = ('throttled', 'clean', 'eased')
+
+
+def pace_trace_format(path: str) -> str:
+    """
+    Return the format a trace is written in, from the extension of its file
+    :param path: str ending in .csv or .jsonl
+    :return: str
+    """
+
+    fmt = PACE_TRACE_FORMATS.get(os.path.splitext(path)[1].lower())
+
+    if fmt is None:
+        raise ValueError(f'A pace trace must be a {" or a ".join(PACE_TRACE_FORMATS)} file, not {path}')
+
+    return fmt
+
+
+class PaceTraceWriter:
+    """A trace written out as it is made, one line per sample, typically from a PACE listener.
+
+    Each line is flushed, so that a run that is killed leaves every sample up to then, which is
+    when the trace is most wanted. Samples come from every worker of a scraper, so writes are locked.
+
+    :param path: str a .csv or a .jsonl file, truncated
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._format = pace_trace_format(path)
+        self._lock = threading.Lock()
+        self._file = open(path, 'w', newline='', encoding='utf-8')
+        self._csv = None
+
+        if self._format == 'csv':
+            self._csv = csv.writer(self._file)
+            self._csv.writerow(EventPace._fields)
+
+    def write(self, sample: EventPace) -> None:
+        """
+        Append a sample
+        :param sample: EventPace
+        :return: None
+        """
+
+        with self._lock:
+            if self._csv is not None:
+                self._csv.writerow(sample)
+            else:
+                self._file.write(json.dumps(sample._asdict()) + '\n')
+
+            self._file.flush()
+
+    def close(self) -> None:
+        with self._lock:
+            self._file.close()
+
+
+def write_pace_trace(samples: Iterable[EventPace], path: str) -> None:
+    """
+    Write a trace, Pacer.trace() typically, to a .csv or a .jsonl file
+    :param samples: Iterable[EventPace]
+    :param path: str
+    :return: None
+    """
+
+    writer = PaceTraceWriter(path)
+
+    try:
+        for sample in samples:
+            writer.write(sample)
+    finally:
+        writer.close()
+
+
+def read_pace_trace(path: str) -> List[EventPace]:
+    """
+    Read a trace written by PaceTraceWriter back
+    :param path: str a .csv or a .jsonl file
+    :return: List[EventPace]
+    """
+
+    fmt = pace_trace_format(path)
+
+    with open(path, newline='', encoding='utf-8') as f:
+        if fmt == 'csv':
+            rows = list(csv.DictReader(f))
+        else:
+            rows = [json.loads(line) for line in f if line.strip()]
+
+    # CSV has no types, and the fields of a sample are all numbers but two
+    return [EventPace(
+        at=float(row['at']),
+        request_class=row['request_class'],
+        event=row['event'],
+        delay=float(row['delay']),
+        throttled=int(row['throttled']),
+        clean_streak=int(row['clean_streak'])) for row in rows]
+
+
+def simulate_pacing(samples: Iterable[EventPace], slow_mo: float, adaptive_slow_mo: bool = True,
+                    increase_factor: float = PACING_INCREASE_FACTOR, ease_factor: float = PACING_EASE_FACTOR,
+                    clean_run: int = CLEAN_RUN_BEFORE_EASING) -> List[EventPace]:
+    """
+    Replay the steps of a recorded trace through a pacer with other constants
+
+    Every step is reported to the new pacer as it was to the recorded one, refused or not, in
+    the same order, and the trace of the new pacer is what is returned, at the recorded times.
+    Whether a step would still have been refused at another pace is not knowable offline, so a
+    replay answers what the constants would have done with the same refusals, not how many
+    there would have been: a slower pace that was refused as often is no improvement.
+
+    :param samples: Iterable[EventPace] a trace, as recorded by a scraper
+    :param slow_mo: float the slow_mo of the replay, the ceiling following from it as a scraper's does
+    :param adaptive_slow_mo: bool
+    :param increase_factor: float
+    :param ease_factor: float
+    :param clean_run: int
+    :return: List[EventPace]
+    """
+
+    replayed = []
+    pacer = Pacer(
+        floor=slow_mo,
+        ceiling=min(PACING_CEILING_LIMIT, slow_mo * PACING_CEILING_FACTOR) if adaptive_slow_mo else slow_mo,
+        increase_factor=increase_factor,
+        ease_factor=ease_factor,
+        clean_run=clean_run,
+        on_sample=replayed.append)
+
+    for sample in samples:
+        if sample.event not in STEP_EVENTS:
+            continue
+
+        request_class = RequestClass(sample.request_class)
+
+        if sample.event == 'throttled':
+            pacer.throttled(request_class)
+        else:
+            pacer.clean(request_class)
+
+        replayed[-1] = replayed[-1]._replace(at=sample.at)
+
+    return replayed
+
+
+def summarize_pace_trace(samples: Iterable[EventPace]) -> Dict[str, dict]:
+    """
+    Return, for each class of request in a trace, what its steps met and what their pace cost
+
+    `slept` adds up the delay each step left the next one with, which is what the run slept
+    between them, hints left aside. It is comparable between a recording and its replays.
+
+    :param samples: Iterable[EventPace]
+    :return: Dict[str, dict] with steps, throttled, eased, slept, and the max and final pace
+    """
+
+    summary = {}
+
+    for sample in samples:
+        if sample.event not in STEP_EVENTS:
+            continue
+
+        row = summary.setdefault(sample.request_class,
+                                 {'steps': 0, 'throttled': 0, 'eased': 0, 'slept': 0.0, 'max': 0.0, 'final': 0.0})
+        row['steps'] += 1
+        row['throttled'] += int(sample.event == 'throttled')
+        row['eased'] += int(sample.event == 'eased')
+        row['slept'] += sample.delay
+        row['max'] = max(row['max'], sample.delay)
+        row['final'] = sample.delay
+
+    return summary
@@ -1,4 +1,11 @@
 import threading
+from collections import deque
+from enum import Enum
+from time import monotonic, time
+from typing import Callable, Dict, List, Optional
+from ..events import EventPace
+from .logger import warn
+from .rate_limit import RateLimiter
 
 
 # The floor of a floor: a run is never allowed to ask faster than this, whatever the pacer
@@ -23,14 +30,55 @@ PACING_INCREASE_FACTOR = 2
 PACING_EASE_FACTOR = 1.5
 CLEAN_RUN_BEFORE_EASING = 20
 
+# The longest Retry-After honoured as it is. A server asking for more is not throttling the run
+# but shutting it out for now, and the backoff gives up well within this, so waiting longer would
+# only delay saying so.
+MAX_RETRY_AFTER = 300
+
+# How many of the latest reports a pacer keeps, a step each. Enough for a few hundred pages of
+# results, so that a long run still has its recent history when it is looked at, and small
+# enough that nobody has to think about a pacer left running.
+PACE_TRACE_SIZE = 10_000
+
+
+class RequestClass(Enum):
+    """What a step of a run asks LinkedIn for, which decides what it is charged."""
+    NAVIGATION = 'navigation'  # A document of its own: the home page, a first page of results, a job's page
+    PAGINATION = 'pagination'  # The next page of results of a search already open
+    CARD = 'card'  # A card brought into view, which only renders what the page already holds
+    DETAILS = 'details'  # A job's details, which the page fetches once its card is clicked
+    APPLY = 'apply'  # The apply button, which opens LinkedIn's redirect to the employer in a popup
+
+
+# What each class is charged, as a share of slow_mo, before anything is learned. Opening a
+# document, a page of results or a job's details asks LinkedIn's servers for work, and it is
+# what they refuse. The apply popup is one redirect, and a card asks for nothing at all: it
+# is paced only so that the page is not scrolled faster than a person would.
+REQUEST_CLASS_FACTORS = {
+    RequestClass.NAVIGATION: 1.0,
+    RequestClass.PAGINATION: 1.0,
+    RequestClass.DETAILS: 1.0,
+    RequestClass.APPLY: 0.5,
+    RequestClass.CARD: 0.25,
+}
+
+# The classes that send LinkedIn no request, so take nothing from an account's budget and are
+# not spaced by the server's
+UNREQUESTED_CLASSES = frozenset({RequestClass.CARD})
+
 
 class Pacer:
-    """The delay every sleep site of a run reads, moved by what LinkedIn answers.
+    """The delays the sleep sites of a run read, one per class of request, moved by what LinkedIn answers.
 
     `slow_mo` is the floor and never the value: a pace that is comfortable for 25 jobs is not
     comfortable for 200, and one safe for 200 wastes minutes on a run of 25. The number a run
     should sleep is therefore not knowable before it starts, only discoverable while it runs.
 
+    Nor is it one number. A card brought into view and a document opened are not the same ask,
+    so every RequestClass starts from its own share of slow_mo, and is raised by the refusals
+    its own steps meet and eased by its own clean work. A page that keeps being refused makes
+    the navigations slower without charging the same to every card of the pages that loaded.
+
     One instance serves a whole `LinkedinScraper`, so it is shared by every query thread and
     locked accordingly: the limit is enforced per account, which makes a 429 seen by one
     worker a reason for all of them to slow down.
@@ -38,69 +86,285 @@ class Pacer:
     A pacer whose ceiling equals its floor is inert - `min(delay * factor, ceiling)` cannot
     move - which is what an opted out caller gets, at no cost to the sleep sites, which go on
     reading the same attribute either way.
+
+    What the server says about its limit, when something is listening, comes on top of that.
+    A Retry-After holds every sleep site until the time it names, whether or not the pacer
+    adapts, since it is the server's number rather than a guess. A budget of requests left in
+    a window spaces them out evenly over what remains of it, within the ceiling.
+
+    The lock only reaches the threads of one process, and the pacer only the workers of one
+    scraper. Given a RateLimiter, every request also takes its turn from a budget shared with
+    whatever else scrapes with the account, other scrapers or other processes, so that the
+    account as a whole keeps to the pace of its navigations rather than each of them on its own.
+
+    Every report is kept, as an EventPace, in a ring buffer of the latest PACE_TRACE_SIZE, and
+    handed to on_sample as it is made. How the pace moved over a run, and how that compares
+    with what other PACING_* constants would have done, is read from those.
+
+    :param floor: float slow_mo, the floor of a navigation
+    :param ceiling: float the ceiling of a navigation
+    :param limiter: Optional[RateLimiter] the account's budget, None when the scraper has it to itself
+    :param increase_factor: float what a refusal multiplies the pace of its class by
+    :param ease_factor: float what a clean run divides it by
+    :param clean_run: int the steps nobody refused that earn an easing
+    :param on_sample: Optional[Callable[[EventPace], None]] called with every report, on the
+        thread that made it, outside of the lock. What it raises is logged, never raised to the
+        caller of the report
     """
 
-    def __init__(self, floor: float, ceiling: float):
+    def __init__(self, floor: float, ceiling: float, limiter: Optional[RateLimiter] = None,
+                 increase_factor: float = PACING_INCREASE_FACTOR, ease_factor: float = PACING_EASE_FACTOR,
+                 clean_run: int = CLEAN_RUN_BEFORE_EASING, on_sample: Optional[Callable[[EventPace], None]] = None):
         if ceiling < floor:
             raise ValueError('A pacer cannot have a ceiling below its floor')
 
-        self._floor = floor
-        self._ceiling = ceiling
-        self._delay = floor
-        self._clean_streak = 0
-        self._throttled_count = 0
+        if increase_factor < 1 or ease_factor < 1:
+            raise ValueError('A pacer cannot have an increase or an ease factor below 1')
+
+        if not isinstance(clean_run, int) or clean_run < 1:
+            raise ValueError('A pacer cannot have a clean run of less than one step')
+
+        self._floors = {c: floor * factor for c, factor in REQUEST_CLASS_FACTORS.items()}
+        self._ceilings = {c: ceiling * factor for c, factor in REQUEST_CLASS_FACTORS.items()}
+        self._delays = dict(self._floors)
+        self._clean_streaks = {c: 0 for c in RequestClass}
+        self._throttled_counts = {c: 0 for c in RequestClass}
+        self._hold_until = 0.0
+        self._budget_delay = 0.0
+        self._budget_until = 0.0
+        self._limiter = limiter
+        self._increase_factor = increase_factor
+        self._ease_factor = ease_factor
+        self._clean_run = clean_run
+        self._on_sample = on_sample
+        self._trace = deque(maxlen=PACE_TRACE_SIZE)
         self._lock = threading.Lock()
 
     @property
     def delay(self) -> float:
         """
-        Return how long to sleep, now
+        Return how long to sleep before a navigation, now
+        :return: float
+        """
+
+        return self.delay_of(RequestClass.NAVIGATION)
+
+    def delay_of(self, request_class: RequestClass) -> float:
+        """
+        Return how long to sleep before a step of a class, now: its pace, or longer while the
+        server asked for more
+        :param request_class: RequestClass
+        :return: float
+        """
+
+        now = monotonic()
+
+        with self._lock:
+            return max(self.__spacing(request_class, now), self._hold_until - now)
+
+    def __spacing(self, request_class: RequestClass, now: float) -> float:
+        # The pace of the class, or the server's budget while its window lasts. Called under the lock.
+        if now < self._budget_until and request_class not in UNREQUESTED_CLASSES:
+            return max(self._delays[request_class], self._budget_delay)
+
+        return self._delays[request_class]
+
+    @property
+    def pace(self) -> float:
+        """
+        Return the delay the pacer has settled on for a navigation, without the server's hints
+        :return: float
+        """
+
+        return self.pace_of(RequestClass.NAVIGATION)
+
+    def pace_of(self, request_class: RequestClass) -> float:
+        """
+        Return the delay the pacer has settled on for a class, from its refusals alone
+        :param request_class: RequestClass
+        :return: float
+        """
+
+        with self._lock:
+            return self._delays[request_class]
+
+    @property
+    def hold(self) -> float:
+        """
+        Return how much longer the server asked for no request to be made
+        :return: float 0 when it asked for nothing, or its wait is over
+        """
+
+        with self._lock:
+            return max(0.0, self._hold_until - monotonic())
+
+    def wait(self, request_class: RequestClass = RequestClass.NAVIGATION, own: Optional[float] = None) -> float:
+        """
+        Return how long to sleep before the next step, taking its turn from the account's budget
+
+        Without a limiter this is the delay of the class. With one, a request waits longer
+        whenever the other users of the account have spent the budget: the delay still spaces
+        this worker's own steps, and the limiter spaces everyone's requests.
+
+        :param request_class: RequestClass
+        :param own: Optional[float] what this worker has left to wait by its own spacing, the delay by default
         :return: float
         """
 
+        own = self.delay_of(request_class) if own is None else own
+
+        if self._limiter is None or request_class in UNREQUESTED_CLASSES:
+            return own
+
         with self._lock:
-            return self._delay
+            interval = self.__spacing(RequestClass.NAVIGATION, monotonic())
+
+        return max(own, self._limiter.reserve(interval))
 
     @property
     def throttled_count(self) -> int:
         """
-        Return how many refusals have been reported to this pacer
+        Return how many refusals have been reported to this pacer, of every class
         :return: int
         """
 
         with self._lock:
-            return self._throttled_count
+            return sum(self._throttled_counts.values())
+
+    def snapshot(self) -> Dict[str, dict]:
+        """
+        Return the pace and the refusals of every class
+        :return: Dict[str, dict]
+        """
+
+        with self._lock:
+            return {c.value: {'pace': round(self._delays[c], 3), 'throttled': self._throttled_counts[c]}
+                    for c in RequestClass}
 
-    def throttled(self) -> float:
+    def trace(self) -> List[EventPace]:
+        """
+        Return the latest reports, oldest first
+        :return: List[EventPace]
         """
-        Report a 429 and slow the run down
+
+        with self._lock:
+            return list(self._trace)
+
+    def __sample(self, request_class: RequestClass, event: str, delay: float) -> EventPace:
+        # Kept in the ring buffer and returned to be published once the lock is released. Called under the lock.
+        sample = EventPace(
+            at=time(),
+            request_class=request_class.value,
+            event=event,
+            delay=delay,
+            throttled=self._throttled_counts[request_class],
+            clean_streak=self._clean_streaks[request_class])
+
+        self._trace.append(sample)
+
+        return sample
+
+    def __publish(self, sample: EventPace) -> None:
+        # Outside of the lock: the callback emits an event, and a listener may well read the pacer.
+        # A report is accounting, made from the middle of a step or from the thread reading the
+        # responses: whatever becomes of it, the step it accounts for goes on.
+        if self._on_sample is None:
+            return
+
+        try:
+            self._on_sample(sample)
+        except BaseException as e:
+            warn('A pace report could not be delivered', e)
+
+    def throttled(self, request_class: RequestClass = RequestClass.NAVIGATION) -> float:
+        """
+        Report a 429 met by a step of a class, and slow that class down
 
         Counting happens whether or not the pace can move, so the number stays meaningful for
         the metrics of a run that opted out of adapting.
 
-        :return: float the new delay
+        :param request_class: RequestClass
+        :return: float the new delay of the class
         """
 
         with self._lock:
-            self._throttled_count += 1
-            self._clean_streak = 0
-            self._delay = min(self._delay * PACING_INCREASE_FACTOR, self._ceiling)
+            self._throttled_counts[request_class] += 1
+            self._clean_streaks[request_class] = 0
+            self._delays[request_class] = min(self._delays[request_class] * self._increase_factor,
+                                              self._ceilings[request_class])
+            delay = self._delays[request_class]
+            sample = self.__sample(request_class, 'throttled', delay)
+
+        self.__publish(sample)
 
-            return self._delay
+        return delay
 
-    def clean(self) -> float:
+    def clean(self, request_class: RequestClass = RequestClass.NAVIGATION) -> float:
         """
-        Report one unit of work nobody refused, easing the pace once enough have gone through
-        :return: float the new delay
+        Report one step of a class nobody refused, easing its pace once enough have gone through
+        :param request_class: RequestClass
+        :return: float the new delay of the class
         """
 
         with self._lock:
-            self._clean_streak += 1
+            self._clean_streaks[request_class] += 1
+
+            if self._clean_streaks[request_class] < self._clean_run:
+                event = 'clean'
+            else:
+                event = 'eased'
+                self._clean_streaks[request_class] = 0
+                self._delays[request_class] = max(self._delays[request_class] / self._ease_factor,
+                                                  self._floors[request_class])
+
+            delay = self._delays[request_class]
+            sample = self.__sample(request_class, event, delay)
+
+        self.__publish(sample)
+
+        return delay
+
+    def retry_after(self, seconds: float) -> float:
+        """
+        Report a Retry-After, holding every sleep site until the time it names
+
+        A later hint never shortens an earlier one: both came from the server, and the longer
+        wait is the one that still holds.
+
+        :param seconds: float
+        :return: float how long the run is now held for
+        """
 
-            if self._clean_streak < CLEAN_RUN_BEFORE_EASING:
-                return self._delay
+        with self._lock:
+            self._hold_until = max(self._hold_until, monotonic() + min(seconds, MAX_RETRY_AFTER))
+            hold = max(0.0, self._hold_until - monotonic())
+            sample = self.__sample(RequestClass.NAVIGATION, 'retry_after', hold)
+
+        self.__publish(sample)
+
+        return hold
+
+    def budget(self, remaining: int, reset: float) -> float:
+        """
+        Report what is left of the current rate limit window, spacing the requests over it
+
+        :param remaining: int requests the server will still take in the window
+        :param reset: float seconds until the window starts over
+        :return: float the delay between requests until it does
+        """
+
+        if remaining < 1:
+            # Nothing will be taken before the reset, which is a Retry-After by another name
+            return self.retry_after(reset)
+
+        with self._lock:
+            # Every step the pacer spaces costs at least one request, so this is the least the
+            # window can be stretched over: the rest is up to the refusals
+            self._budget_delay = min(reset / remaining, self._ceilings[RequestClass.NAVIGATION])
+            self._budget_until = monotonic() + reset
+            delay = max(self._delays[RequestClass.NAVIGATION], self._budget_delay)
+            sample = self.__sample(RequestClass.NAVIGATION, 'budget', delay)
 
-            self._clean_streak = 0
-            self._delay = max(self._delay / PACING_EASE_FACTOR, self._floor)
+        self.__publish(sample)
 
-            return self._delay
+        return delay
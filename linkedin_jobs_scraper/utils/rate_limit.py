@@ -0,0 +1,142 @@
+"""The request budget of one LinkedIn account, shared by everything that scrapes with it."""
+import sqlite3
+import threading
+from time import monotonic, time
+from typing import Tuple
+
+# Seconds a connection waits for another process to release the database: every process
+# scraping with the account takes its turns from the same file
+SQLITE_TIMEOUT = 30
+
+# Steps the account may take back to back after a quiet spell, before the pace applies. Enough
+# for the workers of a scraper to start together, not enough to look like a burst to LinkedIn.
+DEFAULT_BURST = 3
+
+
+def take_tokens(tokens: float, updated_at: float, now: float, interval: float, burst: int,
+                cost: int) -> Tuple[float, float]:
+    """
+    Take tokens from a bucket that refills one every interval seconds, up to burst
+
+    The bucket may go into debt: a step that finds it empty still takes its tokens, and is
+    told how long to wait until they would have been there. Every step is then given a turn
+    at once, in the order they asked, rather than all of them polling for the next token.
+
+    :param tokens: float what the bucket held when it was last updated
+    :param updated_at: float when that was
+    :param now: float on the same clock
+    :param interval: float seconds per token, the pace
+    :param burst: int the most the bucket holds
+    :param cost: int tokens the step takes
+    :return: Tuple[float, float] what the bucket holds now, and the seconds to wait
+    """
+
+    if interval <= 0:
+        return float(burst), 0.0
+
+    tokens = min(float(burst), tokens + max(0.0, now - updated_at) / interval) - cost
+
+    return tokens, max(0.0, -tokens * interval)
+
+
+class RateLimiter:
+    """How many requests an account may make, and when. Subclass it to share the budget any other way.
+
+    A step of a run, whatever the pacer would otherwise sleep before, takes its turn here. The
+    pace still comes from the pacer, which passes it on every call, so a refusal one user of
+    the account meets slows all of them down as soon as their pacers hear of one too.
+
+    Every method may be called from any worker thread.
+    """
+
+    def reserve(self, interval: float, cost: int = 1) -> float:
+        """
+        Take a turn from the account's budget
+        :param interval: float seconds the account should keep between steps, on average
+        :param cost: int steps this one counts for
+        :return: float seconds to wait before taking it
+        """
+
+        raise NotImplementedError('Must implement method in subclass')
+
+    def close(self) -> None:
+        pass
+
+
+class LocalRateLimiter(RateLimiter):
+    """A token bucket in memory, for scrapers of one process sharing an account.
+
+    :param burst: int steps that may be taken back to back after a quiet spell
+    """
+
+    def __init__(self, burst: int = DEFAULT_BURST):
+        if not isinstance(burst, int) or burst < 1:
+            raise ValueError('Parameter burst must be a positive integer')
+
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated_at = monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self, interval: float, cost: int = 1) -> float:
+        with self._lock:
+            now = monotonic()
+            self._tokens, wait = take_tokens(self._tokens, self._updated_at, now, interval, self.burst, cost)
+            self._updated_at = now
+
+            return wait
+
+
+class SqliteRateLimiter(RateLimiter):
+    """A token bucket in a SQLite database, for the processes of a host sharing an account.
+
+    Each turn is taken in a transaction that holds the database's write lock, so two processes
+    never read the same tokens. The wall clock is the only one they share, so a clock set back
+    refills nothing rather than everything.
+
+    :param path: str the database, one per account or one for several with distinct accounts
+    :param account: str the bucket within it
+    :param burst: int steps that may be taken back to back after a quiet spell
+    """
+
+    def __init__(self, path: str, account: str = 'default', burst: int = DEFAULT_BURST):
+        if not isinstance(burst, int) or burst < 1:
+            raise ValueError('Parameter burst must be a positive integer')
+
+        self.path = path
+        self.account = account
+        self.burst = burst
+        self._lock = threading.Lock()
+
+        # Transactions are begun by hand, so that the write lock is taken before the read
+        self._connection = sqlite3.connect(path, timeout=SQLITE_TIMEOUT, check_same_thread=False,
+                                           isolation_level=None)
+        self._connection.execute(
+            'CREATE TABLE IF NOT EXISTS buckets ('
+            'account TEXT PRIMARY KEY, tokens REAL NOT NULL, updated_at REAL NOT NULL)')
+
+    def reserve(self, interval: float, cost: int = 1) -> float:
+        with self._lock:
+            self._connection.execute('BEGIN IMMEDIATE')
+
+            try:
+                now = time()
+                row = self._connection.execute(
+                    'SELECT tokens, updated_at FROM buckets WHERE account = ?', (self.account,)).fetchone()
+                tokens, updated_at = row if row else (float(self.burst), now)
+                tokens, wait = take_tokens(tokens, updated_at, now, interval, self.burst, cost)
+                self._connection.execute(
+                    'INSERT INTO buckets (account, tokens, updated_at) VALUES (?, ?, ?) '
+                    'ON CONFLICT (account) DO UPDATE SET tokens = excluded.tokens, updated_at = excluded.updated_at',
+                    (self.account, tokens, now))
+            except BaseException:
+                self._connection.execute('ROLLBACK')
+                raise
+
+            self._connection.execute('COMMIT')
+
+            return wait
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
@@ -0,0 +1,162 @@
+"""The job ids a scraper has delivered before, kept on disk from one run to the next."""
+import hashlib
+import math
+import sqlite3
+import threading
+from time import time
+from typing import Iterable, Optional, Tuple
+
+# What the Bloom filter is sized for when the index is opened: twice the ids already stored,
+# never fewer than this. It is rebuilt twice as large whenever the ids outgrow it.
+MIN_BLOOM_CAPACITY = 10_000
+
+# The share of unknown ids the filter lets through to SQLite. Each of those costs a lookup,
+# never a wrong answer: a positive is always confirmed against the table.
+BLOOM_FALSE_POSITIVE_RATE = 0.01
+
+# Seconds a connection waits for another process to release the database: shards of a
+# ShardedScraper share one index file
+SQLITE_TIMEOUT = 30
+
+
+class BloomFilter:
+    """A set that answers "certainly not" or "maybe", in a fixed number of bits."""
+
+    def __init__(self, capacity: int, false_positive_rate: float = BLOOM_FALSE_POSITIVE_RATE):
+        self.capacity = capacity
+        self._size = max(8, int(-capacity * math.log(false_positive_rate) / (math.log(2) ** 2)))
+        self._hashes = max(1, round(self._size / capacity * math.log(2)))
+        self._bits = bytearray((self._size + 7) // 8)
+
+    def __positions(self, key: str):
+        # Two hashes out of one digest, combined into as many as needed (Kirsch-Mitzenmacher)
+        digest = hashlib.blake2b(key.encode(), digest_size=16).digest()
+        first = int.from_bytes(digest[:8], 'little')
+        second = int.from_bytes(digest[8:], 'little') | 1
+
+        for i in range(self._hashes):
+            yield (first + i * second) % self._size
+
+    def add(self, key: str) -> None:
+        for position in self.__positions(key):
+            self._bits[position >> 3] |= 1 << (position & 7)
+
+    def __contains__(self, key: str) -> bool:
+        return all(self._bits[position >> 3] & (1 << (position & 7)) for position in self.__positions(key))
+
+
+class SeenIndex:
+    """Every job id delivered so far, with when it was first and last seen.
+
+    The ids are stored in a SQLite database, so that they outlive the run. A Bloom filter in
+    memory sits in front of it: most ids a search shows are known ones on a daily run, but the
+    new ones, which are the question, are answered without touching the disk.
+
+    One instance is safe to share between the workers of a scraper, and the file between
+    processes: an id the filter does not know is looked for among the rows other connections
+    added since, whenever SQLite says they committed any.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, timeout=SQLITE_TIMEOUT, check_same_thread=False)
+
+        with self._connection:
+            self._connection.execute(
+                'CREATE TABLE IF NOT EXISTS seen_jobs ('
+                'job_id TEXT PRIMARY KEY, first_seen REAL NOT NULL, last_seen REAL NOT NULL)')
+
+        self.__rebuild_filter()
+
+    def __rebuild_filter(self) -> None:
+        # Read before the rows, so that whatever is committed meanwhile is read again, never missed
+        self._version = self._connection.execute('PRAGMA data_version').fetchone()[0]
+
+        count = self._connection.execute('SELECT COUNT(*) FROM seen_jobs').fetchone()[0]
+        self._count = count
+        self._filter = BloomFilter(max(MIN_BLOOM_CAPACITY, count * 2))
+        self._last_row = 0
+
+        for row, job_id in self._connection.execute('SELECT rowid, job_id FROM seen_jobs'):
+            self._filter.add(job_id)
+            self._last_row = max(self._last_row, row)
+
+    def __refresh_filter(self) -> None:
+        # data_version changes only when another connection commits, so a run that has the file
+        # to itself keeps answering new ids from memory. Rows are never deleted, which makes the
+        # ones added since the last read those past the highest rowid read.
+        version = self._connection.execute('PRAGMA data_version').fetchone()[0]
+
+        if version == self._version:
+            return
+
+        self._version = version
+
+        for row, job_id in self._connection.execute(
+                'SELECT rowid, job_id FROM seen_jobs WHERE rowid > ?', (self._last_row,)).fetchall():
+            if job_id not in self._filter:
+                self._filter.add(job_id)
+                self._count += 1
+
+            self._last_row = max(self._last_row, row)
+
+        if self._count > self._filter.capacity:
+            self.__rebuild_filter()
+
+    def __contains__(self, job_id: str) -> bool:
+        with self._lock:
+            if job_id not in self._filter:
+                self.__refresh_filter()
+
+            if job_id not in self._filter:
+                return False
+
+            return self._connection.execute(
+                'SELECT 1 FROM seen_jobs WHERE job_id = ?', (job_id,)).fetchone() is not None
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._connection.execute('SELECT COUNT(*) FROM seen_jobs').fetchone()[0]
+
+    def get(self, job_id: str) -> Optional[Tuple[float, float]]:
+        """
+        Return when a job was first and last seen, as epoch seconds
+        :param job_id: str
+        :return: Optional[Tuple[float, float]] None for a job never seen
+        """
+
+        with self._lock:
+            return self._connection.execute(
+                'SELECT first_seen, last_seen FROM seen_jobs WHERE job_id = ?', (job_id,)).fetchone()
+
+    def add(self, job_ids: Iterable[str], seen_at: float = None) -> None:
+        """
+        Record jobs as seen now, keeping when the known ones were first seen
+        :param job_ids: Iterable[str]
+        :param seen_at: float epoch seconds, now when None
+        :return: None
+        """
+
+        seen_at = time() if seen_at is None else seen_at
+        job_ids = list(job_ids)
+
+        with self._lock:
+            with self._connection:
+                self._connection.executemany(
+                    'INSERT INTO seen_jobs (job_id, first_seen, last_seen) VALUES (?, ?, ?) '
+                    'ON CONFLICT (job_id) DO UPDATE SET last_seen = MAX(last_seen, excluded.last_seen)',
+                    [(job_id, seen_at, seen_at) for job_id in job_ids])
+
+            for job_id in job_ids:
+                if job_id not in self._filter:
+                    self._filter.add(job_id)
+                    self._count += 1
+
+            # Past its capacity the filter would let through more and more unknown ids
+            if self._count > self._filter.capacity:
+                self.__rebuild_filter()
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
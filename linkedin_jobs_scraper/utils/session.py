@@ -1,7 +1,8 @@
 """The cookies a LinkedIn session is made of: reading them, and injecting them."""
-from time import sleep, time
+from time import time
 from selenium import webdriver
 from .logger import warn
+from .waits import GONE_EXCEPTIONS, wait_for
 
 SESSION_COOKIE_NAME = 'li_at'
 
@@ -61,23 +62,27 @@ def is_on_linkedin(driver: webdriver) -> bool:
 
 def wait_for_linkedin(driver: webdriver, timeout: int = DOMAIN_WAIT_TIMEOUT) -> bool:
     """
-    Poll until the browser is on a LinkedIn document
+    Wait until the browser is on a LinkedIn document
+
+    The document a navigation leaves aborts the wait as it goes, and the wait carries on in
+    the one that replaced it, which answers on its first evaluation if it is LinkedIn's. A
+    browser that is gone is not on LinkedIn either, so it answers False as a timeout would.
+
     :param driver: webdriver
     :param timeout: int
     :return: bool
     """
 
-    elapsed = 0
-    sleep_time = 0.1
-
-    while elapsed < timeout:
-        if is_on_linkedin(driver):
-            return True
-
-        sleep(sleep_time)
-        elapsed += sleep_time
-
-    return False
+    try:
+        return wait_for(
+            driver,
+            '''
+                const hostname = document.location.hostname;
+                return Boolean(hostname) && hostname.endsWith('linkedin.com');
+            ''',
+            timeout=timeout).met
+    except GONE_EXCEPTIONS:
+        return False
 
 
 def get_cookie(driver: webdriver, name: str) -> str | None:
@@ -0,0 +1,289 @@
+"""Several tabs of one browser, each standing in for a browser of its own."""
+import threading
+from typing import Callable, List, Optional, Set
+from selenium import webdriver
+from .logger import debug
+
+# Seconds a tab may hold the browser for a single wait before the other tabs get a turn. The
+# WebDriver session runs one command at a time, whichever tab it is for.
+TAB_WAIT_SLICE = 0.25
+
+
+class SharedBrowser:
+    """One Chrome hosting up to `max_tabs` tabs, each worked by a thread of its own.
+
+    WebDriver addresses one window at a time and runs one command at a time, so every command
+    goes through `lock`, switching to the tab it is for first. The switch is only made when the
+    last command was for another tab. Cookies belong to the browser, so every tab shares its
+    session, and a Chrome profile, which no two browsers can hold, serves all of them.
+    """
+
+    def __init__(self, driver: webdriver, max_tabs: int):
+        self.driver = driver
+        self.max_tabs = max_tabs
+        self.lock = threading.RLock()
+        self.handles = set()
+        self.closed = False
+
+        # Chrome starts with a window of its own, which serves the first tab
+        self._spare = driver.current_window_handle
+        self._active = self._spare
+
+    @property
+    def has_room(self) -> bool:
+        """
+        Return True if another tab may be opened in this browser
+        :return: bool
+        """
+
+        with self.lock:
+            return not self.closed and len(self.handles) < self.max_tabs
+
+    def open_tab(self) -> 'Tab':
+        """
+        Open a tab, or hand out the window Chrome started with
+        :return: Tab
+        """
+
+        with self.lock:
+            if self._spare is not None:
+                handle, self._spare = self._spare, None
+            else:
+                self.driver.switch_to.new_window('tab')
+                handle = self.driver.current_window_handle
+                self._active = handle
+
+            self.handles.add(handle)
+
+        debug('Opened tab', handle)
+
+        return Tab(self, handle)
+
+    def activate(self, handle: str) -> None:
+        """
+        Point the session at a tab. The caller holds the lock.
+        :param handle: str
+        :return: None
+        """
+
+        if self._active != handle:
+            self.driver.switch_to.window(handle)
+            self._active = handle
+
+    def close_tab(self, handle: str) -> None:
+        """
+        Close a tab, and the browser along with its last one
+        :param handle: str
+        :return: None
+        """
+
+        with self.lock:
+            if handle not in self.handles:
+                return
+
+            self.handles.discard(handle)
+
+            if not self.handles:
+                self.closed = True
+                debug('Closing driver')
+                self.driver.quit()
+                return
+
+            try:
+                self.activate(handle)
+                self.driver.close()
+            except BaseException:
+                # A browser that cannot close a tab is in no state to open one: no new tab goes to
+                # it, and the tabs it still has close it along with the last of them
+                self.closed = True
+                raise
+            finally:
+                # WebDriver points at no window once the one it pointed at is closed
+                self._active = None
+
+
+class _TabSwitchTo:
+    """The switch_to of a tab: going back to its own window is what the scraper asks it for."""
+
+    def __init__(self, tab: 'Tab'):
+        self._tab = tab
+
+    def window(self, handle: str) -> None:
+        tab = self._tab
+        browser = tab.browser
+
+        with browser.lock:
+            # Any other window becomes the tab's own, as it becomes a webdriver's current one:
+            # it is a page opened ahead of time, taking over from the one it follows
+            if handle != tab.handle:
+                browser.handles.discard(tab.handle)
+                browser.handles.add(handle)
+                tab.handle = handle
+
+            browser.activate(handle)
+
+
+class Tab:
+    """A tab of a `SharedBrowser`, answering to the scraper as a webdriver of its own.
+
+    Every attribute of the driver is reached through the browser's lock, with the session
+    pointed at this tab, so that the threads working the other tabs never see it pointed
+    elsewhere half way through a command. `window_handles` lists this tab first, and then the
+    windows no tab of the browser owns, which are the ones a page opened.
+    """
+
+    wait_slice = TAB_WAIT_SLICE
+
+    def __init__(self, browser: SharedBrowser, handle: str):
+        self.browser = browser
+        self.handle = handle
+
+    def __getattr__(self, name: str):
+        browser = self.__dict__['browser']
+        handle = self.__dict__['handle']
+
+        with browser.lock:
+            browser.activate(handle)
+            value = getattr(browser.driver, name)
+
+        if not callable(value):
+            return value
+
+        def call(*args, **kwargs):
+            with browser.lock:
+                browser.activate(handle)
+                return value(*args, **kwargs)
+
+        return call
+
+    @property
+    def window_handles(self) -> List[str]:
+        with self.browser.lock:
+            opened = [h for h in self.browser.driver.window_handles if h not in self.browser.handles]
+
+        return [self.handle] + opened
+
+    @property
+    def sibling_handles(self) -> List[str]:
+        """
+        Return the windows of the other tabs, which nobody but their own thread may close
+        :return: List[str]
+        """
+
+        with self.browser.lock:
+            return [h for h in self.browser.handles if h != self.handle]
+
+    @property
+    def switch_to(self) -> _TabSwitchTo:
+        return _TabSwitchTo(self)
+
+    def close(self) -> None:
+        self.browser.close_tab(self.handle)
+
+    def quit(self) -> None:
+        self.browser.close_tab(self.handle)
+
+
+class TabFactory:
+    """Builds tabs for a `DriverPool`, starting a browser whenever every one open is full.
+
+    :param build_driver: Callable[[], webdriver] starts a browser
+    :param max_tabs: int the tabs one browser hosts at most
+    """
+
+    def __init__(self, build_driver: Callable[[], webdriver], max_tabs: int):
+        self._build_driver = build_driver
+        self._max_tabs = max_tabs
+        self._browsers: List[SharedBrowser] = []
+        self._lock = threading.Lock()
+
+    def __call__(self) -> Tab:
+        # A browser is started under the lock: the workers waiting on it would otherwise each
+        # start one of their own, where they only need a tab in this one
+        with self._lock:
+            self._browsers = [b for b in self._browsers if not b.closed]
+            browser = next((b for b in self._browsers if b.has_room), None)
+
+            if browser is None:
+                browser = SharedBrowser(self._build_driver(), self._max_tabs)
+                self._browsers.append(browser)
+
+            return browser.open_tab()
+
+
+class PagePrefetch:
+    """A page opened ahead of time in a background tab, for the scraper to switch to once it needs it.
+
+    The tab is created through CDP, which loads it without pointing the WebDriver session at it, so
+    the page in front goes on being worked while this one loads. At most one page is held: opening
+    another closes the one before it.
+
+    :param driver: webdriver
+    """
+
+    def __init__(self, driver: webdriver):
+        self.driver = driver
+        self.handle: Optional[str] = None
+        self.url: Optional[str] = None
+
+    @property
+    def handles(self) -> Set[str]:
+        """
+        Return the window of the page held, which is nobody else's to close
+        :return: Set[str]
+        """
+
+        return {self.handle} if self.handle is not None else set()
+
+    def open(self, url: str) -> bool:
+        """
+        Start loading a page in a background tab
+        :param url: str
+        :return: bool whether the tab was opened
+        """
+
+        self.discard()
+
+        try:
+            result = self.driver.execute_cdp_cmd('Target.createTarget', {'url': url, 'background': True})
+        except BaseException as e:
+            debug('Failed to prefetch', url, e)
+            return False
+
+        # Chromedriver names windows after their CDP target
+        self.handle, self.url = result['targetId'], url
+        debug('Prefetching', url)
+
+        return True
+
+    def take(self, url: str) -> Optional[str]:
+        """
+        Hand over the tab holding a page, which is the caller's to switch to and close from then on
+        :param url: str
+        :return: Optional[str] the window, None if the page held is not that one, or there is none
+        """
+
+        if self.url != url:
+            self.discard()
+            return None
+
+        handle, self.handle, self.url = self.handle, None, None
+
+        return handle
+
+    def discard(self) -> None:
+        """
+        Close the page held, if any
+        :return: None
+        """
+
+        if self.handle is None:
+            return
+
+        handle, self.handle, self.url = self.handle, None, None
+
+        try:
+            self.driver.execute_cdp_cmd('Target.closeTarget', {'targetId': handle})
+        except BaseException as e:
+            # Best effort: a tab left behind costs the browser some memory, and nothing else
+            debug('Failed to close the prefetched tab', e)
@@ -0,0 +1,152 @@
+"""How long the waits of a run have been taking, learned as it goes, and what to wait for next time."""
+import json
+import math
+import os
+import threading
+from collections import deque
+from typing import Dict, Optional
+from .logger import debug, warn
+
+# Observations kept per wait site. The oldest go first, so the model follows LinkedIn when it
+# gets slower or faster during a long run, or from one run to the next.
+MAX_SAMPLES = 500
+
+# Observations a site needs before anything is learned from it. Until then the hand-tuned value
+# is used as it is.
+MIN_SAMPLES = 20
+
+# What is learned is the time within which this share of the observations came in, and then some
+LEARNED_PERCENTILE = 0.99
+LEARNED_HEADROOM = 1.5
+
+
+def percentile(samples, q: float) -> float:
+    """
+    Return the q-th quantile of samples, by the nearest rank
+    :param samples: Iterable[float] not empty
+    :param q: float between 0 and 1
+    :return: float
+    """
+
+    ordered = sorted(samples)
+
+    return ordered[min(len(ordered) - 1, max(0, math.ceil(q * len(ordered)) - 1))]
+
+
+class TimingModel:
+    """The latencies observed at every wait site, and the timeouts and quiet periods set from them.
+
+    A site is a name chosen by the caller, one per kind of thing waited for: a card rendering, a
+    panel loading, a list holding still. Every value handed out lies between a floor and the
+    hand-tuned value of the site, which stays the ceiling: the model only ever takes out time a
+    wait has been shown not to need. A wait that ran out where the thing it waited for was merely
+    slow is observed as the ceiling, so a model that learned too short a value unlearns it.
+
+    One instance serves a whole scraper and is safe to share between its workers. Given a path,
+    the observations are read from it when it is opened and written back by `save`, so the next
+    run starts from what this one learned.
+
+    :param path: str a JSON file to keep the observations in, None to keep them in memory only
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = path
+        self._lock = threading.Lock()
+        self._samples: Dict[str, deque] = {}
+
+        if path is not None and os.path.exists(path):
+            self.__load()
+
+    def __load(self) -> None:
+        try:
+            with open(self.path) as f:
+                sites = json.load(f)['sites']
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            # A file that cannot be read costs what was learned, and nothing else
+            warn('Ignoring unreadable timings file', self.path, e)
+            return
+
+        for site, samples in sites.items():
+            self._samples[site] = deque((float(s) for s in samples), maxlen=MAX_SAMPLES)
+
+    def observe(self, site: str, seconds: float) -> None:
+        """
+        Record how long something took at a site
+        :param site: str
+        :param seconds: float
+        :return: None
+        """
+
+        with self._lock:
+            self._samples.setdefault(site, deque(maxlen=MAX_SAMPLES)).append(max(0.0, seconds))
+
+    def percentile(self, site: str, q: float = LEARNED_PERCENTILE) -> Optional[float]:
+        """
+        Return the q-th quantile of what was observed at a site
+        :param site: str
+        :param q: float
+        :return: Optional[float] None until the site has MIN_SAMPLES observations
+        """
+
+        with self._lock:
+            samples = list(self._samples.get(site, ()))
+
+        if len(samples) < MIN_SAMPLES:
+            return None
+
+        return percentile(samples, q)
+
+    def learned(self, site: str, default: float, floor: float) -> float:
+        """
+        Return how long to wait at a site
+        :param site: str
+        :param default: float the hand-tuned value, used until enough is known and never exceeded
+        :param floor: float the least it may be brought down to
+        :return: float seconds
+        """
+
+        observed = self.percentile(site)
+
+        if observed is None:
+            return default
+
+        return min(default, max(floor, observed * LEARNED_HEADROOM))
+
+    def snapshot(self) -> Dict[str, dict]:
+        """
+        Return what has been learned so far, site by site
+        :return: Dict[str, dict] the observation count and the high percentile of every site
+        """
+
+        with self._lock:
+            sites = {site: list(samples) for site, samples in self._samples.items()}
+
+        return {site: {'samples': len(samples),
+                       'p99': round(percentile(samples, LEARNED_PERCENTILE), 3) if samples else None}
+                for site, samples in sites.items()}
+
+    def save(self) -> None:
+        """
+        Write the observations to the model's file, when it has one
+        :return: None
+        """
+
+        if self.path is None:
+            return
+
+        with self._lock:
+            sites = {site: [round(s, 4) for s in samples] for site, samples in self._samples.items()}
+
+        # Written aside and moved over, so a run killed half way through leaves the last file whole
+        temporary = f'{self.path}.tmp'
+
+        try:
+            with open(temporary, 'w') as f:
+                json.dump({'sites': sites}, f)
+
+            os.replace(temporary, self.path)
+        except OSError as e:
+            warn('Failed to save timings to', self.path, e)
+            return
+
+        debug('Saved timings to', self.path)
@@ -0,0 +1,221 @@
+"""Waits that run inside the page and answer as soon as what they wait for is there."""
+from itertools import count
+from time import monotonic, sleep
+from typing import NamedTuple, Any
+from weakref import WeakKeyDictionary
+from selenium import webdriver
+from selenium.common.exceptions import InvalidSessionIdException, NoSuchWindowException
+from urllib3.exceptions import HTTPError
+from .logger import debug
+
+# How often a condition is evaluated when the DOM is not changing. Mutations are what most
+# conditions wait for, but not all of them: a quiet period runs out, a grace expires and a
+# document is swapped without a single mutation being observed.
+IDLE_CHECK_INTERVAL = 0.1
+
+# Mutations arrive in bursts, one per node LinkedIn touches while rendering, so they are
+# coalesced into one evaluation per this many seconds rather than one per mutation.
+MUTATION_COALESCE_DELAY = 0.01
+
+# Room left to the driver on top of the wait itself before it gives up on the script: the
+# page ends the wait, and the driver's own limit is only there for a page that hung.
+SCRIPT_TIMEOUT_MARGIN = 5
+
+# The script timeout set on a driver is never lowered, and raised to at least this, so that
+# it is set once per browser rather than once per wait.
+MIN_SCRIPT_TIMEOUT = 30
+
+# The script timeout last set on each driver. Setting it is a round trip of its own, which
+# would double what a wait costs if it were done every time.
+_script_timeouts = WeakKeyDictionary()
+
+# Pause before asking a document that refused to run the wait again. A navigation in
+# progress answers with an error until the new document is there to run it.
+RETRY_DELAY = 0.05
+
+# What a browser that is no longer there answers with: its session was ended, its window was
+# closed, or its driver process is gone and refuses the connection. No new document will ever
+# come to run the wait in, so retrying would only wait out the timeout. cancel() closes the
+# browsers under a wait, which is where this is met.
+GONE_EXCEPTIONS = (InvalidSessionIdException, NoSuchWindowException, ConnectionError, HTTPError)
+
+# Pause between two slices of a wait, which is when the other users of a shared driver get
+# their turn at it
+SLICE_YIELD_DELAY = 0.01
+
+# Names the page keeps the state of a sliced wait under, from one slice to the next
+_sliced_waits = count()
+
+# The engine every wait runs in. `condition` is evaluated with the wait's arguments and a
+# state object it may keep whatever it likes on between evaluations; anything but null,
+# undefined or false ends the wait with that value. `state.partial` is what the wait
+# answers with when it times out instead.
+#
+# A wait run in slices keeps its state on the window under `stateKey`, so a quiet period or a
+# grace goes on counting across slices; the last slice, or the one meeting the condition,
+# removes it.
+WAIT_SCRIPT = '''
+    const done = arguments[arguments.length - 1];
+    const params = arguments[0];
+    const condition = function (args, state) {
+        %s
+    };
+
+    const started = performance.now();
+    const state = params.stateKey ? (window[params.stateKey] = window[params.stateKey] || {}) : {};
+    let finished = false;
+    let scheduled = false;
+    let evaluations = 0;
+    let observer = null;
+    let interval = null;
+    let deadline = null;
+
+    const finish = (met, value) => {
+        if (finished) {
+            return;
+        }
+
+        finished = true;
+
+        if (params.stateKey && (met || params.last)) {
+            delete window[params.stateKey];
+        }
+
+        if (observer) {
+            observer.disconnect();
+        }
+
+        clearInterval(interval);
+        clearTimeout(deadline);
+
+        done({
+            met: met,
+            value: value === undefined ? null : value,
+            elapsed: (performance.now() - started) / 1000,
+            evaluations: evaluations,
+        });
+    };
+
+    const evaluate = () => {
+        scheduled = false;
+
+        if (finished) {
+            return;
+        }
+
+        evaluations++;
+
+        let value = null;
+
+        try {
+            value = condition(params.args, state);
+        } catch (e) {
+            // A condition reading a node LinkedIn is busy replacing throws, which only
+            // means the answer is not there yet
+            value = null;
+        }
+
+        if (value !== null && value !== undefined && value !== false) {
+            finish(true, value);
+        }
+    };
+
+    const schedule = () => {
+        if (!scheduled) {
+            scheduled = true;
+            setTimeout(evaluate, params.coalesce);
+        }
+    };
+
+    observer = new MutationObserver(schedule);
+    observer.observe(document, {childList: true, subtree: true, attributes: true, characterData: true});
+
+    interval = setInterval(evaluate, params.interval);
+    deadline = setTimeout(() => finish(false, state.partial), params.timeout);
+
+    evaluate();
+'''
+
+
+class WaitResult(NamedTuple):
+    met: bool
+    value: Any = None
+    elapsed: float = 0.0
+    calls: int = 0  # WebDriver round trips the wait took, navigations included
+
+
+def wait_for(driver: webdriver, condition: str, *args, timeout: float = 5) -> WaitResult:
+    """
+    Wait in the page for a condition to hold, for up to timeout seconds
+
+    The condition is a JavaScript function body receiving `args` and `state`. It is evaluated
+    straight away, then again on every change to the DOM and, failing any, every
+    IDLE_CHECK_INTERVAL seconds, so the wait answers within milliseconds of the page getting
+    there and costs one WebDriver call rather than one per tick.
+
+    A document replaced while it is being waited on - a navigation landing, or the error page
+    of a refused one - aborts the script, and the wait goes on in the new document for what
+    remains of the timeout. So does a document that cannot run the script at all yet. A browser
+    that was closed, cancel() closing it included, is not waited on: what it answered is raised.
+
+    A WebDriver session runs one command at a time, so a wait holds its driver for as long as
+    it lasts. A driver shared between threads, a tab of a browser hosting several, says how
+    long it may be held at once with a `wait_slice` attribute, and the wait is then run in
+    slices of that many seconds, leaving the driver to the others in between.
+
+    :param driver: webdriver
+    :param condition: str the body of a function(args, state) returning a value to end the wait
+    :param args: passed to the condition as the array `args`
+    :param timeout: float seconds
+    :return: WaitResult
+    """
+
+    started = monotonic()
+    script = WAIT_SCRIPT % condition
+    calls = 0
+    result = None
+    wait_slice = getattr(driver, 'wait_slice', None)
+    state_key = f'__ljsWait{next(_sliced_waits)}' if wait_slice else None
+
+    while True:
+        remaining = timeout - (monotonic() - started)
+
+        if remaining <= 0:
+            break
+
+        budget = min(remaining, wait_slice) if wait_slice else remaining
+
+        try:
+            if _script_timeouts.get(driver, 0) < remaining + SCRIPT_TIMEOUT_MARGIN:
+                script_timeout = max(MIN_SCRIPT_TIMEOUT, remaining + SCRIPT_TIMEOUT_MARGIN)
+                driver.set_script_timeout(script_timeout)
+                _script_timeouts[driver] = script_timeout
+                calls += 1
+
+            calls += 1
+
+            result = driver.execute_async_script(script, {
+                'args': list(args),
+                'timeout': budget * 1000,
+                'interval': IDLE_CHECK_INTERVAL * 1000,
+                'coalesce': MUTATION_COALESCE_DELAY * 1000,
+                'stateKey': state_key,
+                'last': budget >= remaining,
+            })
+        except GONE_EXCEPTIONS:
+            raise
+        except BaseException as e:
+            debug('The page could not run the wait, trying again', type(e).__name__)
+            sleep(RETRY_DELAY)
+            continue
+
+        if result and result['met']:
+            return WaitResult(True, result['value'], monotonic() - started, calls)
+
+        if budget < remaining:
+            sleep(SLICE_YIELD_DELAY)
+            continue
+
+        break
+
+    return WaitResult(False, result['value'] if result else None, monotonic() - started, calls)
@@ -0,0 +1,51 @@
+"""What the benchmarks share: the certificate the fake LinkedIn serves, and the table they report into."""
+import json
+import os
+
+import pytest
+
+from .fake_linkedin import make_certificate
+
+# Where the measurements are written as JSON, to be compared with the ones of another version
+REPORT_ENV = 'LI_BENCHMARK_REPORT'
+
+# One row per pacing configuration measured, in the order they ran
+RESULTS = {}
+
+COLUMNS = (
+    ('jobs', 'jobs', '{:d}'),
+    ('jobs/min', 'jobs_per_minute', '{:.1f}'),
+    ('429s', 'refused', '{:d}'),
+    ('throttled', 'throttled', '{:d}'),
+    ('slept (s)', 'slept', '{:.1f}'),
+    ('wasted (s)', 'wasted', '{:.1f}'),
+    ('p50 (s)', 'p50', '{:.2f}'),
+    ('p95 (s)', 'p95', '{:.2f}'),
+)
+
+
+@pytest.fixture(scope='session')
+def certificate(tmp_path_factory) -> tuple:
+    paths = make_certificate(str(tmp_path_factory.mktemp('fake-linkedin')))
+
+    if paths is None:
+        pytest.skip('the fake LinkedIn needs the openssl command line for its certificate')
+
+    return paths
+
+
+def pytest_terminal_summary(terminalreporter) -> None:
+    if not RESULTS:
+        return
+
+    terminalreporter.section('pacing benchmark')
+    terminalreporter.write_line(f'{"configuration":<16}' + ''.join(f'{title:>12}' for title, _, _ in COLUMNS))
+
+    for name, row in RESULTS.items():
+        terminalreporter.write_line(f'{name:<16}' + ''.join(f'{fmt.format(row[key]):>12}' for _, key, fmt in COLUMNS))
+
+    if os.environ.get(REPORT_ENV):
+        with open(os.environ[REPORT_ENV], 'w') as f:
+            json.dump(RESULTS, f, indent=2)
+
+        terminalreporter.write_line(f'Written to {os.environ[REPORT_ENV]}')
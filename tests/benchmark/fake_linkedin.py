@@ -0,0 +1,305 @@
+"""A LinkedIn of our own, serving what the scraper reads and refusing it the way LinkedIn does.
+
+The real site cannot be asked to throttle on demand, nor to throttle the same way twice, so a
+number measured against it says as much about the day as about the pacer. This one is driven
+instead: every request it charges takes a token from a bucket refilled at a chosen rate, and an
+empty bucket answers 429 with an empty body, as LinkedIn does.
+
+What it serves is built from the strategy's own selectors: a home page, pages of results that
+paint a preliminary list before the settled one, and job details fetched by the page when a card
+is clicked. The browser is pointed at it with `--host-resolver-rules`, so the scraper asks for
+https://www.linkedin.com as it always does, and is served a self-signed certificate it ignores.
+"""
+import json
+import os
+import shutil
+import ssl
+import subprocess
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from math import ceil
+from random import uniform
+from time import monotonic, sleep
+from urllib.parse import parse_qs, urlparse
+
+from linkedin_jobs_scraper.strategies.authenticated_strategy import JOB_ID_ATTRIBUTE, PAGINATION_SIZE, Selectors
+from linkedin_jobs_scraper.utils.rate_limit import take_tokens
+
+# Far from any id the preliminary render uses, and of the same length, so that no id is ever
+# found inside another
+FIRST_JOB_ID = 4_000_000_000
+
+# What LinkedIn's preliminary render was measured to hold, see __wait_for_stable_job_ids
+PRELIMINARY_SIZE = 7
+
+DETAILS_PATH = '/voyager/api/jobs/jobPostings/'
+
+# Long enough for the description to weigh what a real one does
+DESCRIPTION = 'We are looking for an engineer to join the team. ' * 80
+
+
+def _class_of(selector: str) -> str:
+    # '.a, .b' and 'div.a' alike: the first class the selector names
+    return selector.split(',')[0].split('.')[1].split(' ')[0]
+
+
+SEARCH_PAGE = '''<html><head><title>Jobs | LinkedIn</title></head><body>
+<div class="global-nav"></div>
+<div class="scaffold-layout">
+  <div class="jobs-search-results-list__subtitle"><small>%(total)s results</small></div>
+  <div class="%(container)s"><ul id="results"></ul></div>
+  <div class="%(panel)s"></div>
+</div>
+<script>
+  const card = id => `<li %(attribute)s="${id}"><div class="job-card-container">
+    <a class="job-card-container__link" href="#" data-job="${id}">
+      <div class="artdeco-entity-lockup__title"><strong>Engineer ${id}</strong></div>
+    </a>
+    <div class="artdeco-entity-lockup__subtitle">Acme</div>
+    <div class="artdeco-entity-lockup__caption">Berlin, Germany</div>
+    <time datetime="2026-10-01">2 weeks ago</time>
+  </div></li>`;
+
+  const render = ids => {
+    document.getElementById('results').innerHTML = ids.map(card).join('');
+  };
+
+  const panel = document.querySelector('.%(panel)s');
+
+  // The details are asked for when the card is clicked, and only shown if they were served
+  document.addEventListener('click', event => {
+    const link = event.target.closest('a.job-card-container__link');
+
+    if (!link) {
+      return;
+    }
+
+    event.preventDefault();
+    panel.innerHTML = '';
+
+    fetch('%(details_path)s' + link.dataset.job)
+      .then(response => response.ok ? response.json() : null)
+      .then(job => {
+        if (!job) {
+          return;
+        }
+
+        panel.innerHTML = `<div data-job-id="${job.id}">
+          <div class="job-details-jobs-unified-top-card__job-title">${job.title}</div>
+          <div class="job-details-jobs-unified-top-card__company-name">
+            <a href="https://www.linkedin.com/company/acme/life/">Acme</a>
+          </div>
+          <div class="job-details-jobs-unified-top-card__tertiary-description-container">
+            Berlin, Germany · 2 weeks ago · 40 applicants
+          </div>
+          <div class="jobs-description"><p>${job.description}</p></div>
+        </div>`;
+      })
+      .catch(() => {});
+  });
+
+  render(%(preliminary)s);
+  setTimeout(() => render(%(settled)s), %(settle_delay)s);
+</script>
+</body></html>'''
+
+HOME_PAGE = b'<html><head><title>Feed | LinkedIn</title></head><body><div class="global-nav"></div></body></html>'
+
+
+def job_ids(start: int, total: int) -> list:
+    """
+    Return the ids of the page of results that starts at start
+    :param start: int
+    :param total: int
+    :return: list
+    """
+
+    return [str(FIRST_JOB_ID + i) for i in range(start, min(start + PAGINATION_SIZE, total))]
+
+
+def search_page(start: int, total: int, settle_delay: float) -> bytes:
+    """
+    Return a page of results, which renders jobs of no page of these results before its own
+    :param start: int
+    :param total: int
+    :param settle_delay: float seconds before the settled list replaces the preliminary one
+    :return: bytes
+    """
+
+    preliminary = [str(FIRST_JOB_ID - 1 - i) for i in range(PRELIMINARY_SIZE)]
+
+    return (SEARCH_PAGE % {
+        'total': f'{total:,}',
+        'container': _class_of(Selectors.container),
+        'panel': _class_of(Selectors.detailsPanel),
+        'attribute': JOB_ID_ATTRIBUTE,
+        'details_path': DETAILS_PATH,
+        'preliminary': json.dumps(preliminary),
+        'settled': json.dumps(job_ids(start, total)),
+        'settle_delay': int(settle_delay * 1000),
+    }).encode()
+
+
+def make_certificate(directory: str) -> tuple:
+    """
+    Write a self-signed certificate for www.linkedin.com with the openssl command line
+    :param directory: str
+    :return: tuple the paths of the certificate and of its key, None when openssl is missing
+    """
+
+    if shutil.which('openssl') is None:
+        return None
+
+    certificate, key = os.path.join(directory, 'cert.pem'), os.path.join(directory, 'key.pem')
+
+    subprocess.run(['openssl', 'req', '-x509', '-newkey', 'rsa:2048', '-nodes', '-days', '1',
+                    '-subj', '/CN=www.linkedin.com', '-keyout', key, '-out', certificate],
+                   check=True, capture_output=True)
+
+    return certificate, key
+
+
+class FakeLinkedin:
+    """The server, its bucket and what it has answered.
+
+    :param rate: float requests a second the bucket refills with
+    :param burst: int requests that may be made back to back after a quiet spell
+    :param job_total: int the results every search holds
+    :param latency: float seconds every charged request takes to be answered, on average
+    :param jitter: float the share of the latency it varies by either way
+    :param settle_delay: float seconds a page of results shows its preliminary list for
+    :param retry_after: bool send a Retry-After with every 429, for the time a token takes to come back
+    :param rate_limit_headers: bool send X-RateLimit-Remaining and X-RateLimit-Reset with every charged answer
+    :param certificate: tuple paths of a certificate and its key to serve HTTPS with, None for plain HTTP
+    """
+
+    def __init__(self, rate: float = 1.0, burst: int = 5, job_total: int = 50, latency: float = 0.05,
+                 jitter: float = 0.5, settle_delay: float = 1.0, retry_after: bool = True,
+                 rate_limit_headers: bool = True, certificate: tuple = None):
+        self.rate = rate
+        self.burst = burst
+        self.job_total = job_total
+        self.latency = latency
+        self.jitter = jitter
+        self.settle_delay = settle_delay
+        self.retry_after = retry_after
+        self.rate_limit_headers = rate_limit_headers
+        self.certificate = certificate
+
+        self.served = 0
+        self.refused = 0
+        self.refused_details = 0
+
+        self._tokens = float(burst)
+        self._updated_at = monotonic()
+        self._lock = threading.Lock()
+        self._server = None
+
+    @property
+    def port(self) -> int:
+        return self._server.server_address[1]
+
+    @property
+    def url(self) -> str:
+        return f'{"https" if self.certificate else "http"}://127.0.0.1:{self.port}'
+
+    def take(self, details: bool = False) -> tuple:
+        """
+        Take a token for a request, unless the bucket is empty, and count the answer
+        :param details: bool whether the request is a job's details, which the page fetched on its own
+        :return: tuple whether the request is served, the requests left, and the seconds until the
+                 next one when none is, or until the bucket is full again
+        """
+
+        with self._lock:
+            now = monotonic()
+            tokens, wait = take_tokens(self._tokens, self._updated_at, now, 1 / self.rate, self.burst, 1)
+            served = wait == 0
+
+            # A refused request takes nothing: the bucket only holds requests that were served
+            if not served:
+                tokens += 1
+
+            self._tokens, self._updated_at = tokens, now
+            self.served += int(served)
+            self.refused += int(not served)
+            self.refused_details += int(not served and details)
+
+            reset = (1 - tokens) / self.rate if tokens < 1 else (self.burst - tokens) / self.rate
+
+            return served, int(tokens), reset
+
+    def start(self) -> 'FakeLinkedin':
+        self._server = ThreadingHTTPServer(('127.0.0.1', 0), _handler(self))
+        self._server.daemon_threads = True
+
+        if self.certificate is not None:
+            context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+            context.load_cert_chain(*self.certificate)
+            self._server.socket = context.wrap_socket(self._server.socket, server_side=True)
+
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+
+        return self
+
+    def stop(self) -> None:
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+
+
+def _handler(linkedin: FakeLinkedin) -> type:
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            url = urlparse(self.path)
+
+            if url.path in ('/', '/feed/'):
+                self.__charged(lambda: ('text/html', HOME_PAGE))
+            elif url.path.startswith('/jobs/search'):
+                start = int(parse_qs(url.query).get('start', ['0'])[0])
+                self.__charged(lambda: ('text/html', search_page(start, linkedin.job_total, linkedin.settle_delay)))
+            elif url.path.startswith(DETAILS_PATH):
+                job_id = url.path[len(DETAILS_PATH):]
+                self.__charged(lambda: ('application/json', json.dumps(
+                    {'id': job_id, 'title': f'Engineer {job_id}', 'description': DESCRIPTION}).encode()),
+                    details=True)
+            else:
+                # The favicon, chiefly, which Chrome asks for on its own and LinkedIn does not count
+                self.send_response(404)
+                self.send_header('Content-Length', '0')
+                self.end_headers()
+
+        def __charged(self, build, details: bool = False) -> None:
+            sleep(max(0.0, linkedin.latency * uniform(1 - linkedin.jitter, 1 + linkedin.jitter)))
+
+            served, remaining, reset = linkedin.take(details)
+
+            if not served:
+                self.send_response(429)
+
+                if linkedin.retry_after:
+                    self.send_header('Retry-After', str(max(1, ceil(reset))))
+
+                self.__rate_limit_headers(remaining, reset)
+                self.send_header('Content-Length', '0')
+                self.end_headers()
+                return
+
+            content_type, body = build()
+            self.send_response(200)
+            self.send_header('Content-Type', content_type)
+            self.__rate_limit_headers(remaining, reset)
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def __rate_limit_headers(self, remaining: int, reset: float) -> None:
+            if linkedin.rate_limit_headers:
+                self.send_header('X-RateLimit-Remaining', str(remaining))
+                self.send_header('X-RateLimit-Reset', str(max(1, ceil(reset))))
+
+        def log_message(self, *args):
+            pass
+
+    return Handler
+
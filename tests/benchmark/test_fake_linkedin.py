@@ -0,0 +1,70 @@
+"""Offline tests for the fake LinkedIn the pacing benchmark runs against, so that what it measures is what it says."""
+from __future__ import annotations
+
+import json
+import re
+import ssl
+from urllib.error import HTTPError
+from urllib.request import urlopen
+
+import pytest
+
+from linkedin_jobs_scraper.strategies.authenticated_strategy import PAGINATION_SIZE, Selectors
+from .fake_linkedin import DETAILS_PATH, FIRST_JOB_ID, PRELIMINARY_SIZE, FakeLinkedin, job_ids, search_page
+
+
+@pytest.fixture
+def linkedin():
+    server = FakeLinkedin(rate=0.5, burst=2, latency=0, job_total=30).start()
+    yield server
+    server.stop()
+
+
+def _get(url: str, context=None) -> tuple[int, dict, bytes]:
+    try:
+        with urlopen(url, timeout=5, context=context) as response:
+            return response.status, dict(response.headers), response.read()
+    except HTTPError as e:
+        return e.code, dict(e.headers), e.read()
+
+
+def test_a_page_of_results_paints_other_jobs_before_its_own() -> None:
+    page = search_page(25, 30, settle_delay=1).decode()
+    renders = re.findall(r'render\((\[.*?\])\)', page)
+
+    assert len(json.loads(renders[0])) == PRELIMINARY_SIZE
+    assert not set(json.loads(renders[0])) & set(job_ids(0, 30) + job_ids(25, 30))
+    assert json.loads(renders[1]) == [str(FIRST_JOB_ID + i) for i in range(25, 30)]
+    assert len(job_ids(0, 30)) == PAGINATION_SIZE
+    assert '30 results' in page and Selectors.container.lstrip('.') in page
+
+
+def test_the_bucket_refuses_once_spent_and_says_for_how_long(linkedin) -> None:
+    answers = [_get(f'{linkedin.url}{DETAILS_PATH}{FIRST_JOB_ID}') for _ in range(3)]
+
+    assert [status for status, _, _ in answers] == [200, 200, 429]
+    assert json.loads(answers[0][2])['id'] == str(FIRST_JOB_ID)
+    assert answers[1][1]['X-RateLimit-Remaining'] == '0'
+    assert answers[2][1]['Retry-After'] == '2' and answers[2][2] == b''
+    assert (linkedin.served, linkedin.refused, linkedin.refused_details) == (2, 1, 1)
+
+
+def test_only_what_linkedin_counts_is_charged(linkedin) -> None:
+    for _ in range(3):
+        assert _get(f'{linkedin.url}/favicon.ico')[0] == 404
+
+    status, _, body = _get(f'{linkedin.url}/jobs/search?keywords=engineer&start=25')
+
+    assert status == 200 and str(FIRST_JOB_ID + 29).encode() in body
+    assert linkedin.served == 1
+
+
+def test_the_fake_serves_https_when_given_a_certificate(certificate) -> None:
+    server = FakeLinkedin(latency=0, certificate=certificate).start()
+    context = ssl.create_default_context()
+    context.check_hostname, context.verify_mode = False, ssl.CERT_NONE
+
+    try:
+        assert _get(f'{server.url}/', context)[0] == 200
+    finally:
+        server.stop()
@@ -0,0 +1,140 @@
+"""How fast each pacing configuration scrapes from a LinkedIn that throttles, and what that costs.
+
+Collected by pytest, but only run on demand: every configuration drives a local Chrome through
+the real AuthenticatedStrategy for a couple of minutes, against the fake LinkedIn of fake_linkedin.py.
+Every run meets the same rate limit, so the numbers compare configurations with each other, and
+one version of the scraper with the next:
+
+    LI_BENCHMARK=1 LI_BENCHMARK_REPORT=pacing.json python -m pytest -q tests/benchmark
+
+Reported for each configuration, once every configuration has run:
+
+- jobs/min: the jobs delivered, over the wall time of the run.
+- 429s: the refusals the server answered, and throttled, the ones the pacer heard of.
+- slept: seconds the strategy slept, pacing and backing off alike.
+- wasted: seconds spent on work that came to nothing: the backoff after a refused page, and the
+  waits for details that never loaded, their request having been refused.
+- p50 and p95: the seconds between one job being delivered and the next, the first job aside.
+"""
+import os
+from statistics import median, quantiles
+from time import monotonic
+
+import pytest
+
+from linkedin_jobs_scraper import LinkedinScraper
+from linkedin_jobs_scraper.config import Config
+from linkedin_jobs_scraper.events import Events
+from linkedin_jobs_scraper.query import Query, QueryOptions
+from linkedin_jobs_scraper.strategies import authenticated_strategy as strat
+from linkedin_jobs_scraper.utils.chrome_driver import get_default_driver_options
+from .conftest import RESULTS
+from .fake_linkedin import FakeLinkedin
+
+pytestmark = pytest.mark.skipif(
+    not os.environ.get('LI_BENCHMARK'),
+    reason='benchmarks run on demand, with Chrome installed: set LI_BENCHMARK=1')
+
+# Two pages of results: enough for a pagination, few enough for the slowest configuration
+JOB_TOTAL = 50
+
+# A budget the default slow_mo overruns: a job asks for its details once, and the serial loop
+# asks about once a second, twice what the server takes. A run that does not slow down is
+# refused as soon as the burst is spent.
+SERVER_RATE = 0.5
+SERVER_BURST = 5
+
+PACING_CONFIGS = {
+    'fixed': {'adaptive_slow_mo': False},
+    'adaptive': {},
+    'server-hints': {'observe_network': True},
+    'pipelined': {'pipeline_details': True},
+}
+
+
+class Measurement:
+    """What a run spends its time on, read from inside the strategy without changing what it does."""
+
+    def __init__(self, monkeypatch):
+        self.slept = 0.0
+        self.backoff = 0.0
+        self.refused_details_wait = 0.0
+
+        real_sleep = strat.sleep
+        real_backoff_wait = strat.backoff_wait
+        real_extract = strat.AuthenticatedStrategy._AuthenticatedStrategy__extract_job_details
+
+        def sleep(seconds):
+            self.slept += seconds
+            real_sleep(seconds)
+
+        def backoff_wait(pacer, step):
+            waited = real_backoff_wait(pacer, step)
+            self.backoff += waited
+            return waited
+
+        def extract_job_details(*args):
+            started = monotonic()
+            result = real_extract(*args)
+
+            if not result['success']:
+                self.refused_details_wait += monotonic() - started
+
+            return result
+
+        monkeypatch.setattr(strat, 'sleep', sleep)
+        monkeypatch.setattr(strat, 'backoff_wait', backoff_wait)
+        monkeypatch.setattr(strat.AuthenticatedStrategy, '_AuthenticatedStrategy__extract_job_details',
+                            staticmethod(extract_job_details))
+
+
+def _percentile(values: list, share: int) -> float:
+    if len(values) < 2:
+        return values[0] if values else 0.0
+
+    return quantiles(values, n=100, method='inclusive')[share - 1]
+
+
+@pytest.mark.parametrize('name', list(PACING_CONFIGS))
+def test_pacing_configuration(name, certificate, monkeypatch) -> None:
+    linkedin = FakeLinkedin(rate=SERVER_RATE, burst=SERVER_BURST, job_total=JOB_TOTAL, certificate=certificate).start()
+
+    # The scraper asks for https://www.linkedin.com as it always does, and is answered from here
+    options = get_default_driver_options(headless=True)
+    options.add_argument(f'--host-resolver-rules=MAP www.linkedin.com 127.0.0.1:{linkedin.port}')
+
+    # Whatever the environment holds is a real account's, and the fake one takes any session
+    monkeypatch.setattr(Config, 'LI_AT_COOKIE', 'benchmark')
+    monkeypatch.setattr(Config, 'LI_RM_COOKIE', None)
+    monkeypatch.setattr(Config, 'LI_BCOOKIE', None)
+    measurement = Measurement(monkeypatch)
+
+    scraper = LinkedinScraper(chrome_options=options, max_workers=1, **PACING_CONFIGS[name])
+    delivered = []
+    scraper.on(Events.DATA, lambda data: delivered.append(monotonic()))
+
+    try:
+        started = monotonic()
+        scraper.run(Query(query='engineer', options=QueryOptions(locations=['Berlin'], limit=JOB_TOTAL)))
+        elapsed = monotonic() - started
+        throttled = scraper.pacer.throttled_count
+    finally:
+        scraper.close()
+        linkedin.stop()
+
+    # From one job to the next: the first is mostly the session being established
+    latencies = [b - a for a, b in zip(delivered, delivered[1:])]
+
+    RESULTS[name] = {
+        'jobs': len(delivered),
+        'jobs_per_minute': len(delivered) / elapsed * 60,
+        'refused': linkedin.refused,
+        'throttled': throttled,
+        'slept': measurement.slept,
+        'wasted': measurement.backoff + measurement.refused_details_wait,
+        'p50': median(latencies) if latencies else 0.0,
+        'p95': _percentile(latencies, 95),
+    }
+
+    # A configuration that delivers nothing measured the harness, not the pacing
+    assert delivered, f'{name} delivered no job, {linkedin.refused} of its requests were refused'
@@ -0,0 +1,240 @@
+"""Measure what reading a job costs in WebDriver round trips, before and after batching it.
+
+Not collected by pytest (the filename does not match `test_*.py`), and it never touches the
+live site: a local server hands out a page carrying one job card and its details panel, built
+from the same selectors the strategy reads.
+
+The "before" side replays the calls a job used to cost, one per field group: the card, the
+details wait, then date text, company link, employee count, description and insights. The
+"after" sides are the single extraction call and the details wait the strategy polls it with,
+both calling the function registered in the page before it loaded, as the strategy does once
+its session is established. All read the same page, so the fields they return are compared as
+well as their cost.
+
+    PYTHONPATH=. python -u tests/manual/extraction_benchmark.py [iterations]
+"""
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from statistics import median
+from time import perf_counter, sleep
+
+from linkedin_jobs_scraper.strategies import authenticated_strategy as strat
+from linkedin_jobs_scraper.strategies.authenticated_strategy import Selectors, get_job_item_selector
+from linkedin_jobs_scraper.strategies.extraction import extract_job, register_extraction
+from linkedin_jobs_scraper.utils.timings import TimingModel
+from linkedin_jobs_scraper.utils.chrome_driver import build_driver
+
+PORT = 8733
+JOB_ID = '4055815184'
+
+# Long enough for the description to weigh what a real one does
+DESCRIPTION = '<p>' + 'We are looking for an engineer to join the team. ' * 80 + '</p>'
+
+PAGE = f'''<html><body>
+<div class="scaffold-layout__list"><ul>
+  <li data-occludable-job-id="{JOB_ID}">
+    <div class="job-card-container">
+      <a class="job-card-container__link" href="#">
+        <div class="artdeco-entity-lockup__title"><span>Engineer</span><strong>Engineer</strong></div>
+      </a>
+      <img src="https://media.example/logo.png">
+      <div class="artdeco-entity-lockup__subtitle">Acme</div>
+      <div class="artdeco-entity-lockup__caption">Berlin, Germany</div>
+      <time datetime="2026-10-01">2 weeks ago</time>
+      <ul><li>Promoted</li></ul>
+    </div>
+  </li>
+</ul></div>
+<div class="jobs-search__job-details--container" data-job-id="{JOB_ID}">
+  <div class="job-details-jobs-unified-top-card__job-title">Engineer</div>
+  <div class="job-details-jobs-unified-top-card__company-name">
+    <a href="https://www.linkedin.com/company/acme/life/?trk=x">Acme</a>
+  </div>
+  <div class="job-details-jobs-unified-top-card__tertiary-description-container">
+    Berlin, Germany · 2 weeks ago · 40 applicants
+  </div>
+  <div class="jobs-description">{DESCRIPTION}</div>
+  <div class="job-details-fit-level-preferences"><button>Remote</button><button>Full-time</button></div>
+  <div class="jobs-company__box"><span class="jobs-company__inline-information">1,001-5,000 employees</span></div>
+</div>
+</body></html>'''.encode()
+
+
+class Handler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/html')
+        self.send_header('Content-Length', str(len(PAGE)))
+        self.end_headers()
+        self.wfile.write(PAGE)
+
+    def log_message(self, *args):
+        pass
+
+
+class CountingDriver:
+    """Counts the round trips made through it, which is the cost being compared."""
+
+    def __init__(self, driver):
+        self.driver = driver
+        self.calls = 0
+
+    def execute_script(self, script, *args):
+        self.calls += 1
+        return self.driver.execute_script(script, *args)
+
+    def execute_cdp_cmd(self, cmd, params):
+        self.calls += 1
+        return self.driver.execute_cdp_cmd(cmd, params)
+
+    def execute_async_script(self, script, *args):
+        self.calls += 1
+        return self.driver.execute_async_script(script, *args)
+
+    def set_script_timeout(self, timeout):
+        self.calls += 1
+        return self.driver.set_script_timeout(timeout)
+
+
+extraction_args = strat.AuthenticatedStrategy._AuthenticatedStrategy__extraction_args
+extract_job_details = strat.AuthenticatedStrategy._AuthenticatedStrategy__extract_job_details
+
+
+def read_one_call_per_field(driver) -> dict:
+    """The calls a job cost before the extraction was batched."""
+
+    title, company, img, place, date, _ = driver.execute_script(
+        '''
+            const job = document.querySelector(arguments[0]);
+            const titleElem = job.querySelector(arguments[1]);
+            const visibleTitle = titleElem.querySelector("strong") || titleElem;
+            const title = visibleTitle.innerText.split("\\n").map(e => e.trim()).filter(e => e.length)[0] || "";
+            const companyElem = job.querySelector(arguments[2]);
+            const img = job.querySelector("img") ? job.querySelector("img").getAttribute("src") : "";
+            const place = job.querySelector(arguments[3]) ? job.querySelector(arguments[3]).innerText : "";
+            const date = job.querySelector(arguments[4]) ? job.querySelector(arguments[4]).getAttribute('datetime') : "";
+            const isPromoted = Array.from(job.querySelectorAll('li')).find(e => e.innerText === 'Promoted') ? true : false;
+            return [title, companyElem ? companyElem.innerText : "", img, place, date, isPromoted];
+        ''',
+        get_job_item_selector(JOB_ID), Selectors.title, Selectors.company, Selectors.place, Selectors.date)
+
+    driver.execute_script(
+        '''
+            const detailsPanel = document.querySelector(arguments[1]);
+            const description = document.querySelector(arguments[2]);
+            return detailsPanel && detailsPanel.innerHTML.includes(arguments[0]) &&
+                description && description.innerText.length > 0;
+        ''',
+        JOB_ID, Selectors.detailsPanel, Selectors.description)
+
+    date_text = driver.execute_script(
+        r'''
+            const el = document.querySelector(arguments[0]);
+            if (!el) { return ""; }
+            const segments = el.innerText.split('·').map(e => e.replace(/[\n\r\t ]+/g, ' ').trim()).filter(e => e.length);
+            return segments.find(e => /\bago\b|just now/i.test(e)) || "";
+        ''',
+        Selectors.date_text)
+
+    company_link = driver.execute_script(
+        r'''
+            const el = document.querySelector(arguments[0]);
+            return el ? (el.getAttribute("href") || "").replace(/\/life\/?(?:\?.*)?$/, "") : "";
+        ''',
+        Selectors.company_link)
+
+    employee_count = driver.execute_script(
+        '''
+            const el = Array.from(document.querySelectorAll(arguments[0])).find(e => /employee/i.test(e.innerText));
+            return el ? el.innerText.split(' employees')[0].replace(/,/g, '').trim() : '';
+        ''',
+        Selectors.company_employee_count)
+
+    description, description_html = driver.execute_script(
+        '''
+            const el = document.querySelector(arguments[0]);
+            return el ? [el.innerText, el.outerHTML] : ["", ""];
+        ''',
+        Selectors.description)
+
+    insights = driver.execute_script(
+        r'''
+            return Array.from(document.querySelectorAll(arguments[0]))
+                .map(e => e.textContent.replace(/[\n\r\t ]+/g, ' ').trim());
+        ''',
+        Selectors.insights)
+
+    return {
+        'title': title, 'company': company, 'company_img_link': img, 'place': place, 'date': date,
+        'date_text': date_text, 'company_link': company_link, 'company_employee_count': employee_count,
+        'description': description, 'description_html': description_html, 'insights': insights,
+    }
+
+
+def read_in_one_call(driver) -> dict:
+    return extract_job(driver, extraction_args(JOB_ID, get_job_item_selector(JOB_ID), True))['fields']
+
+
+def read_through_the_details_wait(driver) -> dict:
+    return extract_job_details(driver, '', JOB_ID, None, TimingModel())['fields']
+
+
+def measure(label: str, driver: CountingDriver, read, iterations: int) -> tuple[dict, float]:
+    read(driver)  # Warm up: the first call of either side pays for script compilation
+
+    driver.calls = 0
+    durations = []
+
+    for _ in range(iterations):
+        started = perf_counter()
+        fields = read(driver)
+        durations.append((perf_counter() - started) * 1000)
+
+    calls = driver.calls / iterations
+    print(f'{label:<22} {calls:>5.1f} calls/job   median {median(durations):7.2f} ms   '
+          f'max {max(durations):7.2f} ms')
+
+    return fields, median(durations)
+
+
+def main() -> int:
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+
+    server = HTTPServer(('127.0.0.1', PORT), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    driver = build_driver(headless=True, timeout=20)
+
+    try:
+        # As the strategy does once the session is established: the page holds the function from the start
+        register_extraction(driver)
+        driver.get(f'http://127.0.0.1:{PORT}/jobs')
+        sleep(1)
+
+        counting = CountingDriver(driver)
+
+        print(f'\n--- {iterations} reads of the same job\n')
+        before, before_ms = measure('one call per field', counting, read_one_call_per_field, iterations)
+        after, after_ms = measure('one batched call', counting, read_in_one_call, iterations)
+        waited, _ = measure('the details wait', counting, read_through_the_details_wait, iterations)
+
+        print(f'\n{round(before_ms / after_ms, 1)}x faster per job\n')
+
+        timings = extract_job(driver, extraction_args(JOB_ID, get_job_item_selector(JOB_ID), True))['timings']
+        print('Per-field breakdown of one batched call (ms):')
+
+        for name, ms in sorted(timings.items(), key=lambda item: -item[1]):
+            print(f'  {name:<24} {ms:.3f}')
+
+        mismatched = [name for name in before if not before[name] == after[name] == waited[name]]
+        print('\nFields every side agrees on:', 'all' if not mismatched else f'all but {mismatched}')
+
+        return 1 if mismatched else 0
+    finally:
+        driver.quit()
+        server.shutdown()
+
+
+if __name__ == '__main__':
+    sys.exit(main())
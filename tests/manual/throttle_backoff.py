@@ -16,6 +16,7 @@ own, which is the only place a throttled job detail is visible at all.
     PYTHONPATH=. python -u tests/manual/throttle_backoff.py
 
 The backoff delays are cut down for the run, so it takes seconds rather than a minute.
+How fast each pacing configuration is against the same server is measured by tests/benchmark.
 """
 import sys
 import threading
@@ -0,0 +1,139 @@
+"""Compare the in-page waits with the polling loops they replaced, on a page that renders late.
+
+Not collected by pytest (the filename does not match `test_*.py`), and it never touches the
+live site: a local server hands out a results list whose job details panel is filled in a
+chosen number of milliseconds after the card is clicked, the way LinkedIn fills it after
+fetching the job.
+
+For each render delay both waits are run against the same page. What is reported is how
+late each noticed the render - the polling loop by up to one tick, the observer by the
+coalescing delay - and how many WebDriver calls each spent getting there.
+
+    PYTHONPATH=. python -u tests/manual/wait_benchmark.py [rounds]
+"""
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from statistics import median
+from time import perf_counter, sleep
+
+from linkedin_jobs_scraper.strategies.authenticated_strategy import Selectors
+from linkedin_jobs_scraper.utils.chrome_driver import build_driver
+from linkedin_jobs_scraper.utils.waits import wait_for
+
+PORT = 8734
+JOB_ID = '4055815184'
+
+# Render delays to measure at, in milliseconds: a warm panel, a typical one and a slow one
+DELAYS = (50, 400, 1500)
+
+PAGE = f'''<html><body>
+<div class="jobs-search__job-details--container"></div>
+<script>
+  window.renderDetails = delay => {{
+    const panel = document.querySelector('.jobs-search__job-details--container');
+    panel.innerHTML = '';
+    window.renderedAt = null;
+    setTimeout(() => {{
+      panel.innerHTML = '<div data-job-id="{JOB_ID}"><div class="jobs-description">About the job</div></div>';
+      window.renderedAt = performance.now();
+    }}, delay);
+    return performance.now();
+  }};
+</script>
+</body></html>'''.encode()
+
+# The condition both waits ask, written for each of them
+DETAILS_LOADED = '''
+    const detailsPanel = document.querySelector(%s);
+    const description = document.querySelector(%s);
+    return Boolean(detailsPanel && detailsPanel.innerHTML.includes(%s) &&
+        description && description.innerText.length > 0);
+'''
+
+
+class Handler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/html')
+        self.send_header('Content-Length', str(len(PAGE)))
+        self.end_headers()
+        self.wfile.write(PAGE)
+
+    def log_message(self, *args):
+        pass
+
+
+def poll(driver, timeout=5) -> int:
+    """The loop every wait used to be: one script per 50 ms tick. Answers the calls it made."""
+
+    elapsed = 0
+    sleep_time = 0.05
+    calls = 0
+
+    while elapsed < timeout:
+        calls += 1
+
+        if driver.execute_script(DETAILS_LOADED % ('arguments[1]', 'arguments[2]', 'arguments[0]'),
+                                 JOB_ID, Selectors.detailsPanel, Selectors.description):
+            return calls
+
+        sleep(sleep_time)
+        elapsed += sleep_time
+
+    return calls
+
+
+def observe(driver, timeout=5) -> int:
+    """The in-page wait. Answers the calls it made."""
+
+    return wait_for(driver, DETAILS_LOADED % ('args[1]', 'args[2]', 'args[0]'),
+                    JOB_ID, Selectors.detailsPanel, Selectors.description, timeout=timeout).calls
+
+
+def measure(driver, wait, delay: int) -> tuple[float, int]:
+    """How many ms after the render the wait returned, and the calls it took."""
+
+    started = perf_counter()
+    requested_at = driver.execute_script('return window.renderDetails(arguments[0])', delay)
+    calls = wait(driver)
+    returned = perf_counter()
+
+    rendered_at = driver.execute_script('return window.renderedAt')
+
+    # The page clock and ours only share the moment the render was requested
+    lateness = (returned - started) * 1000 - (rendered_at - requested_at)
+
+    return lateness, calls
+
+
+def main() -> int:
+    rounds = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+
+    server = HTTPServer(('127.0.0.1', PORT), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    driver = build_driver(headless=True, timeout=20)
+
+    try:
+        driver.get(f'http://127.0.0.1:{PORT}/jobs')
+        sleep(1)
+
+        print(f'\n{"render after":>12}  {"wait":<8} {"late by (median)":>18} {"calls/job":>10}')
+
+        for delay in DELAYS:
+            for label, wait in (('polling', poll), ('observer', observe)):
+                samples = [measure(driver, wait, delay) for _ in range(rounds)]
+                late = median(s[0] for s in samples)
+                calls = sum(s[1] for s in samples) / rounds
+
+                print(f'{delay:>10}ms  {label:<8} {late:>16.1f}ms {calls:>10.1f}')
+
+        return 0
+    finally:
+        driver.quit()
+        server.shutdown()
+
+
+if __name__ == '__main__':
+    sys.exit(main())
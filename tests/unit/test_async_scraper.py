@@ -0,0 +1,177 @@
+"""Offline tests for AsyncLinkedinScraper and for cancelling a scraper, driven through a fake strategy."""
+from __future__ import annotations
+
+import asyncio
+import threading
+from time import sleep
+
+import pytest
+
+from linkedin_jobs_scraper import AsyncLinkedinScraper, LinkedinScraper, linkedin_scraper as scraper_module
+from linkedin_jobs_scraper.events import Events, EventBegin, EventData, EventMetrics
+from linkedin_jobs_scraper.exceptions import CallbackException
+from linkedin_jobs_scraper.query import Query, QueryOptions
+from linkedin_jobs_scraper.strategies import Strategy
+
+
+class FakeDriver:
+    def __init__(self) -> None:
+        self.quit_count = 0
+
+    def execute_script(self, *args):
+        return 'www.linkedin.com'
+
+    def get_cookie(self, name):
+        return None
+
+    def quit(self) -> None:
+        self.quit_count += 1
+
+
+class CountingStrategy(Strategy):
+    """Emits BEGIN, then one DATA per job up to the limit (forever for 0), then METRICS."""
+
+    def __init__(self, scraper) -> None:
+        super().__init__(scraper)
+        self.emitted = 0
+
+    def run(self, driver, search_url, query, location, page_offset) -> None:
+        metrics = EventMetrics()
+        self.scraper.emit(Events.BEGIN, EventBegin(job_total=query.options.limit))
+
+        while query.options.limit == 0 or metrics.processed < query.options.limit:
+            self.scraper.raise_if_cancelled()
+            sleep(0.001)
+
+            metrics.processed += 1
+            self.emitted += 1
+            self.scraper.emit(Events.DATA, EventData(query=query.query, job_id=str(metrics.processed)))
+
+        self.scraper.emit(Events.METRICS, metrics)
+
+
+@pytest.fixture
+def built_drivers(monkeypatch) -> list[FakeDriver]:
+    drivers: list[FakeDriver] = []
+
+    def fake_build_driver(**kwargs) -> FakeDriver:
+        drivers.append(FakeDriver())
+        return drivers[-1]
+
+    monkeypatch.setattr(scraper_module, 'build_driver', fake_build_driver)
+    return drivers
+
+
+def _scraper(cls=AsyncLinkedinScraper):
+    scraper = cls(max_workers=1)
+    strategy = CountingStrategy(scraper)
+    scraper._strategy = strategy
+    return scraper, strategy
+
+
+def _query(limit: int) -> Query:
+    return Query(query='engineer', options=QueryOptions(locations=['Europe'], limit=limit))
+
+
+def test_stream_yields_begin_data_and_metrics_in_order(built_drivers) -> None:
+    scraper, _ = _scraper()
+
+    async def consume() -> list:
+        return [event async for event in scraper.stream(_query(3))]
+
+    events = asyncio.run(consume())
+
+    assert isinstance(events[0], EventBegin)
+    assert [e.job_id for e in events[1:4]] == ['1', '2', '3']
+    assert isinstance(events[4], EventMetrics) and events[4].processed == 3
+    assert len(events) == 5
+
+
+def test_stream_holds_back_workers_when_the_buffer_is_full(built_drivers) -> None:
+    scraper, strategy = _scraper()
+    ahead: list[int] = []
+
+    async def consume() -> None:
+        consumed = 0
+
+        async for event in scraper.stream(_query(20), max_buffer=2):
+            if isinstance(event, EventData):
+                consumed += 1
+                await asyncio.sleep(0.01)
+                ahead.append(strategy.emitted - consumed)
+
+    asyncio.run(consume())
+
+    # The buffer, and the one event a worker holds while it waits for room
+    assert max(ahead) <= 3
+
+
+def test_leaving_a_stream_cancels_the_run(built_drivers) -> None:
+    scraper, strategy = _scraper()
+    ends: list[None] = []
+    scraper.on(Events.END, lambda: ends.append(None))
+
+    async def consume() -> None:
+        stream = scraper.stream(_query(0), max_buffer=1)
+
+        async for event in stream:
+            if isinstance(event, EventData) and event.job_id == '5':
+                break
+
+        await stream.aclose()
+
+    asyncio.run(consume())
+
+    assert strategy.emitted < 10
+    assert ends == []
+    assert all(driver.quit_count >= 1 for driver in built_drivers)
+    assert not scraper._emitter[Events.DATA]
+
+
+def test_a_failing_listener_is_raised_by_the_stream(built_drivers) -> None:
+    scraper, _ = _scraper()
+
+    def fail(data) -> None:
+        raise RuntimeError('sink is down')
+
+    scraper.on(Events.DATA, fail)
+
+    async def consume() -> None:
+        async for _ in scraper.stream(_query(3)):
+            pass
+
+    with pytest.raises(CallbackException):
+        asyncio.run(consume())
+
+
+def test_cancelling_run_async_cancels_the_run(built_drivers) -> None:
+    scraper, strategy = _scraper()
+
+    async def cancel_soon() -> None:
+        task = asyncio.ensure_future(scraper.run_async(_query(0)))
+        await asyncio.sleep(0.05)
+        task.cancel()
+
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    asyncio.run(cancel_soon())
+    emitted = strategy.emitted
+    sleep(0.05)
+
+    assert strategy.emitted == emitted
+    assert all(driver.quit_count >= 1 for driver in built_drivers)
+
+
+def test_cancel_returns_a_blocking_run_and_leaves_the_scraper_usable(built_drivers) -> None:
+    scraper, strategy = _scraper(LinkedinScraper)
+    timer = threading.Timer(0.05, scraper.cancel)
+    timer.start()
+
+    scraper.run(_query(0))
+
+    data: list[EventData] = []
+    scraper.on(Events.DATA, data.append)
+    scraper.run(_query(2))
+
+    assert len(data) == 2
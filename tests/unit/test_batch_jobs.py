@@ -0,0 +1,115 @@
+"""Offline tests for scrape_jobs, which shares a batch of job ids between long-lived browsers."""
+from __future__ import annotations
+
+import threading
+from time import sleep
+
+import pytest
+
+from linkedin_jobs_scraper import LinkedinScraper, linkedin_scraper as scraper_module
+from linkedin_jobs_scraper.events import Events, EventData, EventMetrics, EventNotFound
+from linkedin_jobs_scraper.exceptions import CallbackException
+from linkedin_jobs_scraper.strategies import Strategy
+
+
+class FakeDriver:
+    def __init__(self) -> None:
+        self.quit_count = 0
+
+    def execute_script(self, *args):
+        return 'www.linkedin.com'
+
+    def get_cookie(self, name):
+        return None
+
+    def quit(self) -> None:
+        self.quit_count += 1
+
+
+class PanelStrategy(Strategy):
+    """Finds every even id and none of the odd ones."""
+
+    def __init__(self, scraper) -> None:
+        super().__init__(scraper)
+        self.calls: list[tuple[str, FakeDriver]] = []
+        self._lock = threading.Lock()
+
+    def scrape_job(self, driver, job_id, apply_link=False, metrics=None) -> None:
+        sleep(0.01)
+
+        with self._lock:
+            self.calls.append((job_id, driver))
+
+        if int(job_id) % 2:
+            metrics.missed += 1
+            self.scraper.emit(Events.NOT_FOUND, EventNotFound(job_id=job_id))
+        else:
+            self.scraper.emit(Events.DATA, EventData(job_id=job_id))
+            metrics.processed += 1
+
+
+@pytest.fixture
+def built_drivers(monkeypatch) -> list[FakeDriver]:
+    drivers: list[FakeDriver] = []
+
+    def fake_build_driver(**kwargs) -> FakeDriver:
+        drivers.append(FakeDriver())
+        return drivers[-1]
+
+    monkeypatch.setattr(scraper_module, 'build_driver', fake_build_driver)
+    return drivers
+
+
+def _scraper() -> tuple[LinkedinScraper, PanelStrategy, dict]:
+    scraper = LinkedinScraper(max_workers=2)
+    strategy = PanelStrategy(scraper)
+    scraper._strategy = strategy
+
+    events = {'data': [], 'not_found': [], 'metrics': [], 'error': []}
+    scraper.on(Events.DATA, lambda data: events['data'].append(data.job_id))
+    scraper.on(Events.NOT_FOUND, lambda data: events['not_found'].append(data.job_id))
+    scraper.on(Events.METRICS, lambda metrics: events['metrics'].append(metrics))
+    scraper.on(Events.ERROR, lambda e: events['error'].append(e))
+
+    return scraper, strategy, events
+
+
+def test_scrape_jobs_emits_every_id_once_on_one_browser_per_worker(built_drivers) -> None:
+    scraper, strategy, events = _scraper()
+
+    ids = (str(i) for i in range(1, 21))
+    scraper.scrape_jobs(ids)
+
+    assert sorted(events['data'] + events['not_found'], key=int) == [str(i) for i in range(1, 21)]
+    assert len(built_drivers) <= 2
+    assert all(driver.quit_count == 1 for driver in built_drivers)
+
+
+def test_scrape_jobs_reports_aggregate_metrics(built_drivers) -> None:
+    scraper, _, events = _scraper()
+
+    scraper.scrape_jobs(['2', 'https://www.linkedin.com/jobs/view/3/', '4', 'not-a-job'])
+
+    [metrics] = events['metrics']
+    assert isinstance(metrics, EventMetrics)
+    assert (metrics.processed, metrics.missed, metrics.failed) == (2, 1, 1)
+    assert len(events['error']) == 1
+
+
+def test_scrape_jobs_stops_on_a_failing_callback(built_drivers) -> None:
+    scraper, strategy, _ = _scraper()
+
+    def fail(data) -> None:
+        raise RuntimeError('boom')
+
+    scraper.on(Events.DATA, fail)
+
+    with pytest.raises(CallbackException):
+        scraper.scrape_jobs(str(i) for i in range(2, 200, 2))
+
+    assert len(strategy.calls) < 10
+
+
+def test_scrape_jobs_rejects_a_single_string() -> None:
+    with pytest.raises(ValueError):
+        LinkedinScraper().scrape_jobs('4055815184')
@@ -0,0 +1,75 @@
+"""Offline tests for the requests the browser is told not to make."""
+from __future__ import annotations
+
+import pytest
+
+from linkedin_jobs_scraper import LinkedinScraper
+from linkedin_jobs_scraper.cli.args import parse_args
+from linkedin_jobs_scraper.cli.mapping import build_scraper_kwargs
+from linkedin_jobs_scraper.utils.blocking import BLOCKLISTS, DEFAULT_BLOCKED_RESOURCES, block_urls, resolve_blocklist
+
+
+class FakeCdpDriver:
+    def __init__(self, fail: bool = False) -> None:
+        self.commands = []
+        self.fail = fail
+
+    def execute_cdp_cmd(self, cmd: str, params: dict) -> dict:
+        if self.fail:
+            raise RuntimeError('no CDP')
+
+        self.commands.append((cmd, params))
+        return {}
+
+
+def test_nothing_is_blocked_unless_asked() -> None:
+    driver = FakeCdpDriver()
+
+    assert resolve_blocklist(None) is None
+    assert not block_urls(driver, None)
+    assert driver.commands == []
+
+
+def test_an_empty_list_blocks_every_category_but_images() -> None:
+    patterns = resolve_blocklist([])
+
+    assert 'images' not in DEFAULT_BLOCKED_RESOURCES
+    assert all(pattern in patterns for name in DEFAULT_BLOCKED_RESOURCES for pattern in BLOCKLISTS[name])
+    assert '*://media.licdn.com/dms/image/*' not in patterns
+
+
+def test_categories_and_patterns_mix_without_repeating() -> None:
+    patterns = resolve_blocklist(['fonts', '*://ads.example.com/*', 'fonts'])
+
+    assert patterns == list(BLOCKLISTS['fonts']) + ['*://ads.example.com/*']
+
+
+def test_an_unknown_category_is_refused() -> None:
+    with pytest.raises(ValueError):
+        resolve_blocklist(['videos'])
+
+    with pytest.raises(ValueError):
+        LinkedinScraper(blocked_resources=['videos'])
+
+    with pytest.raises(ValueError):
+        LinkedinScraper(blocked_resources='images')
+
+    with pytest.raises(SystemExit):
+        parse_args(['jobs', 'engineer', '--block-resources', 'videos'])
+
+
+def test_the_window_is_told_which_urls_to_refuse() -> None:
+    driver = FakeCdpDriver()
+
+    assert block_urls(driver, ['*.woff*'])
+    assert driver.commands == [('Network.enable', {}), ('Network.setBlockedURLs', {'urls': ['*.woff*']})]
+
+
+def test_a_browser_that_cannot_block_loads_everything() -> None:
+    assert not block_urls(FakeCdpDriver(fail=True), ['*.woff*'])
+
+
+def test_blocking_is_mapped_from_the_command_line() -> None:
+    assert build_scraper_kwargs(parse_args(['jobs', 'engineer', '--block-resources']))['blocked_resources'] == []
+    assert build_scraper_kwargs(parse_args(['jobs', 'engineer', '--block-resources', 'images', 'fonts'])) \
+        ['blocked_resources'] == ['images', 'fonts']
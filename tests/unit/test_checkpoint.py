@@ -0,0 +1,129 @@
+"""Offline tests for checkpoints: a crawl that dies picks up where it stopped on a run with resume."""
+from __future__ import annotations
+
+import json
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+
+from linkedin_jobs_scraper import LinkedinScraper, linkedin_scraper as scraper_module
+from linkedin_jobs_scraper.events import Events, EventMetrics
+from linkedin_jobs_scraper.query import Query, QueryOptions
+from linkedin_jobs_scraper.strategies import VoyagerStrategy, voyager_strategy
+from linkedin_jobs_scraper.utils.checkpoint import Checkpoint, SqliteCheckpointStore
+
+PAGES = 3
+
+
+class FakeApiDriver:
+    """Answers the API requests of a search holding PAGES pages of 25 jobs, failing the pages it is told to."""
+
+    def __init__(self) -> None:
+        self.failing_pages: set[int] = set()
+        self.requested_pages: list[int] = []
+
+    def execute_script(self, *args):
+        return 'www.linkedin.com'
+
+    def get_cookie(self, name):
+        return None
+
+    def quit(self) -> None:
+        pass
+
+    def execute_async_script(self, script, url, accept):
+        if 'jobPostings/' in url:
+            job_id = url.split('jobPostings/')[1].split('?')[0]
+            return {'status': 200, 'body': json.dumps({'title': f'Job {job_id}'})}
+
+        page = int(parse_qs(urlparse(url).query)['start'][0]) // 25
+        self.requested_pages.append(page)
+
+        if page in self.failing_pages:
+            return {'status': 500, 'body': ''}
+
+        ids = [str(1_000_000 + page * 25 + i) for i in range(25)]
+
+        return {'status': 200, 'body': json.dumps({
+            'data': {'paging': {'total': PAGES * 25}, 'elements': []},
+            'included': [{'$type': 'com.linkedin.voyager.dash.jobs.JobPostingCard',
+                          'entityUrn': f'urn:li:fsd_jobPostingCard:({job_id},JOBS_SEARCH)',
+                          'jobPostingUrn': f'urn:li:fsd_jobPosting:{job_id}'} for job_id in ids],
+        })}
+
+
+@pytest.fixture
+def driver(monkeypatch) -> FakeApiDriver:
+    driver = FakeApiDriver()
+    monkeypatch.setattr(scraper_module, 'build_driver', lambda **kwargs: driver)
+    monkeypatch.setattr(VoyagerStrategy, 'open_session', lambda self, d, tag: True)
+    monkeypatch.setattr(voyager_strategy, 'sleep', lambda seconds: None)
+    return driver
+
+
+def _scrape(path: str, resume: bool = False) -> list[str]:
+    delivered: list[str] = []
+
+    with LinkedinScraper(max_workers=1, api_mode=True, checkpoint_store=path) as scraper:
+        scraper.on(Events.DATA, lambda data: delivered.append(data.job_id))
+        scraper.run(Query(query='engineer', options=QueryOptions(locations=['Europe'], limit=0)), resume=resume)
+
+    return delivered
+
+
+def test_a_crawl_cut_short_resumes_at_the_page_it_stopped_on(driver, tmp_path) -> None:
+    path = str(tmp_path / 'checkpoints.db')
+
+    driver.failing_pages = {1}
+    first = _scrape(path)
+
+    driver.failing_pages = set()
+    driver.requested_pages = []
+    second = _scrape(path, resume=True)
+
+    assert len(first) == 25
+    assert driver.requested_pages == [1, 2]
+    assert sorted(first + second) == sorted(str(1_000_000 + i) for i in range(PAGES * 25))
+
+
+def test_a_finished_crawl_leaves_nothing_to_resume(driver, tmp_path) -> None:
+    path = str(tmp_path / 'checkpoints.db')
+
+    assert len(_scrape(path)) == PAGES * 25
+    assert len(_scrape(path, resume=True)) == PAGES * 25
+
+
+def test_without_resume_a_crawl_starts_over(driver, tmp_path) -> None:
+    path = str(tmp_path / 'checkpoints.db')
+
+    driver.failing_pages = {2}
+    _scrape(path)
+
+    driver.failing_pages = set()
+    driver.requested_pages = []
+    _scrape(path)
+
+    assert driver.requested_pages == [0, 1, 2]
+
+
+def test_the_metrics_carry_over(tmp_path) -> None:
+    store = SqliteCheckpointStore(str(tmp_path / 'checkpoints.db'))
+    metrics = EventMetrics()
+    metrics.processed, metrics.failed = 30, 2
+
+    Checkpoint(store, 'search', resume=False).save(1, {'1', '2'}, metrics)
+
+    restored_metrics = EventMetrics()
+    restored = Checkpoint(store, 'search', resume=True).restore(restored_metrics)
+
+    assert restored == {'page': 1, 'processed_ids': {'1', '2'}}
+    assert (restored_metrics.processed, restored_metrics.failed) == (30, 2)
+    assert Checkpoint(store, 'search', resume=False).restore(EventMetrics()) is None
+    store.close()
+
+
+def test_resume_requires_a_checkpoint_store(driver) -> None:
+    scraper = LinkedinScraper(max_workers=1)
+
+    with pytest.raises(ValueError):
+        scraper.run(Query(query='engineer'), resume=True)
@@ -166,6 +166,7 @@ def test_build_scraper_kwargs_flags_and_passthrough() -> None:
         '--chrome-binary-location', '/bin/chrome',
         '--chrome-user-data-dir', '/tmp/profile',
         '--interactive-login',
+        '--api-mode',
     ]))
 
     assert kwargs['headless'] is False
@@ -176,6 +177,7 @@ def test_build_scraper_kwargs_flags_and_passthrough() -> None:
     assert kwargs['chrome_binary_location'] == '/bin/chrome'
     assert kwargs['chrome_user_data_dir'] == '/tmp/profile'
     assert kwargs['interactive_login'] is True
+    assert kwargs['api_mode'] is True
     assert 'max_workers' not in kwargs
     assert 'chrome_options' not in kwargs
 
@@ -0,0 +1,289 @@
+"""Offline tests for event dispatch: the dispatcher thread, its overflow policies and batched listeners."""
+from __future__ import annotations
+
+import threading
+from time import sleep, monotonic
+
+import pytest
+
+from linkedin_jobs_scraper import LinkedinScraper, linkedin_scraper as scraper_module
+from linkedin_jobs_scraper.events import Events, EventData, EventMetrics, OverflowPolicy, DispatchMetrics
+from linkedin_jobs_scraper.events.dispatch import Dispatcher, EventBatch
+from linkedin_jobs_scraper.exceptions import CallbackException
+from linkedin_jobs_scraper.query import Query, QueryOptions
+from linkedin_jobs_scraper.strategies import Strategy
+
+
+class FakeDriver:
+    def execute_script(self, *args):
+        return 'www.linkedin.com'
+
+    def get_cookie(self, name):
+        return None
+
+    def quit(self) -> None:
+        pass
+
+
+class CountingStrategy(Strategy):
+    """Emits one DATA per job up to the limit, then METRICS."""
+
+    def run(self, driver, search_url, query, location, page_offset) -> None:
+        metrics = EventMetrics()
+
+        while metrics.processed < query.options.limit:
+            metrics.processed += 1
+            self.scraper.emit(Events.DATA, EventData(job_id=str(metrics.processed)))
+
+        self.scraper.emit(Events.METRICS, metrics)
+
+
+@pytest.fixture
+def fake_drivers(monkeypatch) -> None:
+    monkeypatch.setattr(scraper_module, 'build_driver', lambda **kwargs: FakeDriver())
+
+
+def _scraper(**kwargs) -> LinkedinScraper:
+    scraper = LinkedinScraper(max_workers=1, **kwargs)
+    scraper._strategy = CountingStrategy(scraper)
+    return scraper
+
+
+def _query(limit: int) -> Query:
+    return Query(query='engineer', options=QueryOptions(locations=['Europe'], limit=limit))
+
+
+class Recorder:
+    """Delivers to a list, as slowly as it is told to."""
+
+    def __init__(self, delay: float = 0) -> None:
+        self.delivered: list = []
+        self.delay = delay
+        self.release = threading.Event()
+        self.release.set()
+
+    def deliver(self, event, args) -> None:
+        self.release.wait()
+        sleep(self.delay)
+        self.delivered.append(args[0])
+
+
+def _dispatcher(recorder: Recorder, **kwargs) -> Dispatcher:
+    return Dispatcher(deliver=recorder.deliver, flush_batches=lambda due_only: None,
+                      next_deadline=lambda: None, metrics=DispatchMetrics(), **kwargs)
+
+
+def test_events_are_delivered_in_order() -> None:
+    recorder = Recorder()
+    dispatcher = _dispatcher(recorder)
+
+    for i in range(50):
+        dispatcher.put(Events.DATA, (i,))
+
+    dispatcher.flush()
+
+    assert recorder.delivered == list(range(50))
+    assert dispatcher.metrics.dispatched == 50
+    dispatcher.close()
+
+
+def test_block_makes_the_emitter_wait_for_room() -> None:
+    recorder = Recorder(delay=0.01)
+    dispatcher = _dispatcher(recorder, max_size=2, overflow=OverflowPolicy.BLOCK)
+
+    started = monotonic()
+
+    for i in range(10):
+        dispatcher.put(Events.DATA, (i,))
+
+    assert monotonic() - started >= 0.05
+    assert dispatcher.metrics.max_depth <= 2
+    dispatcher.close()
+    assert recorder.delivered == list(range(10))
+
+
+def test_drop_discards_data_but_keeps_every_other_event() -> None:
+    recorder = Recorder()
+    recorder.release.clear()
+    dispatcher = _dispatcher(recorder, max_size=2, overflow=OverflowPolicy.DROP)
+
+    for i in range(5):
+        dispatcher.put(Events.DATA, (i,), droppable=True)
+
+    threading.Timer(0.05, recorder.release.set).start()
+    dispatcher.put(Events.END, ('end',))
+    dispatcher.close()
+
+    assert dispatcher.metrics.dropped >= 2
+    assert recorder.delivered[-1] == 'end'
+    assert len(recorder.delivered) + dispatcher.metrics.dropped == 6
+
+
+def test_a_dropped_job_is_not_recorded_as_seen(fake_drivers, tmp_path) -> None:
+    scraper = _scraper(dispatch_events=True, dispatch_queue_size=1, dispatch_overflow=OverflowPolicy.DROP,
+                       seen_index=str(tmp_path / 'seen.db'))
+    release = threading.Event()
+    delivered: list[str] = []
+
+    def slow(data: EventData) -> None:
+        release.wait()
+        delivered.append(data.job_id)
+
+    scraper.on(Events.DATA, slow)
+    threading.Timer(0.2, release.set).start()
+
+    scraper.run(_query(10))
+
+    assert scraper.dispatch_metrics.dropped > 0
+    assert sorted(job_id for job_id in map(str, range(1, 11)) if job_id in scraper.seen_index) == sorted(delivered)
+    scraper.close()
+
+
+def test_spill_keeps_every_event_in_order() -> None:
+    recorder = Recorder()
+    recorder.release.clear()
+    dispatcher = _dispatcher(recorder, max_size=2, overflow=OverflowPolicy.SPILL)
+
+    for i in range(20):
+        dispatcher.put(Events.DATA, (EventData(job_id=str(i)),))
+
+    assert dispatcher.metrics.spilled >= 17
+
+    recorder.release.set()
+    dispatcher.close()
+
+    assert [data.job_id for data in recorder.delivered] == [str(i) for i in range(20)]
+
+
+def test_a_batch_is_due_by_size_or_by_age() -> None:
+    batch = EventBatch(max_size=3, max_latency=0.05)
+
+    assert batch.add(1) is None
+    assert batch.add(2) is None
+    assert batch.add(3) == [1, 2, 3]
+
+    batch.add(4)
+    assert batch.take(due_only=True) is None
+    sleep(0.06)
+    assert batch.take(due_only=True) == [4]
+
+
+def test_a_slow_listener_no_longer_slows_the_workers(fake_drivers) -> None:
+    scraper = _scraper(dispatch_events=True, dispatch_queue_size=100)
+    delivered: list[EventData] = []
+    scraped_in: list[float] = []
+
+    class TimedStrategy(CountingStrategy):
+        def run(self, *args) -> None:
+            started = monotonic()
+            super().run(*args)
+            scraped_in.append(monotonic() - started)
+
+    def slow(data: EventData) -> None:
+        sleep(0.005)
+        delivered.append(data)
+
+    scraper._strategy = TimedStrategy(scraper)
+    scraper.on(Events.DATA, slow)
+
+    scraper.run(_query(20))
+
+    assert scraped_in[0] < 0.05
+    # Every job was delivered by the time run returned, the slow listener included
+    assert len(delivered) == 20
+    assert scraper.dispatch_metrics.callback_time >= 0.1
+    scraper.close()
+
+
+def test_a_failing_listener_is_counted_rather_than_raised(fake_drivers) -> None:
+    scraper = _scraper(dispatch_events=True)
+    delivered: list[EventData] = []
+
+    def fail(data: EventData) -> None:
+        raise RuntimeError('sink is down')
+
+    scraper.on(Events.DATA, fail)
+    scraper.on(Events.DATA, delivered.append)
+
+    scraper.run(_query(3))
+
+    assert len(delivered) == 3
+    assert scraper.dispatch_metrics.callback_errors == 3
+    scraper.close()
+
+
+def test_a_failing_listener_still_raises_inline(fake_drivers) -> None:
+    scraper = _scraper()
+
+    def fail(data: EventData) -> None:
+        raise RuntimeError('sink is down')
+
+    scraper.on(Events.DATA, fail)
+
+    with pytest.raises(CallbackException):
+        scraper.run(_query(3))
+
+
+def test_dispatched_metrics_are_the_count_at_the_time(fake_drivers) -> None:
+    scraper = _scraper(dispatch_events=True)
+    processed: list[int] = []
+
+    class PagedStrategy(Strategy):
+        def run(self, driver, search_url, query, location, page_offset) -> None:
+            metrics = EventMetrics()
+
+            for _ in range(3):
+                metrics.processed += 1
+                self.scraper.emit(Events.METRICS, metrics)
+
+    scraper._strategy = PagedStrategy(scraper)
+    scraper.on(Events.METRICS, lambda metrics: processed.append(metrics.processed))
+
+    scraper.run(_query(1))
+
+    assert processed == [1, 2, 3]
+    scraper.close()
+
+
+@pytest.mark.parametrize('dispatch_events', [False, True])
+def test_batches_are_delivered_by_size_and_at_the_end_of_the_call(fake_drivers, dispatch_events: bool) -> None:
+    scraper = _scraper(dispatch_events=dispatch_events)
+    batches: list[list[str]] = []
+
+    scraper.on_batch(Events.DATA, lambda items: batches.append([data.job_id for data in items]),
+                     max_size=4, max_latency=60)
+
+    scraper.run(_query(10))
+
+    assert batches == [['1', '2', '3', '4'], ['5', '6', '7', '8'], ['9', '10']]
+    scraper.close()
+
+
+def test_the_dispatcher_delivers_a_batch_on_time(fake_drivers) -> None:
+    scraper = _scraper(dispatch_events=True)
+    batches: list[list[EventData]] = []
+    scraper.on_batch(Events.DATA, batches.append, max_size=100, max_latency=0.05)
+
+    scraper.emit(Events.DATA, EventData(job_id='1'))
+    sleep(0.2)
+
+    assert len(batches) == 1
+    scraper.close()
+
+
+def test_a_once_listener_fires_once(fake_drivers) -> None:
+    scraper = _scraper()
+    calls: list[EventData] = []
+    scraper.once(Events.DATA, calls.append)
+
+    scraper.run(_query(3))
+
+    assert len(calls) == 1
+    assert scraper._emitter[Events.DATA] == []
+
+
+def test_on_batch_rejects_an_event_without_payload(fake_drivers) -> None:
+    scraper = _scraper()
+
+    with pytest.raises(ValueError):
+        scraper.on_batch(Events.END, lambda items: None)
@@ -0,0 +1,166 @@
+"""Offline tests for the pool of browsers a scraper keeps between units of work."""
+from __future__ import annotations
+
+import pytest
+
+from linkedin_jobs_scraper import LinkedinScraper, linkedin_scraper as scraper_module
+from linkedin_jobs_scraper.events import Events, EventData
+from linkedin_jobs_scraper.query import Query, QueryOptions
+from linkedin_jobs_scraper.strategies import Strategy
+from linkedin_jobs_scraper.utils.driver_pool import DriverPool
+
+
+class FakeDriver:
+    def __init__(self) -> None:
+        self.quit_count = 0
+
+    def execute_script(self, *args):
+        return 'www.linkedin.com'
+
+    def get_cookie(self, name):
+        return None
+
+    def quit(self) -> None:
+        self.quit_count += 1
+
+
+def _pool(healthy=lambda driver: True, **kwargs) -> tuple[DriverPool, list[FakeDriver]]:
+    built: list[FakeDriver] = []
+
+    def factory() -> FakeDriver:
+        built.append(FakeDriver())
+        return built[-1]
+
+    return DriverPool(factory, healthy, **kwargs), built
+
+
+def test_checkin_keeps_a_healthy_driver_for_the_next_checkout() -> None:
+    pool, built = _pool()
+
+    first = pool.checkout()
+    pool.checkin(first)
+    second = pool.checkout()
+
+    assert second is first
+    assert len(built) == 1
+
+
+def test_checkout_replaces_an_unhealthy_driver() -> None:
+    pool, built = _pool(healthy=lambda driver: False)
+
+    pool.checkin(pool.checkout())
+    pool.checkout()
+
+    assert len(built) == 2
+    assert built[0].quit_count == 1
+
+
+def test_driver_is_retired_after_max_jobs() -> None:
+    pool, built = _pool(max_jobs=2)
+
+    pooled = pool.checkout()
+    pooled.jobs = 2
+    pool.checkin(pooled)
+
+    assert pool.idle_count == 0
+    assert built[0].quit_count == 1
+
+
+def test_driver_is_retired_after_max_age() -> None:
+    pool, built = _pool(max_age=0.000001)
+
+    pool.checkin(pool.checkout())
+
+    assert pool.idle_count == 0
+    assert built[0].quit_count == 1
+
+
+def test_close_quits_idle_drivers_and_refuses_checkout() -> None:
+    pool, built = _pool()
+    pooled = pool.checkout()
+    pool.checkin(pool.checkout())
+
+    pool.close()
+    pool.checkin(pooled)
+
+    assert all(driver.quit_count == 1 for driver in built)
+
+    with pytest.raises(RuntimeError):
+        pool.checkout()
+
+
+class OneJobStrategy(Strategy):
+    def __init__(self, scraper) -> None:
+        super().__init__(scraper)
+        self.drivers: list[FakeDriver] = []
+
+    def run(self, driver, search_url, query, location, page_offset) -> None:
+        self.drivers.append(driver)
+        self.scraper.emit(Events.DATA, EventData(job_id='1'))
+
+
+@pytest.fixture
+def built_drivers(monkeypatch) -> list[FakeDriver]:
+    drivers: list[FakeDriver] = []
+
+    def fake_build_driver(**kwargs) -> FakeDriver:
+        drivers.append(FakeDriver())
+        return drivers[-1]
+
+    monkeypatch.setattr(scraper_module, 'build_driver', fake_build_driver)
+    return drivers
+
+
+def _scraper(**kwargs) -> tuple[LinkedinScraper, OneJobStrategy]:
+    scraper = LinkedinScraper(max_workers=1, **kwargs)
+    scraper.on(Events.DATA, lambda data: None)
+    strategy = OneJobStrategy(scraper)
+    scraper._strategy = strategy
+    return scraper, strategy
+
+
+def _query() -> Query:
+    return Query(query='q', options=QueryOptions(locations=['a']))
+
+
+def test_reuse_drivers_serves_consecutive_runs_with_one_browser(built_drivers) -> None:
+    with _scraper(reuse_drivers=True)[0] as scraper:
+        scraper.run(_query())
+        scraper.run(_query())
+
+        assert len(built_drivers) == 1
+        assert built_drivers[0].quit_count == 0
+
+    assert built_drivers[0].quit_count == 1
+
+
+def test_without_reuse_every_run_closes_its_browser(built_drivers) -> None:
+    scraper, _ = _scraper()
+
+    scraper.run(_query())
+    scraper.run(_query())
+
+    assert len(built_drivers) == 2
+    assert all(driver.quit_count == 1 for driver in built_drivers)
+
+
+def test_driver_max_jobs_counts_emitted_jobs(built_drivers) -> None:
+    scraper, _ = _scraper(reuse_drivers=True, driver_max_jobs=2)
+
+    for _ in range(3):
+        scraper.run(_query())
+
+    scraper.close()
+
+    assert len(built_drivers) == 2
+
+
+@pytest.mark.parametrize('kwargs', [
+    {'reuse_drivers': 'yes'},
+    {'driver_max_age': 0},
+    {'driver_max_jobs': 0},
+    {'driver_max_jobs': 1.5},
+])
+def test_pool_parameters_are_validated(kwargs) -> None:
+    with pytest.raises(ValueError):
+        LinkedinScraper(**kwargs)
@@ -0,0 +1,68 @@
+"""Offline tests for the single-call extraction, driven through a fake driver."""
+from __future__ import annotations
+
+from linkedin_jobs_scraper.strategies.authenticated_strategy import AuthenticatedStrategy
+from linkedin_jobs_scraper.strategies.extraction import CALL_SCRIPT, EXTRACT_FUNCTION, INSTALL_SCRIPT, extract_job
+from linkedin_jobs_scraper.utils.timings import TimingModel
+
+extract_job_details = AuthenticatedStrategy._AuthenticatedStrategy__extract_job_details
+
+
+class FakeDriver:
+    """Answers each script with the next of its replies."""
+
+    def __init__(self, *replies) -> None:
+        self.replies = list(replies)
+        self.scripts: list[str] = []
+        self.cdp_commands: list[str] = []
+
+    def execute_script(self, script: str, *args):
+        self.scripts.append(script)
+        return self.replies.pop(0)
+
+    def execute_cdp_cmd(self, command: str, params: dict) -> None:
+        self.cdp_commands.append(command)
+
+    def set_script_timeout(self, timeout: float) -> None:
+        pass
+
+    def execute_async_script(self, script: str, params: dict):
+        self.scripts.append(script)
+        return self.replies.pop(0)
+
+
+def test_an_installed_function_is_called_once() -> None:
+    driver = FakeDriver({'installed': True, 'result': {'fields': {'title': 'Engineer'}, 'timings': {}}})
+
+    assert extract_job(driver, {})['fields'] == {'title': 'Engineer'}
+    assert driver.scripts == [CALL_SCRIPT]
+
+
+def test_a_document_without_the_function_is_given_it() -> None:
+    driver = FakeDriver({'installed': False}, {'installed': True, 'result': None})
+
+    assert extract_job(driver, {}) is None
+    assert len(driver.scripts) == 2
+    assert driver.cdp_commands == ['Page.addScriptToEvaluateOnNewDocument']
+
+
+def test_the_details_wait_calls_the_function_the_document_holds() -> None:
+    fields = {'title': 'Engineer'}
+    driver = FakeDriver({'met': True, 'value': {'fields': fields, 'timings': {}}})
+
+    assert extract_job_details(driver, '', '1', None, TimingModel()) == {'success': True, 'fields': fields}
+    assert EXTRACT_FUNCTION not in driver.scripts[0]
+
+
+def test_a_document_opened_before_the_registration_is_given_the_function_once() -> None:
+    driver = FakeDriver({'met': True, 'value': {'installed': False}}, None,
+                        {'met': True, 'value': {'fields': {}, 'timings': {}}})
+
+    assert extract_job_details(driver, '', '1', None, TimingModel())['success']
+    assert driver.scripts[1] == INSTALL_SCRIPT
+    assert driver.cdp_commands == ['Page.addScriptToEvaluateOnNewDocument']
+
+
+def test_a_document_being_swapped_answers_none() -> None:
+    assert extract_job(FakeDriver(None), {}) is None
+    assert extract_job(FakeDriver({'installed': False}, None), {}) is None
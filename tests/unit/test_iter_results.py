@@ -0,0 +1,137 @@
+"""Offline tests for iter_results, the pull-based way of taking the jobs of a run."""
+from __future__ import annotations
+
+from time import sleep
+
+import pytest
+
+from linkedin_jobs_scraper import LinkedinScraper, linkedin_scraper as scraper_module
+from linkedin_jobs_scraper.events import Events, EventData, EventMetrics
+from linkedin_jobs_scraper.exceptions import CallbackException
+from linkedin_jobs_scraper.query import Query, QueryOptions
+from linkedin_jobs_scraper.strategies import Strategy
+
+
+class FakeDriver:
+    def __init__(self) -> None:
+        self.quit_count = 0
+
+    def execute_script(self, *args):
+        return 'www.linkedin.com'
+
+    def get_cookie(self, name):
+        return None
+
+    def quit(self) -> None:
+        self.quit_count += 1
+
+
+class CountingStrategy(Strategy):
+    """Emits one DATA per job up to the limit, forever for a limit of 0."""
+
+    def __init__(self, scraper) -> None:
+        super().__init__(scraper)
+        self.emitted = 0
+
+    def run(self, driver, search_url, query, location, page_offset) -> None:
+        metrics = EventMetrics()
+
+        while query.options.limit == 0 or metrics.processed < query.options.limit:
+            self.scraper.raise_if_cancelled()
+            sleep(0.001)
+
+            metrics.processed += 1
+            self.emitted += 1
+            self.scraper.emit(Events.DATA, EventData(query=query.query, location=location,
+                                                     job_id=str(metrics.processed)))
+
+
+@pytest.fixture
+def built_drivers(monkeypatch) -> list[FakeDriver]:
+    drivers: list[FakeDriver] = []
+
+    def fake_build_driver(**kwargs) -> FakeDriver:
+        drivers.append(FakeDriver())
+        return drivers[-1]
+
+    monkeypatch.setattr(scraper_module, 'build_driver', fake_build_driver)
+    return drivers
+
+
+def _scraper() -> tuple[LinkedinScraper, CountingStrategy]:
+    scraper = LinkedinScraper(max_workers=2)
+    strategy = CountingStrategy(scraper)
+    scraper._strategy = strategy
+    return scraper, strategy
+
+
+def _query(limit: int, locations=('Europe',)) -> Query:
+    return Query(query='engineer', options=QueryOptions(locations=list(locations), limit=limit))
+
+
+def test_every_job_is_yielded_once(built_drivers) -> None:
+    scraper, _ = _scraper()
+
+    results = list(scraper.iter_results([_query(3, ['a', 'b']), _query(2)]))
+
+    assert sorted((data.location, data.job_id) for data in results) == [
+        ('Europe', '1'), ('Europe', '2'), ('a', '1'), ('a', '2'), ('a', '3'), ('b', '1'), ('b', '2'), ('b', '3')]
+
+
+def test_workers_wait_for_a_slow_consumer(built_drivers) -> None:
+    scraper, strategy = _scraper()
+    ahead: list[int] = []
+
+    for taken, _ in enumerate(scraper.iter_results(_query(20), max_buffer=2), start=1):
+        sleep(0.01)
+        ahead.append(strategy.emitted - taken)
+
+    # The buffer, and the one job the worker holds while it waits for room
+    assert max(ahead) <= 3
+
+
+def test_closing_early_cancels_the_rest_of_the_run(built_drivers) -> None:
+    scraper, strategy = _scraper()
+    ends: list[None] = []
+    scraper.on(Events.END, lambda: ends.append(None))
+
+    for data in scraper.iter_results(_query(0), max_buffer=1):
+        if data.job_id == '5':
+            break
+
+    assert strategy.emitted < 10
+    assert ends == []
+    assert all(driver.quit_count >= 1 for driver in built_drivers)
+    assert not scraper._emitter[Events.DATA]
+
+
+def test_a_failing_listener_is_raised_once_the_buffer_is_drained(built_drivers) -> None:
+    scraper, _ = _scraper()
+    taken: list[EventData] = []
+
+    def fail_on_third(data: EventData) -> None:
+        if data.job_id == '3':
+            raise RuntimeError('sink is down')
+
+    scraper.on(Events.DATA, fail_on_third)
+
+    with pytest.raises(CallbackException):
+        for data in scraper.iter_results(_query(5)):
+            taken.append(data)
+
+    assert [data.job_id for data in taken] == ['1', '2']
+
+
+def test_a_cancel_with_nothing_running_leaves_the_next_run_alone(built_drivers) -> None:
+    scraper, _ = _scraper()
+
+    scraper.cancel()
+
+    assert len(list(scraper.iter_results(_query(3)))) == 3
+
+
+def test_max_buffer_must_be_positive(built_drivers) -> None:
+    scraper, _ = _scraper()
+
+    with pytest.raises(ValueError):
+        next(scraper.iter_results(_query(1), max_buffer=0))
@@ -0,0 +1,147 @@
+"""Offline tests for list mode and field projection: nothing is read that was not asked for."""
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from linkedin_jobs_scraper import LinkedinScraper, linkedin_scraper as scraper_module
+from linkedin_jobs_scraper.cli.args import parse_args
+from linkedin_jobs_scraper.cli.mapping import build_query, build_query_options
+from linkedin_jobs_scraper.cli.output import create_writer
+from linkedin_jobs_scraper.events import Events, EventData
+from linkedin_jobs_scraper.query import Query, QueryOptions
+from linkedin_jobs_scraper.strategies import VoyagerStrategy, voyager_strategy
+from linkedin_jobs_scraper.strategies.projection import needs_details, project
+
+
+class FakeApiDriver:
+    """Answers the API requests of a search holding one page of 3 jobs, counting what it is asked for."""
+
+    def __init__(self) -> None:
+        self.requested: list[str] = []
+
+    def execute_script(self, *args):
+        return 'www.linkedin.com'
+
+    def get_cookie(self, name):
+        return None
+
+    def quit(self) -> None:
+        pass
+
+    def execute_async_script(self, script, url, accept):
+        if 'jobPostings/' in url:
+            self.requested.append('posting')
+            return {'status': 200, 'body': json.dumps({'title': 'Posting title',
+                                                       'description': {'text': 'Full description'}})}
+
+        self.requested.append('cards')
+
+        return {'status': 200, 'body': json.dumps({
+            'data': {'paging': {'total': 3}, 'elements': []},
+            'included': [{'$type': 'com.linkedin.voyager.dash.jobs.JobPostingCard',
+                          'entityUrn': f'urn:li:fsd_jobPostingCard:({job_id},JOBS_SEARCH)',
+                          'jobPostingUrn': f'urn:li:fsd_jobPosting:{job_id}',
+                          'jobPostingTitle': f'Engineer {job_id[-1]}',
+                          'primaryDescription': {'text': 'Acme'},
+                          'secondaryDescription': {'text': 'Berlin'},
+                          'footerItems': [{'type': 'PROMOTED'}] if job_id == '100003' else []}
+                         for job_id in ('100001', '100002', '100003')],
+        })}
+
+
+@pytest.fixture
+def driver(monkeypatch) -> FakeApiDriver:
+    driver = FakeApiDriver()
+    monkeypatch.setattr(scraper_module, 'build_driver', lambda **kwargs: driver)
+    monkeypatch.setattr(VoyagerStrategy, 'open_session', lambda self, d, tag: True)
+    monkeypatch.setattr(voyager_strategy, 'sleep', lambda seconds: None)
+    return driver
+
+
+def _scrape(**options) -> list:
+    delivered = []
+
+    with LinkedinScraper(max_workers=1, api_mode=True) as scraper:
+        scraper.on(Events.DATA, delivered.append)
+        scraper.run(Query(query='engineer', options=QueryOptions(locations=['Europe'], limit=0, **options)))
+
+    return delivered
+
+
+def test_list_mode_reads_every_job_off_its_card(driver) -> None:
+    delivered = _scrape(details=False)
+
+    assert driver.requested == ['cards']
+    assert [data.title for data in delivered] == ['Engineer 1', 'Engineer 2', 'Engineer 3']
+    assert {(data.company, data.place, data.description) for data in delivered} == {('Acme', 'Berlin', '')}
+    assert delivered[0].link.endswith('/jobs/view/100001')
+
+
+def test_details_are_fetched_by_default(driver) -> None:
+    delivered = _scrape()
+
+    assert driver.requested.count('posting') == 3
+    assert {data.description for data in delivered} == {'Full description'}
+
+
+def test_list_mode_still_skips_promoted_jobs(driver) -> None:
+    delivered = _scrape(details=False, skip_promoted_jobs=True)
+
+    assert [data.job_id for data in delivered] == ['100001', '100002']
+
+
+def test_the_apply_link_needs_the_details(driver) -> None:
+    with pytest.raises(ValueError):
+        _scrape(details=False, apply_link=True)
+
+    with pytest.raises(ValueError):
+        QueryOptions(details='no').validate()
+
+
+def test_the_cli_maps_no_details() -> None:
+    assert build_query_options(parse_args(['jobs', 'engineer', '--no-details'])).details is False
+    assert build_query_options(parse_args(['jobs', 'engineer'])).details is True
+
+    with pytest.raises(SystemExit):
+        parse_args(['jobs', 'engineer', '--no-details', '--apply-link'])
+
+
+def test_only_card_fields_spare_the_details(driver) -> None:
+    delivered = _scrape(fields=['title', 'link'])
+
+    assert driver.requested == ['cards']
+    assert delivered[0].title == 'Engineer 1'
+    assert delivered[0].job_id == '100001'
+    assert delivered[0].company == ''
+
+
+def test_fields_not_asked_for_are_dropped(driver) -> None:
+    delivered = _scrape(fields=['description'])
+
+    assert driver.requested.count('posting') == 3
+    assert {(data.description, data.title) for data in delivered} == {('Full description', '')}
+
+
+def test_what_needs_the_details() -> None:
+    assert needs_details(None)
+    assert needs_details(['title', 'insights'])
+    assert not needs_details(['title', 'company', 'date', 'job_id'])
+
+    data = EventData(job_id='1', title='Engineer', description='Long', insights=['Skills'])
+
+    assert project(data, None) is data
+    assert project(data, ['title']) == EventData(job_id='1', title='Engineer')
+
+
+@pytest.mark.parametrize('fields', [[], ['title', 'salary'], 'title'])
+def test_unknown_fields_are_refused(fields) -> None:
+    with pytest.raises(ValueError):
+        QueryOptions(fields=fields).validate()
+
+
+def test_the_cli_extracts_only_what_it_writes() -> None:
+    config = parse_args(['jobs', 'engineer', '--fields', 'title,link', '--out-format', 'jsonl'])
+
+    assert build_query(config, create_writer(config, None).fields).options.fields == ['title', 'link']
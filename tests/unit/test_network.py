@@ -0,0 +1,151 @@
+"""Offline tests for the rate limit hints read off LinkedIn's responses, and the pacer they feed."""
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+import pytest
+
+from linkedin_jobs_scraper import LinkedinScraper
+from linkedin_jobs_scraper.cli.args import parse_args
+from linkedin_jobs_scraper.cli.mapping import build_scraper_kwargs
+from linkedin_jobs_scraper.strategies.authenticated_strategy import THROTTLE_BACKOFF_JITTER, backoff_wait
+from linkedin_jobs_scraper.strategies.voyager_strategy import VoyagerStrategy
+from linkedin_jobs_scraper.utils.network import ResponseObserver, parse_rate_limit, parse_retry_after
+from linkedin_jobs_scraper.utils.pacing import MAX_RETRY_AFTER, Pacer, RequestClass
+
+NOW = 1_800_000_000.0
+
+
+class FakeNetwork:
+    def __init__(self) -> None:
+        self.handlers = {}
+
+    def add_event_handler(self, event: str, callback) -> int:
+        self.handlers[event] = callback
+        return 1
+
+
+class FakeBidiDriver:
+    def __init__(self) -> None:
+        self.network = FakeNetwork()
+
+
+class FakeFetchDriver:
+    def __init__(self, answers: list[dict]) -> None:
+        self.answers = answers
+
+    def execute_async_script(self, script: str, *args) -> dict:
+        return self.answers.pop(0)
+
+
+def _response(url: str, status: int, **headers) -> dict:
+    return {'response': {'url': url, 'status': status,
+                         'headers': [{'name': name.replace('_', '-'), 'value': {'type': 'string', 'value': value}}
+                                     for name, value in headers.items()]}}
+
+
+def test_retry_after_is_read_as_seconds_or_as_a_date() -> None:
+    assert parse_retry_after('120') == 120
+    assert parse_retry_after('Fri, 15 Jan 2027 08:00:30 GMT', now=NOW) == 30
+    assert parse_retry_after('Fri, 15 Jan 2027 08:00:30 GMT', now=NOW + 60) == 0
+    assert parse_retry_after('soon') is None
+    assert parse_retry_after(None) is None
+
+
+@pytest.mark.parametrize('headers, expected', [
+    ({'x-ratelimit-remaining': '40', 'x-ratelimit-reset': '60'}, (40, 60.0)),
+    ({'x-ratelimit-remaining': '40', 'x-ratelimit-reset': str(int(NOW) + 30)}, (40, 30.0)),
+    ({'ratelimit': 'limit=100, remaining=5, reset=20'}, (5, 20.0)),
+    ({'x-ratelimit-limit': '100'}, None),
+])
+def test_a_budget_needs_both_what_is_left_and_when_it_resets(headers, expected) -> None:
+    assert parse_rate_limit(headers, now=NOW) == expected
+
+
+def test_a_retry_after_holds_the_run_and_replaces_the_ladder() -> None:
+    pacer = Pacer(floor=1, ceiling=10)
+
+    assert backoff_wait(pacer, 45) >= 45 * (1 - THROTTLE_BACKOFF_JITTER)
+
+    pacer.retry_after(7)
+
+    assert 6 < pacer.delay <= 7
+    assert 6 < backoff_wait(pacer, 45) <= 7
+    assert pacer.pace == 1
+
+    pacer.retry_after(2 * MAX_RETRY_AFTER)
+
+    assert pacer.hold <= MAX_RETRY_AFTER
+
+
+def test_a_budget_spaces_the_jobs_within_the_ceiling() -> None:
+    pacer = Pacer(floor=1, ceiling=10)
+
+    assert pacer.budget(20, 60) == 3
+    assert pacer.delay == 3
+    assert pacer.budget(2, 60) == 10
+
+    pacer.budget(0, 40)
+
+    assert pacer.hold > 39
+
+
+def test_a_pacer_that_does_not_adapt_still_honours_the_server() -> None:
+    pacer = Pacer(floor=1, ceiling=1)
+    pacer.budget(2, 60)
+
+    assert pacer.delay == 1
+
+    pacer.retry_after(5)
+
+    assert pacer.delay > 4
+
+
+def test_the_observer_reads_linkedins_responses_and_counts_what_it_costs() -> None:
+    pacer = Pacer(floor=1, ceiling=10)
+    observer = ResponseObserver(pacer)
+    driver = FakeBidiDriver()
+
+    assert observer.attach(driver)
+
+    handler = driver.network.handlers['response_started']
+    handler(_response('https://www.linkedin.com/voyager/api/jobs', 200))
+    handler(_response('https://www.google-analytics.com/collect', 429, retry_after='60'))
+    handler(_response('https://www.linkedin.com/jobs/search/', 429, retry_after='30'))
+    observer.settle()
+
+    try:
+        assert observer.events == 3
+        assert observer.hints == 1
+        assert 29 < pacer.hold <= 30
+        assert observer.overhead > 0
+    finally:
+        observer.close()
+
+
+def test_a_browser_without_bidi_is_not_listened_to() -> None:
+    observer = ResponseObserver(Pacer(floor=1, ceiling=10))
+
+    assert not observer.attach(SimpleNamespace())
+    observer.close()
+
+
+def test_api_mode_reads_the_hints_off_its_own_requests(monkeypatch) -> None:
+    monkeypatch.setattr('linkedin_jobs_scraper.strategies.voyager_strategy.sleep', lambda seconds: None)
+    pacer = Pacer(floor=1, ceiling=10)
+    strategy = VoyagerStrategy(SimpleNamespace(pacer=pacer))
+    driver = FakeFetchDriver([
+        {'status': 200, 'body': '{}', 'headers': {'X-RateLimit-Remaining': '10', 'X-RateLimit-Reset': '50'}},
+    ])
+
+    url = 'https://www.linkedin.com/voyager/api/x'
+
+    assert strategy._VoyagerStrategy__fetch(driver, 'tag', url, '', RequestClass.DETAILS) == (200, {})
+    assert pacer.delay == 5
+
+
+def test_observe_network_is_validated_and_mapped() -> None:
+    with pytest.raises(ValueError):
+        LinkedinScraper(observe_network='yes')
+
+    assert build_scraper_kwargs(parse_args(['jobs', 'engineer', '--observe-network']))['observe_network'] is True
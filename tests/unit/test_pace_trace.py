@@ -0,0 +1,139 @@
+"""Offline tests for the pacer's time series, its export, and its replay against other constants."""
+from __future__ import annotations
+
+import pytest
+
+from linkedin_jobs_scraper import LinkedinScraper
+from linkedin_jobs_scraper.cli.args import parse_args
+from linkedin_jobs_scraper.cli.main import main
+from linkedin_jobs_scraper.events import EventPace, Events
+from linkedin_jobs_scraper.utils.pace_trace import (read_pace_trace, simulate_pacing, summarize_pace_trace,
+                                                    write_pace_trace)
+from linkedin_jobs_scraper.utils.pacing import CLEAN_RUN_BEFORE_EASING, Pacer, RequestClass
+
+
+def _record(pacer: Pacer) -> None:
+    # Two refusals of a page of results, then enough clean details to ease them once
+    pacer.throttled(RequestClass.PAGINATION)
+    pacer.throttled(RequestClass.PAGINATION)
+    pacer.retry_after(3)
+
+    for _ in range(CLEAN_RUN_BEFORE_EASING):
+        pacer.clean(RequestClass.PAGINATION)
+
+
+def test_every_report_is_kept_and_handed_on() -> None:
+    handed = []
+    pacer = Pacer(floor=1, ceiling=10, on_sample=handed.append)
+
+    _record(pacer)
+    trace = pacer.trace()
+
+    assert trace == handed
+    assert [s.event for s in trace[:4]] == ['throttled', 'throttled', 'retry_after', 'clean']
+    assert trace[1].delay == 4 and trace[1].throttled == 2 and trace[1].request_class == 'pagination'
+    assert trace[3].clean_streak == 1
+    assert trace[-1].event == 'eased' and trace[-1].delay == 4 / 1.5 and trace[-1].clean_streak == 0
+
+
+def test_the_trace_keeps_the_latest_reports_only(monkeypatch) -> None:
+    monkeypatch.setattr('linkedin_jobs_scraper.utils.pacing.PACE_TRACE_SIZE', 3)
+    pacer = Pacer(floor=1, ceiling=10)
+
+    _record(pacer)
+
+    assert len(pacer.trace()) == 3
+    assert pacer.trace()[-1].event == 'eased'
+
+
+def test_the_scraper_emits_every_report_as_a_pace_event() -> None:
+    scraper = LinkedinScraper()
+    received = []
+    scraper.on(Events.PACE, received.append)
+
+    try:
+        scraper.pacer.throttled(RequestClass.DETAILS)
+    finally:
+        scraper.close()
+
+    assert [(s.request_class, s.event) for s in received] == [('details', 'throttled')]
+
+
+def test_a_report_never_raises_into_the_step_it_accounts_for() -> None:
+    scraper = LinkedinScraper()
+    received = []
+
+    def fail(sample: EventPace) -> None:
+        raise RuntimeError('sink is down')
+
+    scraper.on(Events.PACE, fail)
+
+    try:
+        assert scraper.pacer.throttled(RequestClass.DETAILS) == 2 * scraper.slow_mo
+
+        # A cancelled worker unwinds at its next report of its own, not at the pacer's
+        scraper.remove_listener(Events.PACE, fail)
+        scraper.on(Events.PACE, received.append)
+        scraper._cancelled.set()
+        scraper.pacer.clean(RequestClass.DETAILS)
+    finally:
+        scraper.close()
+
+    assert [s.event for s in received] == ['clean']
+
+
+@pytest.mark.parametrize('name', ['trace.csv', 'trace.jsonl'])
+def test_a_trace_is_read_back_as_it_was_written(tmp_path, name) -> None:
+    pacer = Pacer(floor=1, ceiling=10)
+    _record(pacer)
+    path = str(tmp_path / name)
+
+    write_pace_trace(pacer.trace(), path)
+
+    assert read_pace_trace(path) == pacer.trace()
+
+
+def test_a_trace_is_a_csv_or_a_jsonl_file(tmp_path) -> None:
+    with pytest.raises(ValueError):
+        write_pace_trace([], str(tmp_path / 'trace.txt'))
+
+    with pytest.raises(SystemExit):
+        parse_args(['jobs', 'engineer', '--pace-trace', 'trace.txt'])
+
+    assert parse_args(['jobs', 'engineer', '--pace-trace', 'trace.csv']).pace_trace == 'trace.csv'
+
+
+def test_a_replay_with_the_same_constants_is_the_recording() -> None:
+    pacer = Pacer(floor=1, ceiling=10)
+    _record(pacer)
+    steps = [s for s in pacer.trace() if s.event != 'retry_after']
+
+    assert [(s.event, s.delay, s.at) for s in simulate_pacing(pacer.trace(), slow_mo=1)] == \
+           [(s.event, s.delay, s.at) for s in steps]
+
+
+def test_a_replay_shows_what_other_constants_make_of_the_same_refusals() -> None:
+    pacer = Pacer(floor=1, ceiling=10)
+    _record(pacer)
+
+    recorded = summarize_pace_trace(pacer.trace())['pagination']
+    gentler = summarize_pace_trace(simulate_pacing(pacer.trace(), slow_mo=1, increase_factor=1.5,
+                                                   clean_run=5))['pagination']
+
+    assert recorded['steps'] == gentler['steps'] == CLEAN_RUN_BEFORE_EASING + 2
+    assert recorded['throttled'] == gentler['throttled'] == 2
+    assert (recorded['eased'], gentler['eased']) == (1, 4)
+    assert gentler['slept'] < recorded['slept']
+    assert gentler['max'] == 2.25
+
+
+def test_the_simulator_is_run_from_the_command_line(tmp_path, capsys) -> None:
+    path = str(tmp_path / 'trace.jsonl')
+    write_pace_trace([EventPace(at=1, request_class='navigation', event='throttled', delay=2, throttled=1),
+                      EventPace(at=2, request_class='navigation', event='clean', delay=2, clean_streak=1)], path)
+
+    assert main(['simulate-pace', path, '--slow-mo', '1', '--increase-factor', '3']) == 0
+
+    out = capsys.readouterr().out
+    assert 'navigation' in out and '4.0 -> 6.0' in out
+    assert main(['simulate-pace', str(tmp_path / 'missing.csv')]) == 1
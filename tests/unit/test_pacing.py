@@ -0,0 +1,80 @@
+"""Offline tests for the pacer's delays, one per class of request."""
+from __future__ import annotations
+
+from linkedin_jobs_scraper import LinkedinScraper
+from linkedin_jobs_scraper.strategies import authenticated_strategy as strat
+from linkedin_jobs_scraper.strategies.authenticated_strategy import AuthenticatedStrategy
+from linkedin_jobs_scraper.utils.pacing import (CLEAN_RUN_BEFORE_EASING, REQUEST_CLASS_FACTORS, Pacer,
+                                                RequestClass)
+from linkedin_jobs_scraper.utils.rate_limit import LocalRateLimiter
+
+
+def test_every_class_starts_from_its_share_of_slow_mo() -> None:
+    pacer = Pacer(floor=0.8, ceiling=8)
+
+    assert pacer.delay == 0.8
+    assert pacer.delay_of(RequestClass.CARD) == 0.8 * REQUEST_CLASS_FACTORS[RequestClass.CARD]
+    assert pacer.delay_of(RequestClass.CARD) < pacer.delay_of(RequestClass.APPLY) < pacer.delay
+
+
+def test_a_refusal_slows_down_its_own_class_only() -> None:
+    pacer = Pacer(floor=1, ceiling=10)
+
+    assert pacer.throttled(RequestClass.PAGINATION) == 2
+    assert pacer.delay_of(RequestClass.PAGINATION) == 2
+    assert pacer.delay == 1
+    assert pacer.delay_of(RequestClass.DETAILS) == 1
+    assert pacer.throttled_count == 1
+    assert pacer.snapshot()['pagination'] == {'pace': 2, 'throttled': 1}
+
+
+def test_clean_work_eases_its_own_class_down_to_its_own_floor() -> None:
+    pacer = Pacer(floor=1, ceiling=10)
+    pacer.throttled(RequestClass.DETAILS)
+
+    for _ in range(CLEAN_RUN_BEFORE_EASING):
+        pacer.clean(RequestClass.NAVIGATION)
+
+    assert pacer.pace_of(RequestClass.DETAILS) == 2
+
+    for _ in range(CLEAN_RUN_BEFORE_EASING * 3):
+        pacer.clean(RequestClass.DETAILS)
+
+    assert pacer.pace_of(RequestClass.DETAILS) == 1
+
+
+class FakeDriver:
+    """A browser on which every page of results renders."""
+
+    def get(self, url: str) -> None:
+        pass
+
+    def execute_script(self, *args) -> None:
+        return None
+
+
+def test_pages_that_load_bring_a_throttled_pagination_back_to_its_floor(monkeypatch) -> None:
+    monkeypatch.setattr(strat, 'sleep', lambda seconds: None)
+    monkeypatch.setattr(AuthenticatedStrategy, '_AuthenticatedStrategy__wait_for_job_items',
+                        staticmethod(lambda driver, tag: True))
+    scraper = LinkedinScraper(slow_mo=1)
+    strategy = AuthenticatedStrategy(scraper)
+
+    try:
+        scraper.pacer.throttled(RequestClass.PAGINATION)
+
+        for _ in range(CLEAN_RUN_BEFORE_EASING * 2):
+            assert strategy._AuthenticatedStrategy__paginate(FakeDriver(), 'https://www.linkedin.com', '')['success']
+
+        assert scraper.pacer.pace_of(RequestClass.PAGINATION) == 1
+        assert scraper.pacer.pace_of(RequestClass.DETAILS) == 1
+    finally:
+        scraper.close()
+
+
+def test_a_card_takes_nothing_from_the_accounts_budget() -> None:
+    pacer = Pacer(floor=1, ceiling=10, limiter=LocalRateLimiter(burst=1))
+
+    assert pacer.wait(RequestClass.CARD, own=0) == 0
+    assert pacer.wait(RequestClass.DETAILS, own=0) == 0
+    assert pacer.wait(RequestClass.DETAILS, own=0) > 0.9
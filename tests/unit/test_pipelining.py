@@ -0,0 +1,29 @@
+"""Offline tests for the pacing of a pipelined run, which keeps the spacing between the jobs it opens."""
+from __future__ import annotations
+
+import pytest
+
+from linkedin_jobs_scraper import LinkedinScraper
+from linkedin_jobs_scraper.cli.args import parse_args
+from linkedin_jobs_scraper.cli.mapping import build_scraper_kwargs
+from linkedin_jobs_scraper.strategies.authenticated_strategy import time_to_next_job
+
+
+def test_the_first_job_is_opened_right_away() -> None:
+    assert time_to_next_job(None, 2.0, 100.0) == 0
+
+
+def test_work_done_inside_the_spacing_is_not_slept_again() -> None:
+    # Read at 100 with the serial loop sleeping 4 between two jobs: the next one is due at 104
+    assert time_to_next_job(100.0, 4.0, 101.5) == pytest.approx(2.5)
+
+
+def test_work_outlasting_the_spacing_waits_for_nothing() -> None:
+    assert time_to_next_job(100.0, 2.0, 110.0) == 0
+
+
+def test_pipelining_is_validated_and_mapped() -> None:
+    with pytest.raises(ValueError):
+        LinkedinScraper(pipeline_details='yes')
+
+    assert build_scraper_kwargs(parse_args(['jobs', 'engineer', '--pipeline-details']))['pipeline_details'] is True
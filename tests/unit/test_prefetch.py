@@ -0,0 +1,69 @@
+"""Offline tests for the next page of results loaded ahead of time in a background tab."""
+from __future__ import annotations
+
+import pytest
+
+from linkedin_jobs_scraper import LinkedinScraper
+from linkedin_jobs_scraper.cli.args import parse_args
+from linkedin_jobs_scraper.cli.mapping import build_scraper_kwargs
+from linkedin_jobs_scraper.utils.tabs import PagePrefetch
+
+NEXT_PAGE = 'https://www.linkedin.com/jobs/search?keywords=engineer&start=25'
+
+
+class FakeCdpDriver:
+    def __init__(self) -> None:
+        self.commands = []
+        self.targets = 0
+
+    def execute_cdp_cmd(self, cmd: str, params: dict) -> dict:
+        self.commands.append((cmd, params))
+
+        if cmd == 'Target.createTarget':
+            self.targets += 1
+            return {'targetId': f'T{self.targets}'}
+
+        return {}
+
+
+def test_the_page_is_loaded_in_the_background_and_handed_over() -> None:
+    driver = FakeCdpDriver()
+    prefetch = PagePrefetch(driver)
+
+    assert prefetch.open(NEXT_PAGE)
+    assert driver.commands == [('Target.createTarget', {'url': NEXT_PAGE, 'background': True})]
+    assert prefetch.handles == {'T1'}
+
+    assert prefetch.take(NEXT_PAGE) == 'T1'
+
+    # Taken, the tab is the caller's: discarding what is left closes nothing
+    prefetch.discard()
+
+    assert prefetch.handles == set()
+    assert len(driver.commands) == 1
+
+
+def test_a_page_that_is_not_the_one_needed_is_closed() -> None:
+    driver = FakeCdpDriver()
+    prefetch = PagePrefetch(driver)
+    prefetch.open(NEXT_PAGE)
+
+    assert prefetch.take(NEXT_PAGE.replace('25', '50')) is None
+    assert driver.commands[-1] == ('Target.closeTarget', {'targetId': 'T1'})
+
+
+def test_opening_another_page_closes_the_one_held() -> None:
+    driver = FakeCdpDriver()
+    prefetch = PagePrefetch(driver)
+    prefetch.open(NEXT_PAGE)
+    prefetch.open(NEXT_PAGE.replace('25', '50'))
+
+    assert driver.commands[1] == ('Target.closeTarget', {'targetId': 'T1'})
+    assert prefetch.handles == {'T2'}
+
+
+def test_prefetching_is_validated_and_mapped() -> None:
+    with pytest.raises(ValueError):
+        LinkedinScraper(prefetch_pages=1)
+
+    assert build_scraper_kwargs(parse_args(['jobs', 'engineer', '--prefetch-pages']))['prefetch_pages'] is True
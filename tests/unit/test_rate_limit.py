@@ -0,0 +1,71 @@
+"""Offline tests for the request budget an account shares between scrapers and processes."""
+from __future__ import annotations
+
+import pytest
+
+from linkedin_jobs_scraper import LinkedinScraper
+from linkedin_jobs_scraper.cli.args import parse_args
+from linkedin_jobs_scraper.cli.mapping import build_scraper_kwargs
+from linkedin_jobs_scraper.sharded_scraper import Credential, ShardedScraper
+from linkedin_jobs_scraper.utils.pacing import Pacer
+from linkedin_jobs_scraper.utils.rate_limit import LocalRateLimiter, SqliteRateLimiter, take_tokens
+
+
+def test_a_full_bucket_lets_a_burst_through_and_then_queues() -> None:
+    tokens, wait = take_tokens(3, 0, 0, interval=2, burst=3, cost=1)
+    assert (tokens, wait) == (2, 0)
+
+    tokens, wait = take_tokens(-1, 0, 0, interval=2, burst=3, cost=1)
+    assert (tokens, wait) == (-2, 4)
+
+
+def test_a_quiet_spell_refills_the_bucket_up_to_the_burst_only() -> None:
+    assert take_tokens(0, 0, 100, interval=2, burst=3, cost=1) == (2, 0)
+    assert take_tokens(0, 0, 3, interval=2, burst=3, cost=2) == (-0.5, 1)
+
+
+def test_scrapers_sharing_a_limiter_take_turns() -> None:
+    limiter = LocalRateLimiter(burst=2)
+
+    waits = [limiter.reserve(10) for _ in range(4)]
+
+    assert waits[:2] == [0, 0]
+    assert 9 < waits[2] <= 10
+    assert 19 < waits[3] <= 20
+
+
+def test_processes_sharing_a_database_take_turns(tmp_path) -> None:
+    path = str(tmp_path / 'account.db')
+    first, second = SqliteRateLimiter(path, burst=1), SqliteRateLimiter(path, burst=1)
+    other = SqliteRateLimiter(path, account='other', burst=1)
+
+    try:
+        assert first.reserve(10) == 0
+        assert 9 < second.reserve(10) <= 10
+        assert other.reserve(10) == 0
+    finally:
+        for limiter in (first, second, other):
+            limiter.close()
+
+
+def test_the_pacer_waits_for_the_longer_of_its_delay_and_the_accounts_turn() -> None:
+    assert Pacer(floor=1, ceiling=10).wait() == 1
+
+    pacer = Pacer(floor=1, ceiling=10, limiter=LocalRateLimiter(burst=1))
+
+    assert pacer.wait() == 1
+    assert pacer.wait(own=0) > 0.9
+    assert pacer.wait(own=0) > 1.9
+
+
+def test_the_rate_limiter_is_validated_mapped_and_kept_per_account() -> None:
+    with pytest.raises(ValueError):
+        LinkedinScraper(rate_limiter=1)
+
+    with pytest.raises(ValueError):
+        LocalRateLimiter(burst=0)
+
+    with pytest.raises(ValueError):
+        ShardedScraper([Credential(li_at='a'), Credential(li_at='b')], rate_limiter='account.db')
+
+    assert build_scraper_kwargs(parse_args(['jobs', 'engineer', '--rate-limiter', 'a.db']))['rate_limiter'] == 'a.db'
@@ -0,0 +1,128 @@
+"""Offline tests for how LinkedinScraper hands queries and locations to its workers.
+
+No network, no browser, no credentials: the driver factory and the strategy are replaced with
+fakes that only record what they were asked to do.
+"""
+from __future__ import annotations
+
+import threading
+from time import sleep
+
+import pytest
+
+from linkedin_jobs_scraper import LinkedinScraper, linkedin_scraper as scraper_module
+from linkedin_jobs_scraper.events import Events
+from linkedin_jobs_scraper.query import Query, QueryOptions
+from linkedin_jobs_scraper.strategies import Strategy
+
+
+class FakeDriver:
+    """Enough of a webdriver for the scraper's own bookkeeping around a run."""
+
+    def __init__(self) -> None:
+        self.quit_count = 0
+
+    def execute_script(self, *args):
+        return 'www.linkedin.com'
+
+    def get_cookie(self, name):
+        return None
+
+    def quit(self) -> None:
+        self.quit_count += 1
+
+
+class RecordingStrategy(Strategy):
+    def __init__(self, scraper) -> None:
+        super().__init__(scraper)
+        self.calls: list[tuple[str, str, FakeDriver]] = []
+        self._lock = threading.Lock()
+
+    def run(self, driver, search_url, query, location, page_offset) -> None:
+        # Long enough for every worker to be busy at once
+        sleep(0.02)
+
+        with self._lock:
+            self.calls.append((query.query, location, driver))
+
+
+@pytest.fixture
+def built_drivers(monkeypatch) -> list[FakeDriver]:
+    drivers: list[FakeDriver] = []
+
+    def fake_build_driver(**kwargs) -> FakeDriver:
+        driver = FakeDriver()
+        drivers.append(driver)
+        return driver
+
+    monkeypatch.setattr(scraper_module, 'build_driver', fake_build_driver)
+    return drivers
+
+
+def _scraper(parallel_locations: bool) -> tuple[LinkedinScraper, RecordingStrategy]:
+    scraper = LinkedinScraper(max_workers=2, parallel_locations=parallel_locations)
+    strategy = RecordingStrategy(scraper)
+    scraper._strategy = strategy
+    return scraper, strategy
+
+
+def _queries() -> list[Query]:
+    return [
+        Query(query='big', options=QueryOptions(locations=['a', 'b', 'c', 'd', 'e'])),
+        Query(query='small', options=QueryOptions(locations=['x'])),
+    ]
+
+
+def test_parallel_locations_runs_every_pair_once(built_drivers) -> None:
+    scraper, strategy = _scraper(parallel_locations=True)
+
+    scraper.run(_queries())
+
+    assert sorted((query, location) for query, location, _ in strategy.calls) == [
+        ('big', 'a'), ('big', 'b'), ('big', 'c'), ('big', 'd'), ('big', 'e'), ('small', 'x')]
+
+
+def test_parallel_locations_spreads_one_query_over_workers(built_drivers) -> None:
+    scraper, strategy = _scraper(parallel_locations=True)
+
+    scraper.run(Query(query='big', options=QueryOptions(locations=['a', 'b', 'c', 'd'])))
+
+    used = {id(driver) for _, _, driver in strategy.calls}
+    assert len(used) == 2
+
+
+def test_parallel_locations_reuses_one_browser_per_worker(built_drivers) -> None:
+    scraper, _ = _scraper(parallel_locations=True)
+
+    scraper.run(_queries())
+
+    assert len(built_drivers) <= 2
+    assert all(driver.quit_count == 1 for driver in built_drivers)
+
+
+def test_parallel_locations_ends_each_query_once(built_drivers) -> None:
+    scraper, _ = _scraper(parallel_locations=True)
+    ends: list[None] = []
+    scraper.on(Events.END, lambda: ends.append(None))
+
+    scraper.run(_queries())
+
+    assert len(ends) == 2
+
+
+def test_sequential_mode_keeps_one_browser_per_query(built_drivers) -> None:
+    scraper, strategy = _scraper(parallel_locations=False)
+
+    scraper.run(_queries())
+
+    drivers_by_query: dict[str, set[int]] = {}
+    for query, _, driver in strategy.calls:
+        drivers_by_query.setdefault(query, set()).add(id(driver))
+
+    assert {query: len(ids) for query, ids in drivers_by_query.items()} == {'big': 1, 'small': 1}
+    assert len(built_drivers) == 2
+
+
+def test_parallel_locations_must_be_a_bool() -> None:
+    with pytest.raises(ValueError):
+        LinkedinScraper(parallel_locations='yes')
@@ -0,0 +1,138 @@
+"""Offline tests for the seen-index: the job ids kept from one run to the next."""
+from __future__ import annotations
+
+import pytest
+
+from linkedin_jobs_scraper import LinkedinScraper, linkedin_scraper as scraper_module
+from linkedin_jobs_scraper.cli.args import parse_args
+from linkedin_jobs_scraper.cli.mapping import build_query_options, build_scraper_kwargs
+from linkedin_jobs_scraper.events import Events, EventData
+from linkedin_jobs_scraper.query import Query, QueryOptions
+from linkedin_jobs_scraper.strategies import Strategy
+from linkedin_jobs_scraper.utils import seen_index as seen_index_module
+from linkedin_jobs_scraper.utils.seen_index import BloomFilter, SeenIndex
+
+
+class FakeDriver:
+    def execute_script(self, *args):
+        return 'www.linkedin.com'
+
+    def get_cookie(self, name):
+        return None
+
+    def quit(self) -> None:
+        pass
+
+
+class ListedStrategy(Strategy):
+    """Emits the jobs 1 to 5, leaving out the known ones when only_new is set."""
+
+    def run(self, driver, search_url, query, location, page_offset) -> None:
+        for job_id in ['1', '2', '3', '4', '5']:
+            if query.options.only_new and job_id in self.scraper.seen_index:
+                continue
+
+            self.scraper.emit(Events.DATA, EventData(job_id=job_id))
+
+
+def test_a_bloom_filter_never_forgets() -> None:
+    bloom = BloomFilter(capacity=1000)
+    keys = [str(i) for i in range(1000)]
+
+    for key in keys:
+        bloom.add(key)
+
+    assert all(key in bloom for key in keys)
+    assert sum(str(i) in bloom for i in range(1000, 11000)) < 300
+
+
+def test_ids_outlive_the_index_they_were_added_to(tmp_path) -> None:
+    path = str(tmp_path / 'seen.db')
+    index = SeenIndex(path)
+    index.add(['1', '2'], seen_at=100)
+    index.close()
+
+    index = SeenIndex(path)
+
+    assert '1' in index and '2' in index
+    assert '3' not in index
+    assert len(index) == 2
+    index.close()
+
+
+def test_ids_another_process_adds_are_seen(tmp_path) -> None:
+    path = str(tmp_path / 'seen.db')
+    mine, theirs = SeenIndex(path), SeenIndex(path)
+
+    assert '1' not in mine
+
+    theirs.add(['1', '2'])
+
+    assert '1' in mine and '2' in mine and '3' not in mine
+
+    mine.close()
+    theirs.close()
+
+
+def test_seeing_a_job_again_keeps_when_it_was_first_seen(tmp_path) -> None:
+    index = SeenIndex(str(tmp_path / 'seen.db'))
+
+    index.add(['1'], seen_at=100)
+    index.add(['1'], seen_at=200)
+    index.add(['1'], seen_at=150)
+
+    assert index.get('1') == (100, 200)
+    assert index.get('2') is None
+    index.close()
+
+
+def test_the_filter_grows_with_the_ids(tmp_path, monkeypatch) -> None:
+    monkeypatch.setattr(seen_index_module, 'MIN_BLOOM_CAPACITY', 10)
+    index = SeenIndex(str(tmp_path / 'seen.db'))
+
+    index.add([str(i) for i in range(100)])
+
+    assert index._filter.capacity >= 100
+    assert all(str(i) in index for i in range(100))
+    index.close()
+
+
+def test_every_job_emitted_is_recorded_and_left_out_next_time(tmp_path, monkeypatch) -> None:
+    monkeypatch.setattr(scraper_module, 'build_driver', lambda **kwargs: FakeDriver())
+    path = str(tmp_path / 'seen.db')
+    query = Query(query='engineer', options=QueryOptions(locations=['Europe']))
+
+    with LinkedinScraper(max_workers=1, seen_index=path) as scraper:
+        scraper._strategy = ListedStrategy(scraper)
+        scraper.run(query)
+
+    index = SeenIndex(path)
+    index.add(['6'])
+    index.close()
+
+    delivered: list[str] = []
+
+    with LinkedinScraper(max_workers=1, seen_index=path) as scraper:
+        scraper._strategy = ListedStrategy(scraper)
+        scraper.on(Events.DATA, lambda data: delivered.append(data.job_id))
+        scraper.run(Query(query='engineer', options=QueryOptions(locations=['Europe'], only_new=True)))
+
+    assert delivered == []
+
+
+def test_only_new_requires_a_seen_index(monkeypatch) -> None:
+    monkeypatch.setattr(scraper_module, 'build_driver', lambda **kwargs: FakeDriver())
+    scraper = LinkedinScraper(max_workers=1)
+
+    with pytest.raises(ValueError):
+        scraper.run(Query(query='engineer', options=QueryOptions(only_new=True)))
+
+
+def test_the_cli_maps_only_new_and_the_index(tmp_path) -> None:
+    config = parse_args(['jobs', 'engineer', '--seen-index', str(tmp_path / 'seen.db'), '--only-new'])
+
+    assert build_query_options(config).only_new is True
+    assert build_scraper_kwargs(config)['seen_index'] == str(tmp_path / 'seen.db')
+
+    with pytest.raises(SystemExit):
+        parse_args(['jobs', 'engineer', '--only-new'])
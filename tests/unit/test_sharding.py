@@ -0,0 +1,178 @@
+"""Offline tests for ShardedScraper: one process per credential, sharing the locations of a run."""
+from __future__ import annotations
+
+import pytest
+
+from linkedin_jobs_scraper import LinkedinScraper, ShardedScraper, Credential
+from linkedin_jobs_scraper.config import Config
+from linkedin_jobs_scraper.events import Events, EventData, EventMetrics
+from linkedin_jobs_scraper.exceptions import InvalidCookieException
+from linkedin_jobs_scraper.query import Query, QueryOptions
+from linkedin_jobs_scraper.strategies import Strategy
+from linkedin_jobs_scraper.utils.driver_pool import DriverPool
+from linkedin_jobs_scraper.utils.timings import TimingModel
+
+
+class FakeDriver:
+    def execute_script(self, *args):
+        return 'www.linkedin.com'
+
+    def get_cookie(self, name):
+        return None
+
+    def quit(self) -> None:
+        pass
+
+
+class OverlappingStrategy(Strategy):
+    """Emits limit jobs per location, numbered the same in every location, tagged with the shard's credential."""
+
+    def run(self, driver, search_url, query, location, page_offset) -> None:
+        metrics = EventMetrics()
+
+        while metrics.processed < query.options.limit:
+            self.scraper.raise_if_cancelled()
+            metrics.processed += 1
+            self.scraper.emit(Events.DATA, EventData(query=query.query, location=location,
+                                                     job_id=str(metrics.processed), company=Config.LI_AT_COOKIE))
+
+        self.scraper.emit(Events.METRICS, metrics)
+
+
+class FailingStrategy(Strategy):
+    """Fails on the account named 'expired', scrapes one job on any other."""
+
+    def run(self, driver, search_url, query, location, page_offset) -> None:
+        if Config.LI_AT_COOKIE == 'expired':
+            raise InvalidCookieException('session expired')
+
+        self.scraper.emit(Events.DATA, EventData(location=location, job_id=location, company=Config.LI_AT_COOKIE))
+
+
+class FakeShardScraper(LinkedinScraper):
+    """Built in every shard's process, which has to import it: hence module level."""
+
+    strategy = OverlappingStrategy
+
+    def __init__(self, **kwargs) -> None:
+        super().__init__(**kwargs)
+        self._drivers = DriverPool(factory=FakeDriver, is_healthy=lambda driver: True)
+        self._strategy = self.strategy(self)
+
+
+class FailingShardScraper(FakeShardScraper):
+    strategy = FailingStrategy
+
+
+class TimedStrategy(Strategy):
+    """Learns a timing per location, and scrapes nothing."""
+
+    def run(self, driver, search_url, query, location, page_offset) -> None:
+        self.scraper.timings.observe('details', 1.5)
+
+
+class TimedShardScraper(FakeShardScraper):
+    strategy = TimedStrategy
+
+
+def _query(limit: int, locations: list[str]) -> Query:
+    return Query(query='engineer', options=QueryOptions(locations=locations, limit=limit))
+
+
+def _collect(scraper: LinkedinScraper) -> dict[str, list]:
+    events: dict[str, list] = {'data': [], 'metrics': [], 'end': [], 'error': []}
+    scraper.on(Events.DATA, events['data'].append)
+    scraper.on(Events.METRICS, events['metrics'].append)
+    scraper.on(Events.END, lambda: events['end'].append(None))
+    scraper.on(Events.ERROR, events['error'].append)
+    return events
+
+
+def test_jobs_found_by_several_shards_are_emitted_once() -> None:
+    scraper = ShardedScraper([Credential(li_at='one'), Credential(li_at='two')],
+                             scraper_factory=FakeShardScraper, max_workers=1)
+    events = _collect(scraper)
+
+    scraper.run([_query(3, ['a', 'b', 'c', 'd']), _query(2, ['e'])])
+
+    assert sorted(data.job_id for data in events['data']) == ['1', '2', '3']
+    assert len(events['metrics']) == 5
+    assert len(events['end']) == 2
+    assert events['error'] == []
+
+
+def test_every_location_is_run_by_one_of_the_shards() -> None:
+    scraper = ShardedScraper([Credential(li_at='one'), Credential(li_at='two')],
+                             scraper_factory=FailingShardScraper, max_workers=2)
+    events = _collect(scraper)
+    locations = [str(i) for i in range(8)]
+
+    scraper.run(_query(1, locations))
+
+    assert sorted(data.location for data in events['data']) == locations
+    assert {data.company for data in events['data']} <= {'one', 'two'}
+    assert len(events['end']) == 1
+
+
+def test_the_locations_of_a_failing_account_go_to_the_others() -> None:
+    scraper = ShardedScraper([Credential(li_at='expired'), Credential(li_at='valid')],
+                             scraper_factory=FailingShardScraper, max_workers=1)
+    events = _collect(scraper)
+    locations = [str(i) for i in range(4)]
+
+    scraper.run(_query(1, locations))
+
+    assert sorted(data.location for data in events['data']) == locations
+    assert {data.company for data in events['data']} == {'valid'}
+    assert len(events['end']) == 1
+
+
+def test_every_shard_failing_is_an_error() -> None:
+    scraper = ShardedScraper([Credential(li_at='expired')], scraper_factory=FailingShardScraper, max_workers=1)
+    events = _collect(scraper)
+
+    scraper.run(_query(1, ['a']))
+
+    assert events['data'] == []
+    assert events['end'] == []
+    assert any('locations left to scrape' in str(e) for e in events['error'])
+
+
+def test_the_results_of_every_shard_can_be_iterated() -> None:
+    scraper = ShardedScraper([Credential(li_at='one'), Credential(li_at='two')],
+                             scraper_factory=FailingShardScraper, max_workers=1)
+
+    with scraper:
+        jobs = list(scraper.iter_results(_query(1, ['a', 'b', 'c'])))
+
+    assert sorted(data.location for data in jobs) == ['a', 'b', 'c']
+    assert not isinstance(scraper, LinkedinScraper) and not hasattr(scraper, 'scrape_job')
+
+
+@pytest.mark.parametrize('credential', [
+    Credential(),
+    Credential(li_rm='rm'),
+    Credential(li_at=''),
+])
+def test_an_incomplete_credential_is_refused(credential: Credential) -> None:
+    with pytest.raises(ValueError):
+        ShardedScraper([credential])
+
+
+def test_per_account_arguments_are_refused() -> None:
+    with pytest.raises(ValueError):
+        ShardedScraper([Credential(li_at='one')], chrome_user_data_dir='/tmp/profile')
+
+    with pytest.raises(ValueError):
+        ShardedScraper([], max_workers=1)
+
+
+def test_closing_a_sharded_scraper_leaves_the_timings_of_its_shards(tmp_path) -> None:
+    path = str(tmp_path / 'timings.json')
+    scraper = ShardedScraper([Credential(li_at='one')], scraper_factory=TimedShardScraper, max_workers=1,
+                             timings=path)
+
+    scraper.run(_query(1, ['a']))
+    scraper.close()
+
+    assert TimingModel(path).snapshot()['details']['samples'] == 1
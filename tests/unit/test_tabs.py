@@ -0,0 +1,162 @@
+"""Offline tests for tabs of one browser standing in for browsers of their own."""
+from __future__ import annotations
+
+import threading
+from time import sleep
+
+import pytest
+
+from linkedin_jobs_scraper import LinkedinScraper
+from linkedin_jobs_scraper.utils.tabs import TabFactory
+
+
+class FakeBrowser:
+    """A webdriver with windows: every command answers with the window it ran in."""
+
+    def __init__(self) -> None:
+        self.windows = ['w0']
+        self.current = 'w0'
+        self.switches = 0
+        self.quit_called = False
+        self.switch_to = self
+
+    # switch_to
+    def window(self, handle: str) -> None:
+        assert handle in self.windows
+        self.current = handle
+        self.switches += 1
+
+    def new_window(self, kind: str) -> None:
+        handle = f'w{len(self.windows)}'
+        self.windows.append(handle)
+        self.current = handle
+
+    @property
+    def current_window_handle(self) -> str:
+        return self.current
+
+    @property
+    def window_handles(self) -> list[str]:
+        return list(self.windows)
+
+    def execute_script(self, *args) -> str:
+        window = self.current
+        # Long enough for another thread to switch windows under a command left unguarded
+        sleep(0.001)
+        return window
+
+    def close(self) -> None:
+        self.windows.remove(self.current)
+
+    def quit(self) -> None:
+        self.quit_called = True
+
+
+def _factory(max_tabs: int) -> tuple[TabFactory, list[FakeBrowser]]:
+    browsers: list[FakeBrowser] = []
+
+    def build() -> FakeBrowser:
+        browsers.append(FakeBrowser())
+        return browsers[-1]
+
+    return TabFactory(build, max_tabs), browsers
+
+
+def test_each_tab_runs_its_commands_in_its_own_window() -> None:
+    factory, browsers = _factory(2)
+    first, second = factory(), factory()
+
+    assert len(browsers) == 1
+    assert [first.execute_script(), first.execute_script(), second.execute_script()] == \
+           [first.handle, first.handle, second.handle]
+
+    # The session is only switched when the last command was for the other tab
+    assert browsers[0].switches == 2
+
+
+def test_concurrent_tabs_never_run_in_each_others_window() -> None:
+    factory, _ = _factory(3)
+    tabs = [factory() for _ in range(3)]
+    misses = []
+
+    def work(tab) -> None:
+        for _ in range(30):
+            if tab.execute_script() != tab.handle:
+                misses.append(tab.handle)
+
+    threads = [threading.Thread(target=work, args=(tab,)) for tab in tabs]
+
+    for thread in threads:
+        thread.start()
+
+    for thread in threads:
+        thread.join()
+
+    assert misses == []
+
+
+def test_a_full_browser_starts_another_and_the_last_tab_closes_it() -> None:
+    factory, browsers = _factory(2)
+    tabs = [factory() for _ in range(3)]
+
+    assert len(browsers) == 2
+
+    tabs[0].quit()
+
+    assert browsers[0].windows == [tabs[1].handle]
+    assert not browsers[0].quit_called
+
+    tabs[1].quit()
+
+    assert browsers[0].quit_called
+
+    # The room a closed tab left is used again
+    assert factory().browser is tabs[2].browser
+
+
+def test_a_browser_that_fails_to_close_a_tab_gets_no_new_ones() -> None:
+    factory, browsers = _factory(3)
+    tabs = [factory() for _ in range(2)]
+
+    def gone(handle: str) -> None:
+        raise ConnectionError('browser gone')
+
+    browsers[0].window = gone
+
+    with pytest.raises(ConnectionError):
+        tabs[0].quit()
+
+    assert factory().browser is not tabs[1].browser
+    assert len(browsers) == 2
+
+    tabs[1].quit()
+
+    assert browsers[0].quit_called
+
+
+def test_a_tab_sees_the_windows_pages_opened_but_not_its_siblings() -> None:
+    factory, browsers = _factory(2)
+    first, second = factory(), factory()
+    browsers[0].windows.append('popup')
+
+    assert first.window_handles == [first.handle, 'popup']
+    assert first.sibling_handles == [second.handle]
+
+
+def test_a_profile_serves_one_worker_per_tab() -> None:
+    scraper = LinkedinScraper(max_workers=4, tabs_per_driver=3, chrome_user_data_dir='/tmp/profile')
+
+    assert scraper.max_workers == 3
+    scraper.close()
+
+
+def test_a_tab_switched_to_a_prefetched_window_takes_it_over() -> None:
+    factory, browsers = _factory(2)
+    first, second = factory(), factory()
+    browsers[0].windows.append('prefetched')
+
+    first.switch_to.window('prefetched')
+
+    assert first.handle == 'prefetched'
+    assert first.execute_script() == 'prefetched'
+    assert second.sibling_handles == ['prefetched']
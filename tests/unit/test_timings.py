@@ -0,0 +1,132 @@
+"""Offline tests for the waits' learned timings, and the last page told apart by LinkedIn's count."""
+from __future__ import annotations
+
+import pytest
+
+from linkedin_jobs_scraper import LinkedinScraper
+from linkedin_jobs_scraper.cli.args import parse_args
+from linkedin_jobs_scraper.cli.main import main
+from linkedin_jobs_scraper.cli.mapping import build_scraper_kwargs
+from linkedin_jobs_scraper.strategies.authenticated_strategy import (AuthenticatedStrategy, LIST_SETTLE_TIMEOUT,
+                                                                     PAGINATION_SIZE, expected_page_size)
+from linkedin_jobs_scraper.utils import timings as timings_module
+from linkedin_jobs_scraper.utils.timings import MIN_SAMPLES, TimingModel, percentile
+
+wait_for_stable_job_ids = AuthenticatedStrategy._AuthenticatedStrategy__wait_for_stable_job_ids
+
+
+class FakeDriver:
+    def __init__(self, reply: dict) -> None:
+        self.reply = reply
+        self.params: list[dict] = []
+
+    def set_script_timeout(self, timeout: float) -> None:
+        pass
+
+    def execute_async_script(self, script: str, params: dict) -> dict:
+        self.params.append(params)
+        return self.reply
+
+
+def _model(site: str, samples) -> TimingModel:
+    model = TimingModel()
+
+    for sample in samples:
+        model.observe(site, sample)
+
+    return model
+
+
+def test_percentiles_are_taken_by_the_nearest_rank() -> None:
+    assert percentile(range(1, 101), 0.99) == 99
+    assert percentile([3.0], 0.99) == 3.0
+
+
+def test_the_hand_tuned_value_holds_until_enough_is_observed() -> None:
+    assert _model('card', [0.2] * (MIN_SAMPLES - 1)).learned('card', 5, 1.5) == 5
+
+
+def test_what_is_learned_lies_between_the_floor_and_the_hand_tuned_value() -> None:
+    assert _model('card', [2.0] * MIN_SAMPLES).learned('card', 5, 1.5) == pytest.approx(3.0)
+    assert _model('card', [0.1] * MIN_SAMPLES).learned('card', 5, 1.5) == 1.5
+    assert _model('card', [9.0] * MIN_SAMPLES).learned('card', 5, 1.5) == 5
+
+
+def test_only_the_latest_observations_are_kept(monkeypatch) -> None:
+    monkeypatch.setattr(timings_module, 'MAX_SAMPLES', MIN_SAMPLES)
+    model = _model('card', [4.0] * MIN_SAMPLES + [1.0] * MIN_SAMPLES)
+
+    assert model.percentile('card') == 1.0
+
+
+def test_observations_outlive_the_run_when_kept_in_a_file(tmp_path) -> None:
+    path = str(tmp_path / 'timings.json')
+
+    with LinkedinScraper(timings=path) as scraper:
+        for _ in range(MIN_SAMPLES):
+            scraper.timings.observe('details', 1.0)
+
+    assert TimingModel(path).learned('details', 5, 1.5) == pytest.approx(1.5)
+
+
+def test_an_unreadable_file_starts_the_model_over(tmp_path) -> None:
+    path = tmp_path / 'timings.json'
+    path.write_text('{not json')
+
+    assert TimingModel(str(path)).percentile('details') is None
+
+
+def test_timings_are_validated_and_mapped() -> None:
+    with pytest.raises(ValueError):
+        LinkedinScraper(timings=1)
+
+    assert build_scraper_kwargs(parse_args(['jobs', 'engineer', '--timings', 't.json']))['timings'] == 't.json'
+
+
+def test_the_cli_keeps_the_timings_of_its_run(tmp_path, monkeypatch, capsys) -> None:
+    path = tmp_path / 'timings.json'
+    monkeypatch.setattr(LinkedinScraper, '_run_queries', lambda self, queries: self.timings.observe('details', 1.0))
+
+    assert main(['jobs', 'engineer', '--timings', str(path)]) == 0
+
+    assert TimingModel(str(path)).snapshot()['details']['samples'] == 1
+
+
+@pytest.mark.parametrize('job_total, page, expected', [
+    (-1, 0, None),
+    (7, 0, 7),
+    (60, 1, PAGINATION_SIZE),
+    (60, 2, 10),
+    (60, 3, None),
+])
+def test_the_count_tells_how_many_jobs_a_page_holds(job_total, page, expected) -> None:
+    assert expected_page_size(job_total, page) == expected
+
+
+def test_a_short_last_page_settles_without_reaching_a_full_batch() -> None:
+    driver = FakeDriver({'met': True, 'value': {'ids': ['1', '2', '3'], 'gap': 120, 'waived': False}})
+    model = TimingModel()
+
+    assert wait_for_stable_job_ids(driver, model, 3) == ['1', '2', '3']
+    assert driver.params[0]['args'][2] == 3
+
+    model_samples = model.snapshot()
+    assert model_samples['list_settle']['samples'] == 1
+    assert model_samples['list_quiet']['p99'] == pytest.approx(0.12)
+
+
+def test_a_page_known_to_be_full_that_never_settled_was_slow() -> None:
+    driver = FakeDriver({'met': False, 'value': {'ids': ['1']}})
+    model = TimingModel()
+
+    assert wait_for_stable_job_ids(driver, model, PAGINATION_SIZE) == ['1']
+    assert model.snapshot()['list_settle']['p99'] == LIST_SETTLE_TIMEOUT
+
+
+def test_a_page_of_unknown_size_that_never_filled_up_teaches_nothing() -> None:
+    driver = FakeDriver({'met': False, 'value': {'ids': ['1']}})
+    model = TimingModel()
+
+    wait_for_stable_job_ids(driver, model)
+
+    assert model.snapshot() == {}
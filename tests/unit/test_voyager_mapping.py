@@ -0,0 +1,112 @@
+"""Offline tests for how the API strategy builds its requests and reads the answers."""
+from __future__ import annotations
+
+from urllib.parse import parse_qs, urlparse
+
+from linkedin_jobs_scraper import LinkedinScraper
+from linkedin_jobs_scraper.strategies import VoyagerStrategy
+from linkedin_jobs_scraper.strategies.voyager_strategy import (
+    build_job_cards_url,
+    build_search_query,
+    format_listed_at,
+    parse_job_cards,
+    parse_job_posting,
+)
+
+SEARCH_URL = ('https://www.linkedin.com/jobs/search?keywords=data+engineer%2C+python&location=Europe'
+              '&f_TPR=r604800&f_JT=F%2CI&sortBy=DD&start=0')
+
+
+def test_search_query_carries_keywords_location_and_filters() -> None:
+    assert build_search_query(SEARCH_URL) == (
+        '(origin:JOB_SEARCH_PAGE_SEARCH_BUTTON,'
+        'keywords:data%20engineer%2C%20python,'
+        'locationFallback:Europe,'
+        'selectedFilters:(timePostedRange:List(r604800),jobType:List(F,I),sortBy:List(DD)),'
+        'spellCorrectionEnabled:true)')
+
+
+def test_a_pinned_geo_wins_over_the_place_name() -> None:
+    query = build_search_query('https://www.linkedin.com/jobs/search?keywords=x&geoId=92000000&location=Europe')
+
+    assert 'locationUnion:(geoId:92000000)' in query
+    assert 'locationFallback' not in query
+
+
+def test_job_cards_url_pages_by_start() -> None:
+    params = parse_qs(urlparse(build_job_cards_url(SEARCH_URL, 50)).query)
+
+    assert params['start'] == ['50']
+    assert params['count'] == ['25']
+    assert params['q'] == ['jobSearch']
+
+
+def _card(job_id: str, title: str, promoted: bool = False) -> dict:
+    footer = [{'type': 'LISTED_DATE', 'timeAt': 1_760_000_000_000}]
+
+    if promoted:
+        footer.append({'type': 'PROMOTED'})
+
+    return {
+        '$type': 'com.linkedin.voyager.dash.jobs.JobPostingCard',
+        'entityUrn': f'urn:li:fsd_jobPostingCard:({job_id},JOBS_SEARCH)',
+        'jobPostingUrn': f'urn:li:fsd_jobPosting:{job_id}',
+        'jobPostingTitle': title,
+        'primaryDescription': {'text': 'Acme'},
+        'secondaryDescription': {'text': 'Berlin, Germany (Remote)'},
+        'footerItems': footer,
+        'logo': {'attributes': [{'detailData': {'companyLogo': {'logo': {'vectorImage': {
+            'rootUrl': 'https://media.licdn.com/',
+            'artifacts': [{'width': 100, 'fileIdentifyingUrlPathSegment': 'small'},
+                          {'width': 400, 'fileIdentifyingUrlPathSegment': 'large'}]}}}}}]},
+    }
+
+
+def test_job_cards_follow_the_ranking_of_the_elements() -> None:
+    payload = {
+        'data': {
+            'paging': {'total': 120},
+            'elements': [
+                {'jobCardUnion': {'*jobPostingCard': 'urn:li:fsd_jobPostingCard:(2222222222,JOBS_SEARCH)'}},
+                {'jobCardUnion': {'*jobPostingCard': 'urn:li:fsd_jobPostingCard:(1111111111,JOBS_SEARCH)'}},
+            ],
+        },
+        'included': [_card('1111111111', 'First'), _card('2222222222', 'Second', promoted=True),
+                     {'$type': 'com.linkedin.voyager.dash.organization.Company'}],
+    }
+
+    total, jobs = parse_job_cards(payload)
+
+    assert total == 120
+    assert [job['job_id'] for job in jobs] == ['2222222222', '1111111111']
+    assert jobs[0]['is_promoted'] is True and jobs[1]['is_promoted'] is False
+    assert jobs[1]['company'] == 'Acme'
+    assert jobs[1]['place'] == 'Berlin, Germany (Remote)'
+    assert jobs[1]['company_img_link'] == 'https://media.licdn.com/large'
+    assert jobs[1]['date'] == format_listed_at(1_760_000_000_000)
+
+
+def test_job_posting_is_mapped_to_event_fields() -> None:
+    posting = parse_job_posting({
+        'title': 'Data Engineer',
+        'formattedLocation': 'Berlin, Germany',
+        'listedAt': 1_760_000_000_000,
+        'description': {'text': 'About the job'},
+        'applyMethod': {'com.linkedin.voyager.jobs.OffsiteApply': {'companyApplyUrl': 'https://acme.example/apply'}},
+        'companyDetails': {'com.linkedin.voyager.deco.jobs.web.shared.WebJobPostingCompany': {
+            'companyResolutionResult': {'name': 'Acme', 'url': 'https://www.linkedin.com/company/acme?trk=x',
+                                        'staffCount': 1200}}},
+    })
+
+    assert posting['title'] == 'Data Engineer'
+    assert posting['company'] == 'Acme'
+    assert posting['company_link'] == 'https://www.linkedin.com/company/acme'
+    assert posting['company_employee_count'] == '1200'
+    assert posting['description'] == 'About the job'
+    assert posting['apply_link'] == 'https://acme.example/apply'
+    assert posting['date'] == '2025-10-09'
+
+
+def test_api_mode_selects_the_api_strategy() -> None:
+    assert isinstance(LinkedinScraper(api_mode=True)._strategy, VoyagerStrategy)
+    assert not isinstance(LinkedinScraper()._strategy, VoyagerStrategy)
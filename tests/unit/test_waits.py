@@ -0,0 +1,113 @@
+"""Offline tests for the in-page wait engine, driven through a fake driver."""
+from __future__ import annotations
+
+import pytest
+from selenium.common.exceptions import InvalidSessionIdException
+from urllib3.exceptions import MaxRetryError
+
+from linkedin_jobs_scraper.utils import waits
+from linkedin_jobs_scraper.utils.session import wait_for_linkedin
+from linkedin_jobs_scraper.utils.waits import wait_for
+
+
+class FakeDriver:
+    """Answers each async script with the next of its replies, raising the ones that are exceptions."""
+
+    def __init__(self, *replies) -> None:
+        self.replies = list(replies)
+        self.scripts: list[tuple[str, dict]] = []
+        self.script_timeouts: list[float] = []
+
+    def set_script_timeout(self, timeout: float) -> None:
+        self.script_timeouts.append(timeout)
+
+    def execute_async_script(self, script: str, params: dict):
+        self.scripts.append((script, params))
+        reply = self.replies.pop(0)
+
+        if isinstance(reply, BaseException):
+            raise reply
+
+        return reply
+
+
+@pytest.fixture(autouse=True)
+def fast_retries(monkeypatch) -> None:
+    monkeypatch.setattr(waits, 'RETRY_DELAY', 0)
+
+
+def test_a_met_condition_costs_one_script_call() -> None:
+    driver = FakeDriver({'met': True, 'value': ['1', '2']})
+
+    result = wait_for(driver, 'return args[0];', 'x', timeout=5)
+
+    assert result.met and result.value == ['1', '2']
+    assert len(driver.scripts) == 1
+    assert driver.scripts[0][1]['args'] == ['x']
+    assert 'return args[0];' in driver.scripts[0][0]
+
+
+def test_a_replaced_document_is_waited_on_again() -> None:
+    driver = FakeDriver(RuntimeError('document unloaded while waiting for result'), {'met': True, 'value': True})
+
+    result = wait_for(driver, 'return true;', timeout=5)
+
+    assert result.met
+    assert len(driver.scripts) == 2
+    assert driver.scripts[1][1]['timeout'] <= driver.scripts[0][1]['timeout']
+
+
+def test_a_timeout_answers_with_the_partial_value() -> None:
+    driver = FakeDriver({'met': False, 'value': ['1']})
+
+    result = wait_for(driver, 'return null;', timeout=5)
+
+    assert not result.met
+    assert result.value == ['1']
+
+
+def test_a_page_that_never_runs_the_wait_times_out() -> None:
+    driver = FakeDriver(*[RuntimeError('no document')] * 10_000)
+
+    result = wait_for(driver, 'return true;', timeout=0.05)
+
+    assert not result.met and result.value is None
+
+
+@pytest.mark.parametrize('gone', [InvalidSessionIdException('invalid session id'),
+                                  MaxRetryError(None, '/session', 'Connection refused')])
+def test_a_closed_browser_is_not_waited_on(gone) -> None:
+    driver = FakeDriver(gone, {'met': True, 'value': True})
+
+    with pytest.raises(type(gone)):
+        wait_for(driver, 'return true;', timeout=60)
+
+    assert len(driver.scripts) == 1
+
+
+def test_a_closed_browser_is_not_on_linkedin() -> None:
+    driver = FakeDriver(InvalidSessionIdException('invalid session id'), {'met': True, 'value': True})
+
+    assert wait_for_linkedin(driver, timeout=60) is False
+    assert len(driver.scripts) == 1
+
+
+def test_the_script_timeout_is_set_once_per_driver() -> None:
+    driver = FakeDriver(*[{'met': True, 'value': True}] * 3)
+
+    for _ in range(3):
+        wait_for(driver, 'return true;', timeout=5)
+
+    assert driver.script_timeouts == [waits.MIN_SCRIPT_TIMEOUT]
+
+
+def test_a_shared_driver_is_waited_on_in_slices_keeping_their_state() -> None:
+    driver = FakeDriver({'met': False, 'value': None}, {'met': True, 'value': 'ready'})
+    driver.wait_slice = 0.25
+
+    result = wait_for(driver, 'return null;', timeout=5)
+
+    assert result.met and result.value == 'ready'
+    assert [params['timeout'] for _, params in driver.scripts] == [250, 250]
+    assert driver.scripts[0][1]['stateKey'] == driver.scripts[1][1]['stateKey'] is not None
+    assert not driver.scripts[0][1]['last']
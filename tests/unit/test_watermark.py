@@ -0,0 +1,85 @@
+"""Offline tests for the watermarks that end a newest-first crawl where an earlier one began."""
+from __future__ import annotations
+
+from datetime import date, datetime
+
+import pytest
+
+from linkedin_jobs_scraper.cli.args import parse_args
+from linkedin_jobs_scraper.cli.mapping import build_query_options
+from linkedin_jobs_scraper.query import Query, QueryOptions
+from linkedin_jobs_scraper.strategies.watermark import Watermark
+
+
+def _query(**options) -> Query:
+    return Query(query='engineer', options=QueryOptions(**options))
+
+
+def test_no_option_never_stops() -> None:
+    watermark = Watermark(_query())
+
+    assert watermark.reached_at('1') is None
+    assert watermark.reached_on('2020-01-01') is None
+
+
+def test_the_job_the_last_crawl_started_at_stops() -> None:
+    watermark = Watermark(_query(stop_at_job_id='42'))
+
+    assert watermark.reached_at('41') is None
+    assert watermark.reached_at('42')
+
+
+@pytest.mark.parametrize('stop_before', [date(2024, 5, 10), datetime(2024, 5, 10, 18, 30)])
+def test_only_the_days_before_the_watermark_stop(stop_before) -> None:
+    watermark = Watermark(_query(stop_before=stop_before))
+
+    assert watermark.reached_on('2024-05-11') is None
+    assert watermark.reached_on('2024-05-10') is None
+    assert watermark.reached_on('2024-05-09')
+
+
+def test_a_card_without_a_readable_day_goes_on() -> None:
+    watermark = Watermark(_query(stop_before=date(2024, 5, 10)))
+
+    assert watermark.reached_on('') is None
+    assert watermark.reached_on('yesterday') is None
+
+
+def test_only_seen_ids_in_a_row_stop() -> None:
+    seen = {'1', '2', '4', '5', '6'}
+    watermark = Watermark(_query(stop_after_seen=3), seen)
+
+    assert [watermark.reached_at(job_id) is not None for job_id in ['1', '2', '3', '4', '5', '6']] == \
+           [False, False, False, False, False, True]
+
+
+@pytest.mark.parametrize('options', [
+    {'stop_at_job_id': ''},
+    {'stop_before': '2024-05-10'},
+    {'stop_after_seen': 0},
+])
+def test_invalid_watermarks_are_refused(options: dict) -> None:
+    with pytest.raises(ValueError):
+        _query(**options).validate()
+
+
+def test_watermarks_are_inherited_from_the_global_options() -> None:
+    query = _query()
+    query.merge_options(QueryOptions(stop_at_job_id='42', stop_after_seen=5))
+
+    assert query.options.stop_at_job_id == '42'
+    assert query.options.stop_after_seen == 5
+
+
+def test_the_cli_maps_the_watermarks(tmp_path) -> None:
+    config = parse_args(['jobs', 'engineer', '--relevance', 'recent', '--stop-at-job-id', '42',
+                         '--stop-before', '2024-05-10', '--stop-after-seen', '5',
+                         '--seen-index', str(tmp_path / 'seen.db')])
+    options = build_query_options(config)
+
+    assert options.stop_at_job_id == '42'
+    assert options.stop_before == date(2024, 5, 10)
+    assert options.stop_after_seen == 5
+
+    with pytest.raises(SystemExit):
+        parse_args(['jobs', 'engineer', '--stop-after-seen', '5'])